@@ -18,6 +18,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../../'))
 
 from vertex.monitoring_service import MonitoringService
 from vertex.vertex_feedback_service import VertexFeedbackService
+from voicehive.utils.quantiles import get_latency_registry
 
 router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 security = HTTPBearer()
@@ -50,6 +51,15 @@ class RecentActivity(BaseModel):
     status: str
     details: Optional[str] = None
 
+class LatencyQuantiles(BaseModel):
+    operation: str
+    count: int
+    mean: Optional[float] = None
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+    p99: Optional[float] = None
+    max: Optional[float] = None
+
 class AlertData(BaseModel):
     id: str
     severity: str
@@ -220,6 +230,27 @@ async def get_performance_metrics():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch performance metrics: {str(e)}")
 
+@router.get("/latency", response_model=List[LatencyQuantiles])
+async def get_latency_quantiles():
+    """Get p50/p95/p99 latency for webhook, LLM, function-call and bus delivery."""
+    try:
+        quantiles = get_latency_registry().get_all_quantiles()
+        
+        return [
+            LatencyQuantiles(
+                operation=operation,
+                count=summary["count"],
+                mean=summary["mean"],
+                p50=summary["p50"],
+                p95=summary["p95"],
+                p99=summary["p99"],
+                max=summary["max"]
+            )
+            for operation, summary in sorted(quantiles.items())
+        ]
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to fetch latency quantiles: {str(e)}")
+
 @router.get("/call-analytics")
 async def get_call_analytics(days: int = 7):
     """Get call analytics data for the specified period."""
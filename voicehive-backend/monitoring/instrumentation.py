@@ -19,6 +19,10 @@ from opentelemetry.sdk.resources import Resource
 from prometheus_client import start_http_server, Counter, Histogram, Gauge
 import time
 
+from voicehive.utils.loop_monitor import get_loop_monitor
+from voicehive.utils.profiling import get_stage_profiler
+from voicehive.utils.quantiles import get_latency_registry, quantile_label, DEFAULT_QUANTILES
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -148,6 +152,24 @@ class VoiceHiveInstrumentation:
                 'system_cpu_usage': Gauge(
                     'voicehive_system_cpu_usage_percent',
                     'System CPU usage percentage'
+                ),
+                'latency_quantile_ms': Gauge(
+                    'voicehive_latency_quantile_ms',
+                    'Latency quantile estimate in milliseconds',
+                    ['operation', 'quantile']
+                ),
+                'event_loop_max_lag_ms': Gauge(
+                    'voicehive_event_loop_max_lag_ms',
+                    'Largest observed event-loop scheduling lag in milliseconds'
+                ),
+                'event_loop_stalls': Gauge(
+                    'voicehive_event_loop_stalls',
+                    'Number of times the event loop was blocked beyond the threshold'
+                ),
+                'event_loop_blocked_ms': Gauge(
+                    'voicehive_event_loop_blocked_ms',
+                    'Total time the event loop was blocked, by coroutine',
+                    ['coroutine']
                 )
             }
             
@@ -239,6 +261,61 @@ class VoiceHiveInstrumentation:
         except Exception as e:
             logger.error(f"Failed to update system metrics: {e}")
     
+    def get_latency_quantiles(self, operation: str = None) -> Dict[str, Any]:
+        """Get p50/p95/p99 latency summaries from the streaming sketches."""
+        registry = get_latency_registry()
+        if operation:
+            return registry.get_quantiles(operation)
+        return registry.get_all_quantiles()
+    
+    def export_latency_sketches(self) -> Dict[str, Any]:
+        """Export serialized sketches so other workers can merge them."""
+        return get_latency_registry().export()
+    
+    def publish_latency_quantiles(self):
+        """Push current latency quantiles to the Prometheus gauges."""
+        try:
+            gauge = self.prometheus_metrics['latency_quantile_ms']
+            for operation, summary in get_latency_registry().get_all_quantiles().items():
+                for q in DEFAULT_QUANTILES:
+                    label = quantile_label(q)
+                    if summary.get(label) is not None:
+                        gauge.labels(operation=operation, quantile=label).set(summary[label])
+        except Exception as e:
+            logger.error(f"Failed to publish latency quantiles: {e}")
+    
+    def publish_loop_health(self):
+        """Push event-loop lag and stall attribution to the Prometheus gauges."""
+        try:
+            stats = get_loop_monitor().get_statistics()
+            self.prometheus_metrics['event_loop_max_lag_ms'].set(stats['max_lag_ms'])
+            self.prometheus_metrics['event_loop_stalls'].set(stats['stalls'])
+            blocked = self.prometheus_metrics['event_loop_blocked_ms']
+            for entry in stats['slow_coroutines']:
+                blocked.labels(coroutine=entry['site']).set(entry['total_ms'])
+        except Exception as e:
+            logger.error(f"Failed to publish event-loop health: {e}")
+    
+    def get_loop_health(self, include_stacks: bool = False) -> Dict[str, Any]:
+        """Get event-loop lag quantiles, stalls and the blocking sites behind them."""
+        return get_loop_monitor().get_statistics(include_stacks=include_stacks)
+    
+    def get_stage_profile(self) -> Dict[str, Any]:
+        """Get per-stage latency histograms and the slowest profiled requests."""
+        profiler = get_stage_profiler()
+        return {
+            "stages": profiler.get_stage_summary(),
+            "slowest_requests": profiler.get_slowest_requests(),
+            "profiler": profiler.get_profiler_statistics()
+        }
+    
+    def enable_stage_tracing(self):
+        """Emit a trace span for every profiled request stage."""
+        def span_factory(name: str, attributes: Dict[str, Any]):
+            return self.create_span(name, attributes)
+        
+        get_stage_profiler().set_span_factory(span_factory)
+    
     def create_span(self, name: str, attributes: Dict[str, Any] = None):
         """Create a new trace span."""
         try:
@@ -268,6 +345,9 @@ def setup_instrumentation(app=None):
         instrumentation.instrument_requests()
         instrumentation.instrument_logging()
         
+        if instrumentation.tracer:
+            instrumentation.enable_stage_tracing()
+        
         if app:
             instrumentation.instrument_fastapi(app)
         
@@ -0,0 +1,22 @@
+"""
+Fast JSON response class
+Renders response bodies with the orjson helpers in utils.serialization
+"""
+
+from typing import Any
+
+from fastapi.responses import Response
+
+from voicehive.utils.serialization import dumps
+
+
+class FastJSONResponse(Response):
+    """JSON response rendered with orjson (stdlib json fallback)"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            # Pre-rendered body
+            return content
+        return dumps(content)
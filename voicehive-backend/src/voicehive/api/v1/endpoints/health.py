@@ -4,14 +4,19 @@ Provides system health status, metrics, and monitoring capabilities
 """
 
 import time
-import psutil
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 
 from voicehive.core.settings import get_settings
+from voicehive.services.ai.context_assembler import get_context_assembler
 from voicehive.utils.logging import get_logger, log_with_context
+from voicehive.utils.loop_monitor import get_loop_monitor
+from voicehive.utils.profiling import get_stage_profiler
+from voicehive.utils.quantiles import QuantileSketch, get_latency_registry
+from voicehive.utils.resources import get_resource_sampler
 
 logger = get_logger(__name__)
 router = APIRouter()
@@ -62,28 +67,14 @@ def get_system_info() -> SystemInfo:
     import platform
     import sys
     
-    # Get CPU usage
-    cpu_percent = psutil.cpu_percent(interval=1)
-    
-    # Get memory usage
-    memory = psutil.virtual_memory()
-    memory_percent = memory.percent
-    
-    # Get disk usage
-    disk = psutil.disk_usage('/')
-    disk_percent = (disk.used / disk.total) * 100
-    
-    # Get load average (Unix-like systems only)
-    try:
-        load_avg = list(psutil.getloadavg())
-    except AttributeError:
-        load_avg = [0.0, 0.0, 0.0]  # Windows doesn't have load average
+    # Read the shared sampler snapshot instead of blocking for a 1-second CPU sample
+    resources = get_resource_sampler().snapshot()
     
     return SystemInfo(
-        cpu_percent=cpu_percent,
-        memory_percent=memory_percent,
-        disk_percent=disk_percent,
-        load_average=load_avg,
+        cpu_percent=resources.cpu_percent,
+        memory_percent=resources.memory_percent,
+        disk_percent=resources.disk_percent,
+        load_average=list(resources.load_average),
         python_version=sys.version,
         platform=platform.platform()
     )
@@ -181,9 +172,13 @@ def get_metrics_summary() -> Dict[str, Any]:
                 
                 summary[metric_type].update({
                     "status_codes": status_codes,
-                    "avg_response_time_ms": round(total_duration / len(recent_metrics), 2) if recent_metrics else 0
+                    "avg_response_time_ms": round(total_duration / len(recent_metrics), 2) if recent_metrics else 0,
+                    **_duration_quantiles(recent_metrics, "response_time_ms")
                 })
             
+            elif metric_type in ("function_calls", "external_api_calls"):
+                summary[metric_type].update(_duration_quantiles(recent_metrics, "duration_ms"))
+            
             elif metric_type == "errors":
                 error_types = {}
                 for metric in recent_metrics:
@@ -197,6 +192,18 @@ def get_metrics_summary() -> Dict[str, Any]:
     return summary
 
 
+def _duration_quantiles(metrics: List[Dict[str, Any]], suffix: str) -> Dict[str, Any]:
+    """Get p50/p95/p99 of the duration_ms field of recent metrics"""
+    sketch = QuantileSketch()
+    sketch.add_many([metric.get("duration_ms", 0) for metric in metrics])
+    p50, p95, p99 = sketch.quantiles([0.5, 0.95, 0.99])
+    return {
+        f"p50_{suffix}": round(p50, 2) if p50 is not None else 0,
+        f"p95_{suffix}": round(p95, 2) if p95 is not None else 0,
+        f"p99_{suffix}": round(p99, 2) if p99 is not None else 0
+    }
+
+
 @router.get("/health", response_model=HealthStatus)
 async def health_check():
     """
@@ -317,6 +324,7 @@ async def get_metrics():
             },
             application={
                 "metrics": metrics_summary,
+                "latency": get_latency_registry().get_all_quantiles(),
                 "version": "1.0.0"
             },
             api={
@@ -337,6 +345,71 @@ async def get_metrics():
         raise HTTPException(status_code=500, detail="Metrics collection failed")
 
 
+@router.get("/metrics/latency")
+async def get_latency_metrics(include_sketches: bool = False):
+    """
+    Get streaming latency quantiles (p50/p95/p99) per operation
+    Set include_sketches to get serialized sketches for cross-worker merging
+    """
+    registry = get_latency_registry()
+    response = {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "window_seconds": registry.window_seconds,
+        "latency": registry.get_all_quantiles()
+    }
+    if include_sketches:
+        response["sketches"] = registry.export()
+    return response
+
+
+@router.get("/metrics/stages")
+async def get_stage_metrics():
+    """
+    Get per-stage latency histograms for profiled requests
+    Includes the slowest N requests with their stage breakdown
+    """
+    profiler = get_stage_profiler()
+    return {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "stages": profiler.get_stage_summary(),
+        "slowest_requests": profiler.get_slowest_requests(),
+        "profiler": profiler.get_profiler_statistics()
+    }
+
+
+@router.get("/metrics/event-loop")
+async def get_event_loop_metrics(include_stacks: bool = False):
+    """
+    Get event-loop lag quantiles and recent stalls
+    Stalls are attributed to the blocking frame and the coroutine that was running
+    """
+    return {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "event_loop": get_loop_monitor().get_statistics(include_stacks=include_stacks)
+    }
+
+
+@router.get("/metrics/context")
+async def get_context_metrics():
+    """
+    Get prompt assembly statistics
+    Reports per-turn input-token savings and provider prompt-cache hits
+    """
+    return {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "context": get_context_assembler().get_context_statistics()
+    }
+
+
+@router.get("/metrics/stages/collapsed", response_class=PlainTextResponse)
+async def get_collapsed_stacks(per_request: bool = False):
+    """
+    Get sampled stacks of the slowest requests in collapsed (flame graph) format
+    Requires the sampling profiler (SAMPLING_PROFILER_ENABLED=true)
+    """
+    return get_stage_profiler().collapsed_stacks(per_request=per_request)
+
+
 def calculate_error_rate() -> float:
     """Calculate error rate from recent metrics"""
     now = datetime.utcnow()
@@ -1,78 +1,122 @@
 from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import JSONResponse
 import logging
+import time
 
-from voicehive.models.vapi import VapiWebhookRequest, VapiWebhookResponse
+from voicehive.core.settings import get_settings
+from voicehive.models.vapi import (
+    VapiWebhookRequest, VapiWebhookResponse, VapiTranscriptEvent, parse_vapi_webhook
+)
 from voicehive.domains.calls.services.roxy_agent import RoxyAgent
 from voicehive.utils.exceptions import AgentError
+from voicehive.utils.profiling import get_stage_profiler
+from voicehive.utils.quantiles import record_latency
+from voicehive.api.responses import FastJSONResponse
+from voicehive.utils.serialization import dumps
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 router = APIRouter(prefix="/webhook", tags=["webhooks"])
 
 # Initialize Roxy agent
 roxy = RoxyAgent()
 
+# Per-request stage profiler
+profiler = get_stage_profiler()
+profiler.configure(
+    enabled=settings.stage_profiling_enabled,
+    sampling_enabled=settings.sampling_profiler_enabled,
+    sample_interval_ms=settings.sampling_profiler_interval_ms,
+    slowest_n=settings.sampling_profiler_slowest_n
+)
+
+# Pre-rendered body for the high-volume transcript acknowledgement
+TRANSCRIPT_RECEIVED_BODY = dumps(VapiWebhookResponse(status="transcript_received").model_dump(mode="json"))
+
 
 @router.post("/vapi", response_model=VapiWebhookResponse)
 async def vapi_webhook(request: Request):
     """
     Webhook endpoint for Vapi.ai to send call events
     """
+    start_time = time.perf_counter()
     try:
-        # Get the raw request body
-        body = await request.json()
-        
-        # Log the incoming request
-        logger.info(f"Received Vapi webhook: {body}")
-        
-        # Validate the request using Pydantic model
-        webhook_request = VapiWebhookRequest(**body)
-        
-        # Extract call and message information
-        call_id = webhook_request.call.id
-        message = webhook_request.message
-        message_type = message.type
-        
-        if message_type == "function-call":
-            # Handle function calls from the assistant
-            function_call = message.functionCall
-            if not function_call:
-                raise HTTPException(status_code=400, detail="Missing function call data")
-            
-            function_name = function_call.get("name")
-            parameters = function_call.get("parameters", {})
-            
-            response = await roxy.handle_function_call(call_id, function_name, parameters)
-            
-            return VapiWebhookResponse(result=response.dict())
-        
-        elif message_type == "transcript":
-            # Handle transcript updates
-            transcript = message.transcript or ""
-            await roxy.handle_transcript_update(call_id, transcript)
-            
-            return VapiWebhookResponse(status="transcript_received")
-        
-        elif message_type == "hang":
-            # Handle call end
-            await roxy.handle_call_end(call_id)
-            
-            return VapiWebhookResponse(status="call_ended")
-        
-        else:
-            # Handle other message types or general conversation
-            user_message = message.content or ""
-            response_message = await roxy.handle_message(call_id, user_message)
-            
-            return VapiWebhookResponse(message=response_message)
-            
+        with profiler.profile_request("vapi_webhook"):
+            # Parse raw bytes and validate (transcript events are only partially validated)
+            with profiler.stage("parse_json"):
+                webhook_request = parse_vapi_webhook(await request.body())
+
+            if isinstance(webhook_request, VapiTranscriptEvent):
+                logger.debug("Received Vapi webhook: type=transcript call=%s", webhook_request.call_id)
+                with profiler.stage("dispatch"):
+                    await roxy.handle_transcript_update(webhook_request.call_id, webhook_request.transcript)
+                return FastJSONResponse(content=TRANSCRIPT_RECEIVED_BODY)
+
+            logger.info(
+                "Received Vapi webhook: type=%s call=%s",
+                webhook_request.message.type, webhook_request.call.id
+            )
+
+            with profiler.stage("dispatch"):
+                webhook_response = await _dispatch_webhook(webhook_request)
+
+            with profiler.stage("serialize"):
+                return FastJSONResponse(content=webhook_response.model_dump(mode="json"))
+
+    except HTTPException:
+        raise
+
     except AgentError as e:
         logger.error(f"Agent error processing Vapi webhook: {str(e)}")
         return VapiWebhookResponse(
             message="I apologize, but I'm having trouble processing your request. Let me transfer you to a human agent."
         )
-    
+
     except Exception as e:
         logger.error(f"Error processing Vapi webhook: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+    finally:
+        record_latency("webhook", (time.perf_counter() - start_time) * 1000)
+
+
+async def _dispatch_webhook(webhook_request: VapiWebhookRequest) -> VapiWebhookResponse:
+    """Route a validated webhook to the matching Roxy handler"""
+    # Extract call and message information
+    call_id = webhook_request.call.id
+    message = webhook_request.message
+    message_type = message.type
+
+    if message_type == "function-call":
+        # Handle function calls from the assistant
+        function_call = message.functionCall
+        if not function_call:
+            raise HTTPException(status_code=400, detail="Missing function call data")
+
+        function_name = function_call.get("name")
+        parameters = function_call.get("parameters", {})
+
+        with profiler.stage("function_call"):
+            response = await roxy.handle_function_call(call_id, function_name, parameters)
+
+        return VapiWebhookResponse(result=response.dict())
+
+    elif message_type == "transcript":
+        # Handle transcript updates
+        transcript = message.transcript or ""
+        await roxy.handle_transcript_update(call_id, transcript)
+
+        return VapiWebhookResponse(status="transcript_received")
+
+    elif message_type == "hang":
+        # Handle call end
+        await roxy.handle_call_end(call_id)
+
+        return VapiWebhookResponse(status="call_ended")
+
+    else:
+        # Handle other message types or general conversation
+        user_message = message.content or ""
+        response_message = await roxy.handle_message(call_id, user_message)
+
+        return VapiWebhookResponse(message=response_message)
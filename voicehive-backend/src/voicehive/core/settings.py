@@ -96,6 +96,13 @@ class Settings(BaseSettings):
     response_timeout: int = Field(default=30, env="RESPONSE_TIMEOUT", ge=1, le=300)
     max_function_calls: int = Field(default=5, env="MAX_FUNCTION_CALLS", ge=1, le=20)
     agent_system_prompt_max_length: int = Field(default=2000, env="AGENT_SYSTEM_PROMPT_MAX_LENGTH", ge=100)
+    prompt_max_input_tokens: int = Field(default=3000, env="PROMPT_MAX_INPUT_TOKENS", ge=256, le=128000)
+    prompt_summary_max_tokens: int = Field(default=200, env="PROMPT_SUMMARY_MAX_TOKENS", ge=16, le=4000)
+    call_session_backend: str = Field(default="memory", env="CALL_SESSION_BACKEND", pattern=r'^(memory|redis)$')
+    call_session_redis_url: Optional[str] = Field(default=None, env="CALL_SESSION_REDIS_URL")
+    call_session_idle_ttl: int = Field(default=1800, env="CALL_SESSION_IDLE_TTL", ge=60, le=86400)
+    call_session_max_sessions: int = Field(default=10000, env="CALL_SESSION_MAX_SESSIONS", ge=1, le=1000000)
+    call_session_max_memory_mb: int = Field(default=64, env="CALL_SESSION_MAX_MEMORY_MB", ge=1, le=4096)
     
     # Performance Configuration
     cache_ttl: int = Field(default=300, env="CACHE_TTL", ge=1, le=86400)  # 5 minutes default
@@ -116,6 +123,13 @@ class Settings(BaseSettings):
     enable_metrics: bool = Field(default=True, env="ENABLE_METRICS")
     metrics_port: int = Field(default=9090, env="METRICS_PORT", ge=1, le=65535)
     health_check_interval: int = Field(default=30, env="HEALTH_CHECK_INTERVAL", ge=1, le=3600)
+    stage_profiling_enabled: bool = Field(default=True, env="STAGE_PROFILING_ENABLED")
+    sampling_profiler_enabled: bool = Field(default=False, env="SAMPLING_PROFILER_ENABLED")
+    sampling_profiler_interval_ms: float = Field(default=5.0, env="SAMPLING_PROFILER_INTERVAL_MS", ge=0.5, le=1000.0)
+    sampling_profiler_slowest_n: int = Field(default=10, env="SAMPLING_PROFILER_SLOWEST_N", ge=1, le=1000)
+    loop_monitor_enabled: bool = Field(default=True, env="LOOP_MONITOR_ENABLED")
+    loop_monitor_interval_ms: float = Field(default=50.0, env="LOOP_MONITOR_INTERVAL_MS", ge=1.0, le=10000.0)
+    loop_block_threshold_ms: float = Field(default=100.0, env="LOOP_BLOCK_THRESHOLD_MS", ge=5.0, le=60000.0)
     
     # Rate Limiting Configuration
     rate_limit_requests: int = Field(default=100, env="RATE_LIMIT_REQUESTS", ge=1, le=10000)
@@ -8,15 +8,21 @@ capabilities for critical decisions. Provides safety constraints and escalation
 import logging
 import asyncio
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Callable, Union
+from typing import Dict, List, Any, Optional, Callable, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import json
 
+import numpy as np
+
 from voicehive.services.ai.openai_service import OpenAIService
+from voicehive.utils.expressions import CompiledExpression, compile_expression
 
 logger = logging.getLogger(__name__)
 
+# Names a SafetyConstraint condition may reference
+CONSTRAINT_VARIABLES = ("decision_type", "risk_level", "impact", "urgency")
+
 
 class DecisionType(Enum):
     """Types of autonomous decisions"""
@@ -76,7 +82,7 @@ class DecisionResult:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(frozen=True)
 class SafetyConstraint:
     """Safety constraint for autonomous decisions"""
     name: str
@@ -90,6 +96,11 @@ class AutonomousController:
     """
     Advanced autonomous decision controller with confidence-based decision making,
     human-in-the-loop capabilities, and comprehensive safety constraints.
+
+    Safety constraint conditions are compiled once when added and indexed by the
+    decision types they can match, so a check only evaluates relevant constraints.
+    Constraints are immutable and changed only through add_safety_constraint and
+    remove_safety_constraint, which keep the index current.
     """
     
     def __init__(self, openai_service: Optional[OpenAIService] = None):
@@ -105,7 +116,8 @@ class AutonomousController:
         }
         
         # Safety constraints
-        self.safety_constraints: List[SafetyConstraint] = []
+        self._safety_constraints: List[Tuple[SafetyConstraint, CompiledExpression]] = []
+        self._constraint_index: Dict[DecisionType, List[Tuple[SafetyConstraint, CompiledExpression]]] = {}
         self._initialize_default_constraints()
         
         # Decision history and monitoring
@@ -158,13 +170,47 @@ class AutonomousController:
             )
         ]
         
-        self.safety_constraints.extend(default_constraints)
+        self._safety_constraints.extend(
+            (constraint, compile_expression(constraint.condition, CONSTRAINT_VARIABLES))
+            for constraint in default_constraints
+        )
+        self._rebuild_constraint_index()
+    
+    @property
+    def safety_constraints(self) -> Tuple[SafetyConstraint, ...]:
+        """Registered safety constraints, in evaluation order"""
+        return tuple(constraint for constraint, _ in self._safety_constraints)
     
     def add_safety_constraint(self, constraint: SafetyConstraint):
-        """Add a custom safety constraint"""
-        self.safety_constraints.append(constraint)
+        """Add a custom safety constraint; raises ValueError if its condition is not a valid expression"""
+        expression = compile_expression(constraint.condition, CONSTRAINT_VARIABLES)
+        self._safety_constraints.append((constraint, expression))
+        self._rebuild_constraint_index()
         logger.info(f"Added safety constraint: {constraint.name}")
     
+    def remove_safety_constraint(self, name: str) -> bool:
+        """Remove the safety constraints with the given name; returns whether any was removed"""
+        remaining = [(constraint, expression) for constraint, expression in self._safety_constraints
+                     if constraint.name != name]
+        if len(remaining) == len(self._safety_constraints):
+            return False
+        self._safety_constraints = remaining
+        self._rebuild_constraint_index()
+        logger.info(f"Removed safety constraint: {name}")
+        return True
+    
+    def _rebuild_constraint_index(self):
+        """Index constraints by the decision types they can match"""
+        self._constraint_index = {decision_type: [] for decision_type in DecisionType}
+        for constraint, expression in self._safety_constraints:
+            decision_types = expression.allowed_values("decision_type")
+            for decision_type in DecisionType:
+                if decision_types is None or decision_type.value in decision_types:
+                    self._constraint_index[decision_type].append((constraint, expression))
+    
+    def _constraints_for(self, decision_type: DecisionType) -> List[Tuple[SafetyConstraint, CompiledExpression]]:
+        return self._constraint_index[decision_type]
+    
     def set_confidence_threshold(self, decision_type: DecisionType, threshold: float):
         """Set confidence threshold for a decision type"""
         self.confidence_thresholds[decision_type] = threshold
@@ -233,40 +279,69 @@ class AutonomousController:
     
     def _check_safety_constraints(self, context: DecisionContext) -> Dict[str, Any]:
         """Check if decision violates any safety constraints"""
-        for constraint in self.safety_constraints:
-            if self._evaluate_constraint_condition(constraint, context):
-                if constraint.requires_human_approval:
-                    return {
-                        "allowed": False,
-                        "reason": f"Safety constraint violated: {constraint.name}",
-                        "constraint": constraint.name
-                    }
-                elif context.risk_level > constraint.max_risk_level:
-                    return {
-                        "allowed": False,
-                        "reason": f"Risk level {context.risk_level} exceeds maximum {constraint.max_risk_level}",
-                        "constraint": constraint.name
-                    }
+        values = self._constraint_values(context)
+        for constraint, expression in self._constraints_for(context.decision_type):
+            try:
+                matched = expression.evaluate(values)
+            except Exception as e:
+                logger.warning(f"Failed to evaluate constraint condition {constraint.condition!r}: {str(e)}")
+                continue
+            if matched and (constraint.requires_human_approval or context.risk_level > constraint.max_risk_level):
+                return self._constraint_violation(constraint, context.risk_level)
         
         return {"allowed": True, "reason": "All constraints satisfied"}
     
-    def _evaluate_constraint_condition(self, constraint: SafetyConstraint, context: DecisionContext) -> bool:
-        """Evaluate if a constraint condition is met"""
-        # Simple condition evaluation - in practice, you'd use a proper expression evaluator
-        condition = constraint.condition
+    def check_safety_constraints_batch(self, contexts: List[DecisionContext]) -> List[Dict[str, Any]]:
+        """Check many decision contexts at once, evaluating each constraint over a whole decision type"""
+        results: List[Dict[str, Any]] = [
+            {"allowed": True, "reason": "All constraints satisfied"} for _ in contexts
+        ]
+        groups: Dict[DecisionType, List[int]] = {}
+        for position, context in enumerate(contexts):
+            groups.setdefault(context.decision_type, []).append(position)
         
-        # Replace variables with actual values
-        condition = condition.replace("risk_level", str(context.risk_level))
-        condition = condition.replace("impact", str(context.impact))
-        condition = condition.replace("urgency", str(context.urgency))
-        condition = condition.replace("decision_type", f"'{context.decision_type.value}'")
+        for decision_type, positions in groups.items():
+            group = [contexts[position] for position in positions]
+            risk_levels = np.fromiter((context.risk_level for context in group), dtype=float, count=len(group))
+            columns = {
+                "decision_type": decision_type.value,
+                "risk_level": risk_levels,
+                "impact": np.fromiter((context.impact for context in group), dtype=float, count=len(group)),
+                "urgency": np.fromiter((context.urgency for context in group), dtype=float, count=len(group))
+            }
+            unresolved = np.ones(len(group), dtype=bool)
+            for constraint, expression in self._constraints_for(decision_type):
+                try:
+                    violated = expression.evaluate_batch(columns, len(group))
+                except Exception as e:
+                    logger.warning(f"Failed to evaluate constraint condition {constraint.condition!r}: {str(e)}")
+                    continue
+                if not constraint.requires_human_approval:
+                    violated = violated & (risk_levels > constraint.max_risk_level)
+                for row in np.flatnonzero(violated & unresolved):
+                    results[positions[row]] = self._constraint_violation(constraint, group[row].risk_level)
+                unresolved &= ~violated
+                if not unresolved.any():
+                    break
         
-        try:
-            # WARNING: In production, use a safe expression evaluator
-            return eval(condition)
-        except Exception:
-            logger.warning(f"Failed to evaluate constraint condition: {condition}")
-            return False
+        return results
+    
+    @staticmethod
+    def _constraint_values(context: DecisionContext) -> Dict[str, Any]:
+        return {
+            "decision_type": context.decision_type.value,
+            "risk_level": context.risk_level,
+            "impact": context.impact,
+            "urgency": context.urgency
+        }
+    
+    @staticmethod
+    def _constraint_violation(constraint: SafetyConstraint, risk_level: int) -> Dict[str, Any]:
+        if constraint.requires_human_approval:
+            reason = f"Safety constraint violated: {constraint.name}"
+        else:
+            reason = f"Risk level {risk_level} exceeds maximum {constraint.max_risk_level}"
+        return {"allowed": False, "reason": reason, "constraint": constraint.name}
     
     def _escalate_decision(self, context: DecisionContext, reason: str) -> DecisionResult:
         """Escalate decision to human oversight"""
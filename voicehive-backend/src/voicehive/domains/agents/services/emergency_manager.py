@@ -60,6 +60,7 @@ class EmergencyThreshold:
     severity: EmergencySeverity
     duration_seconds: int = 60  # How long condition must persist
     cooldown_seconds: int = 300  # Cooldown before re-triggering
+    emergency_type: Optional[EmergencyType] = None  # Defaults to the threshold name
 
 
 class EmergencyManager:
@@ -120,6 +121,22 @@ class EmergencyManager:
                 duration_seconds=60,
                 cooldown_seconds=600
             ),
+            "response_time_p95": EmergencyThreshold(
+                metric_name="p95_response_time_ms",
+                threshold_value=5000,  # 5 seconds at the 95th percentile
+                severity=EmergencySeverity.MEDIUM,
+                duration_seconds=120,
+                cooldown_seconds=180,
+                emergency_type=EmergencyType.RESPONSE_TIME_DEGRADATION
+            ),
+            "response_time_p99": EmergencyThreshold(
+                metric_name="p99_response_time_ms",
+                threshold_value=10000,  # 10 seconds at the 99th percentile
+                severity=EmergencySeverity.HIGH,
+                duration_seconds=120,
+                cooldown_seconds=180,
+                emergency_type=EmergencyType.RESPONSE_TIME_DEGRADATION
+            ),
             "memory_usage": EmergencyThreshold(
                 metric_name="memory_usage_percent",
                 threshold_value=90,  # 90% memory usage
@@ -198,7 +215,7 @@ class EmergencyManager:
                 # Create emergency
                 emergency = Emergency(
                     id=str(uuid.uuid4()),
-                    type=EmergencyType(threshold_name.replace("_", "_").upper()),
+                    type=threshold.emergency_type or EmergencyType(threshold_name.replace("_", "_").upper()),
                     severity=threshold.severity,
                     message=f"{threshold.metric_name} exceeded threshold: {metric_value} > {threshold.threshold_value}",
                     timestamp=current_time,
@@ -4,14 +4,14 @@ Implements early warning system for potential issues
 """
 import logging
 import asyncio
+import time
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple, Union
 from enum import Enum
 from dataclasses import dataclass
 import json
 import numpy as np
-from collections import deque, defaultdict
-import statistics
+from collections import OrderedDict
 
 # Google Cloud Vertex AI imports
 try:
@@ -24,6 +24,9 @@ except ImportError:
     logging.warning("Vertex AI not available - using statistical fallback")
 
 from voicehive.services.ai.openai_service import OpenAIService
+from voicehive.domains.agents.services.ml.rolling_stats import RollingWindowStats, rolling_batch_stats
+from voicehive.domains.agents.services.ml.forecasting import ForecastEngine, MetricForecast
+from voicehive.utils.timeseries import TimeSeriesStore
 from voicehive.utils.exceptions import VoiceHiveError, ErrorHandler
 from voicehive.core.settings import get_settings
 
@@ -98,56 +101,97 @@ class PredictionResult:
 class StatisticalAnalyzer:
     """Statistical analysis for anomaly detection"""
     
-    def __init__(self, window_size: int = 100, sensitivity: float = 2.0):
+    def __init__(self,
+                 window_size: int = 100,
+                 sensitivity: float = 2.0,
+                 trend_window: int = 20,
+                 series_store: Optional[TimeSeriesStore] = None):
         self.window_size = window_size
         self.sensitivity = sensitivity  # Standard deviations for anomaly threshold
+        self.trend_window = trend_window
+        self.min_baseline_points = 10
         
-        # Historical data storage
-        self.metric_windows: Dict[str, deque] = defaultdict(lambda: deque(maxlen=window_size))
+        # Historical data storage: columnar raw, 1-minute and 1-hour series,
+        # optionally shared with the other monitoring components
+        self.series_store = series_store if series_store is not None else TimeSeriesStore(raw_capacity=window_size)
+        self.rolling_stats: Dict[str, RollingWindowStats] = {}
         self.baseline_stats: Dict[str, Dict[str, float]] = {}
+        self.forecaster = ForecastEngine(self.series_store)
     
+    def _rolling(self, metric_name: str) -> RollingWindowStats:
+        rolling = self.rolling_stats.get(metric_name)
+        if rolling is None:
+            rolling = self.rolling_stats[metric_name] = RollingWindowStats(self.window_size, self.trend_window)
+        return rolling
+
     def add_data_point(self, metric_name: str, data_point: MetricDataPoint):
         """Add a new data point to the analysis window"""
-        self.metric_windows[metric_name].append(data_point)
+        self.series_store.add(
+            metric_name, data_point.timestamp.timestamp(), data_point.value, data_point.metadata
+        )
+        self._rolling(metric_name).add(data_point.value)
         self._update_baseline_stats(metric_name)
     
+    def add_data_points(self, metric_name: str, data_points: List[MetricDataPoint]) -> List[AnomalyDetection]:
+        """
+        Add a batch of data points in one vectorized pass
+        
+        Each point is scored against the window ending at that point, as if
+        the points had been added one by one. Returns the anomalous points.
+        """
+        if not data_points:
+            return []
+
+        rolling = self._rolling(metric_name)
+        history = np.fromiter(rolling.values, dtype=float, count=len(rolling))
+        values = np.fromiter((dp.value for dp in data_points), dtype=float, count=len(data_points))
+        mean, std, trend, counts = rolling_batch_stats(history, values, self.window_size, self.trend_window)
+
+        self.series_store.extend(
+            metric_name,
+            np.fromiter((dp.timestamp.timestamp() for dp in data_points), dtype=float, count=len(data_points)),
+            values,
+            [dp.metadata for dp in data_points]
+        )
+        if len(values) >= self.window_size:
+            rolling.reset(values)
+        else:
+            for value in values.tolist():
+                rolling.add(value)
+        self._update_baseline_stats(metric_name)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            z_scores = np.abs(values - mean) / std
+        flagged = np.flatnonzero((counts >= self.min_baseline_points) & (std > 0) & (z_scores > self.sensitivity))
+
+        return [
+            self._build_anomaly(
+                metric_name, data_points[index], float(z_scores[index]),
+                {"mean": float(mean[index]), "std": float(std[index]), "trend": float(trend[index])}
+            )
+            for index in flagged.tolist()
+        ]
+
+    def get_window(self, metric_name: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Zero-copy (epoch-second timestamps, values) views of a metric's analysis window"""
+        return self.series_store.window(metric_name, self.window_size)
+
+    def get_data_points(self, metric_name: str) -> List[MetricDataPoint]:
+        """Materialize a metric's analysis window as data points"""
+        timestamps, values = self.get_window(metric_name)
+        metadata = self.series_store.metadata(metric_name, self.window_size)
+        return [
+            MetricDataPoint(timestamp=datetime.fromtimestamp(timestamp), value=value, metadata=tags)
+            for timestamp, value, tags in zip(timestamps.tolist(), values.tolist(), metadata)
+        ]
+
     def _update_baseline_stats(self, metric_name: str):
         """Update baseline statistics for a metric"""
-        window = self.metric_windows[metric_name]
-        if len(window) < 10:  # Need minimum data points
+        rolling = self.rolling_stats[metric_name]
+        if len(rolling) < self.min_baseline_points:  # Need minimum data points
             return
         
-        values = [dp.value for dp in window]
-        
-        self.baseline_stats[metric_name] = {
-            "mean": statistics.mean(values),
-            "std": statistics.stdev(values) if len(values) > 1 else 0,
-            "median": statistics.median(values),
-            "min": min(values),
-            "max": max(values),
-            "trend": self._calculate_trend(values[-20:])  # Recent trend
-        }
-    
-    def _calculate_trend(self, values: List[float]) -> float:
-        """Calculate trend using simple linear regression"""
-        if len(values) < 2:
-            return 0.0
-        
-        n = len(values)
-        x = list(range(n))
-        
-        # Simple linear regression
-        x_mean = sum(x) / n
-        y_mean = sum(values) / n
-        
-        numerator = sum((x[i] - x_mean) * (values[i] - y_mean) for i in range(n))
-        denominator = sum((x[i] - x_mean) ** 2 for i in range(n))
-        
-        if denominator == 0:
-            return 0.0
-        
-        slope = numerator / denominator
-        return slope
+        self.baseline_stats[metric_name] = rolling.snapshot()
     
     def detect_anomalies(self, metric_name: str, data_point: MetricDataPoint) -> Optional[AnomalyDetection]:
         """Detect anomalies in a new data point"""
@@ -164,24 +208,34 @@ class StatisticalAnalyzer:
         z_score = abs(value - stats["mean"]) / stats["std"]
         
         if z_score > self.sensitivity:
-            # Determine anomaly type and severity
-            anomaly_type = self._classify_anomaly_type(metric_name, value, stats)
-            severity = self._calculate_severity(z_score)
-            
-            return AnomalyDetection(
-                id=f"anomaly_{metric_name}_{int(data_point.timestamp.timestamp())}",
-                metric_name=metric_name,
-                anomaly_type=anomaly_type,
-                severity=severity,
-                timestamp=data_point.timestamp,
-                value=value,
-                expected_value=stats["mean"],
-                deviation_score=z_score,
-                confidence=min(0.95, z_score / 5.0),  # Higher z-score = higher confidence
-                description=f"{metric_name} anomaly: {value:.2f} (expected: {stats['mean']:.2f})"
-            )
+            return self._build_anomaly(metric_name, data_point, z_score, stats)
         
         return None
+
+    def _build_anomaly(self,
+                       metric_name: str,
+                       data_point: MetricDataPoint,
+                       z_score: float,
+                       stats: Dict[str, float]) -> AnomalyDetection:
+        """Create an anomaly record for a point that exceeded the threshold"""
+        value = data_point.value
+
+        # Determine anomaly type and severity
+        anomaly_type = self._classify_anomaly_type(metric_name, value, stats)
+        severity = self._calculate_severity(z_score)
+        
+        return AnomalyDetection(
+            id=f"anomaly_{metric_name}_{int(data_point.timestamp.timestamp())}",
+            metric_name=metric_name,
+            anomaly_type=anomaly_type,
+            severity=severity,
+            timestamp=data_point.timestamp,
+            value=value,
+            expected_value=stats["mean"],
+            deviation_score=z_score,
+            confidence=min(0.95, z_score / 5.0),  # Higher z-score = higher confidence
+            description=f"{metric_name} anomaly: {value:.2f} (expected: {stats['mean']:.2f})"
+        )
     
     def _classify_anomaly_type(self, metric_name: str, value: float, stats: Dict[str, float]) -> AnomalyType:
         """Classify the type of anomaly based on metric and value"""
@@ -214,54 +268,49 @@ class StatisticalAnalyzer:
             return AnomalySeverity.LOW
     
     def predict_future_values(self, metric_name: str, steps_ahead: int = 5) -> List[PredictionResult]:
-        """Predict future values using trend analysis"""
-        if metric_name not in self.baseline_stats:
-            return []
-        
-        window = self.metric_windows[metric_name]
-        if len(window) < 10:
-            return []
-        
-        stats = self.baseline_stats[metric_name]
-        recent_values = [dp.value for dp in list(window)[-20:]]
-        trend = self._calculate_trend(recent_values)
+        """Predict future values using Holt-Winters forecasting"""
+        return self.predict_future_values_batch([metric_name], steps_ahead).get(metric_name, [])
+
+    def predict_future_values_batch(self,
+                                    metric_names: List[str],
+                                    steps_ahead: int = 5) -> Dict[str, List[PredictionResult]]:
+        """
+        Predict future values for several metrics in one vectorized pass
         
+        Metrics with enough hourly history get a seasonal (daily or weekly)
+        model; the rest use damped-trend smoothing on their finest tier.
+        """
+        ready = [name for name in metric_names if name in self.baseline_stats]
+        forecasts = self.forecaster.forecast(ready, steps_ahead)
+        return {
+            name: self._to_predictions(forecast)
+            for name, forecast in forecasts.items()
+        }
+
+    def _to_predictions(self, forecast: MetricForecast) -> List[PredictionResult]:
+        """Convert a forecast into prediction results"""
+        # Determine trend direction
+        if forecast.trend > 0.1:
+            trend_direction = "increasing"
+        elif forecast.trend < -0.1:
+            trend_direction = "decreasing"
+        else:
+            trend_direction = "stable"
+
         predictions = []
-        last_timestamp = window[-1].timestamp
-        
-        for i in range(1, steps_ahead + 1):
-            # Simple linear prediction
-            predicted_value = recent_values[-1] + (trend * i)
-            
-            # Calculate confidence interval based on historical variance
-            std = stats["std"]
-            confidence_interval = (
-                predicted_value - (1.96 * std),  # 95% confidence interval
-                predicted_value + (1.96 * std)
-            )
-            
-            # Determine trend direction
-            if trend > 0.1:
-                trend_direction = "increasing"
-            elif trend < -0.1:
-                trend_direction = "decreasing"
-            else:
-                trend_direction = "stable"
-            
-            # Confidence decreases with prediction distance
-            confidence = max(0.1, 0.9 - (i * 0.1))
-            
-            prediction = PredictionResult(
-                metric_name=metric_name,
-                prediction_timestamp=last_timestamp + timedelta(minutes=i * 5),  # 5-minute intervals
-                predicted_value=predicted_value,
-                confidence_interval=confidence_interval,
-                confidence=confidence,
+        for i, (timestamp, value, lower, upper) in enumerate(zip(
+            forecast.timestamps.tolist(), forecast.values.tolist(),
+            forecast.lower.tolist(), forecast.upper.tolist()
+        ), start=1):
+            predictions.append(PredictionResult(
+                metric_name=forecast.metric_name,
+                prediction_timestamp=datetime.fromtimestamp(timestamp),
+                predicted_value=value,
+                confidence_interval=(lower, upper),  # 95% confidence interval
+                # Confidence decreases with prediction distance
+                confidence=max(0.1, 0.9 - (i * 0.1)),
                 trend_direction=trend_direction
-            )
-            
-            predictions.append(prediction)
-        
+            ))
         return predictions
 
 
@@ -362,16 +411,18 @@ class AnomalyDetector:
     - Pattern recognition for common failure modes
     - Early warning system for potential issues
     - Automated issue classification
+    - LLM enrichment off the detection path, grouped and cached by anomaly signature
     """
     
     def __init__(self, 
                  project_id: Optional[str] = None,
                  location: str = "us-central1",
                  openai_service: Optional[OpenAIService] = None,
-                 sensitivity: float = 2.0):
+                 sensitivity: float = 2.0,
+                 series_store: Optional[TimeSeriesStore] = None):
         
         self.project_id = project_id or getattr(settings, 'google_cloud_project', 'default-project')
-        self.statistical_analyzer = StatisticalAnalyzer(sensitivity=sensitivity)
+        self.statistical_analyzer = StatisticalAnalyzer(sensitivity=sensitivity, series_store=series_store)
         self.vertex_predictor = VertexAIPredictor(self.project_id, location)
         self.openai_service = openai_service or OpenAIService()
         
@@ -383,6 +434,19 @@ class AnomalyDetector:
         # Configuration
         self.analysis_interval = timedelta(minutes=5)
         self.max_anomaly_history = 1000
+
+        # LLM enrichment runs on a bounded worker pool; anomalies sharing a
+        # (metric, type, severity) signature within the window are enriched once
+        self.enrichment_workers = 4
+        self.enrichment_queue_size = 256
+        self.enrichment_window = timedelta(minutes=5)
+        self.enrichment_cache_size = 512
+        self._enrichment_queue: Optional[asyncio.Queue] = None
+        self._enrichment_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._enrichment_tasks: List[asyncio.Task] = []
+        self._pending_enrichments: Dict[Tuple[str, str, str], List[AnomalyDetection]] = {}
+        self._enrichment_cache: "OrderedDict[Tuple[str, str, str], Tuple[str, List[str], float]]" = OrderedDict()
+        self.enrichment_stats = {"queued": 0, "grouped": 0, "cache_hits": 0, "enriched": 0, "failed": 0, "dropped": 0}
         
         logger.info("Anomaly Detector initialized with predictive capabilities")
     
@@ -398,77 +462,130 @@ class AnomalyDetector:
         """
         detected_anomalies = []
         
-        for data_point in time_series.data_points:
-            # Add to statistical analyzer
-            self.statistical_analyzer.add_data_point(time_series.metric_name, data_point)
+        # Add to statistical analyzer and detect anomalies in one vectorized pass
+        anomalies = self.statistical_analyzer.add_data_points(
+            time_series.metric_name, time_series.data_points
+        )
+        
+        for anomaly in anomalies:
+            # Predictions and recommendations are filled in asynchronously
+            self._schedule_enrichment(anomaly, time_series)
+            detected_anomalies.append(anomaly)
             
-            # Detect anomalies
-            anomaly = self.statistical_analyzer.detect_anomalies(time_series.metric_name, data_point)
+            # Store in history
+            self.detected_anomalies.append(anomaly)
             
-            if anomaly:
-                # Enhance anomaly with predictions and recommendations
-                anomaly = await self._enhance_anomaly_detection(anomaly, time_series)
-                detected_anomalies.append(anomaly)
-                
-                # Store in history
-                self.detected_anomalies.append(anomaly)
-                
-                # Trim history if too large
-                if len(self.detected_anomalies) > self.max_anomaly_history:
-                    self.detected_anomalies = self.detected_anomalies[-self.max_anomaly_history:]
-                
-                logger.warning(f"Anomaly detected: {anomaly.description}")
+            # Trim history if too large
+            if len(self.detected_anomalies) > self.max_anomaly_history:
+                self.detected_anomalies = self.detected_anomalies[-self.max_anomaly_history:]
+            
+            logger.warning(f"Anomaly detected: {anomaly.description}")
         
         return detected_anomalies
     
+    @staticmethod
+    def _anomaly_signature(anomaly: AnomalyDetection) -> Tuple[str, str, str]:
+        return anomaly.metric_name, anomaly.anomaly_type.value, anomaly.severity.value
+
+    @staticmethod
+    def _apply_enrichment(anomaly: AnomalyDetection, prediction: str, actions: List[str]) -> None:
+        anomaly.prediction = prediction
+        anomaly.recommended_actions = list(actions)
+
+    def _ensure_enrichment_workers(self) -> asyncio.Queue:
+        """Start the enrichment worker pool on the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._enrichment_queue is None or self._enrichment_loop is not loop:
+            self._enrichment_queue = asyncio.Queue(maxsize=self.enrichment_queue_size)
+            self._enrichment_loop = loop
+            self._pending_enrichments.clear()
+            self._enrichment_tasks = [
+                loop.create_task(self._enrichment_worker(self._enrichment_queue))
+                for _ in range(self.enrichment_workers)
+            ]
+        return self._enrichment_queue
+
+    def _schedule_enrichment(self, anomaly: AnomalyDetection, time_series: TimeSeriesData) -> None:
+        """Queue LLM enrichment, reusing cached or in-flight results for the same signature"""
+        signature = self._anomaly_signature(anomaly)
+
+        cached = self._enrichment_cache.get(signature)
+        if cached is not None and time.monotonic() - cached[2] <= self.enrichment_window.total_seconds():
+            self._enrichment_cache.move_to_end(signature)
+            self._apply_enrichment(anomaly, cached[0], cached[1])
+            self.enrichment_stats["cache_hits"] += 1
+            return
+
+        pending = self._pending_enrichments.get(signature)
+        if pending is not None:
+            pending.append(anomaly)
+            self.enrichment_stats["grouped"] += 1
+            return
+
+        queue = self._ensure_enrichment_workers()
+        try:
+            queue.put_nowait((signature, time_series))
+        except asyncio.QueueFull:
+            logger.warning(f"Enrichment queue full, skipping enrichment for {anomaly.metric_name}")
+            self._apply_enrichment(anomaly, "Monitor for continued deviation", ["Monitor metric closely"])
+            self.enrichment_stats["dropped"] += 1
+            return
+
+        self._pending_enrichments[signature] = [anomaly]
+        self.enrichment_stats["queued"] += 1
+
+    async def _enrichment_worker(self, queue: asyncio.Queue) -> None:
+        """Enrich one anomaly per signature and share the result with its group"""
+        while True:
+            signature, time_series = await queue.get()
+            try:
+                group = self._pending_enrichments.get(signature)
+                if group:
+                    try:
+                        prediction, actions = await self._generate_enrichment(group[0])
+                    except Exception as e:
+                        # Failures get the fallback but are not cached, so the next anomaly retries
+                        logger.error(f"Error enhancing anomaly detection: {str(e)}")
+                        prediction, actions = "Unable to generate prediction", ["Monitor metric closely"]
+                        self.enrichment_stats["failed"] += 1
+                    else:
+                        self._enrichment_cache[signature] = (prediction, list(actions), time.monotonic())
+                        self._enrichment_cache.move_to_end(signature)
+                        while len(self._enrichment_cache) > self.enrichment_cache_size:
+                            self._enrichment_cache.popitem(last=False)
+                        self.enrichment_stats["enriched"] += 1
+
+                    # Anomalies grouped while the request was in flight get the same result
+                    for anomaly in self._pending_enrichments.pop(signature, group):
+                        self._apply_enrichment(anomaly, prediction, actions)
+            except Exception as e:
+                logger.error(f"Error in anomaly enrichment worker: {str(e)}")
+            finally:
+                self._pending_enrichments.pop(signature, None)
+                queue.task_done()
+
+    async def wait_for_enrichment(self) -> None:
+        """Wait until all queued enrichment has completed"""
+        if self._enrichment_queue is not None and self._enrichment_loop is asyncio.get_running_loop():
+            await self._enrichment_queue.join()
+
+    async def shutdown_enrichment(self) -> None:
+        """Stop the enrichment workers"""
+        for task in self._enrichment_tasks:
+            task.cancel()
+        await asyncio.gather(*self._enrichment_tasks, return_exceptions=True)
+        self._enrichment_tasks = []
+        self._enrichment_queue = None
+        self._enrichment_loop = None
+        self._pending_enrichments.clear()
+
     async def _enhance_anomaly_detection(self, 
                                        anomaly: AnomalyDetection,
                                        time_series: TimeSeriesData) -> AnomalyDetection:
         """Enhance anomaly detection with AI-powered insights"""
         try:
-            # Generate prediction using OpenAI
-            prediction_prompt = f"""
-            An anomaly has been detected in the {anomaly.metric_name} metric:
-            
-            - Current value: {anomaly.value}
-            - Expected value: {anomaly.expected_value}
-            - Deviation score: {anomaly.deviation_score}
-            - Anomaly type: {anomaly.anomaly_type.value}
-            - Severity: {anomaly.severity.value}
-            
-            Based on this anomaly, provide:
-            1. A brief prediction of what might happen next
-            2. 3-5 recommended immediate actions
-            
-            Keep the response concise and actionable.
-            """
-            
-            response = await self.openai_service.generate_response(
-                system_prompt="You are an expert system monitoring analyst.",
-                conversation_history=[{"role": "user", "content": prediction_prompt}]
-            )
-            
-            # Parse response to extract prediction and actions
-            lines = response.split('\n')
-            prediction = ""
-            actions = []
-            
-            current_section = None
-            for line in lines:
-                line = line.strip()
-                if "prediction" in line.lower() or "might happen" in line.lower():
-                    current_section = "prediction"
-                elif "action" in line.lower() or "recommend" in line.lower():
-                    current_section = "actions"
-                elif line and current_section == "prediction":
-                    prediction = line
-                elif line and current_section == "actions" and (line.startswith('-') or line.startswith('•')):
-                    actions.append(line.lstrip('-•').strip())
-            
-            # Update anomaly with enhanced information
-            anomaly.prediction = prediction or "Monitor for continued deviation"
-            anomaly.recommended_actions = actions or ["Monitor metric closely", "Check system resources", "Review recent changes"]
-            
+            prediction, actions = await self._generate_enrichment(anomaly)
+            self._apply_enrichment(anomaly, prediction, actions)
         except Exception as e:
             logger.error(f"Error enhancing anomaly detection: {str(e)}")
             anomaly.prediction = "Unable to generate prediction"
@@ -476,6 +593,50 @@ class AnomalyDetector:
         
         return anomaly
     
+    async def _generate_enrichment(self, anomaly: AnomalyDetection) -> Tuple[str, List[str]]:
+        """Ask the LLM for a prediction and recommended actions; raises if the request fails"""
+        # Generate prediction using OpenAI
+        prediction_prompt = f"""
+        An anomaly has been detected in the {anomaly.metric_name} metric:
+        
+        - Current value: {anomaly.value}
+        - Expected value: {anomaly.expected_value}
+        - Deviation score: {anomaly.deviation_score}
+        - Anomaly type: {anomaly.anomaly_type.value}
+        - Severity: {anomaly.severity.value}
+        
+        Based on this anomaly, provide:
+        1. A brief prediction of what might happen next
+        2. 3-5 recommended immediate actions
+        
+        Keep the response concise and actionable.
+        """
+        
+        response = await self.openai_service.generate_response(
+            system_prompt="You are an expert system monitoring analyst.",
+            conversation_history=[{"role": "user", "content": prediction_prompt}]
+        )
+        
+        # Parse response to extract prediction and actions
+        lines = response.split('\n')
+        prediction = ""
+        actions = []
+        
+        current_section = None
+        for line in lines:
+            line = line.strip()
+            if "prediction" in line.lower() or "might happen" in line.lower():
+                current_section = "prediction"
+            elif "action" in line.lower() or "recommend" in line.lower():
+                current_section = "actions"
+            elif line and current_section == "prediction":
+                prediction = line
+            elif line and current_section == "actions" and (line.startswith('-') or line.startswith('•')):
+                actions.append(line.lstrip('-•').strip())
+        
+        return (prediction or "Monitor for continued deviation",
+                actions or ["Monitor metric closely", "Check system resources", "Review recent changes"])
+    
     async def predict_future_metrics(self, 
                                    metric_names: List[str],
                                    steps_ahead: int = 10) -> Dict[str, List[PredictionResult]]:
@@ -489,21 +650,17 @@ class AnomalyDetector:
         Returns:
             Dictionary mapping metric names to prediction results
         """
+        try:
+            forecasts = self.statistical_analyzer.predict_future_values_batch(metric_names, steps_ahead)
+        except Exception as e:
+            logger.error(f"Error predicting metrics: {str(e)}")
+            forecasts = {}
+
         predictions = {}
-        
         for metric_name in metric_names:
-            try:
-                metric_predictions = self.statistical_analyzer.predict_future_values(
-                    metric_name, steps_ahead
-                )
-                predictions[metric_name] = metric_predictions
-                
-                # Cache predictions
-                self.prediction_cache[metric_name] = metric_predictions
-                
-            except Exception as e:
-                logger.error(f"Error predicting {metric_name}: {str(e)}")
-                predictions[metric_name] = []
+            predictions[metric_name] = forecasts.get(metric_name, [])
+            # Cache predictions
+            self.prediction_cache[metric_name] = predictions[metric_name]
         
         return predictions
     
@@ -640,6 +797,12 @@ class AnomalyDetector:
             "severity_distribution": severity_counts,
             "type_distribution": type_counts,
             "vertex_ai_available": self.vertex_predictor.initialized,
-            "metrics_monitored": len(self.statistical_analyzer.metric_windows),
-            "prediction_cache_size": len(self.prediction_cache)
+            "metrics_monitored": len(self.statistical_analyzer.rolling_stats),
+            "series_store": self.statistical_analyzer.series_store.get_stats(),
+            "prediction_cache_size": len(self.prediction_cache),
+            "enrichment": {
+                **self.enrichment_stats,
+                "pending": len(self._pending_enrichments),
+                "cached_signatures": len(self._enrichment_cache)
+            }
         }
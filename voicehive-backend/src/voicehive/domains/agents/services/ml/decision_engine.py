@@ -4,8 +4,10 @@ Integrates ML-based prioritization, anomaly detection, and resource allocation
 """
 import logging
 import asyncio
+import time
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Deque, Dict, Any, List, Optional, Set, Tuple
 from enum import Enum
 from dataclasses import dataclass
 import json
@@ -23,10 +25,15 @@ from voicehive.domains.agents.services.ml.resource_allocator import (
 from voicehive.services.ai.openai_service import OpenAIService
 from voicehive.utils.exceptions import VoiceHiveError, ErrorHandler
 from voicehive.core.settings import get_settings
+from voicehive.utils.priority_queue import KeyedPriorityQueue
+from voicehive.utils.quantiles import LatencyRegistry, get_latency_registry
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Latency registry series for submission-to-result time of scheduled decisions
+DECISION_LATENCY_OPERATION = "decision"
+
 
 class DecisionType(Enum):
     """Types of decisions the engine can make"""
@@ -46,6 +53,16 @@ class DecisionUrgency(Enum):
     LOW = "low"              # < 24 hours
 
 
+# Scheduling deadline for requests without an explicit one (the DecisionUrgency targets)
+URGENCY_DEADLINES = {
+    DecisionUrgency.IMMEDIATE: timedelta(minutes=1),
+    DecisionUrgency.URGENT: timedelta(minutes=5),
+    DecisionUrgency.HIGH: timedelta(minutes=30),
+    DecisionUrgency.NORMAL: timedelta(hours=2),
+    DecisionUrgency.LOW: timedelta(hours=24)
+}
+
+
 @dataclass
 class DecisionContext:
     """Context information for decision making"""
@@ -70,6 +87,11 @@ class DecisionRequest:
     timestamp: datetime
     deadline: Optional[datetime] = None
 
+    @property
+    def effective_deadline(self) -> datetime:
+        """Explicit deadline, or the urgency target counted from the request time"""
+        return self.deadline or self.timestamp + URGENCY_DEADLINES[self.urgency]
+
 
 @dataclass
 class DecisionResult:
@@ -174,12 +196,14 @@ class MultiCriteriaAnalyzer:
             adjusted_weights["risk_level"] *= 1.3
         
         # Increase cost efficiency weight if resource utilization is high
-        avg_utilization = sum(context.resource_utilization.values()) / len(context.resource_utilization)
+        utilization = context.resource_utilization
+        avg_utilization = sum(utilization.values()) / len(utilization) if utilization else 0.0
         if avg_utilization > 0.8:
             adjusted_weights["cost_efficiency"] *= 1.4
         
         # Increase performance weight if recent performance is poor
-        avg_performance = sum(context.current_performance.values()) / len(context.current_performance)
+        performance = context.current_performance
+        avg_performance = sum(performance.values()) / len(performance) if performance else 1.0
         if avg_performance < 0.7:
             adjusted_weights["performance_impact"] *= 1.3
         
@@ -200,12 +224,17 @@ class DecisionEngine:
     - Context-aware decision making
     - Confidence scoring and alternative analysis
     - Execution planning and impact estimation
+    - Versioned context snapshot shared by all requests until its inputs
+      (anomalies, allocator state) change or it ages out
+    - Urgent decisions micro-batched per type and run by a bounded worker
+      pool, earliest deadline first
     """
     
     def __init__(self, 
                  project_id: Optional[str] = None,
                  location: str = "us-central1",
-                 openai_service: Optional[OpenAIService] = None):
+                 openai_service: Optional[OpenAIService] = None,
+                 latency_registry: Optional[LatencyRegistry] = None):
         
         self.project_id = project_id or getattr(settings, 'google_cloud_project', 'default-project')
         
@@ -218,17 +247,40 @@ class DecisionEngine:
         self.multi_criteria_analyzer = MultiCriteriaAnalyzer()
         self.openai_service = openai_service or OpenAIService()
         
-        # Decision state
-        self.pending_decisions: List[DecisionRequest] = []
+        # Decision state; pending requests are ordered by effective deadline
+        self.pending_decisions: KeyedPriorityQueue[DecisionRequest] = KeyedPriorityQueue(
+            key=lambda request: request.id, priority=lambda request: request.effective_deadline
+        )
         self.decision_history: List[DecisionResult] = []
         self.active_decisions: Dict[str, DecisionResult] = {}
         
+        # Context snapshot, rebuilt when its input key changes or after the TTL
+        self.context_ttl_seconds = 30.0
+        self.context_version = 0
+        self._context_snapshot: Optional[DecisionContext] = None
+        self._context_inputs: Optional[Tuple[Any, ...]] = None
+        self._context_built_at = 0.0
+        
+        # Scheduled decisions: per-type queues drained in batches by up to max_decision_workers tasks
+        self.max_decision_workers = 4
+        self.decision_batch_size = 32
+        self.decision_batch_window_seconds = 0.0
+        self._ready_decisions: Dict[DecisionType, KeyedPriorityQueue[DecisionRequest]] = {}
+        self._decision_waiters: Dict[str, Tuple[asyncio.Future, float]] = {}
+        self._decision_workers: Set[asyncio.Task] = set()
+        self._completion_times: Deque[float] = deque(maxlen=1000)
+        self.latency_registry = latency_registry or get_latency_registry()
+        
         # Performance tracking
         self.decision_metrics = {
             "total_decisions": 0,
             "avg_confidence": 0.0,
             "avg_processing_time_ms": 0.0,
-            "success_rate": 0.0
+            "success_rate": 0.0,
+            "batches": 0,
+            "batched_decisions": 0,
+            "context_builds": 0,
+            "context_reuses": 0
         }
         
         logger.info("Enhanced Decision Engine initialized with ML integration")
@@ -254,8 +306,8 @@ class DecisionEngine:
         """
         request_id = str(uuid.uuid4())
         
-        # Gather current context
-        context = await self._gather_decision_context()
+        # Current context (shared snapshot)
+        context = await self._get_decision_context()
         
         request = DecisionRequest(
             id=request_id,
@@ -268,7 +320,7 @@ class DecisionEngine:
             deadline=deadline
         )
         
-        self.pending_decisions.append(request)
+        self.pending_decisions.push(request)
         
         logger.info(f"Decision request {request_id} created for {requesting_agent}")
         
@@ -278,6 +330,31 @@ class DecisionEngine:
         
         return request_id
     
+    def _context_input_key(self) -> Tuple[Any, ...]:
+        """Everything the context is derived from that can change between requests"""
+        anomalies = self.anomaly_detector.detected_anomalies
+        return (
+            self.resource_allocator.state_version,
+            len(anomalies),
+            anomalies[-1] if anomalies else None
+        )
+
+    async def _get_decision_context(self) -> DecisionContext:
+        """Return the context snapshot, rebuilding it only when its inputs changed or it expired"""
+        inputs = self._context_input_key()
+        if (self._context_snapshot is not None and inputs == self._context_inputs
+                and time.monotonic() - self._context_built_at < self.context_ttl_seconds):
+            self.decision_metrics["context_reuses"] += 1
+            return self._context_snapshot
+        
+        context = await self._gather_decision_context()
+        self._context_snapshot = context
+        self._context_inputs = inputs
+        self._context_built_at = time.monotonic()
+        self.context_version += 1
+        self.decision_metrics["context_builds"] += 1
+        return context
+
     async def _gather_decision_context(self) -> DecisionContext:
         """Gather current system context for decision making"""
         try:
@@ -332,16 +409,82 @@ class DecisionEngine:
             )
     
     async def _process_urgent_decision(self, request: DecisionRequest):
-        """Process urgent decisions immediately"""
+        """Schedule an urgent decision on the worker pool and wait for its result"""
         try:
-            result = await self.make_decision(request)
+            result = await self._schedule_decision(request)
             if result:
-                self.active_decisions[result.request_id] = result
-                self.pending_decisions.remove(request)
                 logger.info(f"Urgent decision {request.id} processed immediately")
         except Exception as e:
             logger.error(f"Error processing urgent decision: {str(e)}")
     
+    async def _schedule_decision(self, request: DecisionRequest) -> Optional[DecisionResult]:
+        """Queue a request for batched processing and wait for it"""
+        future = asyncio.get_running_loop().create_future()
+        self._decision_waiters[request.id] = (future, time.perf_counter())
+        
+        queue = self._ready_decisions.get(request.decision_type)
+        if queue is None:
+            queue = self._ready_decisions[request.decision_type] = KeyedPriorityQueue(
+                key=lambda queued: queued.id, priority=lambda queued: queued.effective_deadline
+            )
+        queue.push(request)
+        
+        if len(self._decision_workers) < self.max_decision_workers:
+            worker = asyncio.create_task(self._decision_worker())
+            self._decision_workers.add(worker)
+            worker.add_done_callback(self._decision_workers.discard)
+        
+        return await future
+    
+    async def _decision_worker(self):
+        """Run batches until no scheduled decision is left"""
+        while True:
+            # Let requests submitted in the same burst join the batch
+            await asyncio.sleep(self.decision_batch_window_seconds)
+            batch = self._next_decision_batch()
+            if not batch:
+                # Leave the pool before yielding so a new submission starts a fresh worker
+                self._decision_workers.discard(asyncio.current_task())
+                return
+            await self._run_decision_batch(batch)
+    
+    def _next_decision_batch(self) -> List[DecisionRequest]:
+        """Pop up to decision_batch_size requests of the type whose head has the earliest deadline"""
+        heads = [(queue.peek().effective_deadline, decision_type)
+                 for decision_type, queue in self._ready_decisions.items() if queue]
+        if not heads:
+            return []
+        _, decision_type = min(heads, key=lambda head: head[0])
+        queue = self._ready_decisions[decision_type]
+        return [queue.pop() for _ in range(min(len(queue), self.decision_batch_size))]
+    
+    async def _run_decision_batch(self, batch: List[DecisionRequest]):
+        """Decide a same-type batch and resolve its waiters"""
+        decision_type = batch[0].decision_type
+        start = time.perf_counter()
+        try:
+            results = await self._decide_batch(decision_type, batch)
+        except Exception as e:
+            logger.error(f"Error making {decision_type.value} decisions: {str(e)}")
+            results = [None] * len(batch)
+        
+        finished = time.perf_counter()
+        processing_time = (finished - start) * 1000 / len(batch)
+        self.decision_metrics["batches"] += 1
+        self.decision_metrics["batched_decisions"] += len(batch)
+        
+        for request, result in zip(batch, results):
+            if result is not None:
+                self._record_decision(result, processing_time)
+                self.active_decisions[result.request_id] = result
+                self.pending_decisions.remove(request.id)
+            
+            future, submitted = self._decision_waiters.pop(request.id, (None, finished))
+            self.latency_registry.record(DECISION_LATENCY_OPERATION, (finished - submitted) * 1000)
+            self._completion_times.append(finished)
+            if future is not None and not future.done():
+                future.set_result(result)
+    
     async def make_decision(self, request: DecisionRequest) -> Optional[DecisionResult]:
         """
         Make a decision based on the request
@@ -352,36 +495,62 @@ class DecisionEngine:
         Returns:
             Decision result
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
-            # Route to appropriate decision handler
-            if request.decision_type == DecisionType.IMPROVEMENT_PRIORITIZATION:
-                result = await self._handle_improvement_prioritization(request)
-            elif request.decision_type == DecisionType.RESOURCE_ALLOCATION:
-                result = await self._handle_resource_allocation(request)
-            elif request.decision_type == DecisionType.EMERGENCY_RESPONSE:
-                result = await self._handle_emergency_response(request)
-            elif request.decision_type == DecisionType.CONFLICT_RESOLUTION:
-                result = await self._handle_conflict_resolution(request)
-            elif request.decision_type == DecisionType.STRATEGIC_PLANNING:
-                result = await self._handle_strategic_planning(request)
-            else:
-                raise VoiceHiveError(f"Unknown decision type: {request.decision_type}")
-            
-            # Update metrics
-            processing_time = (datetime.now() - start_time).total_seconds() * 1000
-            self._update_decision_metrics(result, processing_time)
-            
-            # Store in history
-            self.decision_history.append(result)
-            
+            result = (await self._decide_batch(request.decision_type, [request]))[0]
+            if result is not None:
+                self._record_decision(result, (time.perf_counter() - start_time) * 1000)
             return result
             
         except Exception as e:
             logger.error(f"Error making decision {request.id}: {str(e)}")
             return None
     
+    async def _decide_batch(self,
+                            decision_type: DecisionType,
+                            requests: List[DecisionRequest]) -> List[Optional[DecisionResult]]:
+        """Route a batch of same-type requests to its handler (one result per request, None on failure)"""
+        if decision_type == DecisionType.IMPROVEMENT_PRIORITIZATION:
+            results = []
+            for request in requests:
+                try:
+                    results.append(await self._handle_improvement_prioritization(request))
+                except Exception as e:
+                    logger.error(f"Error making decision {request.id}: {str(e)}")
+                    results.append(None)
+            return results
+        elif decision_type == DecisionType.RESOURCE_ALLOCATION:
+            return await self._handle_resource_allocation(requests)
+        elif decision_type == DecisionType.EMERGENCY_RESPONSE:
+            return await self._handle_emergency_response(requests)
+        elif decision_type == DecisionType.CONFLICT_RESOLUTION:
+            return await self._handle_conflict_resolution(requests)
+        elif decision_type == DecisionType.STRATEGIC_PLANNING:
+            return await self._handle_strategic_planning(requests)
+        else:
+            raise VoiceHiveError(f"Unknown decision type: {decision_type}")
+    
+    def _record_decision(self, result: DecisionResult, processing_time_ms: float):
+        """Update metrics and history for a completed decision"""
+        self._update_decision_metrics(result, processing_time_ms)
+        self.decision_history.append(result)
+    
+    def _analyze_per_context(self,
+                             requests: List[DecisionRequest],
+                             alternatives: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run the multi-criteria analysis once per distinct context in the batch"""
+        analyses: Dict[int, Dict[str, Any]] = {}
+        results = []
+        for request in requests:
+            key = id(request.context)
+            if key not in analyses:
+                analyses[key] = self.multi_criteria_analyzer.analyze_decision(
+                    alternatives, context=request.context
+                )
+            results.append(analyses[key])
+        return results
+    
     async def _handle_improvement_prioritization(self, request: DecisionRequest) -> DecisionResult:
         """Handle improvement prioritization decisions"""
         candidates_data = request.data.get("candidates", [])
@@ -442,61 +611,73 @@ class DecisionEngine:
             timestamp=datetime.now()
         )
     
-    async def _handle_resource_allocation(self, request: DecisionRequest) -> DecisionResult:
-        """Handle resource allocation decisions"""
-        resource_requests = request.data.get("resource_requests", [])
-        
-        # Process resource requests
-        allocation_results = []
-        for req_data in resource_requests:
-            request_id = await self.resource_allocator.request_resources(
-                requesting_agent=req_data.get("agent", request.requesting_agent),
-                resource_type=ResourceType(req_data.get("resource_type", "compute_instance")),
-                amount=req_data.get("amount", 1.0),
-                priority=req_data.get("priority", 3),
-                duration_hours=req_data.get("duration_hours"),
-                justification=req_data.get("justification", "")
-            )
-            allocation_results.append(request_id)
+    async def _handle_resource_allocation(self, requests: List[DecisionRequest]) -> List[Optional[DecisionResult]]:
+        """Handle resource allocation decisions: queue every request's resources, then optimize once"""
+        allocation_results: List[Optional[List[str]]] = []
+        for request in requests:
+            try:
+                request_ids = []
+                for req_data in request.data.get("resource_requests", []):
+                    request_id = await self.resource_allocator.request_resources(
+                        requesting_agent=req_data.get("agent", request.requesting_agent),
+                        resource_type=ResourceType(req_data.get("resource_type", "compute_instance")),
+                        amount=req_data.get("amount", 1.0),
+                        priority=req_data.get("priority", 3),
+                        duration_hours=req_data.get("duration_hours"),
+                        justification=req_data.get("justification", "")
+                    )
+                    request_ids.append(request_id)
+                allocation_results.append(request_ids)
+            except Exception as e:
+                logger.error(f"Error queuing resources for decision {request.id}: {str(e)}")
+                allocation_results.append(None)
         
         # Optimize allocations
         optimization_result = await self.resource_allocator.optimize_allocations()
         
-        return DecisionResult(
-            request_id=request.id,
-            decision_type=request.decision_type,
-            decision={
-                "allocation_requests": allocation_results,
-                "optimization_result": optimization_result
-            },
-            reasoning="Processed resource allocation requests with optimization",
-            confidence=0.85,
-            alternatives=[],
-            execution_plan=[
-                {"step": 1, "action": "Allocate requested resources", "timeline": "immediate"},
-                {"step": 2, "action": "Monitor resource utilization", "timeline": "ongoing"}
-            ],
-            estimated_impact={"cost_change": optimization_result.get("total_cost_per_hour", 0)},
-            timestamp=datetime.now()
-        )
+        return [
+            DecisionResult(
+                request_id=request.id,
+                decision_type=request.decision_type,
+                decision={
+                    "allocation_requests": request_ids,
+                    "optimization_result": optimization_result
+                },
+                reasoning="Processed resource allocation requests with optimization",
+                confidence=0.85,
+                alternatives=[],
+                execution_plan=[
+                    {"step": 1, "action": "Allocate requested resources", "timeline": "immediate"},
+                    {"step": 2, "action": "Monitor resource utilization", "timeline": "ongoing"}
+                ],
+                estimated_impact={"cost_change": optimization_result.get("total_cost_per_hour", 0)},
+                timestamp=datetime.now()
+            ) if request_ids is not None else None
+            for request, request_ids in zip(requests, allocation_results)
+        ]
     
-    async def _handle_emergency_response(self, request: DecisionRequest) -> DecisionResult:
-        """Handle emergency response decisions"""
-        emergency_data = request.data.get("emergency", {})
+    async def _handle_emergency_response(self, requests: List[DecisionRequest]) -> List[DecisionResult]:
+        """Handle emergency response decisions (one model call per batch)"""
+        context = requests[0].context
+        emergencies = "\n".join(
+            f"        {index}. Emergency Type: {data.get('type', 'Unknown')}; "
+            f"Severity: {data.get('severity', 'Unknown')}; "
+            f"Description: {data.get('description', 'No description')}"
+            for index, data in enumerate((request.data.get("emergency", {}) for request in requests), start=1)
+        )
+        headline = "An emergency situation has" if len(requests) == 1 else f"{len(requests)} emergency situations have"
         
         # Generate response alternatives using OpenAI
         response_prompt = f"""
-        An emergency situation has occurred:
+        {headline} occurred:
         
-        Emergency Type: {emergency_data.get('type', 'Unknown')}
-        Severity: {emergency_data.get('severity', 'Unknown')}
-        Description: {emergency_data.get('description', 'No description')}
+{emergencies}
         
         Current System State:
-        - Performance: {request.context.current_performance}
-        - Resource Utilization: {request.context.resource_utilization}
+        - Performance: {context.current_performance}
+        - Resource Utilization: {context.resource_utilization}
         
-        Provide 3 emergency response alternatives with scores (0.0-1.0) for:
+        For each emergency, provide 3 response alternatives with scores (0.0-1.0) for:
         - performance_impact
         - cost_efficiency  
         - risk_level
@@ -549,30 +730,27 @@ class DecisionEngine:
             alternatives = [{"name": "Default Emergency Response", "performance_impact": 0.7}]
         
         # Analyze alternatives
-        analysis = self.multi_criteria_analyzer.analyze_decision(
-            alternatives, context=request.context
-        )
-        
-        return DecisionResult(
-            request_id=request.id,
-            decision_type=request.decision_type,
-            decision=analysis["recommendation"],
-            reasoning=f"Selected emergency response based on multi-criteria analysis",
-            confidence=analysis["confidence"],
-            alternatives=alternatives,
-            execution_plan=[
-                {"step": 1, "action": "Execute emergency response", "timeline": "immediate"},
-                {"step": 2, "action": "Monitor system recovery", "timeline": "ongoing"}
-            ],
-            estimated_impact={"downtime_minutes": 2, "recovery_time_minutes": 15},
-            timestamp=datetime.now()
-        )
+        return [
+            DecisionResult(
+                request_id=request.id,
+                decision_type=request.decision_type,
+                decision=analysis["recommendation"],
+                reasoning=f"Selected emergency response based on multi-criteria analysis",
+                confidence=analysis["confidence"],
+                alternatives=alternatives,
+                execution_plan=[
+                    {"step": 1, "action": "Execute emergency response", "timeline": "immediate"},
+                    {"step": 2, "action": "Monitor system recovery", "timeline": "ongoing"}
+                ],
+                estimated_impact={"downtime_minutes": 2, "recovery_time_minutes": 15},
+                timestamp=datetime.now()
+            )
+            for request, analysis in zip(requests, self._analyze_per_context(requests, alternatives))
+        ]
     
-    async def _handle_conflict_resolution(self, request: DecisionRequest) -> DecisionResult:
+    async def _handle_conflict_resolution(self, requests: List[DecisionRequest]) -> List[DecisionResult]:
         """Handle conflict resolution decisions"""
         # Simplified conflict resolution
-        conflicts = request.data.get("conflicts", [])
-        
         resolution_strategies = [
             {
                 "name": "Priority-based Resolution",
@@ -596,29 +774,26 @@ class DecisionEngine:
             }
         ]
         
-        analysis = self.multi_criteria_analyzer.analyze_decision(
-            resolution_strategies, context=request.context
-        )
-        
-        return DecisionResult(
-            request_id=request.id,
-            decision_type=request.decision_type,
-            decision=analysis["recommendation"],
-            reasoning="Resolved conflicts using multi-criteria analysis",
-            confidence=analysis["confidence"],
-            alternatives=resolution_strategies,
-            execution_plan=[
-                {"step": 1, "action": "Apply conflict resolution", "timeline": "immediate"}
-            ],
-            estimated_impact={"conflicts_resolved": len(conflicts)},
-            timestamp=datetime.now()
-        )
+        return [
+            DecisionResult(
+                request_id=request.id,
+                decision_type=request.decision_type,
+                decision=analysis["recommendation"],
+                reasoning="Resolved conflicts using multi-criteria analysis",
+                confidence=analysis["confidence"],
+                alternatives=resolution_strategies,
+                execution_plan=[
+                    {"step": 1, "action": "Apply conflict resolution", "timeline": "immediate"}
+                ],
+                estimated_impact={"conflicts_resolved": len(request.data.get("conflicts", []))},
+                timestamp=datetime.now()
+            )
+            for request, analysis in zip(requests, self._analyze_per_context(requests, resolution_strategies))
+        ]
     
-    async def _handle_strategic_planning(self, request: DecisionRequest) -> DecisionResult:
+    async def _handle_strategic_planning(self, requests: List[DecisionRequest]) -> List[DecisionResult]:
         """Handle strategic planning decisions"""
         # Simplified strategic planning
-        planning_horizon = request.data.get("planning_horizon_days", 30)
-        
         strategic_options = [
             {
                 "name": "Performance Optimization Focus",
@@ -640,23 +815,23 @@ class DecisionEngine:
             }
         ]
         
-        analysis = self.multi_criteria_analyzer.analyze_decision(
-            strategic_options, context=request.context
-        )
-        
-        return DecisionResult(
-            request_id=request.id,
-            decision_type=request.decision_type,
-            decision=analysis["recommendation"],
-            reasoning=f"Strategic plan for {planning_horizon} days based on current context",
-            confidence=analysis["confidence"],
-            alternatives=strategic_options,
-            execution_plan=[
-                {"step": 1, "action": "Implement strategic plan", "timeline": f"{planning_horizon} days"}
-            ],
-            estimated_impact={"strategic_alignment": 0.8},
-            timestamp=datetime.now()
-        )
+        results = []
+        for request, analysis in zip(requests, self._analyze_per_context(requests, strategic_options)):
+            planning_horizon = request.data.get("planning_horizon_days", 30)
+            results.append(DecisionResult(
+                request_id=request.id,
+                decision_type=request.decision_type,
+                decision=analysis["recommendation"],
+                reasoning=f"Strategic plan for {planning_horizon} days based on current context",
+                confidence=analysis["confidence"],
+                alternatives=strategic_options,
+                execution_plan=[
+                    {"step": 1, "action": "Implement strategic plan", "timeline": f"{planning_horizon} days"}
+                ],
+                estimated_impact={"strategic_alignment": 0.8},
+                timestamp=datetime.now()
+            ))
+        return results
     
     def _update_decision_metrics(self, result: DecisionResult, processing_time_ms: float):
         """Update decision engine metrics"""
@@ -685,13 +860,13 @@ class DecisionEngine:
             }
         
         # Check pending decisions
-        for request in self.pending_decisions:
-            if request.id == request_id:
-                return {
-                    "status": "pending",
-                    "urgency": request.urgency.value,
-                    "timestamp": request.timestamp.isoformat()
-                }
+        request = self.pending_decisions.get(request_id)
+        if request is not None:
+            return {
+                "status": "pending",
+                "urgency": request.urgency.value,
+                "timestamp": request.timestamp.isoformat()
+            }
         
         # Check history
         for result in self.decision_history:
@@ -705,14 +880,33 @@ class DecisionEngine:
         
         return None
     
+    def get_throughput(self, window_seconds: float = 60.0) -> float:
+        """Scheduled decisions completed per second over the recent window"""
+        now = time.perf_counter()
+        recent = [t for t in self._completion_times if now - t <= window_seconds]
+        if len(recent) < 2:
+            return 0.0
+        span = max(now - recent[0], recent[-1] - recent[0])
+        return len(recent) / span if span > 0 else 0.0
+    
     def get_engine_statistics(self) -> Dict[str, Any]:
         """Get decision engine statistics"""
+        latency = self.latency_registry.get_quantiles(DECISION_LATENCY_OPERATION)
+        batches = self.decision_metrics["batches"]
         return {
             "total_decisions": self.decision_metrics["total_decisions"],
             "pending_decisions": len(self.pending_decisions),
             "active_decisions": len(self.active_decisions),
             "avg_confidence": self.decision_metrics["avg_confidence"],
             "avg_processing_time_ms": self.decision_metrics["avg_processing_time_ms"],
+            "decisions_per_second": round(self.get_throughput(), 2),
+            "decision_latency_ms": latency,
+            "batches": batches,
+            "avg_batch_size": round(self.decision_metrics["batched_decisions"] / batches, 2) if batches else 0.0,
+            "active_workers": len(self._decision_workers),
+            "context_version": self.context_version,
+            "context_builds": self.decision_metrics["context_builds"],
+            "context_reuses": self.decision_metrics["context_reuses"],
             "ml_components": {
                 "prioritization_engine": "available",
                 "anomaly_detector": "available",
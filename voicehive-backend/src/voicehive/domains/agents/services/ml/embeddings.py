@@ -0,0 +1,200 @@
+"""
+Text embedding utilities for ML scoring
+Content-addressed embedding cache, local hashed embeddings and vectorized similarity
+"""
+
+import hashlib
+import logging
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def content_key(text: str) -> str:
+    """Stable content address of a text"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def hashed_embeddings(texts: List[str], dimension: int = 768) -> np.ndarray:
+    """
+    Deterministic local embeddings by feature hashing
+
+    Unigrams and bigrams are hashed (process-independent) into signed
+    buckets and the vectors L2-normalized, so cosine similarity reflects
+    lexical overlap. Used when no embedding model is available.
+    """
+    vectors = np.zeros((len(texts), dimension), dtype=np.float32)
+    for row, text in enumerate(texts):
+        tokens = TOKEN_PATTERN.findall(text.lower())
+        features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        if not features:
+            continue
+        digests = [hashlib.blake2b(feature.encode(), digest_size=8).digest() for feature in features]
+        hashed = np.frombuffer(b"".join(digests), dtype=np.uint64)
+        signs = np.where(hashed >> np.uint64(63), -1.0, 1.0).astype(np.float32)
+        np.add.at(vectors[row], (hashed % np.uint64(dimension)).astype(np.int64), signs)
+
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.divide(vectors, norms, out=vectors, where=norms > 0)
+    return vectors
+
+
+def batch_texts(texts: List[str], max_items: int, max_chars: int) -> List[List[int]]:
+    """Split text indices into request batches bounded by item count and total characters"""
+    batches: List[List[int]] = []
+    current: List[int] = []
+    size = 0
+    for index, text in enumerate(texts):
+        if current and (len(current) >= max_items or size + len(text) > max_chars):
+            batches.append(current)
+            current, size = [], 0
+        current.append(index)
+        size += len(text)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def cosine_similarity_matrix(vectors: np.ndarray) -> np.ndarray:
+    """Pairwise cosine similarity of row vectors"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    unit = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+    return unit @ unit.T
+
+
+def group_near_duplicates(vectors: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    Cluster rows whose cosine similarity is at least threshold
+
+    Returns a label per row: the index of its cluster representative (the
+    earliest member). Clusters are connected components of the similarity
+    graph, found by label propagation over the thresholded matrix.
+    """
+    count = len(vectors)
+    labels = np.arange(count)
+    if count < 2:
+        return labels
+
+    adjacent = cosine_similarity_matrix(vectors) >= threshold
+    rows, cols = np.nonzero(np.triu(adjacent, k=1))
+    # Propagate minimum labels along edges until stable (graph diameter rounds)
+    while len(rows):
+        merged = np.minimum(labels[rows], labels[cols])
+        updated = labels.copy()
+        np.minimum.at(updated, rows, merged)
+        np.minimum.at(updated, cols, merged)
+        if np.array_equal(updated, labels):
+            break
+        labels = updated
+    return labels
+
+
+class EmbeddingCache:
+    """
+    Content-addressed embedding cache
+
+    Features:
+    - Vectors keyed by the SHA-256 of their text
+    - Optional persistence to a memory-mapped float32 file plus a key sidecar,
+      so embeddings survive restarts and are paged in on demand
+    - Geometric growth of the backing store
+    """
+
+    def __init__(self, dimension: int = 768, path: Optional[str] = None, initial_capacity: int = 1024):
+        self.dimension = dimension
+        self.path = path
+        self._rows: Dict[str, int] = {}
+        self.stats = {"hits": 0, "misses": 0, "stored": 0}
+
+        if path:
+            self._keys_path = f"{path}.keys"
+            if os.path.exists(path) and os.path.exists(self._keys_path):
+                self._load()
+            else:
+                self._vectors = self._open_file(initial_capacity, create=True)
+                open(self._keys_path, "w").close()
+        else:
+            self._vectors = np.zeros((initial_capacity, dimension), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _open_file(self, capacity: int, create: bool = False) -> np.memmap:
+        return np.memmap(self.path, dtype=np.float32, mode="w+" if create else "r+",
+                         shape=(capacity, self.dimension))
+
+    def _load(self) -> None:
+        with open(self._keys_path) as keys_file:
+            keys = keys_file.read().split()
+        capacity = os.path.getsize(self.path) // (4 * self.dimension)
+        # Rows past the last recorded key were never committed
+        keys = keys[:capacity]
+        self._rows = {key: row for row, key in enumerate(keys)}
+        self._vectors = self._open_file(max(capacity, 1))
+
+    def _grow(self, needed: int) -> None:
+        capacity = len(self._vectors)
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, 2 * capacity)
+        if self.path:
+            self._vectors.flush()
+            del self._vectors
+            with open(self.path, "r+b") as vector_file:
+                vector_file.truncate(new_capacity * self.dimension * 4)
+            self._vectors = self._open_file(new_capacity)
+        else:
+            grown = np.zeros((new_capacity, self.dimension), dtype=np.float32)
+            grown[:capacity] = self._vectors
+            self._vectors = grown
+
+    def lookup(self, texts: List[str]) -> Tuple[np.ndarray, List[int]]:
+        """Cached vectors for texts (zero rows where missing) and the missing indices"""
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        rows, found, missing = [], [], []
+        for index, text in enumerate(texts):
+            row = self._rows.get(content_key(text))
+            if row is None:
+                missing.append(index)
+            else:
+                rows.append(row)
+                found.append(index)
+        if rows:
+            vectors[found] = self._vectors[rows]
+        self.stats["hits"] += len(found)
+        self.stats["misses"] += len(missing)
+        return vectors, missing
+
+    def store(self, texts: List[str], vectors: np.ndarray) -> None:
+        """Add vectors for texts not yet cached"""
+        new_keys, new_rows, seen = [], [], set()
+        for index, text in enumerate(texts):
+            key = content_key(text)
+            if key not in self._rows and key not in seen:
+                seen.add(key)
+                new_keys.append(key)
+                new_rows.append(index)
+        if not new_keys:
+            return
+
+        start = len(self._rows)
+        self._grow(start + len(new_keys))
+        self._vectors[start:start + len(new_keys)] = np.asarray(vectors, dtype=np.float32)[new_rows]
+        for offset, key in enumerate(new_keys):
+            self._rows[key] = start + offset
+        if self.path:
+            # Vectors are flushed before their keys, so a crash never exposes unwritten rows
+            self._vectors.flush()
+            with open(self._keys_path, "a") as keys_file:
+                keys_file.write("\n".join(new_keys) + "\n")
+        self.stats["stored"] += len(new_keys)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {**self.stats, "entries": len(self._rows), "capacity": len(self._vectors)}
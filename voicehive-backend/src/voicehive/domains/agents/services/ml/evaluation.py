@@ -0,0 +1,205 @@
+"""
+Objective evaluation backends for the multi-objective optimizer
+Vectorized batch evaluation, process-pool evaluation and a parameter-vector memo cache
+"""
+
+import asyncio
+import logging
+import math
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Dict, List, Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+from voicehive.domains.agents.services.ml.pareto import ParameterEncoding
+
+logger = logging.getLogger(__name__)
+
+# Objective function over decoded parameter columns, returning one value per row
+BatchObjective = Callable[[Dict[str, np.ndarray]], np.ndarray]
+
+# Objective function over one decoded parameter dictionary, returning one value per objective
+SolutionObjective = Callable[[Dict[str, Any]], Sequence[float]]
+
+
+class EvaluationBackend(ABC):
+    """Evaluates a matrix of encoded parameter vectors against all objectives"""
+
+    @abstractmethod
+    async def evaluate(self,
+                       parameters: np.ndarray,
+                       encoding: ParameterEncoding,
+                       objective_names: List[str]) -> np.ndarray:
+        """Return an (n_solutions, n_objectives) matrix of raw objective values"""
+
+    def close(self) -> None:
+        """Release backend resources"""
+
+
+class VectorizedBackend(EvaluationBackend):
+    """
+    Batch evaluation for NumPy-expressible objectives
+
+    Each objective function receives the whole batch as decoded parameter
+    columns and returns a value per solution, so a generation is a handful of
+    array operations instead of a Python loop.
+    """
+
+    def __init__(self, objectives: Dict[str, BatchObjective]):
+        self.objectives = objectives
+
+    async def evaluate(self,
+                       parameters: np.ndarray,
+                       encoding: ParameterEncoding,
+                       objective_names: List[str]) -> np.ndarray:
+        columns = encoding.columns(parameters)
+        values = np.empty((len(parameters), len(objective_names)))
+        for column, name in enumerate(objective_names):
+            if name not in self.objectives:
+                raise KeyError(f"No batch function registered for objective '{name}'")
+            values[:, column] = np.broadcast_to(
+                np.asarray(self.objectives[name](columns), dtype=float), len(parameters)
+            )
+        return values
+
+
+def _evaluate_chunk(function: SolutionObjective, rows: List[Dict[str, Any]]) -> List[Sequence[float]]:
+    """Evaluate a chunk of solutions inside a worker process"""
+    return [function(parameters) for parameters in rows]
+
+
+class ProcessPoolBackend(EvaluationBackend):
+    """
+    Process-pool evaluation for CPU-bound Python objectives
+
+    Features:
+    - Solutions are shipped to workers in chunks to amortize pickling overhead
+    - The event loop stays responsive while workers run
+    - The objective function must be picklable (a module-level function)
+    """
+
+    def __init__(self,
+                 function: SolutionObjective,
+                 max_workers: Optional[int] = None,
+                 chunk_size: Optional[int] = None,
+                 executor: Optional[Executor] = None):
+        self.function = function
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def _chunk_size(self, count: int) -> int:
+        if self.chunk_size:
+            return self.chunk_size
+        workers = self.max_workers or getattr(self.executor, "_max_workers", 1)
+        # A few chunks per worker balances load without per-solution round trips
+        return max(1, math.ceil(count / (workers * 4)))
+
+    async def evaluate(self,
+                       parameters: np.ndarray,
+                       encoding: ParameterEncoding,
+                       objective_names: List[str]) -> np.ndarray:
+        rows = [encoding.decode(row) for row in parameters]
+        size = self._chunk_size(len(rows))
+
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*[
+            loop.run_in_executor(self.executor, _evaluate_chunk, self.function, rows[start:start + size])
+            for start in range(0, len(rows), size)
+        ])
+
+        values = np.array([value for chunk in results for value in chunk], dtype=float)
+        return values.reshape(len(parameters), len(objective_names))
+
+    def close(self) -> None:
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+class EvaluationCache:
+    """
+    LRU memo of objective values keyed by encoded parameter vectors
+
+    Elites and unmutated children reappear every generation; their values are
+    looked up instead of being re-evaluated.
+    """
+
+    def __init__(self, max_size: int = 50000):
+        self.max_size = max_size
+        self._values: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @staticmethod
+    def keys(parameters: np.ndarray) -> List[bytes]:
+        """Cache keys for each row of a parameter matrix"""
+        parameters = np.ascontiguousarray(parameters, dtype=float)
+        return [row.tobytes() for row in parameters]
+
+    def lookup(self, keys: List[bytes], width: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Resolve rows from the cache
+
+        Returns (values, missing, inverse): values holds cached rows, missing
+        indexes the first occurrence of each distinct uncached key, and
+        inverse maps every uncached row to its position in missing (-1 when
+        cached).
+        """
+        values = np.empty((len(keys), width))
+        inverse = np.full(len(keys), -1, dtype=np.int64)
+        missing: Dict[bytes, int] = {}
+        first_rows: List[int] = []
+
+        for index, key in enumerate(keys):
+            hit = self._values.get(key)
+            if hit is not None:
+                self._values.move_to_end(key)
+                values[index] = hit
+                self.hits += 1
+                continue
+
+            position = missing.get(key)
+            if position is None:
+                position = missing[key] = len(first_rows)
+                first_rows.append(index)
+                self.misses += 1
+            else:
+                self.hits += 1  # duplicate within the batch, evaluated once
+            inverse[index] = position
+
+        return values, np.array(first_rows, dtype=np.int64), inverse
+
+    def store(self, keys: List[bytes], values: np.ndarray) -> None:
+        """Memoize evaluated rows"""
+        for key, row in zip(keys, values):
+            self._values[key] = row.copy()
+            self._values.move_to_end(key)
+        while len(self._values) > self.max_size:
+            self._values.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all memoized values"""
+        self._values.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache size and hit statistics"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._values),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0
+        }
@@ -0,0 +1,324 @@
+"""
+Seasonality-aware metric forecasting
+Additive Holt-Winters vectorized across metrics, resumable per metric, over a
+tiered time-series store
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from voicehive.utils.timeseries import TIER_WIDTHS, TimeSeriesStore
+
+logger = logging.getLogger(__name__)
+
+# Seasons tried on the hourly tier, longest first (weekly, daily)
+HOURLY_SEASONS = (24 * 7, 24)
+
+# Minimum samples for a non-seasonal forecast
+MIN_FORECAST_POINTS = 10
+
+# Initialization block for non-seasonal series: level and trend come from
+# the means of the first two blocks rather than two single noisy samples
+NON_SEASONAL_BLOCK = MIN_FORECAST_POINTS // 2
+
+
+@dataclass
+class HoltWintersParams:
+    """Smoothing parameters (level, trend, season) and trend damping"""
+    alpha: float = 0.3
+    beta: float = 0.05
+    gamma: float = 0.3
+    phi: float = 0.99
+
+
+@dataclass
+class HoltWintersState:
+    """Model state for a batch of series; row i belongs to series i"""
+    season_length: int
+    level: np.ndarray
+    trend: np.ndarray
+    seasonal: np.ndarray      # (n, season_length), indexed by step % season_length
+    squared_error: np.ndarray
+    error_count: np.ndarray
+    last_step: np.ndarray     # absolute step index of the last observation processed
+
+    def row(self, index: int) -> "HoltWintersState":
+        """Single-series state (copied, so it does not pin the batch arrays)"""
+        window = slice(index, index + 1)
+        return HoltWintersState(
+            self.season_length, self.level[window].copy(), self.trend[window].copy(),
+            self.seasonal[window].copy(), self.squared_error[window].copy(),
+            self.error_count[window].copy(), self.last_step[window].copy()
+        )
+
+    @classmethod
+    def stack(cls, states: List["HoltWintersState"]) -> "HoltWintersState":
+        return cls(
+            states[0].season_length,
+            np.concatenate([state.level for state in states]),
+            np.concatenate([state.trend for state in states]),
+            np.concatenate([state.seasonal for state in states]),
+            np.concatenate([state.squared_error for state in states]),
+            np.concatenate([state.error_count for state in states]),
+            np.concatenate([state.last_step for state in states])
+        )
+
+
+def initialize_holt_winters(values: np.ndarray, first_step: int, season_length: int) -> HoltWintersState:
+    """
+    Initialize state from the first two seasons (or blocks) of each row
+
+    values is (n, T) with NaN left-padding; column j is step first_step + j.
+    Rows need at least one full block of data after their first sample.
+    """
+    count, width = values.shape
+    m = season_length
+    block = m if m > 1 else NON_SEASONAL_BLOCK
+    starts = np.argmax(~np.isnan(values), axis=1)
+    rows = np.arange(count)
+
+    first_block = values[rows[:, None], starts[:, None] + np.arange(block)]
+    level = first_block.mean(axis=1)
+
+    trend = np.zeros(count)
+    has_second = starts + 2 * block <= width
+    if has_second.any():
+        second = values[rows[has_second, None], starts[has_second, None] + block + np.arange(block)]
+        trend[has_second] = (second.mean(axis=1) - level[has_second]) / block
+
+    seasonal = np.zeros((count, m))
+    if m > 1:
+        phases = (first_step + starts[:, None] + np.arange(m)) % m
+        # Deviations from the first season's (detrended) line
+        ramp = trend[:, None] * (np.arange(m) - (m - 1) / 2)
+        seasonal[rows[:, None], phases] = first_block - level[:, None] - ramp
+
+    # Level sits at the block centre; move it to the block end, where the recursion resumes
+    return HoltWintersState(
+        m, level + trend * (block - 1) / 2, trend, seasonal,
+        np.zeros(count), np.zeros(count), first_step + starts + block - 1
+    )
+
+
+def update_holt_winters(state: HoltWintersState,
+                        values: np.ndarray,
+                        first_step: int,
+                        params: HoltWintersParams) -> HoltWintersState:
+    """
+    Run the additive Holt-Winters recursion over new observations
+
+    One NumPy step per time column updates every series at once. Columns at
+    or before a row's last_step, and NaN observations, leave that row alone.
+    """
+    m = state.season_length
+    alpha, beta, gamma, phi = params.alpha, params.beta, params.gamma, params.phi
+    level, trend, seasonal = state.level, state.trend, state.seasonal
+    squared_error, error_count = state.squared_error, state.error_count
+    rows = np.arange(len(level))
+
+    for column in range(values.shape[1]):
+        step = first_step + column
+        observed = values[:, column]
+        active = (step > state.last_step) & ~np.isnan(observed)
+        if not active.any():
+            continue
+
+        phase = step % m
+        season = seasonal[:, phase] if m > 1 else 0.0
+        forecast = level + phi * trend + season
+        error = np.where(active, observed - forecast, 0.0)
+
+        new_level = alpha * (observed - season) + (1 - alpha) * (level + phi * trend)
+        new_trend = beta * (new_level - level) + (1 - beta) * phi * trend
+        level = np.where(active, new_level, level)
+        trend = np.where(active, new_trend, trend)
+        if m > 1:
+            seasonal[rows, phase] = np.where(active, gamma * (observed - level) + (1 - gamma) * season, season)
+
+        squared_error = squared_error + error * error
+        error_count = error_count + active
+        state.last_step = np.where(active, step, state.last_step)
+
+    state.level, state.trend = level, trend
+    state.squared_error, state.error_count = squared_error, error_count
+    return state
+
+
+def forecast_holt_winters(state: HoltWintersState,
+                          horizon: int,
+                          params: HoltWintersParams) -> Tuple[np.ndarray, np.ndarray]:
+    """Point forecasts and standard errors for steps 1..horizon after each row's last step"""
+    steps = np.arange(1, horizon + 1)
+    phi = params.phi
+    if phi == 1:
+        damped = steps.astype(float)
+    else:
+        damped = phi * (1 - phi ** steps) / (1 - phi)
+
+    mean = state.level[:, None] + state.trend[:, None] * damped[None, :]
+    if state.season_length > 1:
+        phases = (state.last_step[:, None] + steps[None, :]) % state.season_length
+        mean = mean + np.take_along_axis(state.seasonal, phases, axis=1)
+
+    sigma = np.sqrt(state.squared_error / np.maximum(state.error_count, 1))
+    # Error variance grows with the horizon as level shocks accumulate
+    spread = np.sqrt(1 + (steps - 1) * params.alpha ** 2)
+    return mean, sigma[:, None] * spread[None, :]
+
+
+@dataclass
+class MetricForecast:
+    """Forecast for one metric"""
+    metric_name: str
+    timestamps: np.ndarray
+    values: np.ndarray
+    std: np.ndarray
+    trend: float              # underlying per-step trend, seasonality removed
+    tier: str
+    season_length: int
+    step_seconds: float
+
+    @property
+    def lower(self) -> np.ndarray:
+        return self.values - 1.96 * self.std
+
+    @property
+    def upper(self) -> np.ndarray:
+        return self.values + 1.96 * self.std
+
+
+class ForecastEngine:
+    """
+    Batch forecaster over a TimeSeriesStore
+
+    Features:
+    - Picks the hourly tier with weekly or daily seasonality when enough
+      history exists, otherwise non-seasonal Holt on the 1-minute or raw tier
+    - Metrics sharing a tier, season and last step are forecast in one NumPy pass
+    - Model state is kept per metric and only new samples are fed on refit
+    """
+
+    def __init__(self, store: TimeSeriesStore, params: Optional[HoltWintersParams] = None):
+        self.store = store
+        self.params = params or HoltWintersParams()
+        self._models: Dict[Tuple[str, str, int], HoltWintersState] = {}
+        self.stats = {"fits": 0, "incremental_updates": 0, "forecasts": 0}
+
+    def _plan(self, metric_name: str) -> Optional[Tuple[str, int]]:
+        """Choose tier and season length for a metric"""
+        series = self.store.get(metric_name)
+        if series is None:
+            return None
+        hourly = len(series.tier("1h"))
+        for season in HOURLY_SEASONS:
+            if hourly >= 2 * season:
+                return "1h", season
+        if len(series.tier("1m")) >= 2 * MIN_FORECAST_POINTS:
+            return "1m", 1
+        if len(series.raw) >= MIN_FORECAST_POINTS:
+            return "raw", 1
+        return None
+
+    def _steps(self, metric_name: str, tier: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Absolute step indices and values of a metric's tier"""
+        ring = self.store.get(metric_name).tier(tier)
+        if tier == "raw":
+            return ring.indices(), ring.values
+        return np.rint(ring.timestamps / TIER_WIDTHS[tier]).astype(np.int64), ring.values
+
+    def forecast(self, metric_names: List[str], horizon: int) -> Dict[str, MetricForecast]:
+        """Forecast horizon steps ahead for each metric with enough history"""
+        groups: Dict[Tuple[str, int, int], List[str]] = {}
+        for metric_name in metric_names:
+            plan = self._plan(metric_name)
+            if plan is None:
+                continue
+            steps, _ = self._steps(metric_name, plan[0])
+            groups.setdefault((plan[0], plan[1], int(steps[-1])), []).append(metric_name)
+
+        forecasts = {}
+        for (tier, season, last_step), names in groups.items():
+            forecasts.update(self._forecast_group(names, tier, season, last_step, horizon))
+        return forecasts
+
+    def _forecast_group(self,
+                        names: List[str],
+                        tier: str,
+                        season: int,
+                        last_step: int,
+                        horizon: int) -> Dict[str, MetricForecast]:
+        """Fit or update models for metrics ending at the same step, then forecast"""
+        series = {name: self._steps(name, tier) for name in names}
+        warm, cold = [], []
+        for name in names:
+            model = self._models.get((name, tier, season))
+            first_step = int(series[name][0][0])
+            # Resume only if no samples were evicted since the model last saw the series
+            if model is not None and first_step <= int(model.last_step[0]) + 1:
+                warm.append(name)
+            else:
+                cold.append(name)
+
+        states = {}
+        if cold:
+            states.update(self._fit(cold, series, season, last_step))
+        if warm:
+            states.update(self._update(warm, series, tier, season, last_step))
+
+        ordered = [states[name] for name in names]
+        batch = HoltWintersState.stack(ordered)
+        mean, std = forecast_holt_winters(batch, horizon, self.params)
+        self.stats["forecasts"] += len(names)
+
+        forecasts = {}
+        for index, name in enumerate(names):
+            self._models[(name, tier, season)] = batch.row(index)
+            if tier == "raw":
+                timestamps = self.store.get(name).raw.timestamps
+                step_seconds = float(np.median(np.diff(timestamps))) if len(timestamps) > 1 else 60.0
+                future = timestamps[-1] + step_seconds * np.arange(1, horizon + 1)
+            else:
+                step_seconds = float(TIER_WIDTHS[tier])
+                future = (last_step + np.arange(1, horizon + 1)) * step_seconds
+            forecasts[name] = MetricForecast(
+                name, future, mean[index], std[index], float(batch.trend[index]), tier, season, step_seconds
+            )
+        return forecasts
+
+    def _matrix(self, names: List[str], series: Dict[str, Tuple[np.ndarray, np.ndarray]],
+                first_step: int, last_step: int) -> np.ndarray:
+        """Right-aligned (n, T) matrix of samples between two steps, NaN where absent"""
+        matrix = np.full((len(names), last_step - first_step + 1), np.nan)
+        for row, name in enumerate(names):
+            steps, values = series[name]
+            keep = steps >= first_step
+            matrix[row, steps[keep] - first_step] = values[keep]
+        return matrix
+
+    def _fit(self, names, series, season, last_step) -> Dict[str, HoltWintersState]:
+        first_step = min(int(series[name][0][0]) for name in names)
+        matrix = self._matrix(names, series, first_step, last_step)
+        state = initialize_holt_winters(matrix, first_step, season)
+        update_holt_winters(state, matrix, first_step, self.params)
+        self.stats["fits"] += len(names)
+        return {name: state.row(index) for index, name in enumerate(names)}
+
+    def _update(self, names, series, tier, season, last_step) -> Dict[str, HoltWintersState]:
+        state = HoltWintersState.stack([self._models[(name, tier, season)] for name in names])
+        first_step = int(state.last_step.min()) + 1
+        if first_step <= last_step:
+            matrix = self._matrix(names, series, first_step, last_step)
+            update_holt_winters(state, matrix, first_step, self.params)
+        self.stats["incremental_updates"] += len(names)
+        return {name: state.row(index) for index, name in enumerate(names)}
+
+    def forget(self, metric_name: str) -> None:
+        """Drop cached models for a metric"""
+        for key in [key for key in self._models if key[0] == metric_name]:
+            del self._models[key]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {**self.stats, "cached_models": len(self._models)}
@@ -11,15 +11,21 @@ Uses hybrid AI approach with Vertex AI for numerical optimization and OpenAI for
 
 import logging
 import asyncio
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple, Union
-from dataclasses import dataclass, field
+from collections import deque
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple, Union
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import json
 import numpy as np
-from concurrent.futures import ThreadPoolExecutor
 
 from voicehive.services.ai.openai_service import OpenAIService
+from voicehive.domains.agents.services.ml.evaluation import EvaluationBackend, EvaluationCache
+from voicehive.domains.agents.services.ml.pareto import (
+    ParameterEncoding, ParetoArchive, Population, estimate_hypervolume, hypervolume, non_dominated_sort,
+    tournament_select, uniform_crossover, mutate
+)
 
 logger = logging.getLogger(__name__)
 
@@ -68,11 +74,51 @@ class Solution:
 class OptimizationResult:
     """Results from multi-objective optimization"""
     pareto_front: List[Solution]
-    all_solutions: List[Solution]
     best_compromise: Solution
     optimization_time: float
     convergence_metrics: Dict[str, float]
     ai_recommendations: List[str]
+    population: Optional[Population] = None
+    objective_names: List[str] = field(default_factory=list)
+    convergence_history: List[Dict[str, float]] = field(default_factory=list)
+    stop_reason: str = "max_generations"
+
+    @property
+    def all_solutions(self) -> List[Solution]:
+        """Materialize the final population as Solution objects"""
+        if self.population is None:
+            return self.pareto_front
+        return solutions_from_population(self.population, self.objective_names)
+
+
+@dataclass
+class OptimizationProgress:
+    """Snapshot of the improving Pareto front during an optimization run"""
+    generation: int
+    elapsed_seconds: float
+    hypervolume: float
+    pareto_front: List[Solution]
+    evaluations: int = 0
+
+
+def solutions_from_population(population: Population,
+                              objective_names: List[str],
+                              indices: Optional[np.ndarray] = None) -> List[Solution]:
+    """Build Solution objects for selected population rows"""
+    if indices is None:
+        indices = np.arange(len(population))
+
+    solutions = []
+    for index in indices.tolist():
+        values = population.values[index] if population.values is not None else ()
+        solutions.append(Solution(
+            id=f"sol_{int(population.uids[index])}",
+            parameters=population.encoding.decode(population.parameters[index]),
+            objective_values={name: float(value) for name, value in zip(objective_names, values)},
+            pareto_rank=int(population.ranks[index]) if population.ranks is not None else 0,
+            feasible=bool(population.feasible[index])
+        ))
+    return solutions
 
 
 class MultiObjectiveOptimizer:
@@ -81,24 +127,63 @@ class MultiObjectiveOptimizer:
     
     Combines numerical optimization algorithms with AI reasoning for
     strategic decision making in complex multi-objective scenarios.
+    Populations are kept as NumPy arrays (NSGA-II); Solution objects are
+    only materialized for the Pareto front.
     """
     
-    def __init__(self, openai_service: Optional[OpenAIService] = None):
+    def __init__(self, openai_service: Optional[OpenAIService] = None, seed: Optional[int] = None):
         self.openai_service = openai_service or OpenAIService()
         self.objectives: Dict[str, Objective] = {}
         self.constraints: List[Dict[str, Any]] = []
         self.solutions: List[Solution] = []
-        self.optimization_history: List[OptimizationResult] = []
+        # Bounded; stored results drop their population so memory stays flat
+        self.optimization_history: deque = deque(maxlen=20)
+        self.total_runs = 0
         
         # Optimization parameters
         self.population_size = 100
         self.max_generations = 50
         self.mutation_rate = 0.1
         self.crossover_rate = 0.8
+        self.tournament_size = 3
+        self.rng = np.random.default_rng(seed)
+        self._next_uid = 0
+
+        # Non-dominated archive carried across runs of the same problem
+        self.archive_size = 500
+        self.archive: Optional[ParetoArchive] = None
+        self._archive_key: Optional[Tuple] = None
+        self._generation_metrics: List[Dict[str, float]] = []
+
+        # Objective evaluation; the placeholder simulation runs when no backend is set
+        self.evaluation_backend: Optional[EvaluationBackend] = None
+        self.evaluation_cache = EvaluationCache()
+
+        # Hypervolume reference point per objective (natural units); defaults
+        # to the worst end of the 0-100 objective range
+        self.reference_point: Dict[str, float] = {}
+
+        # Exact hypervolume grows exponentially with the objective count; above
+        # this many objectives it is estimated from fixed Monte Carlo samples
+        self.exact_hypervolume_max_objectives = 4
+        self.hypervolume_samples = 20_000
+        self._unit_samples: Optional[np.ndarray] = None
+        self._sample_floor: Optional[np.ndarray] = None
         
+        # Anytime behaviour: stop when hypervolume improves by less than the
+        # relative tolerance over the stagnation window
+        self.stagnation_generations = 10
+        self.stagnation_tolerance = 1e-4
+        self._generation_seconds = 0.0
+        self._stop_reason = "max_generations"
+
         # AI enhancement settings
         self.use_ai_guidance = True
         self.ai_confidence_threshold = 0.7
+        self.last_ai_guidance: Optional[str] = None
+        # Operator rates suggested by AI guidance; they override the configured
+        # rates for the current run only
+        self._guided_rates: Dict[str, float] = {}
         
         logger.info("Multi-objective optimizer initialized")
     
@@ -111,6 +196,14 @@ class MultiObjectiveOptimizer:
         """Add a constraint to the optimization problem"""
         self.constraints.append(constraint)
         logger.info(f"Added constraint: {constraint}")
+
+    def set_evaluation_backend(self, backend: Optional[EvaluationBackend]) -> None:
+        """Use a vectorized or process-pool backend for objective evaluation"""
+        if self.evaluation_backend is not None and self.evaluation_backend is not backend:
+            self.evaluation_backend.close()
+        self.evaluation_backend = backend
+        self.evaluation_cache.clear()
+        logger.info(f"Evaluation backend set: {type(backend).__name__ if backend else 'simulation'}")
     
     async def optimize(
         self,
@@ -130,35 +223,31 @@ class MultiObjectiveOptimizer:
             OptimizationResult with Pareto front and recommendations
         """
         start_time = datetime.now()
+        deadline = time.monotonic() + max_time_seconds
         logger.info(f"Starting multi-objective optimization with {len(self.objectives)} objectives")
         
         try:
-            # Generate initial population
-            initial_solutions = await self._generate_initial_population(
-                parameter_space, self.population_size
-            )
-            
-            # Evaluate initial solutions
-            evaluated_solutions = await self._evaluate_solutions(initial_solutions)
+            encoding = ParameterEncoding(parameter_space)
+            evaluated_population = await self._start_run(encoding)
             
-            # Apply optimization strategy
+            # Apply optimization strategy within what is left of the budget
+            remaining = max(0.0, deadline - time.monotonic())
             if strategy == OptimizationStrategy.HYBRID_AI:
-                optimized_solutions = await self._hybrid_ai_optimization(
-                    evaluated_solutions, parameter_space, max_time_seconds
+                optimized_population = await self._hybrid_ai_optimization(
+                    evaluated_population, encoding, remaining
                 )
             elif strategy == OptimizationStrategy.PARETO_OPTIMAL:
-                optimized_solutions = await self._pareto_optimization(
-                    evaluated_solutions, max_time_seconds
+                optimized_population = await self._pareto_optimization(
+                    evaluated_population, remaining
                 )
             else:
-                optimized_solutions = evaluated_solutions
+                optimized_population = evaluated_population
             
-            # Calculate dominance and Pareto ranking for all solutions
-            self._calculate_dominance(optimized_solutions)
-            self._assign_pareto_ranks(optimized_solutions)
+            # Pareto ranking for all solutions
+            optimized_population.rank(self._objective_signs())
 
             # Calculate Pareto front
-            pareto_front = self._calculate_pareto_front(optimized_solutions)
+            pareto_front = self._calculate_pareto_front(optimized_population)
             
             # Find best compromise solution
             best_compromise = await self._find_best_compromise(pareto_front)
@@ -172,15 +261,19 @@ class MultiObjectiveOptimizer:
             
             result = OptimizationResult(
                 pareto_front=pareto_front,
-                all_solutions=optimized_solutions,
                 best_compromise=best_compromise,
                 optimization_time=optimization_time,
-                convergence_metrics=self._calculate_convergence_metrics(optimized_solutions),
-                ai_recommendations=ai_recommendations
+                convergence_metrics=self._calculate_convergence_metrics(optimized_population),
+                ai_recommendations=ai_recommendations,
+                population=optimized_population,
+                objective_names=list(self.objectives.keys()),
+                convergence_history=list(self._generation_metrics),
+                stop_reason=self._stop_reason
             )
             
-            self.optimization_history.append(result)
-            logger.info(f"Optimization completed in {optimization_time:.2f}s")
+            self.optimization_history.append(replace(result, population=None))
+            self.total_runs += 1
+            logger.info(f"Optimization completed in {optimization_time:.2f}s ({self._stop_reason})")
             logger.info(f"Pareto front contains {len(pareto_front)} solutions")
             
             return result
@@ -188,54 +281,163 @@ class MultiObjectiveOptimizer:
         except Exception as e:
             logger.error(f"Optimization failed: {str(e)}")
             raise
+
+    async def optimize_stream(
+        self,
+        parameter_space: Dict[str, Dict[str, Any]],
+        max_time_seconds: float = 300,
+        use_ai_guidance: Optional[bool] = None
+    ) -> AsyncIterator[OptimizationProgress]:
+        """
+        Run NSGA-II and yield the Pareto front each time it improves
+
+        Callers can act on partial results and stop iterating at any point;
+        the archive keeps the best front found so far.
+        """
+        start = time.monotonic()
+        deadline = start + max_time_seconds
+        encoding = ParameterEncoding(parameter_space)
+        population = await self._start_run(encoding)
+        yield self._progress(population, start)
+
+        guided = self.use_ai_guidance if use_ai_guidance is None else use_ai_guidance
+        async for population, metrics in self._evolve_generations(population, encoding, deadline, guided):
+            if metrics["accepted"]:
+                yield self._progress(population, start)
+
+    def _progress(self, population: Population, start: float) -> OptimizationProgress:
+        """Build a progress snapshot from the archive"""
+        metrics = self._generation_metrics[-1]
+        return OptimizationProgress(
+            generation=metrics["generation"],
+            elapsed_seconds=time.monotonic() - start,
+            hypervolume=metrics["hypervolume"],
+            pareto_front=self._calculate_pareto_front(population),
+            evaluations=self.evaluation_cache.misses
+        )
+
+    async def _start_run(self, encoding: ParameterEncoding) -> Population:
+        """Reset per-run state and evaluate the initial population"""
+        self._generation_metrics = []
+        self._generation_seconds = 0.0
+        self._stop_reason = "max_generations"
+        self._guided_rates = {}
+
+        # Generate initial population
+        initial_population = await self._generate_initial_population(encoding, self.population_size)
+
+        # Evaluate initial solutions
+        evaluated_population = await self._evaluate_solutions(initial_population)
+        self._record_generation(evaluated_population)
+        return evaluated_population
     
+    def _objective_signs(self) -> np.ndarray:
+        """Per-objective multipliers converting values to minimization form"""
+        return np.array([
+            -1.0 if objective.type == ObjectiveType.MAXIMIZE else 1.0
+            for objective in self.objectives.values()
+        ])
+
+    def _reference_vector(self) -> np.ndarray:
+        """Hypervolume reference point in minimization form"""
+        reference = []
+        for name, objective in self.objectives.items():
+            default = 0.0 if objective.type == ObjectiveType.MAXIMIZE else 100.0
+            reference.append(self.reference_point.get(name, default))
+        return np.array(reference, dtype=float) * self._objective_signs()
+
+    def _sync_problem(self, encoding: ParameterEncoding) -> None:
+        """Reset the archive and evaluation cache when the problem definition changes"""
+        key = (
+            tuple((name, objective.type) for name, objective in self.objectives.items()),
+            tuple(encoding.names),
+            json.dumps(self.constraints, sort_keys=True, default=str)
+        )
+        if self.archive is None or key != self._archive_key:
+            self.archive = ParetoArchive(len(self.objectives), encoding.size, self.archive_size)
+            self.evaluation_cache.clear()
+            self._archive_key = key
+            self._sample_floor = None
+
+    def _get_archive(self, encoding: ParameterEncoding) -> ParetoArchive:
+        """Get the archive for the current problem"""
+        self._sync_problem(encoding)
+        return self.archive
+
+    def reset_archive(self) -> None:
+        """Discard archived solutions from previous runs"""
+        self.archive = None
+        self._archive_key = None
+        self._sample_floor = None
+
+    def _record_generation(self, population: Population) -> None:
+        """Feed an evaluated generation into the archive and track convergence"""
+        archive = self._get_archive(population.encoding)
+        accepted = archive.add_population(population, self._objective_signs())
+
+        # The archive only changes on accepted solutions, so reuse the last value otherwise
+        if accepted or not self._generation_metrics:
+            if len(self.objectives) <= self.exact_hypervolume_max_objectives:
+                volume = archive.hypervolume(self._reference_vector())
+            else:
+                volume = self._front_hypervolume(archive.objectives)
+        else:
+            volume = self._generation_metrics[-1]["hypervolume"]
+
+        self._generation_metrics.append({
+            "generation": len(self._generation_metrics),
+            "hypervolume": volume,
+            "archive_size": len(archive),
+            "accepted": accepted
+        })
+
+    def _new_population(self, parameters: np.ndarray, encoding: ParameterEncoding) -> Population:
+        """Wrap encoded parameter vectors in a population with fresh solution IDs"""
+        uids = np.arange(self._next_uid, self._next_uid + len(parameters))
+        self._next_uid += len(parameters)
+        return Population(parameters, encoding, uids)
+
     async def _generate_initial_population(
         self, 
-        parameter_space: Dict[str, Dict[str, Any]], 
+        encoding: ParameterEncoding, 
         size: int
-    ) -> List[Solution]:
+    ) -> Population:
         """Generate initial population of solutions"""
-        solutions = []
+        return self._new_population(encoding.sample(size, self.rng), encoding)
+    
+    async def _evaluate_solutions(self, population: Population) -> Population:
+        """Evaluate solutions against all objectives, reusing memoized parameter vectors"""
+        self._sync_problem(population.encoding)
+
+        keys = self.evaluation_cache.keys(population.parameters)
+        values, missing, inverse = self.evaluation_cache.lookup(keys, len(self.objectives))
+        if len(missing):
+            fresh = await self._evaluate_parameters(population.parameters[missing], population.encoding)
+            self.evaluation_cache.store([keys[index] for index in missing.tolist()], fresh)
+            uncached = inverse >= 0
+            values[uncached] = fresh[inverse[uncached]]
         
-        for i in range(size):
-            parameters = {}
-            for param_name, param_config in parameter_space.items():
-                param_type = param_config.get('type', 'float')
-                min_val = param_config.get('min', 0)
-                max_val = param_config.get('max', 1)
-                
-                if param_type == 'float':
-                    parameters[param_name] = np.random.uniform(min_val, max_val)
-                elif param_type == 'int':
-                    parameters[param_name] = np.random.randint(min_val, max_val + 1)
-                elif param_type == 'choice':
-                    choices = param_config.get('choices', [])
-                    parameters[param_name] = np.random.choice(choices)
-            
-            solution = Solution(
-                id=f"sol_{i}",
-                parameters=parameters,
-                objective_values={}
-            )
-            solutions.append(solution)
+        population.values = values
+        # Check feasibility
+        population.feasible = self._check_feasibility(population)
         
-        return solutions
+        return population
     
-    async def _evaluate_solutions(self, solutions: List[Solution]) -> List[Solution]:
-        """Evaluate solutions against all objectives"""
-        for solution in solutions:
+    async def _evaluate_parameters(self, parameters: np.ndarray, encoding: ParameterEncoding) -> np.ndarray:
+        """Evaluate distinct parameter vectors with the configured backend"""
+        if self.evaluation_backend is not None:
+            return await self.evaluation_backend.evaluate(parameters, encoding, list(self.objectives.keys()))
+
+        values = np.empty((len(parameters), len(self.objectives)))
+        for row in range(len(parameters)):
+            decoded = encoding.decode(parameters[row])
             # Simulate objective evaluation (in real implementation, this would
             # call actual evaluation functions)
-            for obj_name, objective in self.objectives.items():
+            for column, objective in enumerate(self.objectives.values()):
                 # Placeholder evaluation - replace with actual objective functions
-                value = self._simulate_objective_evaluation(solution.parameters, objective)
-                solution.objective_values[obj_name] = value
-            
-            # Check feasibility
-            solution.feasible = self._check_feasibility(solution)
-        
-        return solutions
-    
+                values[row, column] = self._simulate_objective_evaluation(decoded, objective)
+        return values
+
     def _simulate_objective_evaluation(
         self, 
         parameters: Dict[str, Any], 
@@ -244,44 +446,128 @@ class MultiObjectiveOptimizer:
         """Simulate objective evaluation (placeholder)"""
         # This is a placeholder - in real implementation, this would call
         # actual evaluation functions based on the objective type
-        return np.random.uniform(0, 100)
+        return self.rng.uniform(0, 100)
     
-    def _check_feasibility(self, solution: Solution) -> bool:
-        """Check if solution satisfies all constraints"""
+    def _check_feasibility(self, population: Population) -> np.ndarray:
+        """Check which solutions satisfy all constraints"""
+        feasible = np.ones(len(population), dtype=bool)
         for constraint in self.constraints:
             # Implement constraint checking logic
             pass
-        return True
+        return feasible
     
     async def _hybrid_ai_optimization(
         self,
-        solutions: List[Solution],
-        parameter_space: Dict[str, Dict[str, Any]],
-        max_time_seconds: int
-    ) -> List[Solution]:
+        population: Population,
+        encoding: ParameterEncoding,
+        max_time_seconds: float
+    ) -> Population:
         """Hybrid AI-guided optimization"""
         logger.info("Starting hybrid AI optimization")
-        
-        # Use AI to guide the optimization process
-        if self.use_ai_guidance:
-            ai_guidance = await self._get_ai_optimization_guidance(solutions)
-            logger.info(f"AI guidance: {ai_guidance}")
-        
-        # Implement genetic algorithm with AI guidance
-        current_population = solutions
-        generation = 0
-        start_time = datetime.now()
-        
-        while generation < self.max_generations:
-            if (datetime.now() - start_time).total_seconds() > max_time_seconds:
-                break
-            
-            # Selection, crossover, mutation with AI guidance
-            new_population = await self._evolve_population(current_population, parameter_space)
-            current_population = await self._evaluate_solutions(new_population)
-            generation += 1
-        
+
+        current_population = population
+        async for current_population, _ in self._evolve_generations(
+            population, encoding, time.monotonic() + max_time_seconds, self.use_ai_guidance
+        ):
+            pass
+
         return current_population
+
+    async def _evolve_generations(
+        self,
+        population: Population,
+        encoding: ParameterEncoding,
+        deadline: float,
+        use_ai_guidance: bool
+    ) -> AsyncIterator[Tuple[Population, Dict[str, float]]]:
+        """
+        NSGA-II generation loop yielding each surviving population
+
+        Stops at max_generations, when the next generation would overrun the
+        deadline, or when hypervolume stagnates. AI guidance is requested
+        concurrently and applied when it arrives.
+        """
+        signs = self._objective_signs()
+        population.rank(signs)
+
+        guidance_task = None
+        if use_ai_guidance:
+            best = population.best_order()[:5]
+            guidance_task = asyncio.create_task(self._get_ai_optimization_guidance(
+                solutions_from_population(population, list(self.objectives.keys()), best)
+            ))
+
+        # NSGA-II: offspring from crowded tournaments, (mu + lambda) survival
+        current_population = population
+        generation = 0
+        self._stop_reason = "max_generations"
+        try:
+            while generation < self.max_generations:
+                generation_start = time.monotonic()
+                if generation_start + self._generation_seconds > deadline:
+                    self._stop_reason = "time_budget"
+                    break
+
+                if guidance_task is not None and guidance_task.done():
+                    self._apply_ai_guidance(guidance_task.result())
+                    guidance_task = None
+
+                # Selection, crossover, mutation
+                offspring = await self._evolve_population(current_population, encoding)
+                offspring = await self._evaluate_solutions(offspring)
+                self._record_generation(offspring)
+                current_population = self._select_survivors(
+                    current_population.merge(offspring), self.population_size, signs
+                )
+                generation += 1
+
+                # Smoothed generation time decides whether another one fits the budget
+                elapsed = time.monotonic() - generation_start
+                self._generation_seconds = (
+                    elapsed if generation == 1 else 0.7 * self._generation_seconds + 0.3 * elapsed
+                )
+
+                yield current_population, self._generation_metrics[-1]
+
+                if self._has_stagnated():
+                    self._stop_reason = "converged"
+                    break
+
+                # Let the guidance request and other tasks progress between generations
+                await asyncio.sleep(0)
+        finally:
+            if guidance_task is not None:
+                guidance_task.cancel()
+                await asyncio.gather(guidance_task, return_exceptions=True)
+
+    def _has_stagnated(self) -> bool:
+        """Check whether hypervolume stopped improving over the stagnation window"""
+        window = self.stagnation_generations
+        if not window or len(self._generation_metrics) <= window:
+            return False
+
+        previous = self._generation_metrics[-window - 1]["hypervolume"]
+        current = self._generation_metrics[-1]["hypervolume"]
+        return current - previous <= self.stagnation_tolerance * max(abs(previous), 1e-12)
+
+    def _apply_ai_guidance(self, guidance: str) -> None:
+        """Apply AI guidance that arrived while generations were running"""
+        self.last_ai_guidance = guidance
+        logger.info(f"AI guidance: {guidance}")
+
+        try:
+            advice = json.loads(guidance)
+        except (TypeError, ValueError):
+            return
+        if not isinstance(advice, dict):
+            return
+
+        # Only well-formed operator rates are taken over; the rest is advisory
+        for name in ("mutation_rate", "crossover_rate"):
+            value = advice.get(name)
+            if isinstance(value, (int, float)) and 0 < value <= 1:
+                self._guided_rates[name] = float(value)
+                logger.info(f"Applied AI-guided {name} for this run: {value}")
     
     async def _get_ai_optimization_guidance(self, solutions: List[Solution]) -> str:
         """Get AI guidance for optimization direction"""
@@ -312,13 +598,13 @@ class MultiObjectiveOptimizer:
             3. Parameter adjustment recommendations
             4. Potential optimization pitfalls to avoid
             
-            Respond with actionable insights in JSON format.
+            Respond with actionable insights in JSON format. To adjust the genetic operators,
+            include "mutation_rate" and/or "crossover_rate" as numbers between 0 and 1.
             """
             
             response = await self.openai_service.generate_response(
-                prompt=prompt,
-                max_tokens=500,
-                temperature=0.3
+                system_prompt="You are an expert in multi-objective optimization.",
+                conversation_history=[{"role": "user", "content": prompt}]
             )
             
             return response
@@ -329,192 +615,71 @@ class MultiObjectiveOptimizer:
 
     async def _evolve_population(
         self,
-        population: List[Solution],
-        parameter_space: Dict[str, Dict[str, Any]]
-    ) -> List[Solution]:
-        """Evolve population using genetic operators"""
-        new_population = []
-
-        # Keep best solutions (elitism)
-        sorted_pop = sorted(population, key=lambda x: x.pareto_rank)
-        elite_size = max(1, len(population) // 10)
-        new_population.extend(sorted_pop[:elite_size])
-
-        # Generate offspring
-        while len(new_population) < len(population):
-            # Selection
-            parent1 = self._tournament_selection(population)
-            parent2 = self._tournament_selection(population)
-
-            # Crossover
-            if np.random.random() < self.crossover_rate:
-                child1, child2 = self._crossover(parent1, parent2, parameter_space)
-            else:
-                child1, child2 = parent1, parent2
-
-            # Mutation
-            if np.random.random() < self.mutation_rate:
-                child1 = self._mutate(child1, parameter_space)
-            if np.random.random() < self.mutation_rate:
-                child2 = self._mutate(child2, parameter_space)
+        population: Population,
+        encoding: ParameterEncoding
+    ) -> Population:
+        """Create an offspring population using vectorized genetic operators"""
+        pairs = (len(population) + 1) // 2
 
-            new_population.extend([child1, child2])
+        # Selection
+        parents = tournament_select(population, 2 * pairs, self.rng, self.tournament_size)
+        first = population.parameters[parents[:pairs]]
+        second = population.parameters[parents[pairs:]]
 
-        return new_population[:len(population)]
-
-    def _tournament_selection(self, population: List[Solution], tournament_size: int = 3) -> Solution:
-        """Tournament selection for genetic algorithm"""
-        tournament = np.random.choice(population, tournament_size, replace=False)
-        return min(tournament, key=lambda x: x.pareto_rank)
-
-    def _crossover(
-        self,
-        parent1: Solution,
-        parent2: Solution,
-        parameter_space: Dict[str, Dict[str, Any]]
-    ) -> Tuple[Solution, Solution]:
-        """Crossover operation for genetic algorithm"""
-        child1_params = {}
-        child2_params = {}
-
-        for param_name in parameter_space.keys():
-            if np.random.random() < 0.5:
-                child1_params[param_name] = parent1.parameters[param_name]
-                child2_params[param_name] = parent2.parameters[param_name]
-            else:
-                child1_params[param_name] = parent2.parameters[param_name]
-                child2_params[param_name] = parent1.parameters[param_name]
+        # Crossover
+        crossover_rate = self._guided_rates.get("crossover_rate", self.crossover_rate)
+        children = uniform_crossover(first, second, crossover_rate, self.rng)
 
-        child1 = Solution(
-            id=f"child_{len(self.solutions)}",
-            parameters=child1_params,
-            objective_values={}
-        )
-        child2 = Solution(
-            id=f"child_{len(self.solutions) + 1}",
-            parameters=child2_params,
-            objective_values={}
-        )
+        # Mutation
+        mutation_rate = self._guided_rates.get("mutation_rate", self.mutation_rate)
+        children = mutate(children, encoding, mutation_rate, self.rng)
 
-        return child1, child2
+        return self._new_population(children[:len(population)], encoding)
 
-    def _mutate(
-        self,
-        solution: Solution,
-        parameter_space: Dict[str, Dict[str, Any]]
-    ) -> Solution:
-        """Mutation operation for genetic algorithm"""
-        mutated_params = solution.parameters.copy()
-
-        for param_name, param_config in parameter_space.items():
-            if np.random.random() < 0.1:  # 10% chance to mutate each parameter
-                param_type = param_config.get('type', 'float')
-                min_val = param_config.get('min', 0)
-                max_val = param_config.get('max', 1)
-
-                if param_type == 'float':
-                    # Gaussian mutation
-                    current_val = mutated_params[param_name]
-                    mutation_strength = (max_val - min_val) * 0.1
-                    new_val = current_val + np.random.normal(0, mutation_strength)
-                    mutated_params[param_name] = np.clip(new_val, min_val, max_val)
-                elif param_type == 'int':
-                    mutated_params[param_name] = np.random.randint(min_val, max_val + 1)
-                elif param_type == 'choice':
-                    choices = param_config.get('choices', [])
-                    mutated_params[param_name] = np.random.choice(choices)
-
-        return Solution(
-            id=f"mutated_{solution.id}",
-            parameters=mutated_params,
-            objective_values={}
-        )
+    def _select_survivors(self, population: Population, size: int, signs: np.ndarray) -> Population:
+        """Keep the best solutions by Pareto rank, then crowding distance"""
+        population.rank(signs)
+        return population.subset(population.best_order()[:size])
 
     async def _pareto_optimization(
         self,
-        solutions: List[Solution],
-        max_time_seconds: int
-    ) -> List[Solution]:
+        population: Population,
+        max_time_seconds: float
+    ) -> Population:
         """Pure Pareto optimization without AI guidance"""
         logger.info("Starting Pareto optimization")
 
-        # Calculate dominance relationships
-        self._calculate_dominance(solutions)
-
-        # Assign Pareto ranks
-        self._assign_pareto_ranks(solutions)
-
-        return solutions
-
-    def _calculate_dominance(self, solutions: List[Solution]) -> None:
-        """Calculate dominance relationships between solutions"""
-        for i, sol1 in enumerate(solutions):
-            sol1.dominance_count = 0
-            sol1.dominated_solutions = []
-
-            for j, sol2 in enumerate(solutions):
-                if i != j:
-                    if self._dominates(sol1, sol2):
-                        sol1.dominated_solutions.append(sol2.id)
-                    elif self._dominates(sol2, sol1):
-                        sol1.dominance_count += 1
-
-    def _dominates(self, sol1: Solution, sol2: Solution) -> bool:
-        """Check if sol1 dominates sol2"""
-        better_in_at_least_one = False
-
-        for obj_name, objective in self.objectives.items():
-            val1 = sol1.objective_values.get(obj_name, 0)
-            val2 = sol2.objective_values.get(obj_name, 0)
+        current_population = population
+        async for current_population, _ in self._evolve_generations(
+            population, population.encoding, time.monotonic() + max_time_seconds, False
+        ):
+            pass
 
-            if objective.type == ObjectiveType.MAXIMIZE:
-                if val1 < val2:
-                    return False
-                elif val1 > val2:
-                    better_in_at_least_one = True
-            else:  # MINIMIZE
-                if val1 > val2:
-                    return False
-                elif val1 < val2:
-                    better_in_at_least_one = True
+        return current_population
 
-        return better_in_at_least_one
+    def _objective_matrix(self, solutions: List[Solution]) -> np.ndarray:
+        """Objective values of solutions in minimization form"""
+        values = np.array([
+            [solution.objective_values.get(name, 0) for name in self.objectives]
+            for solution in solutions
+        ], dtype=float).reshape(len(solutions), len(self.objectives))
+        return values * self._objective_signs()
 
     def _assign_pareto_ranks(self, solutions: List[Solution]) -> None:
         """Assign Pareto ranks to solutions"""
         if not solutions:
             return
 
-        rank = 1
-        remaining_solutions = [sol for sol in solutions if sol.dominance_count == 0]
-
-        # If no solutions are non-dominated, assign rank 1 to all
-        if not remaining_solutions:
-            for sol in solutions:
-                sol.pareto_rank = 1
-            return
-
-        while remaining_solutions:
-            # Assign current rank
-            for sol in remaining_solutions:
-                sol.pareto_rank = rank
-
-            # Find next front
-            next_front = []
-            for sol in remaining_solutions:
-                for dominated_id in sol.dominated_solutions:
-                    dominated_sol = next((s for s in solutions if s.id == dominated_id), None)
-                    if dominated_sol:
-                        dominated_sol.dominance_count -= 1
-                        if dominated_sol.dominance_count == 0:
-                            next_front.append(dominated_sol)
-
-            remaining_solutions = next_front
-            rank += 1
+        ranks = non_dominated_sort(self._objective_matrix(solutions))
+        for solution, rank in zip(solutions, ranks.tolist()):
+            solution.pareto_rank = rank
 
-    def _calculate_pareto_front(self, solutions: List[Solution]) -> List[Solution]:
-        """Extract Pareto front (rank 1 solutions)"""
-        return [sol for sol in solutions if sol.pareto_rank == 1]
+    def _calculate_pareto_front(self, population: Population) -> List[Solution]:
+        """Extract Pareto front from the archive (rank 1 solutions of the population if empty)"""
+        if self.archive is not None and len(self.archive):
+            population = self.archive.to_population(population.encoding)
+        front = np.flatnonzero(population.ranks == 1)
+        return solutions_from_population(population, list(self.objectives.keys()), front)
 
     async def _find_best_compromise(self, pareto_front: List[Solution]) -> Solution:
         """Find best compromise solution from Pareto front"""
@@ -677,60 +842,68 @@ class MultiObjectiveOptimizer:
             logger.warning(f"Failed to generate AI recommendations: {str(e)}")
             return ["Monitor implementation closely", "Gather feedback for future optimization"]
 
-    def _calculate_convergence_metrics(self, solutions: List[Solution]) -> Dict[str, float]:
+    def _calculate_convergence_metrics(self, population: Population) -> Dict[str, float]:
         """Calculate optimization convergence metrics"""
-        if not solutions:
+        if not len(population):
             return {}
 
-        pareto_front = self._calculate_pareto_front(solutions)
+        if self.archive is not None and len(self.archive):
+            front_values = self.archive.values
+        else:
+            front_values = population.values[population.ranks == 1]
 
         metrics = {
-            "pareto_front_size": len(pareto_front),
-            "solution_diversity": self._calculate_diversity(pareto_front),
-            "convergence_ratio": len(pareto_front) / len(solutions) if solutions else 0,
-            "hypervolume": self._calculate_hypervolume(pareto_front)
+            "pareto_front_size": len(front_values),
+            "solution_diversity": self._calculate_diversity(front_values),
+            "convergence_ratio": float((population.ranks == 1).mean()),
+            "hypervolume": self._calculate_hypervolume(front_values),
+            "generations": len(self._generation_metrics)
         }
 
         return metrics
 
-    def _calculate_diversity(self, solutions: List[Solution]) -> float:
+    def _calculate_diversity(self, values: np.ndarray) -> float:
         """Calculate diversity of solutions in objective space"""
-        if len(solutions) < 2:
+        count = len(values)
+        if count < 2:
             return 0.0
 
-        # Calculate average distance between solutions in objective space
-        total_distance = 0
-        count = 0
-
-        for i, sol1 in enumerate(solutions):
-            for j, sol2 in enumerate(solutions[i+1:], i+1):
-                distance = 0
-                for obj_name in self.objectives.keys():
-                    val1 = sol1.objective_values.get(obj_name, 0)
-                    val2 = sol2.objective_values.get(obj_name, 0)
-                    distance += (val1 - val2) ** 2
-
-                total_distance += distance ** 0.5
-                count += 1
+        # Average pairwise Euclidean distance in objective space
+        total_distance = 0.0
+        for start in range(0, count, 512):
+            block = values[start:start + 512]
+            distances = np.sqrt(((block[:, None, :] - values[None, :, :]) ** 2).sum(axis=2))
+            total_distance += distances.sum()
 
-        return total_distance / count if count > 0 else 0.0
+        return float(total_distance / (count * (count - 1)))
 
-    def _calculate_hypervolume(self, solutions: List[Solution]) -> float:
-        """Calculate hypervolume indicator (simplified)"""
-        if not solutions or not self.objectives:
+    def _calculate_hypervolume(self, values: np.ndarray) -> float:
+        """Calculate the hypervolume dominated by solutions, bounded by the reference point"""
+        if not len(values) or not self.objectives:
             return 0.0
 
-        # Simplified hypervolume calculation
-        # In practice, you'd use a proper hypervolume algorithm
-        volume = 1.0
-        for obj_name, objective in self.objectives.items():
-            values = [sol.objective_values.get(obj_name, 0) for sol in solutions]
-            if objective.type == ObjectiveType.MAXIMIZE:
-                volume *= max(values) if values else 0
-            else:
-                volume *= (100 - min(values)) if values else 0  # Assuming max possible value is 100
+        return self._front_hypervolume(values * self._objective_signs())
+
+    def _front_hypervolume(self, objectives: np.ndarray) -> float:
+        """Exact hypervolume of minimization-form objectives, or a Monte Carlo estimate for many objectives"""
+        reference = self._reference_vector()
+        if len(reference) <= self.exact_hypervolume_max_objectives:
+            return hypervolume(objectives, reference)
 
-        return volume
+        objectives = objectives[np.all(objectives < reference, axis=1)]
+        if not len(objectives):
+            return 0.0
+        if self._unit_samples is None or self._unit_samples.shape != (self.hypervolume_samples, len(reference)):
+            self._unit_samples = self.rng.random((self.hypervolume_samples, len(reference)))
+            self._sample_floor = None
+
+        # Keep the sampling box fixed so estimates only rise as the front improves;
+        # widen it with a margin on the rare point beyond its lower corner
+        ideal = objectives.min(axis=0)
+        if self._sample_floor is None or np.any(ideal < self._sample_floor):
+            floor = ideal - 0.25 * (reference - ideal)
+            self._sample_floor = floor if self._sample_floor is None else np.minimum(self._sample_floor, floor)
+        return estimate_hypervolume(objectives, reference, self._unit_samples, lower=self._sample_floor)
 
     def get_optimization_summary(self) -> Dict[str, Any]:
         """Get summary of optimization history and performance"""
@@ -740,7 +913,7 @@ class MultiObjectiveOptimizer:
         latest_result = self.optimization_history[-1]
 
         summary = {
-            "total_runs": len(self.optimization_history),
+            "total_runs": self.total_runs,
             "latest_run": {
                 "pareto_front_size": len(latest_result.pareto_front),
                 "optimization_time": latest_result.optimization_time,
@@ -752,7 +925,9 @@ class MultiObjectiveOptimizer:
                 }
             },
             "objectives_configured": len(self.objectives),
-            "constraints_configured": len(self.constraints)
+            "constraints_configured": len(self.constraints),
+            "archive_size": len(self.archive) if self.archive is not None else 0,
+            "evaluation_cache": self.evaluation_cache.get_stats()
         }
 
         return summary
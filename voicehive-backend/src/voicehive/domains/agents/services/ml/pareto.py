@@ -0,0 +1,708 @@
+"""
+Vectorized Pareto utilities for multi-objective optimization
+
+Structure-of-arrays populations with NumPy non-dominated sorting, crowding
+distance and genetic operators. Objectives are handled in minimization form
+(maximized objectives are negated).
+"""
+
+import logging
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Parameter kinds
+FLOAT_PARAM = 0
+INT_PARAM = 1
+CHOICE_PARAM = 2
+
+# Rows per block when sorting four or more objectives
+FRONT_BLOCK_SIZE = 256
+
+
+class ParameterEncoding:
+    """Encodes a parameter space as numeric columns (choices become indices)"""
+
+    def __init__(self, parameter_space: Dict[str, Dict[str, Any]]):
+        self.names = list(parameter_space.keys())
+        self.choices: Dict[int, List[Any]] = {}
+
+        kinds, lows, highs = [], [], []
+        for column, (name, config) in enumerate(parameter_space.items()):
+            param_type = config.get('type', 'float')
+            if param_type == 'choice':
+                choices = list(config.get('choices', []))
+                self.choices[column] = choices
+                kinds.append(CHOICE_PARAM)
+                lows.append(0)
+                highs.append(max(len(choices) - 1, 0))
+            else:
+                kinds.append(INT_PARAM if param_type == 'int' else FLOAT_PARAM)
+                lows.append(config.get('min', 0))
+                highs.append(config.get('max', 1))
+
+        self.kinds = np.array(kinds, dtype=np.int8)
+        self.lows = np.array(lows, dtype=float)
+        self.highs = np.array(highs, dtype=float)
+        self.float_columns = self.kinds == FLOAT_PARAM
+        self.discrete_columns = ~self.float_columns
+
+    @property
+    def size(self) -> int:
+        return len(self.names)
+
+    def sample(self, count: int, rng: np.random.Generator) -> np.ndarray:
+        """Sample parameter vectors uniformly from the space"""
+        matrix = self.lows + rng.random((count, self.size)) * (self.highs - self.lows)
+        if self.discrete_columns.any():
+            discrete = rng.integers(
+                self.lows[self.discrete_columns].astype(np.int64),
+                self.highs[self.discrete_columns].astype(np.int64) + 1,
+                size=(count, int(self.discrete_columns.sum()))
+            )
+            matrix[:, self.discrete_columns] = discrete
+        return matrix
+
+    def repair(self, matrix: np.ndarray) -> np.ndarray:
+        """Clip to bounds and snap discrete columns to integers"""
+        np.clip(matrix, self.lows, self.highs, out=matrix)
+        if self.discrete_columns.any():
+            matrix[:, self.discrete_columns] = np.rint(matrix[:, self.discrete_columns])
+        return matrix
+
+    def decode(self, row: np.ndarray) -> Dict[str, Any]:
+        """Convert an encoded row to a parameter dictionary"""
+        parameters = {}
+        for column, name in enumerate(self.names):
+            kind = self.kinds[column]
+            if kind == FLOAT_PARAM:
+                parameters[name] = float(row[column])
+            elif kind == INT_PARAM:
+                parameters[name] = int(row[column])
+            else:
+                choices = self.choices[column]
+                parameters[name] = choices[int(row[column])] if choices else None
+        return parameters
+
+    def columns(self, matrix: np.ndarray) -> Dict[str, np.ndarray]:
+        """Decode a parameter matrix column-wise for vectorized evaluation"""
+        columns = {}
+        for column, name in enumerate(self.names):
+            kind = self.kinds[column]
+            if kind == FLOAT_PARAM:
+                columns[name] = matrix[:, column]
+            elif kind == INT_PARAM:
+                columns[name] = matrix[:, column].astype(np.int64)
+            else:
+                choices = np.empty(max(len(self.choices[column]), 1), dtype=object)
+                choices[:len(self.choices[column])] = self.choices[column]
+                columns[name] = choices[matrix[:, column].astype(np.int64)]
+        return columns
+
+    def encode(self, parameters: Dict[str, Any]) -> np.ndarray:
+        """Convert a parameter dictionary to an encoded row"""
+        row = np.empty(self.size)
+        for column, name in enumerate(self.names):
+            value = parameters[name]
+            row[column] = self.choices[column].index(value) if column in self.choices else value
+        return row
+
+
+class Population:
+    """
+    Structure-of-arrays population
+
+    Holds parameter vectors, raw objective values and ranking data as NumPy
+    arrays; Solution objects are only built on demand.
+    """
+
+    def __init__(self,
+                 parameters: np.ndarray,
+                 encoding: ParameterEncoding,
+                 uids: np.ndarray,
+                 values: Optional[np.ndarray] = None,
+                 feasible: Optional[np.ndarray] = None):
+        self.parameters = parameters
+        self.encoding = encoding
+        self.uids = uids
+        self.values = values
+        self.feasible = feasible if feasible is not None else np.ones(len(parameters), dtype=bool)
+        self.ranks: Optional[np.ndarray] = None
+        self.crowding: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.parameters)
+
+    @property
+    def evaluated(self) -> bool:
+        return self.values is not None
+
+    def subset(self, indices: np.ndarray) -> "Population":
+        """Select rows, keeping ranking data when present"""
+        subset = Population(
+            self.parameters[indices],
+            self.encoding,
+            self.uids[indices],
+            self.values[indices] if self.values is not None else None,
+            self.feasible[indices]
+        )
+        if self.ranks is not None:
+            subset.ranks = self.ranks[indices]
+            subset.crowding = self.crowding[indices]
+        return subset
+
+    def merge(self, other: "Population") -> "Population":
+        """Concatenate two evaluated populations"""
+        return Population(
+            np.vstack([self.parameters, other.parameters]),
+            self.encoding,
+            np.concatenate([self.uids, other.uids]),
+            np.vstack([self.values, other.values]),
+            np.concatenate([self.feasible, other.feasible])
+        )
+
+    def rank(self, signs: np.ndarray) -> None:
+        """Assign Pareto ranks (1 = non-dominated) and crowding distances"""
+        minimized = self.values * signs
+        ranks = non_dominated_sort(minimized)
+        if not self.feasible.all():
+            # Feasible solutions always rank ahead of infeasible ones
+            ranks = np.where(self.feasible, ranks, ranks + ranks[self.feasible].max(initial=0))
+        self.ranks = ranks
+        self.crowding = crowding_distance(minimized, ranks)
+
+    def best_order(self) -> np.ndarray:
+        """Indices ordered by rank, then by descending crowding distance"""
+        return np.lexsort((-self.crowding, self.ranks))
+
+
+def dominance_matrix(objectives: np.ndarray) -> np.ndarray:
+    """Boolean matrix D where D[i, j] means solution i dominates solution j"""
+    left = objectives[:, None, :]
+    right = objectives[None, :, :]
+    return np.all(left <= right, axis=2) & np.any(left < right, axis=2)
+
+
+def non_dominated_sort(objectives: np.ndarray) -> np.ndarray:
+    """
+    Pareto rank of every row (1 = non-dominated), minimizing all columns
+
+    Two objectives use an O(n log n) sweep, three use binary search over
+    per-front staircases, and more fall back to blocked dominance chains.
+    """
+    count, dimensions = objectives.shape
+    if count == 0:
+        return np.zeros(0, dtype=np.int64)
+    if dimensions == 1:
+        return np.unique(objectives[:, 0], return_inverse=True)[1].astype(np.int64) + 1
+
+    # Lexicographic order: a solution can only be dominated by earlier ones
+    order = np.lexsort(objectives.T[::-1])
+    if dimensions == 2:
+        return _sort_two_objectives(objectives, order)
+    if dimensions == 3:
+        return _sort_three_objectives(objectives, order)
+    return _sort_by_dominance_chains(objectives, order)
+
+
+def _sort_two_objectives(objectives: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """Two-objective sort: each front is tracked by its last (lowest f2) member"""
+    ranks = np.empty(len(order), dtype=np.int64)
+    front_f1: List[float] = []
+    front_f2: List[float] = []
+
+    for index, f1, f2 in zip(order.tolist(), objectives[order, 0].tolist(), objectives[order, 1].tolist()):
+        front = bisect_right(front_f2, f2)
+        if front > 0 and front_f2[front - 1] == f2 and front_f1[front - 1] == f1:
+            # Duplicate of that front's last member, which does not dominate it
+            front -= 1
+        if front == len(front_f2):
+            front_f1.append(f1)
+            front_f2.append(f2)
+        else:
+            front_f1[front] = f1
+            front_f2[front] = f2
+        ranks[index] = front + 1
+
+    return ranks
+
+
+def _sort_three_objectives(objectives: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """
+    Three-objective sort (ENS with binary search over fronts)
+
+    In f0 order dominance reduces to a 2D query on (f1, f2), answered from a
+    per-front staircase of its 2D-minimal members.
+    """
+    ranks = np.empty(len(order), dtype=np.int64)
+    fronts: List[tuple] = []  # (f1 ascending, f2 strictly descending, f0) lists per front
+
+    def dominated(front: tuple, f0: float, f1: float, f2: float) -> bool:
+        f1s, f2s, f0s = front
+        position = bisect_right(f1s, f1) - 1
+        if position < 0 or f2s[position] > f2:
+            return False
+        # Equal in all three objectives is a duplicate, not a dominator
+        return not (f1s[position] == f1 and f2s[position] == f2 and f0s[position] == f0)
+
+    rows = objectives[order]
+    for index, (f0, f1, f2) in zip(order.tolist(), rows.tolist()):
+        low, high = 0, len(fronts)
+        while low < high:
+            middle = (low + high) // 2
+            if dominated(fronts[middle], f0, f1, f2):
+                low = middle + 1
+            else:
+                high = middle
+
+        if low == len(fronts):
+            fronts.append(([f1], [f2], [f0]))
+        else:
+            f1s, f2s, f0s = fronts[low]
+            covered = bisect_right(f1s, f1) - 1
+            if covered < 0 or f2s[covered] > f2:
+                # Insert and drop staircase members the new point covers in 2D
+                position = bisect_left(f1s, f1)
+                end = position
+                while end < len(f1s) and f2s[end] >= f2:
+                    end += 1
+                f1s[position:end] = [f1]
+                f2s[position:end] = [f2]
+                f0s[position:end] = [f0]
+        ranks[index] = low + 1
+
+    return ranks
+
+
+def _sort_by_dominance_chains(objectives: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """
+    General sort: rank = 1 + highest rank among dominators
+
+    Solutions are processed in lexicographic blocks, each compared against all
+    earlier solutions with column-wise vectorized comparisons.
+    """
+    count, dimensions = objectives.shape
+    rows = objectives[order]
+    sorted_ranks = np.zeros(count, dtype=np.int64)
+
+    for start in range(0, count, FRONT_BLOCK_SIZE):
+        stop = min(start + FRONT_BLOCK_SIZE, count)
+        block = rows[start:stop]
+        earlier = rows[:stop]
+
+        less_equal = np.ones((stop - start, stop), dtype=bool)
+        equal = np.ones((stop - start, stop), dtype=bool)
+        for column in range(dimensions):
+            earlier_column = earlier[:, column]
+            block_column = block[:, column][:, None]
+            less_equal &= earlier_column <= block_column
+            equal &= earlier_column == block_column
+        dominators = less_equal & ~equal
+
+        block_ranks = np.ones(stop - start, dtype=np.int64)
+        if start:
+            block_ranks += np.max(np.where(dominators[:, :start], sorted_ranks[:start], 0), axis=1)
+
+        # Dominators inside the block come earlier in lexicographic order
+        internal = dominators[:, start:]
+        for row in np.flatnonzero(internal.any(axis=1)).tolist():
+            block_ranks[row] = max(block_ranks[row], block_ranks[internal[row]].max() + 1)
+        sorted_ranks[start:stop] = block_ranks
+
+    ranks = np.empty(count, dtype=np.int64)
+    ranks[order] = sorted_ranks
+    return ranks
+
+
+def crowding_distance(objectives: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    """NSGA-II crowding distance computed for all fronts at once"""
+    count, dimensions = objectives.shape
+    distance = np.zeros(count)
+    if count == 0:
+        return distance
+
+    for column in range(dimensions):
+        order = np.lexsort((objectives[:, column], ranks))
+        sorted_ranks = ranks[order]
+        values = objectives[order, column]
+
+        boundary = sorted_ranks[1:] != sorted_ranks[:-1]
+        first = np.concatenate(([True], boundary))
+        last = np.concatenate((boundary, [True]))
+
+        group = np.cumsum(first) - 1
+        span = (values[last] - values[first])[group]
+
+        gaps = np.zeros(count)
+        if count > 2:
+            gaps[1:-1] = values[2:] - values[:-2]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            column_distance = np.where(span > 0, gaps / span, 0.0)
+        column_distance[first | last] = np.inf
+
+        distance[order] += column_distance
+
+    return distance
+
+
+def tournament_select(population: Population,
+                      count: int,
+                      rng: np.random.Generator,
+                      tournament_size: int = 3) -> np.ndarray:
+    """Crowded tournament selection, returning selected row indices"""
+    position = np.empty(len(population), dtype=np.int64)
+    position[population.best_order()] = np.arange(len(population))
+
+    tournament_size = min(tournament_size, len(population))
+    entrants = rng.integers(0, len(population), size=(count, tournament_size))
+    winners = np.argmin(position[entrants], axis=1)
+    return entrants[np.arange(count), winners]
+
+
+def uniform_crossover(first: np.ndarray,
+                      second: np.ndarray,
+                      crossover_rate: float,
+                      rng: np.random.Generator) -> np.ndarray:
+    """Uniform crossover of parent pairs, returning both children stacked"""
+    pairs, size = first.shape
+    crossing = rng.random(pairs) < crossover_rate
+    swap = (rng.random((pairs, size)) < 0.5) & crossing[:, None]
+    return np.vstack([np.where(swap, second, first), np.where(swap, first, second)])
+
+
+def mutate(parameters: np.ndarray,
+           encoding: ParameterEncoding,
+           mutation_rate: float,
+           rng: np.random.Generator,
+           gene_rate: float = 0.1) -> np.ndarray:
+    """Gaussian mutation for floats, uniform resampling for ints and choices"""
+    count, size = parameters.shape
+    mutating = rng.random(count) < mutation_rate
+    genes = (rng.random((count, size)) < gene_rate) & mutating[:, None]
+    if not genes.any():
+        return parameters
+
+    mutated = parameters.copy()
+    span = encoding.highs - encoding.lows
+
+    float_genes = genes & encoding.float_columns
+    if float_genes.any():
+        noise = rng.normal(0.0, 1.0, size=(count, size)) * (span * 0.1)
+        mutated = np.where(float_genes, mutated + noise, mutated)
+
+    discrete_genes = genes & encoding.discrete_columns
+    if discrete_genes.any():
+        resampled = encoding.sample(count, rng)
+        mutated = np.where(discrete_genes, resampled, mutated)
+
+    return encoding.repair(mutated)
+
+
+def hypervolume(objectives: np.ndarray, reference: np.ndarray) -> float:
+    """
+    Exact hypervolume dominated by objectives (minimization) up to reference
+
+    Two objectives use a sorted sweep, three a z-sweep over an incremental 2D
+    staircase, and more the WFG exclusive-contribution recursion down to 3D.
+    """
+    objectives = np.asarray(objectives, dtype=float)
+    reference = np.asarray(reference, dtype=float)
+    if not len(objectives):
+        return 0.0
+
+    # Only points strictly better than the reference contribute
+    objectives = objectives[np.all(objectives < reference, axis=1)]
+    if not len(objectives):
+        return 0.0
+
+    if objectives.shape[1] == 1:
+        return float(reference[0] - objectives[:, 0].min())
+
+    front = _unique_front(objectives)
+    if front.shape[1] == 2:
+        return _hypervolume_2d(front, reference)
+    if front.shape[1] == 3:
+        return _hypervolume_3d(front, reference)
+    return _hypervolume_wfg(front, reference)
+
+
+def estimate_hypervolume(objectives: np.ndarray,
+                         reference: np.ndarray,
+                         samples: np.ndarray,
+                         lower: Optional[np.ndarray] = None) -> float:
+    """
+    Monte Carlo hypervolume (minimization) up to reference
+
+    ``samples`` are uniform points in the unit cube, scaled into the box from
+    ``lower`` (default: the ideal point) to the reference. With the same samples
+    and a fixed box, an improved front never gets a lower estimate, so
+    successive estimates are comparable. Cost is O(samples x points).
+    """
+    objectives = np.asarray(objectives, dtype=float)
+    reference = np.asarray(reference, dtype=float)
+    if not len(objectives):
+        return 0.0
+    objectives = objectives[np.all(objectives < reference, axis=1)]
+    if not len(objectives):
+        return 0.0
+
+    ideal = objectives.min(axis=0)
+    if lower is not None:
+        ideal = np.minimum(ideal, lower)
+    box = reference - ideal
+
+    # Largest dominated boxes first, each tested only against samples still uncovered;
+    # contiguous per-objective columns keep the comparisons cheap
+    scaled = ideal + samples * box
+    columns = [np.ascontiguousarray(scaled[:, j]) for j in range(scaled.shape[1])]
+    order = np.argsort(-np.prod(reference - objectives, axis=1))
+    for point in objectives[order]:
+        covered = columns[0] >= point[0]
+        for column, value in zip(columns[1:], point[1:]):
+            covered &= column >= value
+        if covered.any():
+            columns = [column[~covered] for column in columns]
+            if not len(columns[0]):
+                break
+    return float(np.prod(box) * (len(samples) - len(columns[0])) / len(samples))
+
+
+def _unique_front(objectives: np.ndarray) -> np.ndarray:
+    """Distinct non-dominated rows"""
+    return np.unique(objectives[non_dominated_sort(objectives) == 1], axis=0)
+
+
+def _hypervolume_2d(front: np.ndarray, reference: np.ndarray) -> float:
+    """Area of a 2D non-dominated front (rows sorted by f1, so f2 descends)"""
+    f1 = front[:, 0]
+    widths = np.diff(np.append(f1, reference[0]))
+    return float(np.dot(widths, reference[1] - front[:, 1]))
+
+
+def _hypervolume_3d(front: np.ndarray, reference: np.ndarray) -> float:
+    """Volume of a 3D front by sweeping f3 and maintaining the 2D staircase area"""
+    front = front[np.argsort(front[:, 2], kind="stable")]
+    reference_x, reference_y = float(reference[0]), float(reference[1])
+
+    xs: List[float] = []
+    ys: List[float] = []
+    area = 0.0
+    volume = 0.0
+
+    def term(index: int) -> float:
+        next_x = xs[index + 1] if index + 1 < len(xs) else reference_x
+        return (next_x - xs[index]) * (reference_y - ys[index])
+
+    z_values = front[:, 2].tolist()
+    for position, (x, y, z) in enumerate(front.tolist()):
+        covered = bisect_right(xs, x) - 1
+        if covered < 0 or ys[covered] > y:
+            start = bisect_left(xs, x)
+            end = start
+            while end < len(xs) and ys[end] >= y:
+                end += 1
+
+            # Only the predecessor's term and the replaced points change
+            first = max(start - 1, 0)
+            area -= sum(term(index) for index in range(first, end))
+            xs[start:end] = [x]
+            ys[start:end] = [y]
+            area += sum(term(index) for index in range(first, start + 1))
+
+        next_z = z_values[position + 1] if position + 1 < len(z_values) else float(reference[2])
+        volume += area * (next_z - z)
+
+    return volume
+
+
+def _hypervolume_wfg(front: np.ndarray, reference: np.ndarray) -> float:
+    """
+    WFG algorithm: sum of exclusive contributions, each bounded by the later points
+
+    Rows are processed in descending order of the last objective, so every point
+    limited by the current one shares its last coordinate. Its exclusive volume
+    is therefore its depth times an (m-1)-dimensional exclusive volume, computed
+    from the non-dominated limit set; the recursion bottoms out in the 3D sweep.
+    """
+    objective_count = front.shape[1]
+    if objective_count == 3:
+        return _hypervolume_3d(front, reference)
+
+    front = front[np.argsort(-front[:, -1], kind="stable")]
+    heads = front[:, :-1]
+    sub_reference = reference[:-1]
+    depths = reference[-1] - front[:, -1]
+    inclusive = np.prod(sub_reference - heads, axis=1)
+
+    volume = 0.0
+    for index in range(len(front)):
+        exclusive = inclusive[index]
+        if index + 1 < len(front):
+            limited = _nondominated(np.maximum(heads[index + 1:], heads[index]))
+            if len(limited):
+                exclusive -= _hypervolume_wfg(limited, sub_reference)
+        volume += depths[index] * exclusive
+    return float(volume)
+
+
+def _nondominated(points: np.ndarray) -> np.ndarray:
+    """Distinct non-dominated rows (minimization), sorted lexicographically"""
+    points = np.unique(points, axis=0)
+    if len(points) < 2:
+        return points
+    weakly_dominates = np.all(points[:, None, :] <= points[None, :, :], axis=2)
+    np.fill_diagonal(weakly_dominates, False)
+    return points[~weakly_dominates.any(axis=0)]
+
+
+class ParetoArchive:
+    """
+    Bounded, incrementally maintained non-dominated archive
+
+    Features:
+    - Two objectives: sorted staircase with a binary-search dominance check
+    - More objectives: batched merge with vectorized non-dominated filtering
+    - Crowding-distance truncation when the archive exceeds max_size
+    - Exact hypervolume of the archived front
+    """
+
+    def __init__(self, objective_count: int, parameter_count: int, max_size: int = 500):
+        self.objective_count = objective_count
+        self.parameter_count = parameter_count
+        self.max_size = max_size
+
+        # Minimization-form objectives plus payload, kept sorted by f1 for two objectives
+        self.objectives = np.empty((0, objective_count))
+        self.values = np.empty((0, objective_count))
+        self.parameters = np.empty((0, parameter_count))
+        self.uids = np.empty(0, dtype=np.int64)
+
+        self.insertions = 0
+        self.rejections = 0
+
+    def __len__(self) -> int:
+        return len(self.objectives)
+
+    def add(self,
+            objectives: np.ndarray,
+            values: np.ndarray,
+            parameters: np.ndarray,
+            uids: np.ndarray) -> int:
+        """Offer solutions to the archive; returns how many were accepted"""
+        if not len(objectives):
+            return 0
+
+        if self.objective_count == 2:
+            accepted = self._add_two_objectives(objectives, values, parameters, uids)
+        else:
+            accepted = self._add_batch(objectives, values, parameters, uids)
+
+        self.insertions += accepted
+        self.rejections += len(objectives) - accepted
+        if len(self) > self.max_size:
+            self._truncate()
+        return accepted
+
+    def add_population(self, population: Population, signs: np.ndarray) -> int:
+        """Offer the feasible solutions of an evaluated population"""
+        feasible = population.feasible
+        return self.add(
+            population.values[feasible] * signs,
+            population.values[feasible],
+            population.parameters[feasible],
+            population.uids[feasible]
+        )
+
+    def _add_two_objectives(self, objectives, values, parameters, uids) -> int:
+        """
+        Insert into the f1-sorted staircase
+
+        The dominance check is an O(log n) bisect, but an accepted point is
+        spliced into Python lists in O(n), and the arrays are rebuilt once per
+        batch in O(n + batch). A batch of k points is therefore O(k * n) in the
+        worst case, with a small constant because the splices are memmoves.
+        """
+        f1 = self.objectives[:, 0].tolist()
+        f2 = self.objectives[:, 1].tolist()
+        rows = list(range(len(f1)))
+        existing = len(f1)
+
+        accepted = 0
+        for offset, (x, y) in enumerate(objectives.tolist()):
+            covered = bisect_right(f1, x) - 1
+            if covered >= 0 and f2[covered] <= y:
+                continue  # dominated by or equal to an archived point
+
+            start = bisect_left(f1, x)
+            end = start
+            while end < len(f1) and f2[end] >= y:
+                end += 1
+            f1[start:end] = [x]
+            f2[start:end] = [y]
+            rows[start:end] = [existing + offset]
+            accepted += 1
+
+        if accepted:
+            rows = np.array(rows, dtype=np.int64)
+            self.objectives = np.vstack([self.objectives, objectives])[rows]
+            self.values = np.vstack([self.values, values])[rows]
+            self.parameters = np.vstack([self.parameters, parameters])[rows]
+            self.uids = np.concatenate([self.uids, uids])[rows]
+        return accepted
+
+    def _add_batch(self, objectives, values, parameters, uids) -> int:
+        merged = np.vstack([self.objectives, objectives])
+        # Drop exact duplicates, preferring archived entries (they come first)
+        _, first_seen = np.unique(merged, axis=0, return_index=True)
+        distinct = np.zeros(len(merged), dtype=bool)
+        distinct[first_seen] = True
+
+        keep = np.flatnonzero(distinct)
+        keep = keep[non_dominated_sort(merged[keep]) == 1]
+        accepted = int((keep >= len(self.objectives)).sum())
+
+        self.objectives = merged[keep]
+        self.values = np.vstack([self.values, values])[keep]
+        self.parameters = np.vstack([self.parameters, parameters])[keep]
+        self.uids = np.concatenate([self.uids, uids])[keep]
+        return accepted
+
+    def _truncate(self) -> None:
+        """Drop the most crowded members until the archive fits"""
+        while len(self) > self.max_size:
+            excess = len(self) - self.max_size
+            crowding = crowding_distance(self.objectives, np.ones(len(self), dtype=np.int64))
+            # Remove in small batches so crowding reflects earlier removals
+            drop = np.argsort(crowding, kind="stable")[:max(1, min(excess, len(self) // 10))]
+            keep = np.setdiff1d(np.arange(len(self)), drop)
+            self.objectives = self.objectives[keep]
+            self.values = self.values[keep]
+            self.parameters = self.parameters[keep]
+            self.uids = self.uids[keep]
+
+    def hypervolume(self, reference: np.ndarray) -> float:
+        """Exact hypervolume of the archived front"""
+        if not len(self):
+            return 0.0
+        if self.objective_count == 2:
+            # Already a sorted non-dominated staircase
+            inside = np.all(self.objectives < reference, axis=1)
+            return _hypervolume_2d(self.objectives[inside], reference)
+        return hypervolume(self.objectives, reference)
+
+    def to_population(self, encoding: ParameterEncoding) -> Population:
+        """Archived solutions as a ranked population"""
+        population = Population(self.parameters.copy(), encoding, self.uids.copy(), self.values.copy())
+        population.ranks = np.ones(len(self), dtype=np.int64)
+        population.crowding = crowding_distance(self.objectives, population.ranks)
+        return population
+
+    def clear(self) -> None:
+        """Remove all archived solutions"""
+        self.objectives = self.objectives[:0]
+        self.values = self.values[:0]
+        self.parameters = self.parameters[:0]
+        self.uids = self.uids[:0]
@@ -4,6 +4,9 @@ Implements intelligent improvement prioritization using machine learning
 """
 import logging
 import asyncio
+import hashlib
+import time
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple
 from enum import Enum
@@ -23,6 +26,9 @@ except ImportError:
     logging.warning("Vertex AI not available - using fallback implementation")
 
 from voicehive.services.ai.openai_service import OpenAIService
+from voicehive.domains.agents.services.ml.embeddings import (
+    EmbeddingCache, batch_texts, group_near_duplicates, hashed_embeddings
+)
 from voicehive.utils.exceptions import VoiceHiveError, ErrorHandler
 from voicehive.core.settings import get_settings
 
@@ -82,10 +88,20 @@ class PrioritizationResult:
 class VertexAIPredictor:
     """Vertex AI integration for ML-based scoring"""
     
-    def __init__(self, project_id: str, location: str = "us-central1"):
+    def __init__(self,
+                 project_id: str,
+                 location: str = "us-central1",
+                 embedding_cache: Optional[EmbeddingCache] = None):
         self.project_id = project_id
         self.location = location
         self.initialized = False
+
+        # Model embeddings are cached by content; requests are split to stay
+        # within the embedding API's per-call instance and size limits
+        self.embedding_dimension = 768
+        self.embedding_cache = embedding_cache or EmbeddingCache(self.embedding_dimension)
+        self.embedding_batch_size = 250
+        self.embedding_batch_chars = 60_000
         
         if VERTEX_AI_AVAILABLE:
             try:
@@ -102,16 +118,36 @@ class VertexAIPredictor:
     
     async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
         """Generate embeddings for text analysis"""
-        if not self.initialized:
-            # Fallback: simple hash-based embeddings
-            return [[hash(text) % 1000 / 1000.0 for _ in range(768)] for text in texts]
+        return (await self.embed(texts)).tolist()
+
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts as a float32 matrix
         
-        try:
-            embeddings = self.embedding_model.get_embeddings(texts)
-            return [embedding.values for embedding in embeddings]
-        except Exception as e:
-            logger.error(f"Error generating embeddings: {str(e)}")
-            return [[0.5] * 768 for _ in texts]  # Fallback
+        Cached vectors are reused; the rest are requested from the model in
+        size-limited batches. Without Vertex AI (or when a batch fails) local
+        hashed embeddings are used, and those are not cached.
+        """
+        if not self.initialized:
+            return hashed_embeddings(texts, self.embedding_dimension)
+
+        vectors, missing = self.embedding_cache.lookup(texts)
+        if not missing:
+            return vectors
+
+        missing_texts = [texts[index] for index in missing]
+        for batch in batch_texts(missing_texts, self.embedding_batch_size, self.embedding_batch_chars):
+            chunk = [missing_texts[index] for index in batch]
+            rows = [missing[index] for index in batch]
+            try:
+                embeddings = await asyncio.to_thread(self.embedding_model.get_embeddings, chunk)
+                batch_vectors = np.array([embedding.values for embedding in embeddings], dtype=np.float32)
+                self.embedding_cache.store(chunk, batch_vectors)
+            except Exception as e:
+                logger.error(f"Error generating embeddings: {str(e)}")
+                batch_vectors = hashed_embeddings(chunk, self.embedding_dimension)
+            vectors[rows] = batch_vectors
+        return vectors
     
     async def predict_improvement_score(self, candidate: ImprovementCandidate) -> float:
         """Predict improvement score using ML model"""
@@ -243,6 +279,107 @@ class OpenAIReasoner:
             logger.error(f"Error in OpenAI reasoning: {str(e)}")
             return 0.5, f"Fallback reasoning: {candidate.description}"
     
+    async def reason_candidates(self,
+                                scored: List[Tuple[ImprovementCandidate, float]],
+                                context: Dict[str, Any]) -> Dict[str, Tuple[float, str]]:
+        """
+        Reason about several candidates, batching them into one prompt
+        
+        Candidates the batch response does not cover are retried one by one.
+        Returns (score, reasoning) by candidate id; candidates whose reasoning
+        failed are omitted so callers can apply their own fallback.
+        """
+        results: Dict[str, Tuple[float, str]] = {}
+        if len(scored) > 1:
+            try:
+                response = await self.openai_service.generate_response(
+                    system_prompt="You are an expert AI system analyst specializing in improvement prioritization.",
+                    conversation_history=[{
+                        "role": "user",
+                        "content": self._build_batch_prompt(scored, context)
+                    }]
+                )
+                results.update(self._parse_batch_response(response, {c.id for c, _ in scored}))
+            except Exception as e:
+                logger.error(f"Error in batched OpenAI reasoning: {str(e)}")
+
+        for candidate, ml_score in scored:
+            if candidate.id in results:
+                continue
+            try:
+                response = await self.openai_service.generate_response(
+                    system_prompt="You are an expert AI system analyst specializing in improvement prioritization.",
+                    conversation_history=[{
+                        "role": "user",
+                        "content": self._build_reasoning_prompt(candidate, ml_score, context)
+                    }]
+                )
+                reasoning_result = self._parse_reasoning_response(response)
+                results[candidate.id] = (reasoning_result["score"], reasoning_result["reasoning"])
+            except Exception as e:
+                logger.error(f"Error in OpenAI reasoning for {candidate.id}: {str(e)}")
+
+        return results
+
+    def _build_batch_prompt(self,
+                            scored: List[Tuple[ImprovementCandidate, float]],
+                            context: Dict[str, Any]) -> str:
+        """Build one prompt covering several candidates"""
+        candidates = "\n".join(
+            f"- id: {candidate.id} | title: {candidate.title} | description: {candidate.description} | "
+            f"category: {getattr(candidate.category, 'value', candidate.category)} | "
+            f"impact: {candidate.estimated_impact} | effort: {candidate.estimated_effort} | "
+            f"risk: {candidate.risk_level} | source: {candidate.source_agent} | ML score: {ml_score}"
+            for candidate, ml_score in scored
+        )
+        return f"""
+        Analyze each improvement candidate below and provide a priority score (0.0-1.0) with reasoning:
+
+        **Improvement Candidates:**
+        {candidates}
+
+        **System Context:**
+        - Current Performance: {context.get('current_performance', 'Unknown')}
+        - Recent Issues: {context.get('recent_issues', 'None')}
+        - Resource Availability: {context.get('resource_availability', 'Normal')}
+        - Business Priority: {context.get('business_priority', 'Standard')}
+
+        **Analysis Requirements:**
+        1. Validate each ML score against business logic
+        2. Consider strategic alignment and timing
+        3. Assess potential risks and dependencies
+
+        **Response Format (one entry per candidate id):**
+        {{
+            "results": [
+                {{"id": "<candidate id>", "score": <float 0.0-1.0>, "reasoning": "<explanation>"}}
+            ]
+        }}
+        """
+
+    def _parse_batch_response(self, response: str, candidate_ids: set) -> Dict[str, Tuple[float, str]]:
+        """Parse a batched reasoning response into per-candidate results"""
+        try:
+            json_start = response.find("{")
+            json_end = response.rfind("}") + 1
+            if json_start < 0 or json_end <= json_start:
+                return {}
+            entries = json.loads(response[json_start:json_end]).get("results")
+            if not isinstance(entries, list):
+                return {}
+
+            results = {}
+            for entry in entries:
+                candidate_id = str(entry.get("id", ""))
+                if candidate_id in candidate_ids and "score" in entry:
+                    score = max(0.0, min(1.0, float(entry["score"])))
+                    results[candidate_id] = (score, entry.get("reasoning", "No reasoning provided"))
+            return results
+
+        except Exception as e:
+            logger.error(f"Error parsing batched reasoning response: {str(e)}")
+            return {}
+
     def _build_reasoning_prompt(self, 
                                candidate: ImprovementCandidate,
                                ml_score: float,
@@ -327,32 +464,63 @@ class PrioritizationEngine:
     
     Combines Vertex AI machine learning with OpenAI reasoning
     for intelligent improvement prioritization
+
+    Features:
+    - Candidates are reasoned about in batches with bounded concurrency
+    - Reasoning is cached by candidate content, so recurring issues are not re-reasoned
+    - Near-duplicate candidates (embedding similarity) share one reasoning call
+    - Optional deadline: unfinished candidates fall back to their ML score
     """
     
     def __init__(self, 
                  project_id: Optional[str] = None,
                  location: str = "us-central1",
-                 openai_service: Optional[OpenAIService] = None):
+                 openai_service: Optional[OpenAIService] = None,
+                 embedding_cache_path: Optional[str] = None):
         
         self.project_id = project_id or getattr(settings, 'google_cloud_project', 'default-project')
-        self.vertex_predictor = VertexAIPredictor(self.project_id, location)
+        self.vertex_predictor = VertexAIPredictor(
+            self.project_id, location, EmbeddingCache(path=embedding_cache_path)
+        )
         self.openai_reasoner = OpenAIReasoner(openai_service)
         
         # Prioritization history for learning
-        self.prioritization_history: List[PrioritizationResult] = []
+        self.max_history_size = 1000
+        self.prioritization_history: deque = deque(maxlen=self.max_history_size)
         self.performance_feedback: Dict[str, float] = {}
+
+        # Reasoning configuration
+        self.reasoning_concurrency = 4
+        self.reasoning_batch_size = 5
+        self.reasoning_cache_size = 1024
+        self.reasoning_cache_ttl = timedelta(hours=24)
+        # Uncached candidates at least this similar are reasoned about once
+        self.similarity_threshold = 0.92
+        self._reasoning_cache: "OrderedDict[str, Tuple[float, str, float]]" = OrderedDict()
+        self.reasoning_stats = {
+            "reasoned": 0,
+            "batches": 0,
+            "cache_hits": 0,
+            "deduplicated": 0,
+            "merged": 0,
+            "deadline_fallbacks": 0,
+            "reasoning_errors": 0
+        }
         
         logger.info("Prioritization Engine initialized with hybrid ML approach")
     
     async def prioritize_improvements(self, 
                                     candidates: List[ImprovementCandidate],
-                                    context: Optional[Dict[str, Any]] = None) -> List[PrioritizationResult]:
+                                    context: Optional[Dict[str, Any]] = None,
+                                    deadline_seconds: Optional[float] = None) -> List[PrioritizationResult]:
         """
         Prioritize a list of improvement candidates
         
         Args:
             candidates: List of improvement candidates
             context: Additional context for prioritization
+            deadline_seconds: Time budget for reasoning; candidates not reasoned
+                about in time are prioritized by their ML score
             
         Returns:
             List of prioritization results sorted by priority
@@ -361,14 +529,49 @@ class PrioritizationEngine:
             return []
         
         context = context or {}
-        results = []
-        
         logger.info(f"Prioritizing {len(candidates)} improvement candidates")
-        
-        for candidate in candidates:
+
+        # Step 1: ML-based scores (in-process, cheap)
+        ml_scores = await asyncio.gather(
+            *(self.vertex_predictor.predict_improvement_score(candidate) for candidate in candidates),
+            return_exceptions=True
+        )
+
+        # Step 2: reasoning for candidates whose content has not been seen recently
+        context_key = self._context_key(context)
+        keys = [self._candidate_key(candidate, context_key) for candidate in candidates]
+        reasoning = self._cached_reasoning(keys)
+        pending: Dict[str, Tuple[ImprovementCandidate, float]] = {}
+        for candidate, key, ml_score in zip(candidates, keys, ml_scores):
+            if key in reasoning or isinstance(ml_score, BaseException):
+                continue
+            if key in pending:
+                self.reasoning_stats["deduplicated"] += 1
+            else:
+                pending[key] = (candidate, ml_score)
+        if pending:
+            aliases = await self._merge_near_duplicates(pending)
+            reasoning.update(await self._reason_pending(pending, context, deadline_seconds))
+            for key, leader in aliases.items():
+                if leader in reasoning:
+                    reasoning[key] = reasoning[leader]
+
+        # Step 3: combine scores
+        results = []
+        for candidate, key, ml_score in zip(candidates, keys, ml_scores):
             try:
-                result = await self._prioritize_single_candidate(candidate, context)
-                results.append(result)
+                if isinstance(ml_score, BaseException):
+                    raise ml_score
+                if key in reasoning:
+                    reasoning_score, reasoning_text = reasoning[key]
+                    results.append(self._build_result(candidate, ml_score, reasoning_score, reasoning_text))
+                else:
+                    self.reasoning_stats["deadline_fallbacks"] += 1
+                    results.append(self._build_result(
+                        candidate, ml_score, ml_score,
+                        "Reasoning unavailable within deadline - using ML score",
+                        max_confidence=0.5
+                    ))
                 
             except Exception as e:
                 logger.error(f"Error prioritizing candidate {candidate.id}: {str(e)}")
@@ -393,30 +596,126 @@ class PrioritizationEngine:
         
         logger.info(f"Prioritization complete - {len(results)} results generated")
         return results
-    
-    async def _prioritize_single_candidate(self, 
-                                         candidate: ImprovementCandidate,
-                                         context: Dict[str, Any]) -> PrioritizationResult:
-        """Prioritize a single improvement candidate"""
-        
-        # Step 1: Get ML-based score from Vertex AI
-        ml_score = await self.vertex_predictor.predict_improvement_score(candidate)
-        
-        # Step 2: Get reasoning-based analysis from OpenAI
-        reasoning_score, reasoning_text = await self.openai_reasoner.analyze_improvement_reasoning(
-            candidate, ml_score, context
-        )
+
+    def _context_key(self, context: Dict[str, Any]) -> str:
+        return json.dumps(context, sort_keys=True, default=str)
+
+    def _candidate_key(self, candidate: ImprovementCandidate, context_key: str) -> str:
+        """Content hash of a candidate; ids and timestamps are excluded so recurring issues match"""
+        content = json.dumps([
+            candidate.title,
+            candidate.description,
+            getattr(candidate.category, "value", candidate.category),
+            candidate.estimated_impact,
+            candidate.estimated_effort,
+            candidate.risk_level,
+            candidate.source_agent,
+            sorted(candidate.performance_data.items()) if candidate.performance_data else [],
+            context_key
+        ], default=str)
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def _cached_reasoning(self, keys: List[str]) -> Dict[str, Tuple[float, str]]:
+        """Fresh cached reasoning for the given keys"""
+        now = time.monotonic()
+        ttl = self.reasoning_cache_ttl.total_seconds()
+        found = {}
+        for key in keys:
+            entry = self._reasoning_cache.get(key)
+            if entry is None:
+                continue
+            if now - entry[2] > ttl:
+                del self._reasoning_cache[key]
+                continue
+            self.reasoning_stats["cache_hits"] += 1
+            found[key] = (entry[0], entry[1])
+        return found
+
+    def _cache_reasoning(self, key: str, score: float, reasoning: str) -> None:
+        self._reasoning_cache[key] = (score, reasoning, time.monotonic())
+        self._reasoning_cache.move_to_end(key)
+        while len(self._reasoning_cache) > self.reasoning_cache_size:
+            self._reasoning_cache.popitem(last=False)
+
+    async def _merge_near_duplicates(self, pending: Dict[str, Tuple[ImprovementCandidate, float]]) -> Dict[str, str]:
+        """
+        Drop near-duplicate candidates from pending, in place
         
-        # Step 3: Combine scores with weighted approach
+        Returns a map from each dropped candidate key to the key of the
+        cluster representative whose reasoning it will share.
+        """
+        if len(pending) < 2:
+            return {}
+
+        keys = list(pending)
+        texts = [
+            f"{getattr(candidate.category, 'value', candidate.category)}: {candidate.title}\n{candidate.description}"
+            for candidate, _ in pending.values()
+        ]
+        try:
+            labels = group_near_duplicates(await self.vertex_predictor.embed(texts), self.similarity_threshold)
+        except Exception as e:
+            logger.error(f"Error grouping similar candidates: {str(e)}")
+            return {}
+
+        aliases = {}
+        for index in np.flatnonzero(labels != np.arange(len(keys))).tolist():
+            aliases[keys[index]] = keys[labels[index]]
+            del pending[keys[index]]
+        self.reasoning_stats["merged"] += len(aliases)
+        return aliases
+
+    async def _reason_pending(self,
+                              pending: Dict[str, Tuple[ImprovementCandidate, float]],
+                              context: Dict[str, Any],
+                              deadline_seconds: Optional[float]) -> Dict[str, Tuple[float, str]]:
+        """Reason about unique uncached candidates in concurrent batches"""
+        semaphore = asyncio.Semaphore(self.reasoning_concurrency)
+        items = list(pending.items())
+        batches = [
+            items[start:start + self.reasoning_batch_size]
+            for start in range(0, len(items), self.reasoning_batch_size)
+        ]
+        reasoning: Dict[str, Tuple[float, str]] = {}
+
+        async def reason_batch(batch: List[Tuple[str, Tuple[ImprovementCandidate, float]]]):
+            async with semaphore:
+                self.reasoning_stats["batches"] += 1
+                try:
+                    by_id = await self.openai_reasoner.reason_candidates([scored for _, scored in batch], context)
+                except Exception as e:
+                    logger.error(f"Error in reasoning batch: {str(e)}")
+                    by_id = {}
+            # Results are recorded as each batch lands, so a deadline keeps finished work
+            for key, (candidate, _) in batch:
+                if candidate.id in by_id:
+                    score, text = by_id[candidate.id]
+                    reasoning[key] = (score, text)
+                    self._cache_reasoning(key, score, text)
+                    self.reasoning_stats["reasoned"] += 1
+                else:
+                    # Failed reasoning is not cached so the candidate is retried next time
+                    reasoning[key] = (0.5, f"Fallback reasoning: {candidate.description}")
+                    self.reasoning_stats["reasoning_errors"] += 1
+
+        tasks = [asyncio.create_task(reason_batch(batch)) for batch in batches]
+        _, unfinished = await asyncio.wait(tasks, timeout=deadline_seconds)
+        for task in unfinished:
+            task.cancel()
+        if unfinished:
+            await asyncio.gather(*unfinished, return_exceptions=True)
+        return reasoning
+
+    def _build_result(self,
+                      candidate: ImprovementCandidate,
+                      ml_score: float,
+                      reasoning_score: float,
+                      reasoning_text: str,
+                      max_confidence: float = 1.0) -> PrioritizationResult:
+        """Combine ML and reasoning scores into a prioritization result"""
         combined_score = self._combine_scores(ml_score, reasoning_score, candidate)
-        
-        # Step 4: Determine final priority
         final_priority = self._score_to_priority(combined_score)
-        
-        # Step 5: Calculate confidence
-        confidence = self._calculate_confidence(ml_score, reasoning_score, candidate)
-        
-        # Step 6: Generate timeline recommendation
+        confidence = min(max_confidence, self._calculate_confidence(ml_score, reasoning_score, candidate))
         timeline = self._recommend_timeline(final_priority, candidate)
         
         return PrioritizationResult(
@@ -430,6 +729,22 @@ class PrioritizationEngine:
             recommended_timeline=timeline
         )
     
+    async def _prioritize_single_candidate(self, 
+                                         candidate: ImprovementCandidate,
+                                         context: Dict[str, Any]) -> PrioritizationResult:
+        """Prioritize a single improvement candidate"""
+        
+        # Step 1: Get ML-based score from Vertex AI
+        ml_score = await self.vertex_predictor.predict_improvement_score(candidate)
+        
+        # Step 2: Get reasoning-based analysis from OpenAI
+        reasoning_score, reasoning_text = await self.openai_reasoner.analyze_improvement_reasoning(
+            candidate, ml_score, context
+        )
+        
+        # Steps 3-6: combine scores, priority, confidence and timeline
+        return self._build_result(candidate, ml_score, reasoning_score, reasoning_text)
+    
     def _combine_scores(self, 
                        ml_score: float, 
                        reasoning_score: float, 
@@ -536,5 +851,7 @@ class PrioritizationEngine:
             "priority_distribution": priority_counts,
             "average_confidence": avg_confidence,
             "vertex_ai_available": self.vertex_predictor.initialized,
-            "last_prioritization": self.prioritization_history[-1].candidate.timestamp.isoformat()
+            "last_prioritization": self.prioritization_history[-1].candidate.timestamp.isoformat(),
+            "reasoning": {**self.reasoning_stats, "cached": len(self._reasoning_cache)},
+            "embedding_cache": self.vertex_predictor.embedding_cache.get_stats()
         }
@@ -4,13 +4,17 @@ Implements adaptive resource management based on demand and performance
 """
 import logging
 import asyncio
+import time
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 from enum import Enum
 from dataclasses import dataclass
 import json
 import uuid
 
+import numpy as np
+
 # Google Cloud imports
 try:
     import vertexai
@@ -24,6 +28,8 @@ except ImportError:
 from voicehive.services.ai.openai_service import OpenAIService
 from voicehive.utils.exceptions import VoiceHiveError, ErrorHandler
 from voicehive.core.settings import get_settings
+from voicehive.utils.deadlines import DeadlineHeap
+from voicehive.utils.priority_queue import KeyedPriorityQueue
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -110,8 +116,96 @@ class ResourceMetrics:
     timestamp: datetime
 
 
+class AllocationLedger:
+    """
+    Columnar record of released allocations
+
+    Features:
+    - One NumPy column per field (resource type code, amount, hourly cost,
+      allocation / expiry / release timestamps, expired flag)
+    - Fixed-capacity ring: the oldest records are overwritten once full
+    - Vectorized usage reports (unit-hours and accrued cost per resource type
+      within a time window)
+    """
+
+    RESOURCE_TYPES = list(ResourceType)
+
+    def __init__(self, capacity: int = 100_000):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._codes = {rt: code for code, rt in enumerate(self.RESOURCE_TYPES)}
+        self.resource_type = np.zeros(capacity, dtype=np.int8)
+        self.amount = np.zeros(capacity)
+        self.cost_per_hour = np.zeros(capacity)
+        self.allocated_at = np.zeros(capacity)
+        self.expires_at = np.full(capacity, np.nan)
+        self.released_at = np.zeros(capacity)
+        self.expired = np.zeros(capacity, dtype=bool)
+        # Records ever appended; the write position is total % capacity
+        self.total = 0
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+
+    def append(self, allocation: ResourceAllocation, released_at: float, expired: bool) -> None:
+        row = self.total % self.capacity
+        self.resource_type[row] = self._codes[allocation.resource_type]
+        self.amount[row] = allocation.allocated_amount
+        self.cost_per_hour[row] = allocation.cost
+        self.allocated_at[row] = allocation.allocation_time.timestamp()
+        self.expires_at[row] = allocation.expiry_time.timestamp() if allocation.expiry_time else np.nan
+        self.released_at[row] = released_at
+        self.expired[row] = expired
+        self.total += 1
+
+    def usage(self, since: Optional[float] = None, until: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """Per resource type: records, expiries, unit-hours and cost accrued within [since, until]"""
+        live = slice(0, len(self))
+        start = self.allocated_at[live]
+        end = self.released_at[live]
+        if since is not None:
+            start = np.maximum(start, since)
+        if until is not None:
+            end = np.minimum(end, until)
+        # Held intervals clipped to the window; records that do not overlap it have start > end
+        in_window = start <= end
+        hours = np.where(in_window, end - start, 0.0) / 3600
+
+        codes = self.resource_type[live]
+        size = len(self.RESOURCE_TYPES)
+        records = np.bincount(codes, weights=in_window, minlength=size)
+        expired = np.bincount(codes, weights=in_window & self.expired[live], minlength=size)
+        unit_hours = np.bincount(codes, weights=hours * self.amount[live], minlength=size)
+        cost = np.bincount(codes, weights=hours * self.cost_per_hour[live], minlength=size)
+
+        return {
+            rt.value: {
+                "allocations": int(records[code]),
+                "expired": int(expired[code]),
+                "unit_hours": float(unit_hours[code]),
+                "cost": float(cost[code])
+            }
+            for code, rt in enumerate(self.RESOURCE_TYPES) if records[code]
+        }
+
+
+def _request_priority(request: "AllocationRequest") -> Tuple[int, datetime]:
+    """Pending-queue order: priority first, then earliest deadline"""
+    return request.priority, request.deadline or datetime.max
+
+
 class ResourceOptimizer:
-    """Optimization engine for resource allocation"""
+    """
+    Optimization engine for resource allocation
+
+    Batch allocation is a 0/1 knapsack per resource type coupled by an hourly
+    budget, solved through its LP relaxation: within a type, cost is
+    proportional to amount, so the optimal fractional order is by priority
+    weight per unit and does not depend on the budget multiplier. One sort per
+    type plus a bisection on the multiplier gives the integral prefix; leftover
+    capacity is then filled greedily with the requests that still fit.
+    """
     
     def __init__(self):
         # Resource specifications
@@ -128,6 +222,11 @@ class ResourceOptimizer:
             "utilization": 0.2,
             "fairness": 0.1
         }
+
+        # Batch solver parameters: objective weight per priority level (1=highest)
+        self.priority_weights = {1: 16.0, 2: 8.0, 3: 4.0, 4: 2.0, 5: 1.0}
+        self.budget_limit_per_hour = 1000.0
+        self.last_solution: Dict[str, Any] = {}
     
     def _initialize_resource_specs(self) -> Dict[ResourceType, ResourceSpec]:
         """Initialize resource specifications"""
@@ -167,23 +266,148 @@ class ResourceOptimizer:
         }
     
     def calculate_optimal_allocation(self, 
-                                   requests: List[AllocationRequest],
+                                   requests: Sequence[AllocationRequest],
                                    current_metrics: Dict[ResourceType, ResourceMetrics],
                                    strategy: AllocationStrategy = AllocationStrategy.BALANCED) -> List[ResourceAllocation]:
-        """Calculate optimal resource allocation"""
-        
+        """Allocate the set of pending requests that maximizes weighted priority under capacity and budget"""
+        requests = list(requests)
+        selected = self.solve_batch(requests, current_metrics)
+
         allocations = []
-        
-        # Sort requests by priority and deadline
-        sorted_requests = sorted(requests, key=lambda r: (r.priority, r.deadline or datetime.max))
-        
-        for request in sorted_requests:
-            allocation = self._allocate_for_request(request, current_metrics, strategy)
-            if allocation:
-                allocations.append(allocation)
-        
+        for index in selected:
+            request = requests[index]
+            spec = self.resource_specs[request.resource_type]
+            allocations.append(self._create_allocation(request, request.requested_amount, spec, strategy))
         return allocations
-    
+
+    def solve_batch(self,
+                    requests: Sequence[AllocationRequest],
+                    current_metrics: Dict[ResourceType, ResourceMetrics]) -> List[int]:
+        """
+        Select requests to fulfil in full
+
+        Returns:
+            Indices into requests, in (priority, deadline) order
+        """
+        start = time.perf_counter()
+        types = [rt for rt in self.resource_specs if rt in current_metrics]
+        type_index = {rt: i for i, rt in enumerate(types)}
+        n = len(requests)
+
+        kind = np.fromiter((type_index.get(r.resource_type, -1) for r in requests), np.int64, n)
+        amount = np.fromiter((r.requested_amount for r in requests), float, n)
+        priority = np.fromiter((r.priority for r in requests), np.int64, n)
+        weight = np.fromiter((self.priority_weights.get(r.priority, 1.0) for r in requests), float, n)
+        deadline = np.fromiter((r.deadline.timestamp() if r.deadline else np.inf for r in requests), float, n)
+
+        unit_cost = np.array([self.resource_specs[rt].cost_per_unit for rt in types])
+        capacity = np.array([
+            max(0.0, max(self.resource_specs[rt].scaling_limits[1], current_metrics[rt].total_capacity)
+                - current_metrics[rt].allocated_amount)
+            for rt in types
+        ])
+        committed = sum(metric.cost_per_hour for metric in current_metrics.values())
+        budget = max(0.0, self.budget_limit_per_hour - committed)
+
+        valid = (kind >= 0) & (amount >= 0)
+        density = np.where(valid, weight / np.maximum(amount, 1e-12), -np.inf)
+        # Grouped by type, best weight per unit first, earlier deadline then arrival breaking ties
+        order = np.lexsort((np.arange(n), deadline, -density, kind))
+        order = order[valid[order]]
+        segments = np.searchsorted(kind[order], np.arange(len(types) + 1))
+
+        groups = []
+        for t in range(len(types)):
+            members = order[segments[t]:segments[t + 1]]
+            groups.append((members, density[members], np.cumsum(amount[members])))
+
+        def prefix_lengths(multiplier: float) -> List[int]:
+            lengths = []
+            for t, (members, dens, cumulative) in enumerate(groups):
+                fits = np.searchsorted(cumulative, capacity[t] * (1 + 1e-12), side="right")
+                worth = np.searchsorted(-dens, -multiplier * unit_cost[t], side="left")
+                lengths.append(int(min(fits, worth)))
+            return lengths
+
+        def spend(lengths: List[int]) -> float:
+            return sum(unit_cost[t] * groups[t][2][k - 1] for t, k in enumerate(lengths) if k)
+
+        # Smallest budget multiplier whose integral prefixes fit the budget
+        multiplier = 0.0
+        lengths = prefix_lengths(0.0)
+        if spend(lengths) > budget:
+            costed = order[amount[order] > 0]
+            low, high = 0.0, max(float(density[costed].max(initial=0.0)) / max(unit_cost.min(initial=1.0), 1e-12), 1.0)
+            for _ in range(60):
+                middle = (low + high) / 2
+                if spend(prefix_lengths(middle)) > budget:
+                    low = middle
+                else:
+                    high = middle
+            multiplier = high
+            lengths = prefix_lengths(multiplier)
+
+        chosen = np.zeros(n, dtype=bool)
+        remaining = capacity.copy()
+        for t, k in enumerate(lengths):
+            if k:
+                chosen[groups[t][0][:k]] = True
+                remaining[t] -= groups[t][2][k - 1]
+        budget_left = budget - spend(lengths)
+
+        # First-fit the leftover capacity with the best remaining requests
+        next_density = [groups[t][1][k] if k < len(groups[t][0]) else -np.inf for t, k in enumerate(lengths)]
+        for t in np.argsort(next_density)[::-1]:
+            members = groups[t][0][lengths[t]:]
+            while len(members):
+                limit = min(remaining[t], budget_left / unit_cost[t] if unit_cost[t] > 0 else np.inf)
+                members = members[amount[members] <= limit * (1 + 1e-12)]
+                if not len(members):
+                    break
+                cumulative = np.cumsum(amount[members])
+                k = int(np.searchsorted(cumulative, limit * (1 + 1e-12), side="right"))
+                chosen[members[:k]] = True
+                remaining[t] -= cumulative[k - 1]
+                budget_left -= cumulative[k - 1] * unit_cost[t]
+                members = members[k:]
+
+        selected = np.flatnonzero(chosen)
+        selected = selected[np.lexsort((selected, deadline[selected], priority[selected]))]
+
+        for t, rt in enumerate(types):
+            used = capacity[t] - remaining[t]
+            headroom = current_metrics[rt].total_capacity - current_metrics[rt].allocated_amount
+            if used > headroom:
+                # This would trigger actual scaling in production
+                logger.info(f"Scaling up {rt.value} by {used - max(headroom, 0.0)}")
+
+        self.last_solution = {
+            "requests": n,
+            "allocated": int(len(selected)),
+            "objective": float(weight[selected].sum()),
+            "lp_bound": self._lp_bound(groups, capacity, unit_cost, budget, multiplier, amount, weight),
+            "budget_multiplier": float(multiplier),
+            "cost_per_hour": float(budget - budget_left),
+            "solve_ms": (time.perf_counter() - start) * 1000
+        }
+        return selected.tolist()
+
+    @staticmethod
+    def _lp_bound(groups, capacity: np.ndarray, unit_cost: np.ndarray, budget: float,
+                  multiplier: float, amount: np.ndarray, weight: np.ndarray) -> float:
+        """Lagrangian (LP) upper bound on the objective at the given budget multiplier"""
+        bound = multiplier * budget
+        for t, (members, dens, cumulative) in enumerate(groups):
+            reduced = dens - multiplier * unit_cost[t]
+            worth = int(np.searchsorted(-reduced, 0.0, side="left"))
+            fits = int(np.searchsorted(cumulative[:worth], capacity[t], side="right"))
+            value = float((weight[members[:fits]] - multiplier * unit_cost[t] * amount[members[:fits]]).sum())
+            if fits < worth:
+                used = cumulative[fits - 1] if fits else 0.0
+                value += reduced[fits] * (capacity[t] - used)
+            bound += value
+        return float(bound)
+
     def _allocate_for_request(self, 
                             request: AllocationRequest,
                             current_metrics: Dict[ResourceType, ResourceMetrics],
@@ -217,13 +441,20 @@ class ResourceOptimizer:
                 logger.warning(f"Cannot fulfill request {request.id} - insufficient capacity")
                 return None
         
-        # Create allocation
         allocation_amount = min(request.requested_amount, available_capacity)
+        return self._create_allocation(request, allocation_amount, resource_spec, strategy)
+
+    def _create_allocation(self,
+                           request: AllocationRequest,
+                           allocation_amount: float,
+                           resource_spec: ResourceSpec,
+                           strategy: AllocationStrategy) -> ResourceAllocation:
+        """Create the allocation record for a request"""
         expiry_time = None
         if request.duration_hours:
             expiry_time = request.timestamp + timedelta(hours=request.duration_hours)
         
-        allocation = ResourceAllocation(
+        return ResourceAllocation(
             id=str(uuid.uuid4()),
             resource_type=request.resource_type,
             allocated_amount=allocation_amount,
@@ -238,8 +469,6 @@ class ResourceOptimizer:
                 "priority": request.priority
             }
         )
-        
-        return allocation
     
     def optimize_existing_allocations(self, 
                                     allocations: List[ResourceAllocation],
@@ -375,6 +604,10 @@ class ResourceAllocator:
     - Cost optimization with performance constraints
     - Multi-criteria decision making
     - Real-time allocation adjustments
+    - Expiry enforced on time: allocations are indexed by expiry and released
+      by a loop timer (and by a sweep before every read)
+    - Per-type active totals maintained on every transition, and released
+      allocations kept in a columnar ledger for usage reporting
     """
     
     def __init__(self, 
@@ -388,18 +621,32 @@ class ResourceAllocator:
         self.openai_service = openai_service or OpenAIService()
         
         # Allocation state
-        self.pending_requests: List[AllocationRequest] = []
+        self.pending_requests: KeyedPriorityQueue[AllocationRequest] = KeyedPriorityQueue(
+            key=lambda request: request.id, priority=_request_priority
+        )
         self.active_allocations: Dict[str, ResourceAllocation] = {}
-        self.allocation_history: List[ResourceAllocation] = []
+        
+        # Configuration
+        self.optimization_interval = timedelta(minutes=10)
+        self.max_allocation_history = 100_000
+        
+        # Allocation lifecycle: expiry deadlines (epoch seconds) with a loop timer for
+        # the earliest, per-type active totals, and a ledger of released allocations
+        self._expiry_index = DeadlineHeap()
+        self._expiry_timer: Optional[asyncio.TimerHandle] = None
+        self._expiry_timer_deadline: Optional[float] = None
+        self.active_totals: Dict[ResourceType, Dict[str, float]] = {
+            rt: {"count": 0, "allocated_amount": 0.0, "cost_per_hour": 0.0} for rt in ResourceType
+        }
+        self.allocation_ledger = AllocationLedger(self.max_allocation_history)
+        self.lifecycle_stats = {"allocated": 0, "released": 0, "expired": 0}
+        # Bumped whenever active allocations or resource metrics change, so consumers can cache derived state
+        self.state_version = 0
         
         # Metrics tracking
         self.resource_metrics: Dict[ResourceType, ResourceMetrics] = {}
         self.last_optimization_time = datetime.now()
         
-        # Configuration
-        self.optimization_interval = timedelta(minutes=10)
-        self.max_allocation_history = 10000
-        
         logger.info("Resource Allocator initialized with intelligent scheduling")
     
     async def request_resources(self, 
@@ -439,7 +686,7 @@ class ResourceAllocator:
             deadline=deadline
         )
         
-        self.pending_requests.append(request)
+        self.pending_requests.push(request)
         
         logger.info(f"Resource request {request_id} created for {requesting_agent}")
         
@@ -461,8 +708,8 @@ class ResourceAllocator:
             )
             
             if allocation:
-                self.active_allocations[allocation.id] = allocation
-                self.pending_requests.remove(request)
+                self._activate(allocation)
+                self.pending_requests.remove(request.id)
                 
                 logger.info(f"High-priority allocation {allocation.id} processed immediately")
             else:
@@ -494,20 +741,10 @@ class ResourceAllocator:
                 self.pending_requests, current_metrics, strategy
             )
             
-            # Apply new allocations
-            allocated_requests = []
+            # Apply new allocations and drop their requests from the queue
             for allocation in new_allocations:
-                self.active_allocations[allocation.id] = allocation
-                
-                # Find and remove corresponding request
-                for request in self.pending_requests:
-                    if request.id == allocation.metadata.get("request_id"):
-                        allocated_requests.append(request)
-                        break
-            
-            # Remove allocated requests from pending
-            for request in allocated_requests:
-                self.pending_requests.remove(request)
+                self._activate(allocation)
+                self.pending_requests.remove(allocation.metadata.get("request_id"))
             
             # Optimize existing allocations
             optimizations = self.resource_optimizer.optimize_existing_allocations(
@@ -525,7 +762,7 @@ class ResourceAllocator:
                 "pending_requests": len(self.pending_requests),
                 "active_allocations": len(self.active_allocations),
                 "optimizations_applied": len(applied_optimizations),
-                "total_cost_per_hour": sum(alloc.cost for alloc in self.active_allocations.values()),
+                "total_cost_per_hour": self.total_cost_per_hour,
                 "optimization_time": datetime.now().isoformat()
             }
             
@@ -539,7 +776,7 @@ class ResourceAllocator:
         try:
             # Prepare data for AI analysis
             historical_data = {
-                "allocation_history_size": len(self.allocation_history),
+                "allocation_history_size": self.allocation_ledger.total,
                 "average_utilization": self._calculate_average_utilization(current_metrics),
                 "cost_trend": "stable"  # This would be calculated from history
             }
@@ -574,14 +811,13 @@ class ResourceAllocator:
     
     async def _get_current_metrics(self) -> Dict[ResourceType, ResourceMetrics]:
         """Get current resource metrics"""
+        self.release_expired()
         metrics = {}
+        pending_by_type = Counter(request.resource_type for request in self.pending_requests)
         
         for resource_type, spec in self.resource_optimizer.resource_specs.items():
-            # Calculate current allocation
-            allocated_amount = sum(
-                alloc.allocated_amount for alloc in self.active_allocations.values()
-                if alloc.resource_type == resource_type and alloc.status == ResourceStatus.ALLOCATED
-            )
+            # Current allocation, from the incrementally maintained totals
+            allocated_amount = self.active_totals[resource_type]["allocated_amount"]
             
             # Calculate utilization
             utilization = (allocated_amount / spec.capacity) * 100 if spec.capacity > 0 else 0
@@ -594,13 +830,14 @@ class ResourceAllocator:
                 total_capacity=spec.capacity,
                 allocated_amount=allocated_amount,
                 utilization_percentage=utilization,
-                pending_requests=len([r for r in self.pending_requests if r.resource_type == resource_type]),
+                pending_requests=pending_by_type[resource_type],
                 cost_per_hour=allocated_amount * spec.cost_per_unit,
                 efficiency_score=efficiency,
                 timestamp=datetime.now()
             )
         
         self.resource_metrics = metrics
+        self.state_version += 1
         return metrics
     
     def _calculate_average_utilization(self, metrics: Dict[ResourceType, ResourceMetrics]) -> float:
@@ -634,14 +871,11 @@ class ResourceAllocator:
                 if allocation_id in self.active_allocations:
                     allocation = self.active_allocations[allocation_id]
                     
-                    if optimization["type"] == "downscale":
-                        allocation.allocated_amount = optimization["recommended_amount"]
-                        allocation.status = ResourceStatus.SCALING
-                        applied.append(optimization)
-                        
-                    elif optimization["type"] == "upscale":
+                    if optimization["type"] in ("downscale", "upscale"):
+                        self._track(allocation, -1)
                         allocation.allocated_amount = optimization["recommended_amount"]
                         allocation.status = ResourceStatus.SCALING
+                        self._track(allocation, 1)
                         applied.append(optimization)
                 
             except Exception as e:
@@ -649,8 +883,102 @@ class ResourceAllocator:
         
         return applied
     
+    def _activate(self, allocation: ResourceAllocation):
+        """Record a new active allocation and index its expiry"""
+        self.active_allocations[allocation.id] = allocation
+        self._track(allocation, 1)
+        self.lifecycle_stats["allocated"] += 1
+        if allocation.expiry_time:
+            if self._expiry_index.schedule(allocation.id, allocation.expiry_time.timestamp()):
+                self._arm_expiry_timer()
+
+    def _track(self, allocation: ResourceAllocation, sign: int):
+        """Add (sign=1) or remove (sign=-1) an active allocation from the per-type totals"""
+        self.state_version += 1
+        totals = self.active_totals[allocation.resource_type]
+        totals["count"] += sign
+        totals["cost_per_hour"] += sign * allocation.cost
+        if allocation.status == ResourceStatus.ALLOCATED:
+            totals["allocated_amount"] += sign * allocation.allocated_amount
+        if totals["count"] == 0:
+            # Drop accumulated rounding error
+            totals["cost_per_hour"] = totals["allocated_amount"] = 0.0
+
+    def release_allocation(self, allocation_id: str, expired: bool = False) -> bool:
+        """Release an active allocation into the ledger"""
+        allocation = self.active_allocations.pop(allocation_id, None)
+        if allocation is None:
+            return False
+        self._track(allocation, -1)
+        self._expiry_index.discard(allocation_id)
+        self.allocation_ledger.append(allocation, time.time(), expired)
+        self.lifecycle_stats["expired" if expired else "released"] += 1
+        return True
+
+    def release_expired(self, now: Optional[float] = None) -> List[str]:
+        """Release every allocation whose expiry time has passed"""
+        expired = [
+            allocation_id for allocation_id in self._expiry_index.pop_expired(now if now is not None else time.time())
+            if self.release_allocation(allocation_id, expired=True)
+        ]
+        if expired:
+            logger.info(f"Released {len(expired)} expired allocations")
+        self._arm_expiry_timer()
+        return expired
+
+    def _arm_expiry_timer(self):
+        """Schedule the expiry timer for the earliest deadline (no-op outside an event loop)"""
+        deadline = self._expiry_index.next_deadline()
+        timer = self._expiry_timer
+        if timer is not None and not timer.cancelled() and self._expiry_timer_deadline == deadline:
+            return
+        if timer is not None:
+            timer.cancel()
+            self._expiry_timer = self._expiry_timer_deadline = None
+        if deadline is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Swept on the next read instead
+            return
+        self._expiry_timer = loop.call_later(max(0.0, deadline - time.time()), self._on_expiry_timer)
+        self._expiry_timer_deadline = deadline
+
+    def _on_expiry_timer(self):
+        self._expiry_timer = self._expiry_timer_deadline = None
+        try:
+            self.release_expired()
+        except Exception as e:
+            logger.error(f"Error releasing expired allocations: {str(e)}")
+
+    def shutdown(self):
+        """Cancel the expiry timer"""
+        if self._expiry_timer is not None:
+            self._expiry_timer.cancel()
+        self._expiry_timer = self._expiry_timer_deadline = None
+
+    @property
+    def total_cost_per_hour(self) -> float:
+        return sum(totals["cost_per_hour"] for totals in self.active_totals.values())
+
+    def get_usage_report(self, window_hours: Optional[float] = 24.0) -> Dict[str, Any]:
+        """Usage and cost per resource type: released allocations from the ledger, active ones from the totals"""
+        self.release_expired()
+        now = time.time()
+        since = now - window_hours * 3600 if window_hours is not None else None
+        return {
+            "window_hours": window_hours,
+            "released": self.allocation_ledger.usage(since=since, until=now),
+            "active": {
+                rt.value: dict(totals) for rt, totals in self.active_totals.items() if totals["count"]
+            },
+            "active_cost_per_hour": self.total_cost_per_hour
+        }
+
     def get_allocation_status(self, allocation_id: Optional[str] = None) -> Dict[str, Any]:
         """Get status of allocations"""
+        self.release_expired()
         if allocation_id:
             allocation = self.active_allocations.get(allocation_id)
             if allocation:
@@ -670,7 +998,7 @@ class ResourceAllocator:
         return {
             "active_allocations": len(self.active_allocations),
             "pending_requests": len(self.pending_requests),
-            "total_cost_per_hour": sum(alloc.cost for alloc in self.active_allocations.values()),
+            "total_cost_per_hour": self.total_cost_per_hour,
             "resource_utilization": {
                 rt.value: metrics.utilization_percentage 
                 for rt, metrics in self.resource_metrics.items()
@@ -680,11 +1008,18 @@ class ResourceAllocator:
     
     def get_allocation_statistics(self) -> Dict[str, Any]:
         """Get allocation statistics"""
+        self.release_expired()
         return {
-            "total_allocations": len(self.allocation_history) + len(self.active_allocations),
+            "total_allocations": self.lifecycle_stats["allocated"],
             "active_allocations": len(self.active_allocations),
+            "released_allocations": self.lifecycle_stats["released"],
+            "expired_allocations": self.lifecycle_stats["expired"],
+            "total_cost_per_hour": self.total_cost_per_hour,
+            "ledger_records": len(self.allocation_ledger),
+            "scheduled_expiries": len(self._expiry_index),
             "pending_requests": len(self.pending_requests),
             "vertex_ai_available": self.vertex_optimizer.initialized,
             "resource_types_managed": len(self.resource_optimizer.resource_specs),
-            "last_optimization": self.last_optimization_time.isoformat()
+            "last_optimization": self.last_optimization_time.isoformat(),
+            "solver": self.resource_optimizer.last_solution
         }
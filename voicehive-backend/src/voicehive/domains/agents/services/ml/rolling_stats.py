@@ -0,0 +1,218 @@
+"""
+Incremental rolling statistics for metric windows
+O(1) per-point mean/variance/min/max/trend updates plus a vectorized batch pass
+"""
+
+import logging
+from bisect import bisect_left, insort
+from collections import deque
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Updates between exact recomputations that cancel floating-point drift
+RESYNC_INTERVAL = 10_000
+
+
+class RollingWindowStats:
+    """
+    Sliding-window statistics maintained incrementally
+
+    Features:
+    - Sliding Welford mean and sample variance
+    - Monotonic-deque rolling min and max
+    - Sorted-window rolling median (bisect insert/remove)
+    - Closed-form least-squares slope over the most recent trend_window points
+    """
+
+    __slots__ = (
+        "window_size", "trend_window", "values", "_sorted", "_min", "_max",
+        "_index", "mean", "_m2", "_trend_values", "_trend_sum", "_trend_xsum", "_updates"
+    )
+
+    def __init__(self, window_size: int = 100, trend_window: int = 20):
+        self.window_size = window_size
+        # The trend is fitted to the tail of the window, never beyond it
+        self.trend_window = min(trend_window, window_size)
+        self.values: deque = deque(maxlen=window_size)
+        self._sorted: list = []
+        # (position, value) candidates, oldest first
+        self._min: deque = deque()
+        self._max: deque = deque()
+        self._index = 0
+
+        self.mean = 0.0
+        self._m2 = 0.0
+
+        # Trend window with running sum(y) and sum(x * y), x = 0..n-1 from its oldest point
+        self._trend_values: deque = deque(maxlen=self.trend_window)
+        self._trend_sum = 0.0
+        self._trend_xsum = 0.0
+        self._updates = 0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def add(self, value: float) -> None:
+        """Add a value, evicting the oldest one when the window is full"""
+        value = float(value)
+        values = self.values
+
+        if len(values) == self.window_size:
+            removed = values[0]
+            # Sliding Welford: remove the oldest value, then add the new one
+            count = len(values)
+            old_mean = self.mean
+            self.mean += (value - removed) / count
+            self._m2 += (value - removed) * (value - self.mean + removed - old_mean)
+            del self._sorted[bisect_left(self._sorted, removed)]
+        else:
+            count = len(values) + 1
+            delta = value - self.mean
+            self.mean += delta / count
+            self._m2 += delta * (value - self.mean)
+        values.append(value)
+        insort(self._sorted, value)
+
+        # Monotonic deques: drop dominated candidates and expired positions
+        position = self._index
+        self._index += 1
+        expired = position - self.window_size
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((position, value))
+        if self._min[0][0] <= expired:
+            self._min.popleft()
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((position, value))
+        if self._max[0][0] <= expired:
+            self._max.popleft()
+
+        trend = self._trend_values
+        if len(trend) == self.trend_window:
+            # Dropping the oldest point shifts every remaining x down by one
+            oldest = trend[0]
+            self._trend_sum -= oldest
+            self._trend_xsum -= self._trend_sum
+            self._trend_xsum += (len(trend) - 1) * value
+        else:
+            self._trend_xsum += len(trend) * value
+        self._trend_sum += value
+        trend.append(value)
+
+        self._updates += 1
+        if self._updates >= RESYNC_INTERVAL:
+            self._resync()
+
+    def _resync(self) -> None:
+        """Recompute running sums exactly from the window"""
+        values = np.fromiter(self.values, dtype=float, count=len(self.values))
+        self.mean = float(values.mean()) if len(values) else 0.0
+        self._m2 = float(((values - self.mean) ** 2).sum())
+        trend = np.fromiter(self._trend_values, dtype=float, count=len(self._trend_values))
+        self._trend_sum = float(trend.sum())
+        self._trend_xsum = float((np.arange(len(trend)) * trend).sum())
+        self._updates = 0
+
+    def reset(self, values: Iterable[float]) -> None:
+        """Rebuild the state from the most recent values"""
+        self.__init__(self.window_size, self.trend_window)
+        for value in list(values)[-self.window_size:]:
+            self.add(value)
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation"""
+        count = len(self.values)
+        if count < 2:
+            return 0.0
+        return float(np.sqrt(max(self._m2, 0.0) / (count - 1)))
+
+    @property
+    def median(self) -> float:
+        ordered = self._sorted
+        middle = len(ordered) // 2
+        if len(ordered) % 2:
+            return ordered[middle]
+        return (ordered[middle - 1] + ordered[middle]) / 2
+
+    @property
+    def minimum(self) -> float:
+        return self._min[0][1]
+
+    @property
+    def maximum(self) -> float:
+        return self._max[0][1]
+
+    @property
+    def trend(self) -> float:
+        """Least-squares slope of the trend window per point"""
+        count = len(self._trend_values)
+        if count < 2:
+            return 0.0
+        x_sum = count * (count - 1) / 2
+        x_squares = (count - 1) * count * (2 * count - 1) / 6
+        denominator = count * x_squares - x_sum * x_sum
+        return (count * self._trend_xsum - x_sum * self._trend_sum) / denominator
+
+    def snapshot(self) -> Dict[str, float]:
+        """Baseline statistics in the analyzer's dictionary form"""
+        return {
+            "mean": self.mean,
+            "std": self.std,
+            "median": self.median,
+            "min": self.minimum,
+            "max": self.maximum,
+            "trend": self.trend
+        }
+
+
+def rolling_batch_stats(history: np.ndarray,
+                        batch: np.ndarray,
+                        window_size: int,
+                        trend_window: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Mean, sample std, trend and window length as each batch value is appended
+
+    history holds the values already in the window (oldest first). Each
+    output row describes the window ending at that batch value, matching
+    per-point RollingWindowStats updates.
+    """
+    trend_window = min(trend_window, window_size)
+    history = np.asarray(history, dtype=float)[-window_size:]
+    batch = np.asarray(batch, dtype=float)
+    series = np.concatenate([history, batch])
+
+    # Shift by a reference value so the cumulative sums stay well conditioned
+    shifted = series - (series.mean() if len(series) else 0.0)
+    positions = np.arange(len(series), dtype=float)
+    zero = np.zeros(1)
+    sums = np.concatenate([zero, np.cumsum(shifted)])
+    squares = np.concatenate([zero, np.cumsum(shifted * shifted)])
+    weighted = np.concatenate([zero, np.cumsum(positions * shifted)])
+
+    ends = np.arange(len(history), len(series)) + 1
+    starts = np.maximum(ends - window_size, 0)
+    counts = (ends - starts).astype(float)
+
+    window_sum = sums[ends] - sums[starts]
+    mean = window_sum / counts + (series.mean() if len(series) else 0.0)
+    variance = (squares[ends] - squares[starts] - window_sum * window_sum / counts)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        std = np.where(counts > 1, np.sqrt(np.maximum(variance, 0.0) / (counts - 1)), 0.0)
+
+    # Least-squares slope over the trailing trend window (x relative to its start)
+    trend_starts = np.maximum(ends - trend_window, 0)
+    trend_counts = (ends - trend_starts).astype(float)
+    y_sum = sums[ends] - sums[trend_starts]
+    xy_sum = weighted[ends] - weighted[trend_starts] - trend_starts * y_sum
+    x_sum = trend_counts * (trend_counts - 1) / 2
+    x_squares = (trend_counts - 1) * trend_counts * (2 * trend_counts - 1) / 6
+    denominator = trend_counts * x_squares - x_sum * x_sum
+    with np.errstate(invalid="ignore", divide="ignore"):
+        trend = np.where(denominator > 0, (trend_counts * xy_sum - x_sum * y_sum) / denominator, 0.0)
+
+    return mean, std, trend, counts.astype(np.int64)
@@ -3,16 +3,20 @@ Monitoring Agent - Real-time system monitoring for supervisor coordination
 """
 import logging
 import asyncio
+import time
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Set
 from enum import Enum
-from dataclasses import dataclass
-import psutil
+from dataclasses import dataclass, fields
 import uuid
 
 from voicehive.domains.communication.services.message_bus import MessageBus, MessageType, MessagePriority
 from voicehive.domains.feedback.services.vertex.monitoring_service import MonitoringService, HealthStatus
+from voicehive.utils.deadlines import DeadlineHeap
 from voicehive.utils.exceptions import VoiceHiveError, ErrorHandler
+from voicehive.utils.quantiles import QuantileSketch
+from voicehive.utils.resources import ResourceSampler, get_resource_sampler
+from voicehive.utils.timeseries import TimeSeriesStore
 from voicehive.core.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -55,6 +59,13 @@ class SystemMetrics:
     system_cpu_percent: float
     system_memory_percent: float
     active_emergencies: int
+    p95_response_time_ms: float = 0.0
+    p99_response_time_ms: float = 0.0
+
+
+# SystemMetrics fields kept as columns in the time-series store
+SYSTEM_METRIC_FIELDS = [f for f in fields(SystemMetrics) if f.name != "timestamp"]
+SYSTEM_METRIC_PREFIX = "system."
 
 
 class MonitoringAgent:
@@ -71,19 +82,35 @@ class MonitoringAgent:
     
     def __init__(self, 
                  message_bus: Optional[MessageBus] = None,
-                 monitoring_service: Optional[MonitoringService] = None):
+                 monitoring_service: Optional[MonitoringService] = None,
+                 series_store: Optional[TimeSeriesStore] = None,
+                 resource_sampler: Optional[ResourceSampler] = None):
         self.message_bus = message_bus or MessageBus()
         self.monitoring_service = monitoring_service or MonitoringService()
+        self.resource_sampler = resource_sampler or get_resource_sampler()
         
         # Agent tracking
         self.registered_agents: Dict[str, AgentMetrics] = {}
         self.agent_heartbeats: Dict[str, datetime] = {}
+        # Heartbeat expiry deadlines (monotonic clock), per-status counts and the response
+        # time / success rate aggregates of active (non-offline) agents, all kept up to date
+        # on each transition so a monitoring tick costs O(expired), not O(agents)
+        self._heartbeat_deadlines = DeadlineHeap()
+        self.status_counts: Dict[AgentStatus, int] = {status: 0 for status in AgentStatus}
+        self._active_response_sum = 0.0
+        self._active_success_sum = 0.0
+        self._active_response_sketch = QuantileSketch()
+        self._alerted_offline_count = 0
+        self.health_stats = {"health_checks": 0, "agents_expired": 0, "offline_alerts": 0, "recoveries": 0}
         
         # Monitoring configuration
         self.monitoring_interval = 5  # seconds
         self.heartbeat_timeout = 30   # seconds
-        self.metrics_history: List[SystemMetrics] = []
         self.max_history_size = 1000
+        # System metrics history is stored column-wise, one series per field
+        self.series_store = series_store if series_store is not None else TimeSeriesStore(
+            raw_capacity=self.max_history_size
+        )
         
         # Monitoring state
         self.is_running = False
@@ -92,6 +119,7 @@ class MonitoringAgent:
         # Performance thresholds
         self.thresholds = {
             "response_time_ms": 5000,      # 5 seconds
+            "p95_response_time_ms": 8000,  # 8 seconds
             "success_rate": 0.95,          # 95%
             "memory_usage_mb": 1000,       # 1GB
             "cpu_usage_percent": 80,       # 80%
@@ -121,6 +149,7 @@ class MonitoringAgent:
             handler=self._handle_agent_message
         )
         
+        await self.resource_sampler.start()
         self.is_running = True
         self.monitoring_task = asyncio.create_task(self._monitoring_loop())
         
@@ -138,6 +167,7 @@ class MonitoringAgent:
                 await self.monitoring_task
             except asyncio.CancelledError:
                 pass
+        await self.resource_sampler.stop()
         
         logger.info("Monitoring Agent stopped")
     
@@ -159,8 +189,16 @@ class MonitoringAgent:
                 uptime_seconds=0
             )
             
+            previous = self.registered_agents.get(agent_id)
+            if previous is not None:
+                self.status_counts[previous.status] -= 1
+                if previous.status != AgentStatus.OFFLINE:
+                    self._track_active(previous, -1)
             self.registered_agents[agent_id] = initial_metrics
+            self.status_counts[initial_metrics.status] += 1
+            self._track_active(initial_metrics, 1)
             self.agent_heartbeats[agent_id] = datetime.now()
+            self._heartbeat_deadlines.schedule(agent_id, time.monotonic() + self.heartbeat_timeout)
             
             # Publish registration event
             await self.message_bus.publish(
@@ -200,6 +238,29 @@ class MonitoringAgent:
         except Exception as e:
             logger.error(f"Error handling agent message: {str(e)}")
     
+    def _set_status(self, agent_id: str, status: AgentStatus) -> AgentStatus:
+        """Change an agent's status, keeping the status counters in step; returns the previous status"""
+        metrics = self.registered_agents[agent_id]
+        previous = metrics.status
+        if previous != status:
+            self.status_counts[previous] -= 1
+            self.status_counts[status] += 1
+            metrics.status = status
+            if previous == AgentStatus.OFFLINE:
+                self._track_active(metrics, 1)
+            elif status == AgentStatus.OFFLINE:
+                self._track_active(metrics, -1)
+        return previous
+    
+    def _track_active(self, metrics: AgentMetrics, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) an active agent's share of the running aggregates"""
+        self._active_response_sum += sign * metrics.response_time_ms
+        self._active_success_sum += sign * metrics.success_rate
+        if sign > 0:
+            self._active_response_sketch.add(metrics.response_time_ms)
+        else:
+            self._active_response_sketch.remove(metrics.response_time_ms)
+    
     async def _process_heartbeat(self, agent_id: str, data: Dict[str, Any]):
         """Process agent heartbeat"""
         self.agent_heartbeats[agent_id] = datetime.now()
@@ -207,12 +268,20 @@ class MonitoringAgent:
         if agent_id in self.registered_agents:
             metrics = self.registered_agents[agent_id]
             metrics.last_heartbeat = datetime.now()
+            self._heartbeat_deadlines.schedule(agent_id, time.monotonic() + self.heartbeat_timeout)
             
             # Update status based on heartbeat data
             if data.get("status") == "healthy":
-                metrics.status = AgentStatus.HEALTHY
+                previous = self._set_status(agent_id, AgentStatus.HEALTHY)
             elif data.get("status") == "degraded":
-                metrics.status = AgentStatus.DEGRADED
+                previous = self._set_status(agent_id, AgentStatus.DEGRADED)
+            elif metrics.status == AgentStatus.OFFLINE:
+                previous = self._set_status(agent_id, AgentStatus.HEALTHY)
+            else:
+                previous = metrics.status
+            
+            if previous == AgentStatus.OFFLINE:
+                await self._publish_agent_recovered(agent_id)
     
     async def _process_status_update(self, agent_id: str, data: Dict[str, Any]):
         """Process agent status update"""
@@ -223,15 +292,25 @@ class MonitoringAgent:
         status_str = data.get("status", "healthy")
         
         try:
-            metrics.status = AgentStatus(status_str)
+            status = AgentStatus(status_str)
         except ValueError:
-            metrics.status = AgentStatus.HEALTHY
+            status = AgentStatus.HEALTHY
+        self._set_status(agent_id, status)
+        # An agent reported alive again must be watched for the next timeout
+        if status != AgentStatus.OFFLINE and agent_id not in self._heartbeat_deadlines:
+            self._heartbeat_deadlines.schedule(agent_id, time.monotonic() + self.heartbeat_timeout)
         
-        # Update other metrics if provided
-        if "response_time_ms" in data:
-            metrics.response_time_ms = float(data["response_time_ms"])
-        if "success_rate" in data:
-            metrics.success_rate = float(data["success_rate"])
+        # Update other metrics if provided, moving an active agent's share of the aggregates
+        response_time = float(data["response_time_ms"]) if "response_time_ms" in data else metrics.response_time_ms
+        success_rate = float(data["success_rate"]) if "success_rate" in data else metrics.success_rate
+        if (response_time, success_rate) != (metrics.response_time_ms, metrics.success_rate):
+            active = metrics.status != AgentStatus.OFFLINE
+            if active:
+                self._track_active(metrics, -1)
+            metrics.response_time_ms = response_time
+            metrics.success_rate = success_rate
+            if active:
+                self._track_active(metrics, 1)
         if "error_count" in data:
             metrics.error_count = int(data["error_count"])
     
@@ -277,55 +356,67 @@ class MonitoringAgent:
                 await asyncio.sleep(self.monitoring_interval)
     
     async def _check_agent_health(self):
-        """Check health of all registered agents"""
-        current_time = datetime.now()
-        timeout_threshold = timedelta(seconds=self.heartbeat_timeout)
+        """Mark agents whose heartbeat deadline has passed as offline (alerts fire once per transition)"""
+        self.health_stats["health_checks"] += 1
+        expired = self._heartbeat_deadlines.pop_expired(time.monotonic())
+        self.health_stats["agents_expired"] += len(expired)
         
-        for agent_id, last_heartbeat in self.agent_heartbeats.items():
-            if current_time - last_heartbeat > timeout_threshold:
-                # Agent is offline
-                if agent_id in self.registered_agents:
-                    self.registered_agents[agent_id].status = AgentStatus.OFFLINE
-                    
-                    # Publish offline alert
-                    await self.message_bus.publish(
-                        message_type=MessageType.EMERGENCY_ALERT,
-                        data={
-                            "alert_type": "agent_offline",
-                            "agent_id": agent_id,
-                            "last_heartbeat": last_heartbeat.isoformat(),
-                            "timeout_seconds": self.heartbeat_timeout
-                        },
-                        sender_id="monitoring_agent",
-                        priority=MessagePriority.HIGH
-                    )
-                    
-                    logger.warning(f"Agent {agent_id} is offline (last heartbeat: {last_heartbeat})")
+        for agent_id in expired:
+            if agent_id not in self.registered_agents:
+                continue
+            if self._set_status(agent_id, AgentStatus.OFFLINE) == AgentStatus.OFFLINE:
+                continue
+            last_heartbeat = self.agent_heartbeats.get(agent_id, self.registered_agents[agent_id].last_heartbeat)
+            
+            # Publish offline alert
+            await self.message_bus.publish(
+                message_type=MessageType.EMERGENCY_ALERT,
+                data={
+                    "alert_type": "agent_offline",
+                    "agent_id": agent_id,
+                    "last_heartbeat": last_heartbeat.isoformat(),
+                    "timeout_seconds": self.heartbeat_timeout
+                },
+                sender_id="monitoring_agent",
+                priority=MessagePriority.HIGH
+            )
+            self.health_stats["offline_alerts"] += 1
+            
+            logger.warning(f"Agent {agent_id} is offline (last heartbeat: {last_heartbeat})")
+    
+    async def _publish_agent_recovered(self, agent_id: str):
+        """Announce that an offline agent is sending heartbeats again"""
+        self.health_stats["recoveries"] += 1
+        await self.message_bus.publish(
+            message_type=MessageType.AGENT_STATUS_UPDATE,
+            data={
+                "agent_id": agent_id,
+                "status": self.registered_agents[agent_id].status.value,
+                "event_type": "agent_recovered",
+                "timestamp": datetime.now().isoformat()
+            },
+            sender_id="monitoring_agent",
+            priority=MessagePriority.NORMAL
+        )
+        logger.info(f"Agent {agent_id} is back online")
     
     async def _collect_system_metrics(self) -> SystemMetrics:
         """Collect system-wide metrics"""
         current_time = datetime.now()
         
-        # Count agents by status
-        status_counts = {status: 0 for status in AgentStatus}
-        total_response_time = 0
-        total_success_rate = 0
-        active_agents = 0
-        
-        for metrics in self.registered_agents.values():
-            status_counts[metrics.status] += 1
-            if metrics.status != AgentStatus.OFFLINE:
-                total_response_time += metrics.response_time_ms
-                total_success_rate += metrics.success_rate
-                active_agents += 1
+        # Status counts and active-agent aggregates are maintained on transitions
+        status_counts = self.status_counts
+        active_agents = len(self.registered_agents) - status_counts[AgentStatus.OFFLINE]
         
-        # Calculate averages
-        avg_response_time = total_response_time / max(active_agents, 1)
-        overall_success_rate = total_success_rate / max(active_agents, 1)
+        # Averages and tail latency across active agents
+        avg_response_time = self._active_response_sum / active_agents if active_agents else 0.0
+        overall_success_rate = self._active_success_sum / active_agents if active_agents else 0.0
+        p95_response_time, p99_response_time = self._active_response_sketch.quantiles([0.95, 0.99])
         
-        # Get system resource usage
-        system_cpu = psutil.cpu_percent()
-        system_memory = psutil.virtual_memory().percent
+        # System resource usage from the shared sampler (container-aware, no inline syscalls)
+        resources = self.resource_sampler.snapshot()
+        system_cpu = resources.cpu_percent
+        system_memory = resources.memory_percent
         
         # Count active emergencies (simplified)
         active_emergencies = 0  # This would integrate with EmergencyManager
@@ -341,7 +432,9 @@ class MonitoringAgent:
             overall_success_rate=overall_success_rate,
             system_cpu_percent=system_cpu,
             system_memory_percent=system_memory,
-            active_emergencies=active_emergencies
+            active_emergencies=active_emergencies,
+            p95_response_time_ms=p95_response_time or 0.0,
+            p99_response_time_ms=p99_response_time or 0.0
         )
     
     async def _check_alert_conditions(self, metrics: SystemMetrics):
@@ -356,6 +449,14 @@ class MonitoringAgent:
                 "threshold": self.thresholds["response_time_ms"]
             })
         
+        # Check tail latency (averages hide slow agents)
+        if metrics.p95_response_time_ms > self.thresholds["p95_response_time_ms"]:
+            alerts.append({
+                "type": "high_p95_response_time",
+                "value": metrics.p95_response_time_ms,
+                "threshold": self.thresholds["p95_response_time_ms"]
+            })
+        
         # Check success rate
         if metrics.overall_success_rate < self.thresholds["success_rate"]:
             alerts.append({
@@ -372,13 +473,14 @@ class MonitoringAgent:
                 "threshold": self.thresholds["cpu_usage_percent"]
             })
         
-        # Check offline agents
-        if metrics.offline_agents > 0:
+        # Check offline agents (only when more agents went offline since the last alert)
+        if metrics.offline_agents > self._alerted_offline_count:
             alerts.append({
                 "type": "agents_offline",
                 "value": metrics.offline_agents,
                 "threshold": 0
             })
+        self._alerted_offline_count = metrics.offline_agents
         
         # Publish alerts
         for alert in alerts:
@@ -403,6 +505,8 @@ class MonitoringAgent:
                     "unhealthy_agents": metrics.unhealthy_agents,
                     "offline_agents": metrics.offline_agents,
                     "avg_response_time_ms": metrics.avg_response_time_ms,
+                    "p95_response_time_ms": metrics.p95_response_time_ms,
+                    "p99_response_time_ms": metrics.p99_response_time_ms,
                     "overall_success_rate": metrics.overall_success_rate,
                     "system_cpu_percent": metrics.system_cpu_percent,
                     "system_memory_percent": metrics.system_memory_percent,
@@ -414,12 +518,15 @@ class MonitoringAgent:
         )
     
     def _add_to_history(self, metrics: SystemMetrics):
-        """Add metrics to history with size management"""
-        self.metrics_history.append(metrics)
-        
-        # Trim history if too large
-        if len(self.metrics_history) > self.max_history_size:
-            self.metrics_history = self.metrics_history[-self.max_history_size:]
+        """Add metrics to history; the store's ring buffers bound its size"""
+        timestamp = metrics.timestamp.timestamp()
+        for field in SYSTEM_METRIC_FIELDS:
+            self.series_store.add(SYSTEM_METRIC_PREFIX + field.name, timestamp, getattr(metrics, field.name))
+
+    @property
+    def metrics_history(self) -> List[SystemMetrics]:
+        """Recorded system metrics, oldest first"""
+        return self.get_system_metrics(limit=self.max_history_size)
     
     def get_agent_metrics(self, agent_id: Optional[str] = None) -> Dict[str, Any]:
         """Get metrics for specific agent or all agents"""
@@ -442,15 +549,37 @@ class MonitoringAgent:
     
     def get_system_metrics(self, limit: int = 100) -> List[SystemMetrics]:
         """Get recent system metrics"""
-        return self.metrics_history[-limit:]
+        columns = {}
+        timestamps = None
+        for field in SYSTEM_METRIC_FIELDS:
+            timestamps, values = self.series_store.window(SYSTEM_METRIC_PREFIX + field.name, limit)
+            cast = int if field.type is int else float
+            columns[field.name] = [cast(value) for value in values.tolist()]
+        if timestamps is None or not len(timestamps):
+            return []
+
+        return [
+            SystemMetrics(
+                timestamp=datetime.fromtimestamp(timestamp),
+                **{name: column[index] for name, column in columns.items()}
+            )
+            for index, timestamp in enumerate(timestamps.tolist())
+        ]
+
+    def _history_size(self) -> int:
+        series = self.series_store.get(SYSTEM_METRIC_PREFIX + SYSTEM_METRIC_FIELDS[0].name)
+        return len(series.raw) if series is not None else 0
     
     def get_monitoring_statistics(self) -> Dict[str, Any]:
         """Get monitoring agent statistics"""
         return {
             "registered_agents": len(self.registered_agents),
-            "metrics_history_size": len(self.metrics_history),
+            "metrics_history_size": self._history_size(),
             "monitoring_interval_seconds": self.monitoring_interval,
             "heartbeat_timeout_seconds": self.heartbeat_timeout,
+            "agent_status_counts": {status.value: count for status, count in self.status_counts.items()},
+            "tracked_heartbeats": len(self._heartbeat_deadlines),
+            "health_stats": dict(self.health_stats),
             "is_running": self.is_running,
             "thresholds": self.thresholds
         }
@@ -3,8 +3,9 @@ Operational Supervisor - Real-time operations coordinator ("Air Traffic Control"
 """
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Awaitable, Callable, Dict, Any, List, Optional
 from enum import Enum
 from dataclasses import dataclass
 
@@ -15,14 +16,31 @@ from voicehive.services.ai.openai_service import OpenAIService
 from voicehive.domains.agents.services.emergency_manager import EmergencyManager, Emergency, EmergencySeverity
 from voicehive.domains.agents.services.monitoring_agent import MonitoringAgent, AgentStatus
 from voicehive.domains.communication.services.message_bus import MessageBus, MessageType, MessagePriority
-from voicehive.domains.agents.services.ml.decision_engine import DecisionEngine, DecisionType, DecisionUrgency
+from voicehive.domains.agents.services.ml.decision_engine import (
+    DecisionEngine, DecisionType as MLDecisionType, DecisionUrgency
+)
 from voicehive.domains.agents.services.ml.anomaly_detector import AnomalyDetector, TimeSeriesData, MetricDataPoint
 from voicehive.domains.agents.services.ml.resource_allocator import ResourceAllocator
+from voicehive.utils.deadlines import DeadlineHeap
+from voicehive.utils.quantiles import get_latency_registry
+from voicehive.utils.resources import get_resource_sampler
 from voicehive.core.settings import get_settings
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Metadata attached to every metric sample the supervisor feeds to anomaly detection
+SUPERVISOR_METRIC_TAGS = {"source": "operational_supervisor"}
+
+# Time budget (seconds) of each coordination stage before it is cancelled
+DEFAULT_STAGE_BUDGETS = {
+    "health": 1.0,
+    "decisions": 5.0,
+    "conflicts": 5.0,
+    "emergencies": 5.0,
+    "improvements": 2.0
+}
+
 
 class DecisionType(Enum):
     """Types of operational decisions"""
@@ -100,11 +118,16 @@ class OperationalSupervisor:
         self.message_bus = message_bus or MessageBus()
         self.emergency_manager = emergency_manager or EmergencyManager(self.openai_service)
         self.monitoring_agent = monitoring_agent or MonitoringAgent(self.message_bus)
+        # One columnar time-series store backs monitoring history and anomaly detection
+        self.series_store = self.monitoring_agent.series_store
+        self.resource_sampler = get_resource_sampler()
 
         # ML-powered components (Phase 2)
         self.project_id = project_id or getattr(settings, 'google_cloud_project', 'default-project')
         self.decision_engine = DecisionEngine(self.project_id, openai_service=self.openai_service)
-        self.anomaly_detector = AnomalyDetector(self.project_id, openai_service=self.openai_service)
+        self.anomaly_detector = AnomalyDetector(
+            self.project_id, openai_service=self.openai_service, series_store=self.series_store
+        )
         self.resource_allocator = ResourceAllocator(self.project_id, openai_service=self.openai_service)
 
         # System integrations
@@ -127,10 +150,28 @@ class OperationalSupervisor:
         self.active_conflicts: Dict[str, AgentConflict] = {}
         self.conflict_history: List[AgentConflict] = []
 
-        # Coordination state
+        # Coordination state: stages run when an event makes them due instead of on a fixed tick
         self.is_running = False
         self.coordination_task: Optional[asyncio.Task] = None
-        self.coordination_interval = 1  # 1-second coordination cycle
+        self.heartbeat_timeout = 30  # seconds without heartbeat before an agent is offline
+        self.reconcile_interval = 30  # seconds between safety sweeps when no events arrive
+        self.stage_budgets: Dict[str, float] = dict(DEFAULT_STAGE_BUDGETS)
+        self._wakeup = asyncio.Event()
+        self._stage_tasks: Dict[str, asyncio.Task] = {}
+        # Heartbeat deadlines on the monotonic clock; only expired agents are ever visited
+        self._heartbeats = DeadlineHeap()
+        # Ordered sets of ids waiting to be handled
+        self._decision_queue: Dict[str, None] = {}
+        self._conflict_queue: Dict[str, None] = {}
+        self._emergency_check_requested = False
+        self._next_reconcile = 0.0
+        self.coordination_stats = {
+            "wakeups": 0,
+            "agents_expired": 0,
+            "stage_runs": {stage: 0 for stage in DEFAULT_STAGE_BUDGETS},
+            "stage_timeouts": {stage: 0 for stage in DEFAULT_STAGE_BUDGETS},
+            "last_stage_ms": {stage: 0.0 for stage in DEFAULT_STAGE_BUDGETS}
+        }
 
         # Performance tracking
         self.performance_metrics = {
@@ -162,6 +203,7 @@ class OperationalSupervisor:
             subscriber_id="operational_supervisor",
             message_types=[
                 MessageType.EMERGENCY_ALERT,
+                MessageType.AGENT_HEARTBEAT,
                 MessageType.AGENT_STATUS_UPDATE,
                 MessageType.PERFORMANCE_METRIC
             ],
@@ -169,6 +211,8 @@ class OperationalSupervisor:
         )
 
         self.is_running = True
+        self._wakeup.clear()
+        self._next_reconcile = time.monotonic() + self.reconcile_interval
         self.coordination_task = asyncio.create_task(self.coordinate_agents())
 
         logger.info("Operational Supervisor started and coordinating agents")
@@ -186,6 +230,14 @@ class OperationalSupervisor:
             except asyncio.CancelledError:
                 pass
 
+        stages = [task for task in self._stage_tasks.values() if not task.done()]
+        for task in stages:
+            task.cancel()
+        await asyncio.gather(*stages, return_exceptions=True)
+        self._stage_tasks.clear()
+        await self.anomaly_detector.shutdown_enrichment()
+        self.resource_allocator.shutdown()
+
         await self.monitoring_agent.stop()
 
         logger.info("Operational Supervisor stopped")
@@ -208,6 +260,7 @@ class OperationalSupervisor:
             )
 
             self.registered_agents[agent_id] = registration
+            self._arm_heartbeat(agent_id)
 
             # Register with monitoring agent
             await self.monitoring_agent.register_agent(agent_id, agent_type, capabilities)
@@ -219,11 +272,45 @@ class OperationalSupervisor:
             logger.error(f"Failed to register agent {agent_id}: {str(e)}")
             return False
 
+    def record_heartbeat(self, agent_id: str):
+        """Push back an agent's heartbeat deadline (O(1) for agents already tracked)"""
+        registration = self.registered_agents.get(agent_id)
+        if registration is None:
+            return
+        registration.last_heartbeat = datetime.now()
+        if registration.status == AgentStatus.OFFLINE:
+            registration.status = AgentStatus.HEALTHY
+        self._arm_heartbeat(agent_id)
+
+    def submit_decision(self, decision: OperationalDecision):
+        """Queue an operational decision for immediate processing"""
+        self.active_decisions[decision.id] = decision
+        self._decision_queue[decision.id] = None
+        self._wakeup.set()
+
+    def report_conflict(self, conflict: AgentConflict):
+        """Queue an agent conflict for immediate resolution"""
+        self.active_conflicts[conflict.id] = conflict
+        self._conflict_queue[conflict.id] = None
+        self._wakeup.set()
+
+    def request_emergency_check(self):
+        """Ask for an emergency check; requests arriving while one is pending are coalesced"""
+        self._emergency_check_requested = True
+        self._wakeup.set()
+
+    def _arm_heartbeat(self, agent_id: str):
+        if self._heartbeats.schedule(agent_id, time.monotonic() + self.heartbeat_timeout):
+            # New earliest deadline: the coordinator must shorten its sleep
+            self._wakeup.set()
+
     async def _handle_message(self, message):
         """Handle incoming messages from other agents"""
         try:
             if message.type == MessageType.EMERGENCY_ALERT:
                 await self._handle_emergency_alert(message.data)
+            elif message.type == MessageType.AGENT_HEARTBEAT:
+                self.record_heartbeat(message.data.get("agent_id"))
             elif message.type == MessageType.AGENT_STATUS_UPDATE:
                 await self._handle_agent_status_update(message.data)
             elif message.type == MessageType.PERFORMANCE_METRIC:
@@ -232,113 +319,207 @@ class OperationalSupervisor:
         except Exception as e:
             logger.error(f"Error handling message: {str(e)}")
 
+    async def _handle_emergency_alert(self, data: Dict[str, Any]):
+        """Check emergency conditions as soon as an alert arrives"""
+        # Our own resolution notices come back on the bus and must not re-trigger a check
+        if data.get("event_type") == "emergency_resolved":
+            return
+        self.request_emergency_check()
+
+    async def _handle_agent_status_update(self, data: Dict[str, Any]):
+        """Treat a status update as proof of life and record the reported status"""
+        agent_id = data.get("agent_id")
+        if agent_id not in self.registered_agents:
+            return
+        try:
+            status = AgentStatus(data.get("status", "healthy"))
+        except ValueError:
+            status = None
+        # Offline notices (including our own) are not proof of life
+        if status == AgentStatus.OFFLINE:
+            return
+        self.record_heartbeat(agent_id)
+        if status is not None:
+            self.registered_agents[agent_id].status = status
+
+    async def _handle_performance_metric(self, data: Dict[str, Any]):
+        """New metrics make emergency checks and improvement analysis due"""
+        agent_id = data.get("agent_id")
+        if agent_id in self.registered_agents:
+            self.record_heartbeat(agent_id)
+        self.request_emergency_check()
+
     async def coordinate_agents(self):
-        """Main real-time coordination loop"""
+        """Main real-time coordination loop: sleeps until a deadline or event makes a stage due"""
         logger.info("Starting agent coordination loop")
 
         while self.is_running:
             try:
-                coordination_start = datetime.now()
-
-                # Monitor agent health
-                await self._monitor_agent_health()
-
-                # Process urgent decisions
-                await self._process_urgent_decisions()
-
-                # Handle conflicts
-                await self._resolve_conflicts()
-
-                # Check for emergencies
-                await self._check_emergencies()
-
-                # Bridge to improvement pipeline
-                await self._forward_improvement_triggers()
-
-                # Update performance metrics
-                coordination_time = (datetime.now() - coordination_start).total_seconds() * 1000
-                self.performance_metrics["avg_decision_time_ms"] = coordination_time
-
-                # Wait for next coordination cycle
-                await asyncio.sleep(self.coordination_interval)
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self._next_wakeup_delay())
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                self.coordination_stats["wakeups"] += 1
+
+                now = time.monotonic()
+                if now >= self._next_reconcile:
+                    self._reconcile_pending()
+                    self._next_reconcile = now + self.reconcile_interval
+
+                next_deadline = self._heartbeats.next_deadline()
+                if next_deadline is not None and next_deadline <= now:
+                    self._launch_stage("health", self._monitor_agent_health)
+                if self._decision_queue:
+                    self._launch_stage("decisions", self._process_urgent_decisions)
+                if self._conflict_queue:
+                    self._launch_stage("conflicts", self._resolve_conflicts)
+                if self._emergency_check_requested:
+                    if self._launch_stage("emergencies", self._check_emergencies):
+                        self._emergency_check_requested = False
+                        self._launch_stage("improvements", self._forward_improvement_triggers)
 
             except Exception as e:
                 logger.error(f"Error in coordination loop: {str(e)}")
-                await asyncio.sleep(self.coordination_interval)
+                await asyncio.sleep(1)
+
+    def _next_wakeup_delay(self) -> float:
+        """Seconds until the earliest heartbeat deadline or reconciliation sweep"""
+        wake_at = self._next_reconcile
+        next_deadline = self._heartbeats.next_deadline()
+        if next_deadline is not None:
+            wake_at = min(wake_at, next_deadline)
+        return max(0.0, wake_at - time.monotonic())
+
+    def _reconcile_pending(self):
+        """Safety sweep for work that bypassed the queues (e.g. written directly to the active maps)"""
+        for decision_id, decision in self.active_decisions.items():
+            if not decision.executed and decision.confidence_score > 0.8:
+                self._decision_queue.setdefault(decision_id, None)
+        for conflict_id, conflict in self.active_conflicts.items():
+            if not conflict.resolved:
+                self._conflict_queue.setdefault(conflict_id, None)
+        self._emergency_check_requested = True
+
+    def _launch_stage(self, stage: str, handler: Callable[[], Awaitable[None]]) -> bool:
+        """Start a stage unless the previous run is still in flight; returns whether it started"""
+        running = self._stage_tasks.get(stage)
+        if running is not None and not running.done():
+            return False
+        self._stage_tasks[stage] = asyncio.create_task(self._run_stage(stage, handler))
+        return True
+
+    async def _run_stage(self, stage: str, handler: Callable[[], Awaitable[None]]):
+        """Run one stage within its time budget"""
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(handler(), timeout=self.stage_budgets.get(stage))
+        except asyncio.TimeoutError:
+            self.coordination_stats["stage_timeouts"][stage] += 1
+            logger.warning(f"Coordination stage {stage} exceeded its {self.stage_budgets.get(stage)}s budget")
+        except Exception as e:
+            logger.error(f"Error in coordination stage {stage}: {str(e)}")
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.coordination_stats["stage_runs"][stage] += 1
+            self.coordination_stats["last_stage_ms"][stage] = elapsed_ms
+            self.performance_metrics["avg_decision_time_ms"] = elapsed_ms
+            # Work queued while this stage ran is picked up on the next pass
+            self._wakeup.set()
 
     async def _monitor_agent_health(self):
-        """Monitor health of all registered agents"""
-        current_time = datetime.now()
+        """Mark agents whose heartbeat deadline has passed as offline"""
+        now = time.monotonic()
         unhealthy_agents = []
 
-        for agent_id, registration in self.registered_agents.items():
-            # Check heartbeat timeout (30 seconds)
-            if current_time - registration.last_heartbeat > timedelta(seconds=30):
-                registration.status = AgentStatus.OFFLINE
-                unhealthy_agents.append(agent_id)
-                logger.warning(f"Agent {agent_id} is offline - no heartbeat for 30+ seconds")
+        for agent_id in self._heartbeats.pop_expired(now):
+            if agent_id not in self.registered_agents:
+                continue
+            self.registered_agents[agent_id].status = AgentStatus.OFFLINE
+            unhealthy_agents.append(agent_id)
+            logger.warning(f"Agent {agent_id} is offline - no heartbeat for {self.heartbeat_timeout}+ seconds")
+
+        self.coordination_stats["agents_expired"] += len(unhealthy_agents)
 
         # Handle unhealthy agents
         if unhealthy_agents:
             await self._handle_unhealthy_agents(unhealthy_agents)
 
+    async def _handle_unhealthy_agents(self, agent_ids: List[str]):
+        """Announce agents that went offline"""
+        for agent_id in agent_ids:
+            await self.message_bus.publish(
+                message_type=MessageType.AGENT_STATUS_UPDATE,
+                data={"agent_id": agent_id, "status": AgentStatus.OFFLINE.value, "source": "operational_supervisor"},
+                sender_id="operational_supervisor",
+                priority=MessagePriority.HIGH
+            )
+
     async def _process_urgent_decisions(self):
-        """Process urgent operational decisions using ML-powered decision engine"""
-        # Check for pending decisions that need immediate attention
-        urgent_decisions = [
-            decision for decision in self.active_decisions.values()
-            if not decision.executed and decision.confidence_score > 0.8
-        ]
-
-        # Use ML decision engine for complex decisions
-        for decision in urgent_decisions:
-            try:
-                # Create decision request for ML engine
-                decision_request_id = await self.decision_engine.request_decision(
-                    decision_type=DecisionType.CONFLICT_RESOLUTION,
-                    urgency=DecisionUrgency.URGENT,
-                    data={
-                        "decision_id": decision.id,
-                        "type": decision.type.value,
-                        "affected_agents": decision.affected_agents,
-                        "decision_data": decision.decision_data
-                    },
-                    requesting_agent="operational_supervisor"
-                )
+        """Process queued urgent decisions using ML-powered decision engine"""
+        queued = list(self._decision_queue)
+        self._decision_queue.clear()
+        urgent_decisions = []
+        for decision_id in queued:
+            decision = self.active_decisions.get(decision_id)
+            if decision is not None and not decision.executed and decision.confidence_score > 0.8:
+                urgent_decisions.append(decision)
+
+        # Submit concurrently so the decision engine can batch them
+        await asyncio.gather(*(self._process_urgent_decision(decision) for decision in urgent_decisions))
+
+    async def _process_urgent_decision(self, decision: OperationalDecision):
+        """Run one urgent decision through the ML decision engine, falling back to direct execution"""
+        try:
+            # Create decision request for ML engine
+            decision_request_id = await self.decision_engine.request_decision(
+                decision_type=MLDecisionType.CONFLICT_RESOLUTION,
+                urgency=DecisionUrgency.URGENT,
+                data={
+                    "decision_id": decision.id,
+                    "type": decision.type.value,
+                    "affected_agents": decision.affected_agents,
+                    "decision_data": decision.decision_data
+                },
+                requesting_agent="operational_supervisor"
+            )
 
-                # Get ML-enhanced decision result
-                ml_result = self.decision_engine.get_decision_status(decision_request_id)
+            # Get ML-enhanced decision result
+            ml_result = self.decision_engine.get_decision_status(decision_request_id)
 
-                if ml_result and ml_result["status"] == "completed":
-                    # Execute the ML-enhanced decision
-                    result = await self._execute_ml_decision(decision, ml_result)
-                    decision.executed = True
-                    decision.execution_result = result
+            if ml_result and ml_result["status"] == "completed":
+                # Execute the ML-enhanced decision
+                result = await self._execute_ml_decision(decision, ml_result)
+                decision.executed = True
+                decision.execution_result = result
 
-                    # Move to history
-                    self.decision_history.append(decision)
-                    del self.active_decisions[decision.id]
+                # Move to history
+                self.decision_history.append(decision)
+                del self.active_decisions[decision.id]
 
-                    logger.info(f"Executed ML-enhanced urgent decision: {decision.type.value}")
-                else:
-                    # Fallback to original execution
-                    result = await self._execute_decision(decision)
-                    decision.executed = True
-                    decision.execution_result = result
+                logger.info(f"Executed ML-enhanced urgent decision: {decision.type.value}")
+            else:
+                # Fallback to original execution
+                result = await self._execute_decision(decision)
+                decision.executed = True
+                decision.execution_result = result
 
-                    # Move to history
-                    self.decision_history.append(decision)
-                    del self.active_decisions[decision.id]
+                # Move to history
+                self.decision_history.append(decision)
+                del self.active_decisions[decision.id]
 
-                    logger.info(f"Executed urgent decision (fallback): {decision.type.value}")
+                logger.info(f"Executed urgent decision (fallback): {decision.type.value}")
 
-            except Exception as e:
-                logger.error(f"Failed to execute decision {decision.id}: {str(e)}")
+        except Exception as e:
+            logger.error(f"Failed to execute decision {decision.id}: {str(e)}")
 
     async def _resolve_conflicts(self):
-        """Handle conflicts between agents"""
-        for conflict in list(self.active_conflicts.values()):
-            if not conflict.resolved:
+        """Handle queued conflicts between agents"""
+        queued = list(self._conflict_queue)
+        self._conflict_queue.clear()
+        for conflict_id in queued:
+            conflict = self.active_conflicts.get(conflict_id)
+            if conflict is not None and not conflict.resolved:
                 try:
                     resolution_result = await self._resolve_agent_conflict(conflict)
                     if resolution_result["success"]:
@@ -364,12 +545,13 @@ class OperationalSupervisor:
         try:
             # Convert metrics to time series data for anomaly detection
             time_series_data = []
+            now = datetime.now()
             for metric_name, value in system_metrics.items():
                 if isinstance(value, (int, float)):
                     data_point = MetricDataPoint(
-                        timestamp=datetime.now(),
+                        timestamp=now,
                         value=float(value),
-                        metadata={"source": "operational_supervisor"}
+                        metadata=SUPERVISOR_METRIC_TAGS
                     )
                     time_series = TimeSeriesData(
                         metric_name=metric_name,
@@ -522,10 +704,26 @@ class OperationalSupervisor:
             except Exception as e:
                 logger.warning(f"Could not get resource utilization: {str(e)}")
 
-            # System load metrics (simplified)
-            metrics["system_load"] = 0.7  # This would come from actual monitoring
-            metrics["memory_usage_percent"] = 65.0
-            metrics["cpu_usage_percent"] = 45.0
+            # Tail latency from the streaming sketches (webhook end-to-end)
+            webhook_latency = get_latency_registry().get_quantiles("webhook")
+            if webhook_latency["count"]:
+                metrics["p95_response_time_ms"] = webhook_latency["p95"]
+                metrics["p99_response_time_ms"] = webhook_latency["p99"]
+
+            # Resource usage from the shared sampler snapshot
+            resources = self.resource_sampler.snapshot()
+            metrics["system_load"] = resources.load_average[0] / resources.effective_cpus
+            metrics["memory_usage_percent"] = resources.memory_percent
+            metrics["cpu_usage_percent"] = resources.cpu_percent
+            metrics["process_rss_mb"] = resources.process_rss_mb
+            metrics["open_fds"] = float(resources.open_fds)
+            metrics["event_loop_lag_ms"] = resources.loop_lag_ms
+            metrics["gc_pause_ms"] = resources.gc_pause_ms
+
+            # Export latency quantiles, loop lag and stall attribution on the same cadence
+            if self.instrumentation:
+                self.instrumentation.publish_latency_quantiles()
+                self.instrumentation.publish_loop_health()
 
             return metrics
 
@@ -551,6 +749,16 @@ class OperationalSupervisor:
         except Exception as e:
             logger.error(f"Error notifying emergency handled: {str(e)}")
 
+    def get_coordination_statistics(self) -> Dict[str, Any]:
+        """Get statistics about the event-driven coordination loop"""
+        return {
+            **self.coordination_stats,
+            "tracked_heartbeats": len(self._heartbeats),
+            "queued_decisions": len(self._decision_queue),
+            "queued_conflicts": len(self._conflict_queue),
+            "stage_budgets": dict(self.stage_budgets)
+        }
+
     def get_ml_statistics(self) -> Dict[str, Any]:
         """Get statistics about ML component performance"""
         try:
@@ -0,0 +1,302 @@
+"""
+Call session store for RoxyAgent conversation state
+Bounded per-call turn buffers with idle-TTL eviction and an optional shared Redis backend
+"""
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from typing import Dict, Any, List, Optional, Deque
+
+from voicehive.core.settings import get_settings
+from voicehive.utils.serialization import dumps, loads
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    aioredis = None
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Approximate fixed cost of a turn record beyond its content
+TURN_OVERHEAD_BYTES = 96
+
+
+class TurnRecord:
+    """Compact conversation turn (role, content, timestamp)"""
+
+    __slots__ = ("role", "content", "timestamp")
+
+    def __init__(self, role: str, content: str, timestamp: Optional[float] = None):
+        self.role = role
+        self.content = content
+        self.timestamp = timestamp if timestamp is not None else time.time()
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate memory footprint of this turn"""
+        return TURN_OVERHEAD_BYTES + len(self.content)
+
+    def to_list(self) -> list:
+        """Convert turn to a compact serializable list"""
+        return [self.role, self.content, self.timestamp]
+
+    @classmethod
+    def from_list(cls, data: list) -> "TurnRecord":
+        """Create turn from its serialized list form"""
+        return cls(data[0], data[1], data[2])
+
+    def __repr__(self) -> str:
+        return f"TurnRecord(role={self.role!r}, content={self.content!r})"
+
+
+class CallSession:
+    """Turn buffer and bookkeeping for a single call"""
+
+    __slots__ = ("call_id", "turns", "last_active", "size_bytes")
+
+    def __init__(self, call_id: str, max_turns: int):
+        self.call_id = call_id
+        self.turns: Deque[TurnRecord] = deque(maxlen=max_turns)
+        self.last_active = time.monotonic()
+        self.size_bytes = 0
+
+    def append(self, turn: TurnRecord) -> None:
+        """Append a turn, dropping the oldest when the buffer is full"""
+        if len(self.turns) == self.turns.maxlen:
+            self.size_bytes -= self.turns[0].size_bytes
+        self.turns.append(turn)
+        self.size_bytes += turn.size_bytes
+
+
+class CallSessionBackend(ABC):
+    """Storage backend for call sessions"""
+
+    @abstractmethod
+    async def get_turns(self, call_id: str) -> List[TurnRecord]:
+        """Get the recent turns of a call, oldest first"""
+
+    @abstractmethod
+    async def append_turns(self, call_id: str, turns: List[TurnRecord]) -> None:
+        """Append turns to a call, keeping only the most recent ones"""
+
+    @abstractmethod
+    async def delete(self, call_id: str) -> bool:
+        """Drop all state for a call"""
+
+    async def evict_expired(self) -> int:
+        """Evict idle sessions and return how many were removed"""
+        return 0
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """Get backend statistics"""
+
+
+class InMemorySessionBackend(CallSessionBackend):
+    """
+    Per-worker session backend
+
+    Features:
+    - Sessions kept in last-activity order, so idle eviction pops from the front
+    - Idle TTL for calls that drop without a hang event
+    - Session-count and memory caps with least-recently-active eviction
+    - Fixed-size deque turn buffers (no per-turn list rebuilds)
+    """
+
+    def __init__(self,
+                 max_turns: int,
+                 idle_ttl: float = 1800,
+                 max_sessions: int = 10000,
+                 max_bytes: int = 64 * 1024 * 1024):
+        self.max_turns = max_turns
+        self.idle_ttl = idle_ttl
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+
+        self._sessions: "OrderedDict[str, CallSession]" = OrderedDict()
+        self._total_bytes = 0
+        self._stats = {
+            "expired": 0,
+            "evicted": 0,
+            "deleted": 0
+        }
+
+    async def get_turns(self, call_id: str) -> List[TurnRecord]:
+        self._evict_idle()
+        session = self._sessions.get(call_id)
+        if session is None:
+            return []
+        return list(session.turns)
+
+    async def append_turns(self, call_id: str, turns: List[TurnRecord]) -> None:
+        self._evict_idle()
+
+        session = self._sessions.get(call_id)
+        if session is None:
+            session = CallSession(call_id, self.max_turns)
+            self._sessions[call_id] = session
+        else:
+            self._sessions.move_to_end(call_id)
+
+        previous_size = session.size_bytes
+        for turn in turns:
+            session.append(turn)
+        session.last_active = time.monotonic()
+        self._total_bytes += session.size_bytes - previous_size
+
+        self._enforce_caps()
+
+    async def delete(self, call_id: str) -> bool:
+        session = self._sessions.pop(call_id, None)
+        if session is None:
+            return False
+        self._total_bytes -= session.size_bytes
+        self._stats["deleted"] += 1
+        return True
+
+    async def evict_expired(self) -> int:
+        return self._evict_idle()
+
+    def _evict_idle(self) -> int:
+        """Drop sessions idle longer than the TTL (oldest activity first)"""
+        cutoff = time.monotonic() - self.idle_ttl
+        evicted = 0
+        while self._sessions:
+            call_id, session = next(iter(self._sessions.items()))
+            if session.last_active > cutoff:
+                break
+            self._sessions.popitem(last=False)
+            self._total_bytes -= session.size_bytes
+            evicted += 1
+
+        if evicted:
+            self._stats["expired"] += evicted
+            logger.debug(f"Expired {evicted} idle call sessions")
+        return evicted
+
+    def _enforce_caps(self) -> None:
+        """Evict least recently active sessions beyond the count and memory caps"""
+        while len(self._sessions) > 1 and (
+            len(self._sessions) > self.max_sessions or self._total_bytes > self.max_bytes
+        ):
+            call_id, session = self._sessions.popitem(last=False)
+            self._total_bytes -= session.size_bytes
+            self._stats["evicted"] += 1
+            logger.warning(f"Evicted call session {call_id} (session store at capacity)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "memory",
+            "active_sessions": len(self._sessions),
+            "memory_bytes": self._total_bytes,
+            "max_sessions": self.max_sessions,
+            "max_bytes": self.max_bytes,
+            "idle_ttl": self.idle_ttl,
+            **self._stats
+        }
+
+
+class RedisSessionBackend(CallSessionBackend):
+    """
+    Shared session backend so any worker can serve any turn of a call
+
+    Each call is a capped Redis list whose TTL is refreshed on every write.
+    """
+
+    def __init__(self,
+                 max_turns: int,
+                 idle_ttl: float = 1800,
+                 redis_url: str = "redis://localhost:6379/0",
+                 key_prefix: str = "voicehive:call_session:",
+                 client=None):
+        if client is None:
+            if not REDIS_AVAILABLE:
+                raise ImportError("redis package is required for the Redis call session backend")
+            client = aioredis.from_url(redis_url)
+
+        self.client = client
+        self.max_turns = max_turns
+        self.idle_ttl = int(idle_ttl)
+        self.key_prefix = key_prefix
+
+    def _key(self, call_id: str) -> str:
+        return f"{self.key_prefix}{call_id}"
+
+    async def get_turns(self, call_id: str) -> List[TurnRecord]:
+        raw_turns = await self.client.lrange(self._key(call_id), -self.max_turns, -1)
+        return [TurnRecord.from_list(loads(raw)) for raw in raw_turns]
+
+    async def append_turns(self, call_id: str, turns: List[TurnRecord]) -> None:
+        key = self._key(call_id)
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.rpush(key, *[dumps(turn.to_list()) for turn in turns])
+            pipe.ltrim(key, -self.max_turns, -1)
+            pipe.expire(key, self.idle_ttl)
+            await pipe.execute()
+
+    async def delete(self, call_id: str) -> bool:
+        return bool(await self.client.delete(self._key(call_id)))
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "redis",
+            "key_prefix": self.key_prefix,
+            "idle_ttl": self.idle_ttl,
+            "max_turns": self.max_turns
+        }
+
+
+class CallSessionStore:
+    """Conversation state for in-progress calls"""
+
+    def __init__(self, backend: CallSessionBackend):
+        self.backend = backend
+
+    async def get_history(self, call_id: str) -> List[TurnRecord]:
+        """Get recent conversation turns for a call"""
+        return await self.backend.get_turns(call_id)
+
+    async def append(self, call_id: str, *turns: TurnRecord) -> None:
+        """Record new conversation turns for a call"""
+        if turns:
+            await self.backend.append_turns(call_id, list(turns))
+
+    async def end_session(self, call_id: str) -> bool:
+        """Drop conversation state when a call ends"""
+        return await self.backend.delete(call_id)
+
+    async def cleanup_expired(self) -> int:
+        """Evict idle call sessions"""
+        return await self.backend.evict_expired()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get session store statistics"""
+        return self.backend.get_stats()
+
+
+def create_call_session_store() -> CallSessionStore:
+    """Create a call session store from settings"""
+    max_turns = settings.conversation_history_limit
+    idle_ttl = settings.call_session_idle_ttl
+
+    if settings.call_session_backend == "redis":
+        if REDIS_AVAILABLE and settings.call_session_redis_url:
+            logger.info("Using Redis call session store")
+            return CallSessionStore(RedisSessionBackend(
+                max_turns=max_turns,
+                idle_ttl=idle_ttl,
+                redis_url=settings.call_session_redis_url
+            ))
+        logger.warning("Redis call session store not available - using in-memory store")
+
+    return CallSessionStore(InMemorySessionBackend(
+        max_turns=max_turns,
+        idle_ttl=idle_ttl,
+        max_sessions=settings.call_session_max_sessions,
+        max_bytes=settings.call_session_max_memory_mb * 1024 * 1024
+    ))
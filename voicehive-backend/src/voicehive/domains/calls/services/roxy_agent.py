@@ -1,4 +1,5 @@
 import logging
+import time
 from typing import Dict, Any, List
 from datetime import datetime
 
@@ -13,9 +14,14 @@ from voicehive.models.vapi import (
 )
 from voicehive.services.ai.openai_service import OpenAIService
 from voicehive.domains.appointments.services.appointment_service import AppointmentService
+from voicehive.domains.calls.repositories.call_session_store import (
+    CallSessionStore, TurnRecord, create_call_session_store
+)
 from voicehive.domains.leads.services.lead_service import LeadService
 from voicehive.domains.notifications.services.notification_service import NotificationService
 from voicehive.utils.exceptions import AgentError, FunctionCallError
+from voicehive.utils.profiling import stage
+from voicehive.utils.quantiles import record_latency
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -31,7 +37,7 @@ class RoxyAgent:
         self.appointment_service = AppointmentService()
         self.lead_service = LeadService()
         self.notification_service = NotificationService()
-        self.conversation_history: Dict[str, List[ConversationMessage]] = {}
+        self.session_store: CallSessionStore = create_call_session_store()
         self.system_prompt = self._load_system_prompt()
         
     def _load_system_prompt(self) -> str:
@@ -82,25 +88,24 @@ Available tools:
             if not user_message.strip():
                 return "Hello! I'm Roxy, your VoiceHive assistant. How can I help you today?"
             
-            # Get or create conversation history
-            history = self._get_conversation_history(call_id)
-            
-            # Add user message to history
-            user_msg = ConversationMessage(role="user", content=user_message)
-            history.append(user_msg)
+            with stage("history"):
+                # Get recent conversation turns for this call
+                history = await self._get_conversation_history(call_id)
+                
+                # Add user message to history
+                user_turn = TurnRecord("user", user_message)
+                history.append(user_turn)
             
             # Generate response using OpenAI
-            response = await self.openai_service.generate_response(
-                self.system_prompt, 
-                history
-            )
-            
-            # Add assistant response to history
-            assistant_msg = ConversationMessage(role="assistant", content=response)
-            history.append(assistant_msg)
+            with stage("llm"):
+                response = await self.openai_service.generate_response(
+                    self.system_prompt, 
+                    history
+                )
             
-            # Update conversation history (keep only recent messages)
-            self._update_conversation_history(call_id, history)
+            with stage("history"):
+                # Record both turns (the store keeps only recent messages)
+                await self.session_store.append(call_id, user_turn, TurnRecord("assistant", response))
             
             return response
             
@@ -120,6 +125,7 @@ Available tools:
         Returns:
             Function call response
         """
+        start_time = time.perf_counter()
         try:
             logger.info(f"Function call for call {call_id}: {function_name} with parameters: {parameters}")
             
@@ -140,6 +146,9 @@ Available tools:
                 success=False,
                 message=f"Function call failed: {str(e)}"
             )
+        
+        finally:
+            record_latency("function_call", (time.perf_counter() - start_time) * 1000)
 
     async def handle_transcript_update(self, call_id: str, transcript: str) -> None:
         """
@@ -168,8 +177,7 @@ Available tools:
             logger.info(f"Call ended: {call_id}")
             
             # Clean up conversation history
-            if call_id in self.conversation_history:
-                del self.conversation_history[call_id]
+            await self.session_store.end_session(call_id)
             
             # Store final call data for analysis
             # This would typically go to a database
@@ -177,15 +185,15 @@ Available tools:
         except Exception as e:
             logger.error(f"Error handling call end for call {call_id}: {str(e)}")
 
-    def _get_conversation_history(self, call_id: str) -> List[ConversationMessage]:
+    async def _get_conversation_history(self, call_id: str) -> List[TurnRecord]:
         """Get conversation history for a call"""
-        return self.conversation_history.get(call_id, [])
+        return await self.session_store.get_history(call_id)
 
-    def _update_conversation_history(self, call_id: str, history: List[ConversationMessage]) -> None:
-        """Update conversation history, keeping only recent messages"""
-        # Keep only the last N messages to prevent memory bloat
-        limit = settings.conversation_history_limit
-        self.conversation_history[call_id] = history[-limit:] if len(history) > limit else history
+    async def _update_conversation_history(self, call_id: str, history: List[ConversationMessage]) -> None:
+        """Append messages to a call's conversation history"""
+        await self.session_store.append(
+            call_id, *(TurnRecord(message.role, message.content) for message in history)
+        )
 
     async def _handle_book_appointment(self, parameters: Dict[str, Any]) -> FunctionCallResponse:
         """Handle appointment booking"""
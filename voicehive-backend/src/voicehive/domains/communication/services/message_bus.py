@@ -12,6 +12,7 @@ from collections import defaultdict
 import uuid
 
 from voicehive.utils.exceptions import VoiceHiveError, ErrorHandler
+from voicehive.utils.quantiles import record_latency
 from voicehive.core.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -296,6 +297,12 @@ class MessageBus:
             await subscription.handler(message)
             logger.debug(f"Message {message.id} delivered to {subscription.subscriber_id}")
             
+            # Publish-to-handled latency
+            record_latency(
+                "bus_delivery",
+                (datetime.now() - message.timestamp).total_seconds() * 1000
+            )
+            
             # Reset circuit breaker on successful delivery
             if subscription.subscriber_id in self.failed_subscribers:
                 del self.failed_subscribers[subscription.subscriber_id]
@@ -20,6 +20,8 @@ from google.cloud import monitoring_v3
 from google.cloud import logging as cloud_logging
 from google.cloud import secretmanager
 
+from voicehive.utils.resources import get_resource_sampler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -507,18 +509,11 @@ class MonitoringService:
     async def _check_system_resources_health(self) -> HealthCheck:
         """Check system resources health"""
         try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
-            
-            # Memory usage
-            memory = psutil.virtual_memory()
-            memory_percent = memory.percent
-            
-            # Load average (Unix systems)
-            try:
-                load_avg = os.getloadavg()[0]  # 1-minute load average
-            except (OSError, AttributeError):
-                load_avg = 0  # Windows doesn't have load average
+            # Shared sampler snapshot (container-aware CPU and memory, no blocking sample)
+            resources = get_resource_sampler().snapshot()
+            cpu_percent = resources.cpu_percent
+            memory_percent = resources.memory_percent
+            load_avg = resources.load_average[0]  # 1-minute load average
             
             # Determine status based on resource usage
             if cpu_percent > 90 or memory_percent > 90:
@@ -540,8 +535,10 @@ class MonitoringService:
                 details={
                     "cpu_percent": cpu_percent,
                     "memory_percent": memory_percent,
-                    "memory_available_gb": memory.available / (1024**3),
-                    "load_average": load_avg
+                    "memory_available_gb": resources.memory_available_mb / 1024,
+                    "load_average": load_avg,
+                    "process_rss_mb": resources.process_rss_mb,
+                    "open_fds": resources.open_fds
                 }
             )
         except Exception as e:
@@ -590,17 +587,17 @@ class MonitoringService:
         metrics = []
         timestamp = datetime.now()
         
-        # System metrics
-        cpu_percent = psutil.cpu_percent()
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
+        # System metrics from the shared sampler snapshot
+        resources = get_resource_sampler().snapshot()
         
         metrics.extend([
-            MetricData("cpu_usage_percent", cpu_percent, timestamp, unit="percent"),
-            MetricData("memory_usage_percent", memory.percent, timestamp, unit="percent"),
-            MetricData("memory_usage_mb", memory.used / (1024**2), timestamp, unit="megabytes"),
-            MetricData("disk_usage_percent", (disk.used / disk.total) * 100, timestamp, unit="percent"),
-            MetricData("disk_free_gb", disk.free / (1024**3), timestamp, unit="gigabytes")
+            MetricData("cpu_usage_percent", resources.cpu_percent, timestamp, unit="percent"),
+            MetricData("memory_usage_percent", resources.memory_percent, timestamp, unit="percent"),
+            MetricData("memory_usage_mb", resources.memory_used_mb, timestamp, unit="megabytes"),
+            MetricData("disk_usage_percent", resources.disk_percent, timestamp, unit="percent"),
+            MetricData("disk_free_gb", resources.disk_free_gb, timestamp, unit="gigabytes"),
+            MetricData("process_rss_mb", resources.process_rss_mb, timestamp, unit="megabytes"),
+            MetricData("event_loop_lag_ms", resources.loop_lag_ms, timestamp, unit="milliseconds")
         ])
         
         # Application metrics from health checks
@@ -15,6 +15,8 @@ from fastapi.responses import JSONResponse
 from voicehive.api.v1.api import api_router
 from voicehive.core.settings import get_settings
 from voicehive.utils.exceptions import VoiceHiveException
+from voicehive.utils.loop_monitor import get_loop_monitor
+from voicehive.utils.resources import get_resource_sampler
 
 # Configure logging
 logging.basicConfig(
@@ -33,11 +35,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Starting VoiceHive application...")
     logger.info(f"Environment: {settings.ENVIRONMENT}")
     logger.info(f"Debug mode: {settings.DEBUG}")
+    await get_resource_sampler().start()
+    if settings.loop_monitor_enabled:
+        get_loop_monitor().configure(
+            interval_ms=settings.loop_monitor_interval_ms,
+            block_threshold_ms=settings.loop_block_threshold_ms
+        )
+        get_loop_monitor().start()
     
     yield
     
     # Shutdown
     logger.info("Shutting down VoiceHive application...")
+    get_loop_monitor().stop()
+    await get_resource_sampler().stop()
 
 
 def create_application() -> FastAPI:
@@ -4,10 +4,12 @@ Data models for Vapi.ai webhook integration and call handling
 """
 
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
 
 from pydantic import BaseModel, Field
 
+from voicehive.utils.serialization import loads
+
 
 class VapiMessage(BaseModel):
     """Base Vapi message model"""
@@ -33,6 +35,44 @@ class VapiWebhookRequest(BaseModel):
     timestamp: Optional[datetime] = None
 
 
+class VapiTranscriptEvent:
+    """
+    Partially validated transcript event
+
+    Transcript updates are the most frequent Vapi event and only need the call
+    ID and transcript text, so they skip full VapiWebhookRequest validation.
+    """
+    __slots__ = ("call_id", "transcript")
+
+    type = "transcript"
+
+    def __init__(self, call_id: str, transcript: str):
+        self.call_id = call_id
+        self.transcript = transcript
+
+
+def parse_vapi_webhook(raw: bytes) -> Union[VapiTranscriptEvent, VapiWebhookRequest]:
+    """
+    Parse a raw Vapi webhook body
+
+    Dispatches on message.type before validation: well-formed transcript events
+    take the partial fast path, everything else (including malformed transcript
+    payloads) goes through full VapiWebhookRequest validation.
+    """
+    body = loads(raw)
+
+    if type(body) is dict:
+        message = body.get("message")
+        call = body.get("call")
+        if type(message) is dict and type(call) is dict and message.get("type") == "transcript":
+            call_id = call.get("id")
+            transcript = message.get("transcript")
+            if type(call_id) is str and (transcript is None or type(transcript) is str):
+                return VapiTranscriptEvent(call_id, transcript or "")
+
+    return VapiWebhookRequest.model_validate(body)
+
+
 class VapiWebhookResponse(BaseModel):
     """Response to Vapi webhook"""
     message: Optional[str] = None
@@ -1,10 +1,14 @@
+import asyncio
 import logging
-from typing import List
+import time
+from typing import List, Optional, Tuple
 from openai import OpenAI
 
 from voicehive.core.settings import get_settings
 from voicehive.models.vapi import ConversationMessage
+from voicehive.services.ai.context_assembler import get_context_assembler
 from voicehive.utils.exceptions import OpenAIServiceError
+from voicehive.utils.quantiles import record_latency
 
 settings = get_settings()
 
@@ -16,40 +20,62 @@ class OpenAIService:
     
     def __init__(self):
         self.client = OpenAI(api_key=settings.openai_api_key)
+        self.context_assembler = get_context_assembler()
         
-    async def generate_response(self, system_prompt: str, conversation_history: List[ConversationMessage]) -> str:
+    async def generate_response(self,
+                                system_prompt: str,
+                                conversation_history: List[ConversationMessage],
+                                pinned_context: Optional[str] = None) -> str:
         """
         Generate a response using OpenAI GPT
         
         Args:
             system_prompt: The system prompt for the AI
             conversation_history: List of conversation messages
+            pinned_context: Per-call context kept in the stable prompt prefix
             
         Returns:
             Generated response text
         """
         try:
-            # Prepare messages for OpenAI API
-            messages = [{"role": "system", "content": system_prompt}]
+            # Prepare messages within the token budget (stable prefix first)
+            context = self.context_assembler.assemble(system_prompt, conversation_history, pinned_context)
             
-            # Add conversation history
-            for msg in conversation_history:
-                messages.append({
-                    "role": msg.role,
-                    "content": msg.content
-                })
+            # Generate response; the client is synchronous, so run it off the event loop
+            start_time = time.perf_counter()
+            try:
+                response = await asyncio.to_thread(
+                    self.client.chat.completions.create,
+                    model=settings.openai_model,
+                    messages=context.messages,
+                    max_tokens=settings.openai_max_tokens,
+                    temperature=settings.openai_temperature,
+                    timeout=settings.response_timeout
+                )
+            finally:
+                latency_ms = (time.perf_counter() - start_time) * 1000
+                record_latency("llm", latency_ms)
             
-            # Generate response
-            response = self.client.chat.completions.create(
-                model=settings.openai_model,
-                messages=messages,
-                max_tokens=settings.openai_max_tokens,
-                temperature=settings.openai_temperature,
-                timeout=settings.response_timeout
-            )
+            prompt_tokens, cached_tokens = self._prompt_usage(response)
+            self.context_assembler.record_turn(context, prompt_tokens, cached_tokens, latency_ms)
             
             return response.choices[0].message.content.strip()
             
         except Exception as e:
             logger.error(f"Error generating OpenAI response: {str(e)}")
             raise OpenAIServiceError(f"Failed to generate response: {str(e)}")
+
+    @staticmethod
+    def _prompt_usage(response) -> Tuple[Optional[int], Optional[int]]:
+        """Get prompt and provider-cached token counts from a completion response"""
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return None, None
+
+        prompt_tokens = getattr(usage, "prompt_tokens", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None) if details is not None else None
+        return (
+            prompt_tokens if isinstance(prompt_tokens, int) else None,
+            cached_tokens if isinstance(cached_tokens, int) else None
+        )
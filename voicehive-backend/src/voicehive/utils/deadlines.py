@@ -0,0 +1,79 @@
+"""
+Keyed deadline heap
+Tracks one expiry deadline per key (e.g. agent heartbeats) so expiry checks cost O(expired)
+"""
+
+import heapq
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+class DeadlineHeap:
+    """
+    Min-heap of per-key deadlines
+
+    Postponing a deadline (the common case: a heartbeat arrives) only updates
+    the recorded deadline in O(1); the key's heap entry is re-pushed with the
+    new deadline when it surfaces. Each key therefore has one live heap entry,
+    and popping expired keys never looks at keys that are not yet due.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, Hashable]] = []
+        self._due: Dict[Hashable, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._due
+
+    def deadline(self, key: Hashable) -> Optional[float]:
+        return self._due.get(key)
+
+    def schedule(self, key: Hashable, deadline: float) -> bool:
+        """Set the deadline of key; returns True if it is now the earliest deadline"""
+        current = self._due.get(key)
+        self._due[key] = deadline
+        if current is not None and deadline >= current:
+            return False
+        heapq.heappush(self._heap, (deadline, key))
+        return self.next_deadline() == deadline
+
+    def discard(self, key: Hashable) -> None:
+        """Stop tracking key (its heap entry is dropped lazily)"""
+        self._due.pop(key, None)
+
+    def next_deadline(self) -> Optional[float]:
+        """Earliest live deadline, or None when nothing is tracked"""
+        heap = self._heap
+        while heap:
+            deadline, key = heap[0]
+            due = self._due.get(key)
+            if due is None or due < deadline:
+                # Discarded, or superseded by an earlier entry
+                heapq.heappop(heap)
+            elif due > deadline:
+                heapq.heapreplace(heap, (due, key))
+            else:
+                return deadline
+        return None
+
+    def pop_expired(self, now: float) -> List[Hashable]:
+        """Remove and return the keys whose deadline is at or before now"""
+        expired = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            deadline, key = heapq.heappop(heap)
+            due = self._due.get(key)
+            if due is None or due < deadline:
+                continue
+            if due > deadline:
+                heapq.heappush(heap, (due, key))
+                continue
+            del self._due[key]
+            expired.append(key)
+        return expired
+
+    def heap_size(self) -> int:
+        """Number of heap entries, including stale ones not yet dropped"""
+        return len(self._heap)
@@ -0,0 +1,221 @@
+"""
+Safe expression compiler
+Validates small boolean/arithmetic expressions once and compiles them to closures and NumPy column evaluators
+"""
+
+import ast
+import operator
+from typing import Any, Callable, FrozenSet, Iterable, Mapping, Optional
+
+import numpy as np
+
+_COMPARE_OPS = {
+    ast.Eq: operator.eq, ast.NotEq: operator.ne,
+    ast.Lt: operator.lt, ast.LtE: operator.le,
+    ast.Gt: operator.gt, ast.GtE: operator.ge,
+    ast.In: lambda left, right: left in right,
+    ast.NotIn: lambda left, right: left not in right
+}
+_VECTOR_COMPARE_OPS = {
+    **_COMPARE_OPS,
+    ast.In: lambda left, right: np.isin(left, list(right)),
+    ast.NotIn: lambda left, right: ~np.isin(left, list(right))
+}
+_BINARY_OPS = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: operator.truediv, ast.FloorDiv: operator.floordiv, ast.Mod: operator.mod
+}
+_DIVISION_OPS = (ast.Div, ast.FloorDiv, ast.Mod)
+_UNARY_OPS = {ast.USub: operator.neg, ast.UAdd: operator.pos}
+_CONSTANT_TYPES = (bool, int, float, str, type(None))
+
+# Scalar evaluators return a value; vector evaluators return (values, invalid rows)
+Evaluator = Callable[[Mapping[str, Any]], Any]
+
+
+class CompiledExpression:
+    """
+    Expression parsed and validated once, evaluated many times
+
+    Only literals, the declared variable names, ``and``/``or``/``not``, comparisons
+    (including chained ones and ``in`` against a literal tuple/list) and
+    ``+ - * / // %`` are accepted; anything else (calls, attributes, subscripts,
+    undeclared names) is rejected at compile time with ValueError, so evaluation
+    never touches ``eval``. ``evaluate`` runs a closure tree over one mapping of
+    values; ``evaluate_batch`` runs the same tree over NumPy columns and returns
+    one boolean per row. A row that would raise ZeroDivisionError in ``evaluate``
+    (honouring ``and``/``or`` and chained-comparison short-circuiting) is False
+    in ``evaluate_batch``, i.e. not matched.
+    """
+
+    def __init__(self, source: str, variables: Iterable[str]):
+        self.source = source
+        self.variables: FrozenSet[str] = frozenset(variables)
+        try:
+            tree = ast.parse(source.strip(), mode="eval")
+        except SyntaxError as e:
+            raise ValueError(f"Invalid expression {source!r}: {e.msg}") from e
+        self._tree = tree.body
+        self.names: FrozenSet[str] = frozenset()
+        self._scalar = self._compile(self._tree, vector=False)
+        self._vector = self._compile(self._tree, vector=True)
+
+    def evaluate(self, values: Mapping[str, Any]) -> bool:
+        """Evaluate against one mapping of variable values"""
+        return bool(self._scalar(values))
+
+    def evaluate_batch(self, columns: Mapping[str, Any], size: int) -> np.ndarray:
+        """Evaluate against columns (arrays of length ``size`` or scalars); returns a bool array"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result, invalid = self._vector(columns)
+        return np.broadcast_to(np.logical_and(np.asarray(result, dtype=bool), np.logical_not(invalid)), (size,))
+
+    def allowed_values(self, name: str) -> Optional[FrozenSet[Any]]:
+        """
+        Values of ``name`` for which the expression can be true, if the expression
+        requires ``name == literal`` or ``name in (literals)``; None if unrestricted
+        """
+        return self._allowed_values(self._tree, name)
+
+    def _allowed_values(self, node: ast.AST, name: str) -> Optional[FrozenSet[Any]]:
+        if isinstance(node, ast.BoolOp):
+            parts = [self._allowed_values(value, name) for value in node.values]
+            if isinstance(node.op, ast.And):
+                restricted = [part for part in parts if part is not None]
+                return frozenset.intersection(*restricted) if restricted else None
+            return None if any(part is None for part in parts) else frozenset().union(*parts)
+        if (isinstance(node, ast.Compare) and len(node.ops) == 1
+                and isinstance(node.left, ast.Name) and node.left.id == name):
+            right = node.comparators[0]
+            if isinstance(node.ops[0], ast.Eq) and isinstance(right, ast.Constant):
+                return frozenset([right.value])
+            if isinstance(node.ops[0], ast.In) and isinstance(right, (ast.Tuple, ast.List)):
+                return frozenset(element.value for element in right.elts)
+        return None
+
+    def _compile(self, node: ast.AST, vector: bool) -> Evaluator:
+        if isinstance(node, ast.Constant):
+            if not isinstance(node.value, _CONSTANT_TYPES):
+                raise ValueError(f"Unsupported literal {node.value!r} in {self.source!r}")
+            value = node.value
+            if vector:
+                return lambda values: (value, False)
+            return lambda values: value
+
+        if isinstance(node, ast.Name):
+            if node.id not in self.variables:
+                raise ValueError(f"Unknown variable {node.id!r} in {self.source!r}")
+            self.names = self.names | {node.id}
+            key = node.id
+            if vector:
+                return lambda values: (values[key], False)
+            return lambda values: values[key]
+
+        if isinstance(node, (ast.Tuple, ast.List)):
+            if not all(isinstance(element, ast.Constant) for element in node.elts):
+                raise ValueError(f"Only literal collections are supported in {self.source!r}")
+            collection = tuple(element.value for element in node.elts)
+            if vector:
+                return lambda values: (collection, False)
+            return lambda values: collection
+
+        if isinstance(node, ast.BoolOp):
+            operands = [self._compile(value, vector) for value in node.values]
+            is_and = isinstance(node.op, ast.And)
+            if vector:
+                return self._compile_bool_op(operands, is_and)
+            if is_and:
+                return lambda values: all(operand(values) for operand in operands)
+            return lambda values: any(operand(values) for operand in operands)
+
+        if isinstance(node, ast.UnaryOp):
+            operand = self._compile(node.operand, vector)
+            if isinstance(node.op, ast.Not):
+                op = np.logical_not if vector else operator.not_
+            else:
+                op = _UNARY_OPS.get(type(node.op))
+                if op is None:
+                    raise ValueError(f"Unsupported operator in {self.source!r}")
+            if vector:
+                return lambda values: self._apply_unary(op, operand(values))
+            return lambda values: op(operand(values))
+
+        if isinstance(node, ast.BinOp):
+            op = _BINARY_OPS.get(type(node.op))
+            if op is None:
+                raise ValueError(f"Unsupported operator in {self.source!r}")
+            left, right = self._compile(node.left, vector), self._compile(node.right, vector)
+            if vector:
+                divides = isinstance(node.op, _DIVISION_OPS)
+                return lambda values: self._apply_binary(op, left(values), right(values), divides)
+            return lambda values: op(left(values), right(values))
+
+        if isinstance(node, ast.Compare):
+            table = _VECTOR_COMPARE_OPS if vector else _COMPARE_OPS
+            ops = []
+            for op_node, comparator in zip(node.ops, node.comparators):
+                op = table.get(type(op_node))
+                if op is None:
+                    raise ValueError(f"Unsupported comparison in {self.source!r}")
+                if isinstance(op_node, (ast.In, ast.NotIn)) and not isinstance(comparator, (ast.Tuple, ast.List)):
+                    raise ValueError(f"'in' requires a literal tuple or list in {self.source!r}")
+                ops.append(op)
+            operands = [self._compile(operand, vector) for operand in [node.left, *node.comparators]]
+            if len(ops) == 1 and not vector:
+                op, left, right = ops[0], operands[0], operands[1]
+                return lambda values: op(left(values), right(values))
+            return self._compile_chain(ops, operands, vector)
+
+        raise ValueError(f"Unsupported syntax {type(node).__name__} in {self.source!r}")
+
+    @staticmethod
+    def _apply_unary(op, operand):
+        value, invalid = operand
+        return op(value), invalid
+
+    @staticmethod
+    def _apply_binary(op, left, right, divides: bool):
+        (left_value, left_invalid), (right_value, right_invalid) = left, right
+        invalid = np.logical_or(left_invalid, right_invalid)
+        if divides:
+            invalid = np.logical_or(invalid, np.equal(right_value, 0))
+        return op(left_value, right_value), invalid
+
+    @staticmethod
+    def _compile_bool_op(operands, is_and: bool) -> Evaluator:
+        def evaluate(values):
+            # Rows on which the scalar path would still evaluate the next operand
+            reached, result, invalid = True, is_and, False
+            for operand in operands:
+                value, operand_invalid = operand(values)
+                invalid = np.logical_or(invalid, np.logical_and(reached, operand_invalid))
+                if is_and:
+                    result = np.logical_and(result, value)
+                    reached = np.logical_and(reached, value)
+                else:
+                    result = np.logical_or(result, value)
+                    reached = np.logical_and(reached, np.logical_not(value))
+            return result, invalid
+        return evaluate
+
+    @staticmethod
+    def _compile_chain(ops, operands, vector: bool) -> Evaluator:
+        pairs = list(zip(ops, operands, operands[1:]))
+        if vector:
+            def evaluate(values):
+                reached, invalid = True, False
+                left_value, left_invalid = operands[0](values)
+                invalid = np.logical_or(invalid, left_invalid)
+                for op, _, right in pairs:
+                    right_value, right_invalid = right(values)
+                    invalid = np.logical_or(invalid, np.logical_and(reached, right_invalid))
+                    reached = np.logical_and(reached, op(left_value, right_value))
+                    left_value = right_value
+                return reached, invalid
+            return evaluate
+        return lambda values: all(op(left(values), right(values)) for op, left, right in pairs)
+
+
+def compile_expression(source: str, variables: Iterable[str]) -> CompiledExpression:
+    """Compile ``source`` over the given variable names; raises ValueError if it is not allowed"""
+    return CompiledExpression(source, variables)
@@ -0,0 +1,267 @@
+"""
+Event-loop health monitoring
+High-resolution lag probe plus a watchdog thread that captures the stack of whatever blocks the loop
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+from voicehive.utils.quantiles import LatencyRegistry, get_latency_registry
+
+logger = logging.getLogger(__name__)
+
+# Latency registry operation the probe reports lag under
+LOOP_LAG_OPERATION = "event_loop_lag"
+# Frame that runs every loop callback; the frame above it is the callback or coroutine being run
+_HANDLE_RUN = ("asyncio.events", "_run")
+# Distinct blocking sites / coroutines tracked before new ones are folded into "other"
+MAX_SITES = 200
+
+
+@dataclass
+class LoopStall:
+    """One period during which the event loop did not run the probe"""
+    started_at: float
+    location: str
+    entry: str
+    stack: List[str]
+    duration_ms: float = 0.0
+    finished: bool = False
+
+    def to_dict(self, include_stack: bool = True) -> Dict[str, Any]:
+        data = {
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration_ms, 3),
+            "location": self.location,
+            "entry": self.entry,
+            "finished": self.finished
+        }
+        if include_stack:
+            data["stack"] = self.stack
+        return data
+
+
+@dataclass
+class _SiteStats:
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def add(self, duration_ms: float) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+
+class LoopMonitor:
+    """
+    Event-loop lag and blocking-call detector
+
+    Features:
+    - Lag probe: a self-rescheduling ``call_later`` callback measures how late
+      the loop runs it (two callbacks per interval, no task or sleep overhead)
+    - Watchdog thread: when the probe has not run for ``block_threshold_ms``
+      past its due time, captures the loop thread's stack once per stall
+    - Stalls attributed to the innermost blocking frame and to the callback or
+      coroutine the loop was running (the frame entered from ``Handle._run``)
+    - Lag histogram recorded in the latency registry for Prometheus export
+    """
+
+    def __init__(self,
+                 interval_ms: float = 50.0,
+                 block_threshold_ms: float = 100.0,
+                 max_stalls: int = 50,
+                 stack_depth: int = 40,
+                 registry: Optional[LatencyRegistry] = None):
+        self.interval_ms = interval_ms
+        self.block_threshold_ms = block_threshold_ms
+        self.stack_depth = stack_depth
+        self.registry = registry or get_latency_registry()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+        # Written by the probe (loop thread), read by the watchdog; the lock guards
+        # the open stall and the stall deque the watchdog appends to
+        self._last_beat = 0.0
+        self._open_stall: Optional[LoopStall] = None
+        self._stalled_beat = 0.0
+
+        self.stalls: Deque[LoopStall] = deque(maxlen=max_stalls)
+        self.blocking_sites: Dict[str, _SiteStats] = {}
+        self.slow_entries: Dict[str, _SiteStats] = {}
+        self.stats = {"probes": 0, "stalls": 0, "blocked_ms": 0.0, "max_lag_ms": 0.0}
+
+    @property
+    def is_running(self) -> bool:
+        return self._handle is not None
+
+    def configure(self,
+                  interval_ms: Optional[float] = None,
+                  block_threshold_ms: Optional[float] = None) -> None:
+        """Update probe cadence and stall threshold (applies from the next probe)"""
+        if interval_ms is not None:
+            self.interval_ms = interval_ms
+        if block_threshold_ms is not None:
+            self.block_threshold_ms = block_threshold_ms
+
+    def start(self) -> None:
+        """Start monitoring the running loop; must be called from the loop's thread"""
+        if self.is_running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._schedule_probe(self._loop.time())
+
+        self._stop.clear()
+        self._watchdog = threading.Thread(target=self._watch, name="voicehive-loop-watchdog", daemon=True)
+        self._watchdog.start()
+        logger.info(f"Event-loop monitor started ({self.interval_ms}ms probe, {self.block_threshold_ms}ms threshold)")
+
+    def stop(self) -> None:
+        """Stop the probe and the watchdog"""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._stop.set()
+        if self._watchdog and self._watchdog is not threading.current_thread():
+            self._watchdog.join(timeout=1.0)
+        self._watchdog = None
+
+    def _schedule_probe(self, now: float) -> None:
+        interval = self.interval_ms / 1000
+        self._handle = self._loop.call_at(now + interval, self._probe, now + interval)
+
+    def _probe(self, due: float) -> None:
+        now = self._loop.time()
+        lag_ms = max(0.0, (now - due) * 1000)
+        self._last_beat = time.perf_counter()
+        self.stats["probes"] += 1
+        if lag_ms > self.stats["max_lag_ms"]:
+            self.stats["max_lag_ms"] = lag_ms
+        self.registry.record(LOOP_LAG_OPERATION, lag_ms)
+
+        if self._open_stall is not None:
+            self._finish_stall(lag_ms)
+        self._schedule_probe(now)
+
+    def _finish_stall(self, lag_ms: float) -> None:
+        with self._lock:
+            stall, self._open_stall = self._open_stall, None
+        stall.duration_ms = lag_ms
+        stall.finished = True
+        self.stats["blocked_ms"] += lag_ms
+        self._site(self.blocking_sites, stall.location).add(lag_ms)
+        self._site(self.slow_entries, stall.entry).add(lag_ms)
+        logger.warning(f"Event loop blocked for {lag_ms:.0f}ms in {stall.entry} at {stall.location}")
+
+    def _site(self, sites: Dict[str, _SiteStats], key: str) -> _SiteStats:
+        stats = sites.get(key)
+        if stats is None:
+            if len(sites) >= MAX_SITES:
+                key = "other"
+            stats = sites.setdefault(key, _SiteStats())
+        return stats
+
+    def _watch(self) -> None:
+        """Watchdog thread: detect a silent probe and capture the blocking stack"""
+        while not self._stop.wait(self.block_threshold_ms / 2000):
+            beat = self._last_beat
+            silent_ms = (time.perf_counter() - beat) * 1000
+            if silent_ms < self.interval_ms + self.block_threshold_ms or beat == self._stalled_beat:
+                continue
+            stall = self._capture_stall()
+            if stall is None:
+                continue
+            with self._lock:
+                # The probe may have run while the stack was being captured
+                if self._last_beat != beat:
+                    continue
+                self._stalled_beat = beat
+                self._open_stall = stall
+                self.stalls.append(stall)
+                self.stats["stalls"] += 1
+
+    def _capture_stall(self) -> Optional[LoopStall]:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return None
+
+        frames = []
+        while frame is not None:
+            frames.append(frame)
+            frame = frame.f_back
+        location = self._describe(frames[0])
+        entry = "unknown"
+        for index, candidate in enumerate(frames):
+            if (candidate.f_globals.get("__name__"), candidate.f_code.co_name) == _HANDLE_RUN and index:
+                entry = self._qualname(frames[index - 1])
+                break
+
+        stack = [self._describe(f) for f in reversed(frames[:self.stack_depth])]
+        return LoopStall(started_at=time.time(), location=location, entry=entry, stack=stack)
+
+    @staticmethod
+    def _qualname(frame) -> str:
+        code = frame.f_code
+        return f"{frame.f_globals.get('__name__', '?')}:{getattr(code, 'co_qualname', code.co_name)}"
+
+    @classmethod
+    def _describe(cls, frame) -> str:
+        return f"{cls._qualname(frame)}:{frame.f_lineno}"
+
+    def get_lag_quantiles(self) -> Dict[str, Any]:
+        return self.registry.get_quantiles(LOOP_LAG_OPERATION)
+
+    def get_statistics(self, include_stacks: bool = False) -> Dict[str, Any]:
+        """Get lag quantiles, stall counts and the top blocking sites and coroutines"""
+        def top(sites: Dict[str, _SiteStats]) -> List[Dict[str, Any]]:
+            ranked = sorted(sites.items(), key=lambda item: item[1].total_ms, reverse=True)[:20]
+            return [
+                {"site": site, "count": s.count, "total_ms": round(s.total_ms, 3), "max_ms": round(s.max_ms, 3)}
+                for site, s in ranked
+            ]
+
+        with self._lock:
+            stalls = list(self.stalls)
+        return {
+            "running": self.is_running,
+            "interval_ms": self.interval_ms,
+            "block_threshold_ms": self.block_threshold_ms,
+            "probes": self.stats["probes"],
+            "max_lag_ms": round(self.stats["max_lag_ms"], 3),
+            "lag": self.get_lag_quantiles(),
+            "stalls": self.stats["stalls"],
+            "blocked_ms": round(self.stats["blocked_ms"], 3),
+            "blocking_sites": top(self.blocking_sites),
+            "slow_coroutines": top(self.slow_entries),
+            "recent_stalls": [stall.to_dict(include_stack=include_stacks) for stall in reversed(stalls)]
+        }
+
+    def reset(self) -> None:
+        """Clear recorded stalls and aggregates"""
+        with self._lock:
+            self.stalls.clear()
+        self.blocking_sites.clear()
+        self.slow_entries.clear()
+        self.stats = {"probes": 0, "stalls": 0, "blocked_ms": 0.0, "max_lag_ms": 0.0}
+
+
+# Global event-loop monitor instance
+loop_monitor = LoopMonitor()
+
+
+def get_loop_monitor() -> LoopMonitor:
+    """Get the global event-loop monitor"""
+    return loop_monitor
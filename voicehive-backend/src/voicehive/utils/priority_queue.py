@@ -0,0 +1,101 @@
+"""
+Keyed priority queue
+Heap-ordered items addressable by key, so inserts, removals by key and head pops stay cheap
+"""
+
+import heapq
+import itertools
+from typing import Any, Callable, Dict, Generic, Hashable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class KeyedPriorityQueue(Generic[T]):
+    """
+    Min-heap of items ordered by ``priority(item)`` and indexed by ``key(item)``
+
+    Removing an item by key drops it from the index in O(1); its heap entry is
+    discarded lazily when it surfaces, and the heap is compacted once stale
+    entries outnumber live ones, so every operation is O(log n) amortized.
+    Items with equal priority come out in insertion order. Iteration yields
+    live items in insertion order; ``ordered()`` yields them by priority.
+    """
+
+    def __init__(self, key: Callable[[T], Hashable], priority: Callable[[T], Any]):
+        self._key = key
+        self._priority = priority
+        self._heap: List[Tuple[Any, int, Hashable]] = []
+        self._items: Dict[Hashable, Tuple[int, T]] = {}
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def __iter__(self) -> Iterator[T]:
+        return (item for _, item in self._items.values())
+
+    def get(self, key: Hashable) -> Optional[T]:
+        entry = self._items.get(key)
+        return entry[1] if entry else None
+
+    def push(self, item: T) -> None:
+        """Insert item, replacing (and re-prioritizing) any item with the same key"""
+        key = self._key(item)
+        seq = next(self._sequence)
+        self._items[key] = (seq, item)
+        heapq.heappush(self._heap, (self._priority(item), seq, key))
+
+    def remove(self, key: Hashable) -> Optional[T]:
+        """Remove and return the item with this key, or None if absent"""
+        entry = self._items.pop(key, None)
+        if entry is None:
+            return None
+        if len(self._heap) > 2 * len(self._items) + 64:
+            self._compact()
+        return entry[1]
+
+    def peek(self) -> Optional[T]:
+        """Highest-priority item without removing it"""
+        self._drop_stale()
+        return self._items[self._heap[0][2]][1] if self._heap else None
+
+    def pop(self) -> Optional[T]:
+        """Remove and return the highest-priority item"""
+        self._drop_stale()
+        if not self._heap:
+            return None
+        _, _, key = heapq.heappop(self._heap)
+        return self._items.pop(key)[1]
+
+    def ordered(self, limit: Optional[int] = None) -> List[T]:
+        """Live items by priority (the first ``limit`` of them if given)"""
+        live = [entry for entry in self._heap if self._is_live(entry)]
+        ranked = sorted(live) if limit is None else heapq.nsmallest(limit, live)
+        return [self._items[key][1] for _, _, key in ranked]
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._items.clear()
+
+    def heap_size(self) -> int:
+        """Number of heap entries, including stale ones not yet dropped"""
+        return len(self._heap)
+
+    def _is_live(self, entry: Tuple[Any, int, Hashable]) -> bool:
+        current = self._items.get(entry[2])
+        return current is not None and current[0] == entry[1]
+
+    def _drop_stale(self) -> None:
+        heap = self._heap
+        while heap and not self._is_live(heap[0]):
+            heapq.heappop(heap)
+
+    def _compact(self) -> None:
+        self._heap = [entry for entry in self._heap if self._is_live(entry)]
+        heapq.heapify(self._heap)
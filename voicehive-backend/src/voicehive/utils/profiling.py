@@ -0,0 +1,308 @@
+"""
+Per-request stage profiling
+Low-overhead named stage timers built on contextvars, with an opt-in
+sampling profiler that produces flame-graph collapsed stacks for the
+slowest requests
+"""
+
+import heapq
+import itertools
+import logging
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, List, Optional, Callable, Iterator
+
+from voicehive.utils.quantiles import LatencyRegistry
+
+logger = logging.getLogger(__name__)
+
+# Profile of the request being handled in the current context
+_current_profile: ContextVar[Optional["RequestProfile"]] = ContextVar("request_profile", default=None)
+
+
+class RequestProfile:
+    """Stage timings collected for a single request"""
+
+    __slots__ = (
+        "name", "request_id", "start_ns", "end_ns", "stages", "stage_stack",
+        "thread_id", "owner_frame", "samples"
+    )
+
+    def __init__(self, name: str, request_id: str, owner_frame=None):
+        self.name = name
+        self.request_id = request_id
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: Optional[int] = None
+        self.stages: Dict[str, int] = {}
+        self.stage_stack: List[str] = []
+        self.thread_id = threading.get_ident()
+        self.owner_frame = owner_frame
+        self.samples: Optional[Counter] = None
+
+    @property
+    def duration_ms(self) -> float:
+        """Total request time in milliseconds"""
+        end_ns = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end_ns - self.start_ns) / 1e6
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert profile to dictionary"""
+        return {
+            "name": self.name,
+            "request_id": self.request_id,
+            "duration_ms": round(self.duration_ms, 3),
+            "stages_ms": {stage: round(ns / 1e6, 3) for stage, ns in self.stages.items()},
+            "sample_count": sum(self.samples.values()) if self.samples else 0
+        }
+
+
+class StageProfiler:
+    """
+    Per-request stage profiler
+
+    Features:
+    - ``profile_request`` opens a request scope held in a ContextVar
+    - ``stage`` times a named block; nested stages are recorded as ``outer/inner``
+    - Per-stage latency histograms backed by mergeable quantile sketches
+    - Opt-in sampling profiler keeping collapsed stacks of the slowest N requests
+    """
+
+    def __init__(self,
+                 enabled: bool = True,
+                 sampling_enabled: bool = False,
+                 sample_interval_ms: float = 5.0,
+                 slowest_n: int = 10):
+        self.enabled = enabled
+        self.sampling_enabled = sampling_enabled
+        self.sample_interval_ms = sample_interval_ms
+        self.slowest_n = slowest_n
+
+        # Per-stage histograms, keyed "<request>.<stage>"
+        self.stage_histograms = LatencyRegistry()
+        self.requests_profiled = 0
+
+        # Slowest requests (min-heap on duration)
+        self._slowest: List[tuple] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+        # Sampling profiler state
+        self._active: Dict[str, RequestProfile] = {}
+        self._sampler_thread: Optional[threading.Thread] = None
+        self._sampler_stop = threading.Event()
+
+        # Optional tracing hook: called as span_factory(name, attributes) -> span
+        self.span_factory: Optional[Callable] = None
+
+    def configure(self,
+                  enabled: Optional[bool] = None,
+                  sampling_enabled: Optional[bool] = None,
+                  sample_interval_ms: Optional[float] = None,
+                  slowest_n: Optional[int] = None) -> None:
+        """Update profiler configuration"""
+        if enabled is not None:
+            self.enabled = enabled
+        if sample_interval_ms is not None:
+            self.sample_interval_ms = sample_interval_ms
+        if slowest_n is not None:
+            self.slowest_n = slowest_n
+        if sampling_enabled is not None:
+            self.sampling_enabled = sampling_enabled
+            if not sampling_enabled:
+                self.stop_sampler()
+
+    def set_span_factory(self, span_factory: Optional[Callable]) -> None:
+        """Emit a tracing span for every stage via span_factory(name, attributes)"""
+        self.span_factory = span_factory
+
+    @contextmanager
+    def profile_request(self, name: str, request_id: Optional[str] = None) -> Iterator[Optional[RequestProfile]]:
+        """Profile a request; stages recorded inside this scope belong to it"""
+        if not self.enabled:
+            yield None
+            return
+
+        # Frame of the code that opened the scope, used to attribute samples
+        owner_frame = sys._getframe(2) if self.sampling_enabled else None
+        profile = RequestProfile(name, request_id or uuid.uuid4().hex[:12], owner_frame)
+        token = _current_profile.set(profile)
+
+        if self.sampling_enabled:
+            profile.samples = Counter()
+            self._active[profile.request_id] = profile
+            self.start_sampler()
+
+        try:
+            yield profile
+        finally:
+            profile.end_ns = time.perf_counter_ns()
+            _current_profile.reset(token)
+            if profile.samples is not None:
+                self._active.pop(profile.request_id, None)
+            profile.owner_frame = None
+            self._finish(profile)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a named stage of the current request (no-op outside a request)"""
+        profile = _current_profile.get()
+        if profile is None:
+            yield
+            return
+
+        profile.stage_stack.append(name)
+        stage_name = "/".join(profile.stage_stack)
+        span = None
+        if self.span_factory is not None:
+            span = self.span_factory(f"{profile.name}.{stage_name}", {"request_id": profile.request_id})
+
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            profile.stages[stage_name] = profile.stages.get(stage_name, 0) + elapsed_ns
+            profile.stage_stack.pop()
+            if span is not None:
+                span.end()
+
+    def _finish(self, profile: RequestProfile) -> None:
+        """Aggregate a finished request into histograms and the slowest-N set"""
+        histograms = self.stage_histograms
+        histograms.record(f"{profile.name}.total", profile.duration_ms)
+        for stage_name, elapsed_ns in profile.stages.items():
+            histograms.record(f"{profile.name}.{stage_name}", elapsed_ns / 1e6)
+
+        with self._lock:
+            self.requests_profiled += 1
+            entry = (profile.duration_ms, next(self._sequence), profile)
+            if len(self._slowest) < self.slowest_n:
+                heapq.heappush(self._slowest, entry)
+            elif entry[0] > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def start_sampler(self) -> None:
+        """Start the background stack sampler if it is not running"""
+        if self._sampler_thread and self._sampler_thread.is_alive():
+            return
+
+        self._sampler_stop.clear()
+        self._sampler_thread = threading.Thread(
+            target=self._sample_loop, name="voicehive-stage-sampler", daemon=True
+        )
+        self._sampler_thread.start()
+        logger.info(f"Sampling profiler started ({self.sample_interval_ms}ms interval)")
+
+    def stop_sampler(self) -> None:
+        """Stop the background stack sampler"""
+        self._sampler_stop.set()
+        if self._sampler_thread and self._sampler_thread is not threading.current_thread():
+            self._sampler_thread.join(timeout=1.0)
+        self._sampler_thread = None
+
+    def _sample_loop(self) -> None:
+        interval = self.sample_interval_ms / 1000
+        while not self._sampler_stop.wait(interval):
+            if self._active:
+                self._take_sample()
+
+    def _take_sample(self) -> None:
+        """Attribute the current stack of each thread to the request it is serving"""
+        frames = sys._current_frames()
+        for profile in list(self._active.values()):
+            frame = frames.get(profile.thread_id)
+            owner = profile.owner_frame
+            if frame is None or owner is None or profile.samples is None:
+                continue
+
+            stack = []
+            owned = False
+            while frame is not None:
+                stack.append(f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}")
+                if frame is owner:
+                    owned = True
+                frame = frame.f_back
+
+            # Only count samples where this request's code is on the stack
+            if owned:
+                profile.samples[";".join(reversed(stack))] += 1
+
+    def get_stage_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-request, per-stage latency quantiles"""
+        summary: Dict[str, Dict[str, Any]] = {}
+        for key, quantiles in self.stage_histograms.get_all_quantiles().items():
+            request_name, _, stage_name = key.partition(".")
+            summary.setdefault(request_name, {})[stage_name] = quantiles
+        return summary
+
+    def get_slowest_requests(self) -> List[Dict[str, Any]]:
+        """Get the slowest profiled requests, slowest first"""
+        with self._lock:
+            entries = sorted(self._slowest, key=lambda entry: entry[0], reverse=True)
+        return [profile.to_dict() for _, _, profile in entries]
+
+    def collapsed_stacks(self, per_request: bool = False) -> str:
+        """Render sampled stacks of the slowest requests in collapsed format"""
+        with self._lock:
+            profiles = [profile for _, _, profile in self._slowest]
+
+        totals: Counter = Counter()
+        for profile in profiles:
+            if not profile.samples:
+                continue
+            root = f"{profile.name}[{profile.request_id}]" if per_request else profile.name
+            for stack, count in profile.samples.items():
+                totals[f"{root};{stack}"] += count
+
+        return "\n".join(f"{stack} {count}" for stack, count in sorted(totals.items()))
+
+    def dump_collapsed_stacks(self, path: str, per_request: bool = False) -> int:
+        """Write collapsed stacks (flamegraph.pl / speedscope input) to path"""
+        content = self.collapsed_stacks(per_request=per_request)
+        with open(path, "w") as output:
+            output.write(content + "\n" if content else "")
+        line_count = content.count("\n") + 1 if content else 0
+        logger.info(f"Wrote {line_count} collapsed stacks to {path}")
+        return line_count
+
+    def reset(self) -> None:
+        """Clear histograms and the slowest-request set"""
+        self.stage_histograms.reset()
+        with self._lock:
+            self._slowest.clear()
+            self.requests_profiled = 0
+
+    def get_profiler_statistics(self) -> Dict[str, Any]:
+        """Get profiler statistics"""
+        return {
+            "enabled": self.enabled,
+            "sampling_enabled": self.sampling_enabled,
+            "sample_interval_ms": self.sample_interval_ms,
+            "slowest_n": self.slowest_n,
+            "requests_profiled": self.requests_profiled,
+            "active_sampled_requests": len(self._active)
+        }
+
+
+def current_profile() -> Optional[RequestProfile]:
+    """Get the profile of the request handled in the current context"""
+    return _current_profile.get()
+
+
+# Global stage profiler instance
+stage_profiler = StageProfiler()
+
+
+def get_stage_profiler() -> StageProfiler:
+    """Get the global stage profiler"""
+    return stage_profiler
+
+
+def stage(name: str):
+    """Time a named stage of the current request using the global profiler"""
+    return stage_profiler.stage(name)
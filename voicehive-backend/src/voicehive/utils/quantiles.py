@@ -0,0 +1,438 @@
+"""
+Streaming latency quantile sketches
+Mergeable DDSketch-style histograms for tail-latency reporting (p50/p95/p99)
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, List, Optional, Iterable
+
+import numpy as np
+
+# Default quantiles reported by summaries
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+
+class QuantileSketch:
+    """
+    DDSketch-style quantile sketch with relative-error guarantees
+
+    Values are mapped to logarithmic buckets ``ceil(log_gamma(x))`` so every
+    quantile estimate is within ``relative_accuracy`` of the true value. Bucket
+    counts live in a dense NumPy array that grows on demand; two sketches with
+    the same accuracy can be merged exactly, which makes them safe to combine
+    across workers and time windows.
+    """
+
+    def __init__(self,
+                 relative_accuracy: float = 0.01,
+                 max_bins: int = 2048,
+                 min_value: float = 1e-6):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.max_bins = max_bins
+        self.min_value = min_value
+
+        # Dense bucket storage: counts[i] holds bucket index (offset + i)
+        self._counts = np.zeros(0, dtype=np.float64)
+        self._offset = 0
+        self._zero_count = 0.0
+
+        # Pending single-value inserts and removals, flushed to NumPy in batches
+        self._buffer: List[float] = []
+        self._removals: List[float] = []
+        self._buffer_size = 256
+
+        self._count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Add a single observation"""
+        self._buffer.append(value)
+        if len(self._buffer) >= self._buffer_size:
+            self._flush()
+
+    def add_many(self, values: Iterable[float]) -> None:
+        """Add a batch of observations in one vectorized pass"""
+        array = np.asarray(values, dtype=np.float64).ravel()
+        if array.size:
+            self._insert(array)
+
+    def remove(self, value: float) -> None:
+        """
+        Remove one previously added observation
+
+        Count, sum and bucket counts are updated exactly; min and max keep
+        bounding every value ever added.
+        """
+        self._removals.append(value)
+        if len(self._removals) >= self._buffer_size:
+            self._flush()
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Merge another sketch into this one (in place)"""
+        if not math.isclose(self.gamma, other.gamma):
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+
+        other._flush()
+        self._flush()
+
+        if other._count == 0:
+            return self
+
+        if other._counts.size:
+            self._ensure_range(other._offset, other._offset + other._counts.size - 1)
+            start = other._offset - self._offset
+            self._counts[start:start + other._counts.size] += other._counts
+
+        self._zero_count += other._zero_count
+        self._count += other._count
+        self._sum += other._sum
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+        self._collapse()
+        return self
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the q-quantile (0 <= q <= 1)"""
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs: Iterable[float]) -> List[Optional[float]]:
+        """Estimate several quantiles with a single cumulative pass"""
+        self._flush()
+        qs = list(qs)
+        if self._count == 0:
+            return [None] * len(qs)
+
+        ranks = np.clip(np.asarray(qs, dtype=np.float64), 0.0, 1.0) * (self._count - 1)
+        cumulative = self._zero_count + np.cumsum(self._counts)
+
+        results: List[Optional[float]] = []
+        for q, rank in zip(qs, ranks):
+            if q <= 0:
+                results.append(self._min)
+            elif q >= 1:
+                results.append(self._max)
+            elif rank < self._zero_count:
+                results.append(0.0)
+            else:
+                position = int(np.searchsorted(cumulative, rank, side="right"))
+                position = min(position, cumulative.size - 1)
+                key = self._offset + position
+                estimate = 2 * self.gamma ** key / (self.gamma + 1)
+                results.append(float(min(max(estimate, self._min), self._max)))
+        return results
+
+    @property
+    def count(self) -> int:
+        """Number of observations"""
+        self._flush()
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        """Sum of all observations"""
+        self._flush()
+        return self._sum
+
+    @property
+    def min(self) -> float:
+        """Smallest observation"""
+        self._flush()
+        return self._min
+
+    @property
+    def max(self) -> float:
+        """Largest observation"""
+        self._flush()
+        return self._max
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Arithmetic mean of all observations"""
+        self._flush()
+        return self._sum / self._count if self._count else None
+
+    def summary(self, quantiles: Iterable[float] = DEFAULT_QUANTILES) -> Dict[str, Any]:
+        """Get a summary dictionary with count, mean and quantiles"""
+        quantiles = tuple(quantiles)
+        values = self.quantiles(quantiles)
+        summary = {
+            "count": self._count,
+            "mean": round(self.mean, 3) if self._count else None,
+            "min": round(self._min, 3) if self._count else None,
+            "max": round(self._max, 3) if self._count else None,
+        }
+        for q, value in zip(quantiles, values):
+            summary[quantile_label(q)] = round(value, 3) if value is not None else None
+        return summary
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the sketch so it can be shipped to another worker"""
+        self._flush()
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_bins": self.max_bins,
+            "min_value": self.min_value,
+            "offset": self._offset,
+            "counts": self._counts.tolist(),
+            "zero_count": self._zero_count,
+            "count": self._count,
+            "sum": self._sum,
+            "min": self._min if self._count else None,
+            "max": self._max if self._count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        """Rebuild a sketch serialized with to_dict"""
+        sketch = cls(
+            relative_accuracy=data["relative_accuracy"],
+            max_bins=data.get("max_bins", 2048),
+            min_value=data.get("min_value", 1e-6)
+        )
+        sketch._offset = int(data["offset"])
+        sketch._counts = np.asarray(data["counts"], dtype=np.float64)
+        sketch._zero_count = float(data.get("zero_count", 0.0))
+        sketch._count = int(data["count"])
+        sketch._sum = float(data["sum"])
+        if sketch._count:
+            sketch._min = float(data["min"])
+            sketch._max = float(data["max"])
+        return sketch
+
+    def copy(self) -> "QuantileSketch":
+        """Get an independent copy of this sketch"""
+        return QuantileSketch.from_dict(self.to_dict())
+
+    def _flush(self) -> None:
+        """Move buffered single inserts and removals into the bucket array"""
+        if self._buffer:
+            values = np.asarray(self._buffer, dtype=np.float64)
+            self._buffer = []
+            self._insert(values)
+        if self._removals:
+            values = np.asarray(self._removals, dtype=np.float64)
+            self._removals = []
+            self._delete(values)
+
+    def _insert(self, values: np.ndarray) -> None:
+        values = values[np.isfinite(values)]
+        if not values.size:
+            return
+
+        self._count += int(values.size)
+        self._sum += float(values.sum())
+        self._min = min(self._min, float(values.min()))
+        self._max = max(self._max, float(values.max()))
+
+        positive = values[values > self.min_value]
+        self._zero_count += float(values.size - positive.size)
+        if not positive.size:
+            return
+
+        keys = np.ceil(np.log(positive) / self._log_gamma).astype(np.int64)
+        low, high = int(keys.min()), int(keys.max())
+        self._ensure_range(low, high)
+        self._counts += np.bincount(keys - self._offset, minlength=self._counts.size)
+        self._collapse()
+
+    def _delete(self, values: np.ndarray) -> None:
+        values = values[np.isfinite(values)]
+        if not values.size:
+            return
+
+        self._count -= int(values.size)
+        self._sum -= float(values.sum())
+        if self._count <= 0:
+            self._count, self._sum, self._min, self._max = 0, 0.0, math.inf, -math.inf
+
+        positive = values[values > self.min_value]
+        self._zero_count -= float(values.size - positive.size)
+        if not positive.size or not self._counts.size:
+            return
+
+        # Keys folded by _collapse live in the lowest bucket
+        keys = np.ceil(np.log(positive) / self._log_gamma).astype(np.int64)
+        index = np.clip(keys - self._offset, 0, self._counts.size - 1)
+        self._counts -= np.bincount(index, minlength=self._counts.size)
+
+    def _ensure_range(self, low: int, high: int) -> None:
+        """Grow the dense bucket array so it covers [low, high]"""
+        if not self._counts.size:
+            self._offset = low
+            self._counts = np.zeros(high - low + 1, dtype=np.float64)
+            return
+
+        current_high = self._offset + self._counts.size - 1
+        new_low = min(low, self._offset)
+        new_high = max(high, current_high)
+        if new_low == self._offset and new_high == current_high:
+            return
+
+        grown = np.zeros(new_high - new_low + 1, dtype=np.float64)
+        start = self._offset - new_low
+        grown[start:start + self._counts.size] = self._counts
+        self._counts = grown
+        self._offset = new_low
+
+    def _collapse(self) -> None:
+        """Fold the lowest buckets together once the sketch exceeds max_bins"""
+        excess = self._counts.size - self.max_bins
+        if excess <= 0:
+            return
+
+        folded = self._counts[:excess + 1].sum()
+        self._counts = self._counts[excess:].copy()
+        self._counts[0] = folded
+        self._offset += excess
+
+
+class WindowedQuantileSketch:
+    """
+    Time-windowed quantile sketch
+
+    Keeps one sketch per ``bucket_seconds`` interval and merges the intervals
+    that fall inside the window on read, so summaries reflect recent traffic
+    rather than everything since process start.
+    """
+
+    def __init__(self,
+                 window_seconds: int = 3600,
+                 bucket_seconds: int = 60,
+                 relative_accuracy: float = 0.01):
+        self.window_seconds = window_seconds
+        self.bucket_seconds = bucket_seconds
+        self.relative_accuracy = relative_accuracy
+        self._buckets: deque = deque(maxlen=max(1, window_seconds // bucket_seconds))
+
+    def add(self, value: float, timestamp: Optional[float] = None) -> None:
+        """Add an observation to the interval containing ``timestamp``"""
+        self._bucket_for(timestamp if timestamp is not None else time.time()).add(value)
+
+    def snapshot(self, now: Optional[float] = None) -> QuantileSketch:
+        """Merge every interval inside the window into a single sketch"""
+        now = now if now is not None else time.time()
+        oldest = now - self.window_seconds
+        merged = QuantileSketch(relative_accuracy=self.relative_accuracy)
+        for bucket_start, sketch in self._buckets:
+            if bucket_start + self.bucket_seconds > oldest:
+                merged.merge(sketch)
+        return merged
+
+    def _bucket_for(self, timestamp: float) -> QuantileSketch:
+        bucket_start = timestamp - (timestamp % self.bucket_seconds)
+        if self._buckets and self._buckets[-1][0] == bucket_start:
+            return self._buckets[-1][1]
+        if self._buckets and bucket_start < self._buckets[-1][0]:
+            # Late observation: attribute it to the matching interval if still held
+            for start, sketch in reversed(self._buckets):
+                if start == bucket_start:
+                    return sketch
+            return self._buckets[0][1]
+
+        sketch = QuantileSketch(relative_accuracy=self.relative_accuracy)
+        self._buckets.append((bucket_start, sketch))
+        return sketch
+
+
+class LatencyRegistry:
+    """
+    Registry of named latency sketches shared across the process
+
+    Well-known series: ``webhook``, ``llm``, ``function_call`` and
+    ``bus_delivery`` (all in milliseconds).
+    """
+
+    def __init__(self, window_seconds: int = 3600, bucket_seconds: int = 60,
+                 relative_accuracy: float = 0.01):
+        self.window_seconds = window_seconds
+        self.bucket_seconds = bucket_seconds
+        self.relative_accuracy = relative_accuracy
+        self._sketches: Dict[str, WindowedQuantileSketch] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, value_ms: float) -> None:
+        """Record a latency observation in milliseconds"""
+        with self._lock:
+            sketch = self._sketches.get(name)
+            if sketch is None:
+                sketch = WindowedQuantileSketch(
+                    window_seconds=self.window_seconds,
+                    bucket_seconds=self.bucket_seconds,
+                    relative_accuracy=self.relative_accuracy
+                )
+                self._sketches[name] = sketch
+            sketch.add(value_ms)
+
+    def get_sketch(self, name: str) -> QuantileSketch:
+        """Get the merged windowed sketch for a series"""
+        with self._lock:
+            sketch = self._sketches.get(name)
+            if sketch is None:
+                return QuantileSketch(relative_accuracy=self.relative_accuracy)
+            return sketch.snapshot()
+
+    def get_quantiles(self, name: str,
+                      quantiles: Iterable[float] = DEFAULT_QUANTILES) -> Dict[str, Any]:
+        """Get count, mean and quantiles for a series"""
+        return self.get_sketch(name).summary(quantiles)
+
+    def get_all_quantiles(self,
+                          quantiles: Iterable[float] = DEFAULT_QUANTILES) -> Dict[str, Dict[str, Any]]:
+        """Get summaries for every registered series"""
+        with self._lock:
+            names = list(self._sketches.keys())
+        return {name: self.get_quantiles(name, quantiles) for name in names}
+
+    def export(self) -> Dict[str, Dict[str, Any]]:
+        """Serialize all windowed sketches for cross-worker aggregation"""
+        with self._lock:
+            names = list(self._sketches.keys())
+        return {name: self.get_sketch(name).to_dict() for name in names}
+
+    @staticmethod
+    def merge_exports(exports: Iterable[Dict[str, Dict[str, Any]]]) -> Dict[str, QuantileSketch]:
+        """Merge sketches exported by several workers, series by series"""
+        merged: Dict[str, QuantileSketch] = {}
+        for export in exports:
+            for name, data in export.items():
+                sketch = QuantileSketch.from_dict(data)
+                if name in merged:
+                    merged[name].merge(sketch)
+                else:
+                    merged[name] = sketch
+        return merged
+
+    def reset(self) -> None:
+        """Drop all recorded series"""
+        with self._lock:
+            self._sketches.clear()
+
+
+def quantile_label(q: float) -> str:
+    """Format a quantile as a short label (0.95 -> p95, 0.999 -> p99.9)"""
+    percent = q * 100
+    return f"p{percent:g}"
+
+
+# Global latency registry instance
+latency_registry = LatencyRegistry()
+
+
+def record_latency(name: str, value_ms: float) -> None:
+    """Record a latency observation in the global registry"""
+    latency_registry.record(name, value_ms)
+
+
+def get_latency_registry() -> LatencyRegistry:
+    """Get the global latency registry"""
+    return latency_registry
@@ -0,0 +1,327 @@
+"""
+Shared system-resource sampler
+One background task reads /proc and cgroup files at a fixed cadence; consumers read the latest snapshot
+"""
+
+import asyncio
+import gc
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 ** 2
+# cgroup v1 reports "no limit" as a huge page-aligned number
+UNLIMITED_MEMORY = 1 << 60
+
+
+@dataclass(frozen=True)
+class ResourceSnapshot:
+    """Point-in-time resource usage; CPU figures cover the interval since the previous sample"""
+    timestamp: float
+    monotonic: float
+    system_cpu_percent: float
+    system_memory_percent: float
+    memory_available_mb: float
+    memory_used_mb: float
+    process_cpu_percent: float
+    process_rss_mb: float
+    open_fds: int
+    effective_cpus: float
+    load_average: Tuple[float, float, float]
+    disk_percent: float
+    disk_free_gb: float
+    loop_lag_ms: float
+    gc_pause_ms: float
+    gc_collections: int
+    sample_duration_ms: float
+    cgroup_cpu_percent: Optional[float] = None
+    cgroup_memory_percent: Optional[float] = None
+    cgroup_memory_limit_mb: Optional[float] = None
+
+    @property
+    def cpu_percent(self) -> float:
+        """CPU usage against the container's quota when one applies, else host-wide"""
+        return self.cgroup_cpu_percent if self.cgroup_cpu_percent is not None else self.system_cpu_percent
+
+    @property
+    def memory_percent(self) -> float:
+        """Memory usage against the container's limit when one applies, else host-wide"""
+        return self.cgroup_memory_percent if self.cgroup_memory_percent is not None else self.system_memory_percent
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["load_average"] = list(self.load_average)
+        data["cpu_percent"] = self.cpu_percent
+        data["memory_percent"] = self.memory_percent
+        return data
+
+
+@dataclass
+class _Counters:
+    """Cumulative counters needed to turn the next reading into rates"""
+    monotonic: float
+    system_busy: Optional[int]
+    system_total: Optional[int]
+    process_cpu_seconds: float
+    cgroup_cpu_seconds: Optional[float]
+
+
+class ResourceSampler:
+    """
+    Background sampler of process, host and cgroup resource usage
+
+    Features:
+    - Direct /proc and cgroup (v1 and v2) reads, psutil only as a fallback
+    - Container-aware CPU (quota-normalized) and memory (limit-relative) usage
+    - Process CPU, RSS and open file descriptors
+    - Event-loop lag (overshoot of the sampler's own sleep) and GC pause time
+    - Snapshots are immutable and published by reference swap, so readers never lock
+    """
+
+    def __init__(self,
+                 interval: float = 1.0,
+                 proc_root: str = "/proc",
+                 cgroup_root: str = "/sys/fs/cgroup",
+                 disk_path: str = "/"):
+        self.interval = interval
+        self.proc_root = proc_root
+        self.cgroup_root = cgroup_root
+        self.disk_path = disk_path
+        self._clock_ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+        self._page_size = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+        self._process = psutil.Process()
+
+        self._snapshot: Optional[ResourceSnapshot] = None
+        self._previous: Optional[_Counters] = None
+        self._task: Optional[asyncio.Task] = None
+        self._users = 0
+
+        self._gc_started_ns: Optional[int] = None
+        self._gc_pause_ns = 0
+        self._gc_collections = 0
+        self.stats = {"samples": 0, "errors": 0}
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def snapshot(self) -> ResourceSnapshot:
+        """Latest snapshot; sampled on demand only when no sampler task keeps it fresh"""
+        snapshot = self._snapshot
+        if snapshot is None or (not self.is_running and time.monotonic() - snapshot.monotonic >= self.interval):
+            snapshot = self.sample()
+        return snapshot
+
+    async def start(self):
+        """Start sampling (reference-counted: every start needs a matching stop)"""
+        self._users += 1
+        if self.is_running:
+            return
+        gc.callbacks.append(self._on_gc)
+        self.sample()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Resource sampler started ({self.interval}s interval)")
+
+    async def stop(self):
+        """Release one start; the task stops when the last user stops"""
+        self._users = max(0, self._users - 1)
+        if self._users or self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag_ms = max(0.0, loop.time() - expected) * 1000
+            try:
+                self.sample(loop_lag_ms=lag_ms)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"Resource sampling failed: {str(e)}")
+
+    def _on_gc(self, phase: str, info: Dict[str, Any]):
+        if phase == "start":
+            self._gc_started_ns = time.perf_counter_ns()
+        elif self._gc_started_ns is not None:
+            self._gc_pause_ns += time.perf_counter_ns() - self._gc_started_ns
+            self._gc_collections += 1
+            self._gc_started_ns = None
+
+    def sample(self, loop_lag_ms: float = 0.0) -> ResourceSnapshot:
+        """Take a sample now and publish it as the latest snapshot"""
+        started = time.perf_counter()
+        now = time.monotonic()
+
+        system_busy, system_total = self._read_system_cpu()
+        process_cpu_seconds, rss_bytes = self._read_process()
+        cgroup_cpu_seconds = self._read_cgroup_cpu_usage()
+        cpu_quota = self._cpu_quota()
+        effective_cpus = self._effective_cpus(cpu_quota)
+        memory_percent, available_bytes, used_bytes = self._read_memory()
+        cgroup_usage, cgroup_limit = self._read_cgroup_memory()
+
+        previous = self._previous
+        system_cpu = process_cpu = 0.0
+        cgroup_cpu = None
+        if previous is not None and now > previous.monotonic:
+            elapsed = now - previous.monotonic
+            if system_busy is not None and previous.system_busy is not None and system_total > previous.system_total:
+                system_cpu = 100.0 * (system_busy - previous.system_busy) / (system_total - previous.system_total)
+            elif system_busy is None:
+                system_cpu = psutil.cpu_percent()
+            process_cpu = 100.0 * (process_cpu_seconds - previous.process_cpu_seconds) / (elapsed * effective_cpus)
+            if cgroup_cpu_seconds is not None and previous.cgroup_cpu_seconds is not None and cpu_quota:
+                cgroup_cpu = 100.0 * (cgroup_cpu_seconds - previous.cgroup_cpu_seconds) / (elapsed * effective_cpus)
+        self._previous = _Counters(now, system_busy, system_total, process_cpu_seconds, cgroup_cpu_seconds)
+
+        try:
+            disk = psutil.disk_usage(self.disk_path)
+            disk_percent, disk_free_gb = disk.percent, disk.free / 1024 ** 3
+        except OSError:
+            disk_percent, disk_free_gb = 0.0, 0.0
+        try:
+            load_average = tuple(float(v) for v in os.getloadavg())
+        except (OSError, AttributeError):
+            load_average = (0.0, 0.0, 0.0)
+
+        gc_pause_ns, self._gc_pause_ns = self._gc_pause_ns, 0
+        snapshot = ResourceSnapshot(
+            timestamp=time.time(),
+            monotonic=now,
+            system_cpu_percent=min(100.0, max(0.0, system_cpu)),
+            system_memory_percent=memory_percent,
+            memory_available_mb=available_bytes / MB,
+            memory_used_mb=used_bytes / MB,
+            process_cpu_percent=max(0.0, process_cpu),
+            process_rss_mb=rss_bytes / MB,
+            open_fds=self._count_open_fds(),
+            effective_cpus=effective_cpus,
+            load_average=load_average,
+            disk_percent=disk_percent,
+            disk_free_gb=disk_free_gb,
+            loop_lag_ms=loop_lag_ms,
+            gc_pause_ms=gc_pause_ns / 1e6,
+            gc_collections=self._gc_collections,
+            sample_duration_ms=(time.perf_counter() - started) * 1000,
+            cgroup_cpu_percent=None if cgroup_cpu is None else max(0.0, cgroup_cpu),
+            cgroup_memory_percent=None if cgroup_limit is None else 100.0 * cgroup_usage / cgroup_limit,
+            cgroup_memory_limit_mb=None if cgroup_limit is None else cgroup_limit / MB
+        )
+        self._snapshot = snapshot
+        self.stats["samples"] += 1
+        return snapshot
+
+    def _read(self, path: str) -> Optional[str]:
+        try:
+            with open(path) as handle:
+                return handle.read()
+        except OSError:
+            return None
+
+    def _read_system_cpu(self) -> Tuple[Optional[int], Optional[int]]:
+        stat = self._read(os.path.join(self.proc_root, "stat"))
+        if not stat:
+            return None, None
+        # user nice system idle iowait irq softirq steal
+        ticks = [int(v) for v in stat.split("\n", 1)[0].split()[1:9]]
+        idle = ticks[3] + ticks[4]
+        total = sum(ticks)
+        return total - idle, total
+
+    def _read_process(self) -> Tuple[float, int]:
+        stat = self._read(os.path.join(self.proc_root, "self", "stat"))
+        if not stat:
+            times = self._process.cpu_times()
+            return times.user + times.system, self._process.memory_info().rss
+        # The command name may contain spaces; fields resume after its closing parenthesis
+        fields = stat[stat.rindex(")") + 2:].split()
+        cpu_seconds = (int(fields[11]) + int(fields[12])) / self._clock_ticks
+        return cpu_seconds, int(fields[21]) * self._page_size
+
+    def _read_memory(self) -> Tuple[float, int, int]:
+        meminfo = self._read(os.path.join(self.proc_root, "meminfo"))
+        if not meminfo:
+            memory = psutil.virtual_memory()
+            return memory.percent, memory.available, memory.total - memory.available
+        values = {}
+        for line in meminfo.splitlines():
+            name, _, rest = line.partition(":")
+            if name in ("MemTotal", "MemAvailable"):
+                values[name] = int(rest.split()[0]) * 1024
+        total = values.get("MemTotal", 0)
+        available = values.get("MemAvailable", 0)
+        return (100.0 * (total - available) / total if total else 0.0), available, total - available
+
+    def _count_open_fds(self) -> int:
+        try:
+            return len(os.listdir(os.path.join(self.proc_root, "self", "fd")))
+        except OSError:
+            try:
+                return self._process.num_fds()
+            except (AttributeError, psutil.Error):
+                return 0
+
+    def _cpu_quota(self) -> Optional[float]:
+        """CPUs granted by the cgroup quota, or None when unlimited"""
+        cpu_max = self._read(os.path.join(self.cgroup_root, "cpu.max"))
+        if cpu_max:
+            quota, period = cpu_max.split()[:2]
+            return None if quota == "max" else int(quota) / int(period)
+        quota = self._read(os.path.join(self.cgroup_root, "cpu", "cpu.cfs_quota_us"))
+        period = self._read(os.path.join(self.cgroup_root, "cpu", "cpu.cfs_period_us"))
+        if quota and period and int(quota) > 0:
+            return int(quota) / int(period)
+        return None
+
+    def _effective_cpus(self, quota: Optional[float]) -> float:
+        try:
+            cpus = float(len(os.sched_getaffinity(0)))
+        except AttributeError:
+            cpus = float(os.cpu_count() or 1)
+        return min(cpus, quota) if quota else cpus
+
+    def _read_cgroup_cpu_usage(self) -> Optional[float]:
+        cpu_stat = self._read(os.path.join(self.cgroup_root, "cpu.stat"))
+        if cpu_stat:
+            for line in cpu_stat.splitlines():
+                if line.startswith("usage_usec"):
+                    return int(line.split()[1]) / 1e6
+        usage = self._read(os.path.join(self.cgroup_root, "cpuacct", "cpuacct.usage"))
+        return int(usage) / 1e9 if usage else None
+
+    def _read_cgroup_memory(self) -> Tuple[Optional[int], Optional[int]]:
+        usage = self._read(os.path.join(self.cgroup_root, "memory.current"))
+        limit = self._read(os.path.join(self.cgroup_root, "memory.max"))
+        if usage is None:
+            usage = self._read(os.path.join(self.cgroup_root, "memory", "memory.usage_in_bytes"))
+            limit = self._read(os.path.join(self.cgroup_root, "memory", "memory.limit_in_bytes"))
+        if not usage or not limit or limit.strip() == "max" or int(limit) >= UNLIMITED_MEMORY:
+            return None, None
+        return int(usage), int(limit)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "running": self.is_running, "users": self._users, "interval_seconds": self.interval}
+
+
+# Global resource sampler shared by monitoring consumers
+resource_sampler = ResourceSampler()
+
+
+def get_resource_sampler() -> ResourceSampler:
+    """Get the global resource sampler"""
+    return resource_sampler
@@ -0,0 +1,386 @@
+"""
+Compact per-metric time-series storage
+NumPy ring buffers with raw, 1-minute and 1-hour downsampling tiers
+"""
+
+import math
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# Downsampling tier name -> bucket width in seconds (None = raw samples)
+TIER_WIDTHS: Dict[str, Optional[int]] = {"raw": None, "1m": 60, "1h": 3600}
+
+# Initial buffer length; buffers grow geometrically up to capacity plus slack
+INITIAL_BUFFER = 16
+
+# Spare slots past the capacity as a fraction of it (1/16): the window is
+# compacted once per capacity // 16 appends, ~6% extra memory
+SLACK_DIVISOR = 16
+
+
+class TagTable:
+    """
+    Interned metadata dictionaries
+
+    Each distinct dictionary is stored once and referenced from samples by a
+    small integer id; id 0 means no metadata. Returned dictionaries are shared
+    and must not be mutated.
+    """
+
+    def __init__(self):
+        self._ids: Dict[Any, int] = {}
+        self._tags: List[Optional[Dict[str, Any]]] = [None]
+
+    def __len__(self) -> int:
+        return len(self._tags) - 1
+
+    @staticmethod
+    def _key(metadata: Dict[str, Any]) -> Any:
+        try:
+            key = tuple(sorted(metadata.items()))
+            hash(key)
+            return key
+        except TypeError:
+            return tuple(sorted((name, repr(value)) for name, value in metadata.items()))
+
+    def intern(self, metadata: Optional[Dict[str, Any]]) -> int:
+        if not metadata:
+            return 0
+        key = self._key(metadata)
+        tag = self._ids.get(key)
+        if tag is None:
+            tag = self._ids[key] = len(self._tags)
+            self._tags.append(dict(metadata))
+        return tag
+
+    def lookup(self, tag: int) -> Optional[Dict[str, Any]]:
+        return self._tags[tag]
+
+
+class RingSeries:
+    """
+    Bounded series of (epoch seconds, value) pairs with optional tag ids
+
+    Samples are appended to a linear buffer with a little spare room past the
+    capacity; when it fills, the live window is compacted to the front. The
+    window is therefore always a contiguous slice (zero-copy views) at
+    amortized O(1) per sample. The tag column is only allocated once a
+    tagged sample arrives.
+    """
+
+    __slots__ = ("capacity", "_limit", "_timestamps", "_values", "_tags", "_start", "_end", "total")
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._limit = capacity + max(capacity // SLACK_DIVISOR, 1)
+        length = min(INITIAL_BUFFER, self._limit)
+        self._timestamps = np.empty(length)
+        self._values = np.empty(length)
+        self._tags: Optional[np.ndarray] = None
+        self._start = 0
+        self._end = 0
+        # Samples ever appended; the oldest live sample has index total - len
+        self.total = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def _reserve(self, count: int) -> None:
+        """Make room for count more samples at the end of the buffer"""
+        if self._end + count <= len(self._values):
+            return
+
+        keep = min(len(self), self.capacity - count)
+        length = len(self._values)
+        if length < self._limit:
+            length = min(self._limit, max(2 * length, keep + count))
+            timestamps, values = np.empty(length), np.empty(length)
+            tags = np.zeros(length, dtype=np.int32) if self._tags is not None else None
+        else:
+            timestamps, values, tags = self._timestamps, self._values, self._tags
+
+        tail = slice(self._end - keep, self._end)
+        timestamps[:keep] = self._timestamps[tail]
+        values[:keep] = self._values[tail]
+        if tags is not None:
+            tags[:keep] = self._tags[tail]
+        self._timestamps, self._values, self._tags = timestamps, values, tags
+        self._start, self._end = 0, keep
+
+    def _ensure_tags(self) -> np.ndarray:
+        if self._tags is None:
+            self._tags = np.zeros(len(self._values), dtype=np.int32)
+        return self._tags
+
+    def append(self, timestamp: float, value: float, tag: int = 0) -> None:
+        """Append one sample, evicting the oldest when full"""
+        if self._end == len(self._values):
+            self._reserve(1)
+        self._timestamps[self._end] = timestamp
+        self._values[self._end] = value
+        if tag:
+            self._ensure_tags()[self._end] = tag
+        elif self._tags is not None:
+            self._tags[self._end] = 0
+        self._end += 1
+        self.total += 1
+        if self._end - self._start > self.capacity:
+            self._start += 1
+
+    def extend(self, timestamps: np.ndarray, values: np.ndarray, tags: Optional[np.ndarray] = None) -> None:
+        """Append a batch of samples"""
+        count = len(values)
+        if not count:
+            return
+        self.total += count
+        if count >= self.capacity:
+            timestamps, values = timestamps[-self.capacity:], values[-self.capacity:]
+            if tags is not None:
+                tags = tags[-self.capacity:]
+            self._start = self._end = 0
+            count = self.capacity
+
+        self._reserve(count)
+        window = slice(self._end, self._end + count)
+        self._timestamps[window] = timestamps
+        self._values[window] = values
+        if tags is not None and tags.any():
+            self._ensure_tags()[window] = tags
+        elif self._tags is not None:
+            self._tags[window] = 0
+        self._end += count
+        self._start = max(self._start, self._end - self.capacity)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Epoch-second timestamps of the window (view, oldest first)"""
+        return self._timestamps[self._start:self._end]
+
+    @property
+    def values(self) -> np.ndarray:
+        """Values of the window (view, oldest first)"""
+        return self._values[self._start:self._end]
+
+    @property
+    def tags(self) -> np.ndarray:
+        """Tag ids of the window (view when tagged, zeros otherwise)"""
+        if self._tags is None:
+            return np.zeros(len(self), dtype=np.int32)
+        return self._tags[self._start:self._end]
+
+    def indices(self) -> np.ndarray:
+        """Absolute sample indices of the window"""
+        return np.arange(self.total - len(self), self.total)
+
+    @property
+    def nbytes(self) -> int:
+        tags = self._tags.nbytes if self._tags is not None else 0
+        return self._timestamps.nbytes + self._values.nbytes + tags
+
+
+class DownsampledTier:
+    """
+    Fixed-width bucket means over a ring buffer
+
+    Closed buckets are appended with their start timestamp; empty buckets
+    between samples are filled with the previous mean so every step is one
+    bucket wide. Samples older than the open bucket are ignored.
+    """
+
+    __slots__ = ("width", "series", "_bucket", "_sum", "_count")
+
+    def __init__(self, width: int, capacity: int):
+        self.width = width
+        self.series = RingSeries(capacity)
+        self._bucket: Optional[int] = None
+        self._sum = 0.0
+        self._count = 0
+
+    def add(self, timestamp: float, value: float) -> None:
+        bucket = int(timestamp // self.width)
+        if self._bucket is None or bucket == self._bucket:
+            self._bucket = bucket
+            self._sum += value
+            self._count += 1
+        elif bucket > self._bucket:
+            mean = self._sum / self._count
+            gap = min(bucket - self._bucket - 1, self.series.capacity)
+            self.series.append(self._bucket * self.width, mean)
+            for step in range(gap, 0, -1):
+                self.series.append((bucket - step) * self.width, mean)
+            self._bucket, self._sum, self._count = bucket, value, 1
+
+    def extend(self, timestamps: np.ndarray, values: np.ndarray) -> None:
+        """Add time-ordered samples in one vectorized pass"""
+        buckets = np.floor_divide(timestamps, self.width).astype(np.int64)
+        if self._bucket is not None:
+            fresh = buckets >= self._bucket
+            buckets, values = buckets[fresh], values[fresh]
+        if not len(buckets):
+            return
+
+        # Sum and count consecutive samples falling in the same bucket
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        group_buckets = buckets[starts]
+        sums = np.add.reduceat(values, starts)
+        counts = np.diff(np.r_[starts, len(buckets)]).astype(float)
+
+        if self._bucket is not None and group_buckets[0] == self._bucket:
+            sums[0] += self._sum
+            counts[0] += self._count
+        elif self._bucket is not None:
+            group_buckets = np.r_[self._bucket, group_buckets]
+            sums = np.r_[self._sum, sums]
+            counts = np.r_[self._count, counts]
+
+        # Every group but the last is closed; emit it plus fillers up to the next group
+        means = sums[:-1] / counts[:-1]
+        if len(means):
+            closed = group_buckets[:-1]
+            gaps = np.minimum(np.diff(group_buckets) - 1, self.series.capacity)
+            repeats = gaps + 1
+            offsets = np.arange(repeats.sum()) - np.repeat(np.cumsum(repeats) - repeats, repeats)
+            # Fillers are the buckets right before the next group
+            run_start = np.repeat(group_buckets[1:] - repeats, repeats)
+            emitted = np.where(offsets == 0, np.repeat(closed, repeats), run_start + offsets)
+            self.series.extend(emitted * float(self.width), np.repeat(means, repeats))
+
+        self._bucket = int(group_buckets[-1])
+        self._sum = float(sums[-1])
+        self._count = int(counts[-1])
+
+
+class TieredSeries:
+    """Raw samples plus downsampled tiers for one metric"""
+
+    __slots__ = ("raw", "tiers")
+
+    def __init__(self, capacities: Dict[str, int]):
+        self.raw = RingSeries(capacities["raw"])
+        self.tiers = {
+            name: DownsampledTier(width, capacities[name])
+            for name, width in TIER_WIDTHS.items() if width is not None
+        }
+
+    def add(self, timestamp: float, value: float, tag: int = 0) -> None:
+        self.raw.append(timestamp, value, tag)
+        for tier in self.tiers.values():
+            tier.add(timestamp, value)
+
+    def extend(self, timestamps: np.ndarray, values: np.ndarray, tags: Optional[np.ndarray] = None) -> None:
+        self.raw.extend(timestamps, values, tags)
+        for tier in self.tiers.values():
+            tier.extend(timestamps, values)
+
+    def tier(self, name: str) -> RingSeries:
+        return self.raw if name == "raw" else self.tiers[name].series
+
+    @property
+    def nbytes(self) -> int:
+        return self.raw.nbytes + sum(tier.series.nbytes for tier in self.tiers.values())
+
+
+class TimeSeriesStore:
+    """
+    Per-metric time-series store shared by the monitoring components
+
+    Features:
+    - Float64 epoch-second timestamps and values in NumPy ring buffers
+    - Raw, 1-minute and 1-hour tiers kept up to date on ingestion
+    - Sample metadata interned once and referenced by id
+    - Zero-copy window views and per-metric memory reporting
+    - Buffers grow with the data, so sparse metrics stay small
+    """
+
+    def __init__(self,
+                 raw_capacity: int = 1000,
+                 minute_capacity: int = 2880,
+                 hour_capacity: int = 24 * 7 * 4):
+        self.capacities = {"raw": raw_capacity, "1m": minute_capacity, "1h": hour_capacity}
+        self.tag_table = TagTable()
+        self._series: Dict[str, TieredSeries] = {}
+
+    def __contains__(self, metric_name: str) -> bool:
+        return metric_name in self._series
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._series)
+
+    def _get_or_create(self, metric_name: str) -> TieredSeries:
+        series = self._series.get(metric_name)
+        if series is None:
+            series = self._series[metric_name] = TieredSeries(self.capacities)
+        return series
+
+    def add(self,
+            metric_name: str,
+            timestamp: float,
+            value: float,
+            metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Record one sample"""
+        self._get_or_create(metric_name).add(timestamp, value, self.tag_table.intern(metadata))
+
+    def extend(self,
+               metric_name: str,
+               timestamps: np.ndarray,
+               values: np.ndarray,
+               metadata: Optional[List[Optional[Dict[str, Any]]]] = None) -> None:
+        """Record time-ordered samples, optionally with per-sample metadata"""
+        tags = None
+        if metadata is not None and any(metadata):
+            intern = self.tag_table.intern
+            tags = np.fromiter((intern(item) for item in metadata), dtype=np.int32, count=len(metadata))
+        self._get_or_create(metric_name).extend(
+            np.asarray(timestamps, dtype=float), np.asarray(values, dtype=float), tags
+        )
+
+    def get(self, metric_name: str) -> Optional[TieredSeries]:
+        return self._series.get(metric_name)
+
+    def window(self,
+               metric_name: str,
+               size: Optional[int] = None,
+               tier: str = "raw") -> Tuple[np.ndarray, np.ndarray]:
+        """Zero-copy (timestamps, values) views of the latest samples of a tier"""
+        series = self._series.get(metric_name)
+        if series is None:
+            return np.empty(0), np.empty(0)
+        ring = series.tier(tier)
+        start = -size if size else 0
+        return ring.timestamps[start:], ring.values[start:]
+
+    def metadata(self, metric_name: str, size: Optional[int] = None) -> List[Optional[Dict[str, Any]]]:
+        """Metadata of the latest raw samples (shared dictionaries, do not mutate)"""
+        series = self._series.get(metric_name)
+        if series is None:
+            return []
+        tags = series.raw.tags[-size if size else 0:]
+        lookup = self.tag_table.lookup
+        return [lookup(tag) for tag in tags.tolist()]
+
+    def remove(self, metric_name: str) -> bool:
+        return self._series.pop(metric_name, None) is not None
+
+    def memory_bytes(self) -> int:
+        return sum(series.nbytes for series in self._series.values())
+
+    def memory_by_metric(self) -> Dict[str, int]:
+        """Buffer bytes held by each metric across all tiers"""
+        return {metric_name: series.nbytes for metric_name, series in self._series.items()}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store size statistics"""
+        memory = self.memory_bytes()
+        return {
+            "metrics": len(self._series),
+            "memory_bytes": memory,
+            "bytes_per_metric": math.ceil(memory / len(self._series)) if self._series else 0,
+            "interned_tags": len(self.tag_table),
+            "capacities": dict(self.capacities)
+        }
@@ -0,0 +1,157 @@
+"""
+Test Suite for asynchronous anomaly enrichment
+Tests non-blocking detection, signature grouping, result caching and worker bounds
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+
+from voicehive.domains.agents.services.ml.anomaly_detector import (
+    AnomalyDetection, AnomalyDetector, AnomalySeverity, AnomalyType, MetricDataPoint, TimeSeriesData
+)
+
+LLM_RESPONSE = """Prediction:
+Latency will keep rising over the next hour
+Recommended actions:
+- Scale out the voice workers
+- Check the database connection pool"""
+
+
+def _anomaly(metric_name: str, severity: AnomalySeverity = AnomalySeverity.HIGH) -> AnomalyDetection:
+    return AnomalyDetection(
+        id=f"anomaly_{metric_name}", metric_name=metric_name, anomaly_type=AnomalyType.RESPONSE_TIME_SPIKE,
+        severity=severity, timestamp=datetime.now(), value=200.0, expected_value=100.0,
+        deviation_score=3.5, confidence=0.7, description=f"{metric_name} anomaly"
+    )
+
+
+def _series(metric_name: str, spikes: int) -> TimeSeriesData:
+    start = datetime.now() - timedelta(hours=1)
+    values = [100.0 + (i % 3) for i in range(40)] + [400.0] * spikes
+    return TimeSeriesData(
+        metric_name=metric_name,
+        data_points=[MetricDataPoint(timestamp=start + timedelta(seconds=i), value=v) for i, v in enumerate(values)]
+    )
+
+
+class TestAnomalyEnrichment:
+    """Test LLM enrichment decoupled from anomaly detection"""
+
+    @pytest_asyncio.fixture
+    async def detector(self):
+        openai_service = AsyncMock()
+        openai_service.generate_response = AsyncMock(return_value=LLM_RESPONSE)
+        detector = AnomalyDetector(project_id="test-project", openai_service=openai_service)
+        yield detector
+        await detector.shutdown_enrichment()
+
+    @pytest.mark.asyncio
+    async def test_detection_does_not_wait_for_llm(self, detector):
+        async def slow_response(**kwargs):
+            await asyncio.sleep(0.5)
+            return LLM_RESPONSE
+        detector.openai_service.generate_response.side_effect = slow_response
+
+        start = time.perf_counter()
+        anomalies = await detector.add_metric_data(_series("response_time_ms", spikes=1))
+        elapsed = time.perf_counter() - start
+
+        assert len(anomalies) == 1
+        assert elapsed < 0.2
+        assert anomalies[0].prediction is None
+
+        await detector.wait_for_enrichment()
+        assert anomalies[0].prediction == "Latency will keep rising over the next hour"
+        assert anomalies[0].recommended_actions == ["Scale out the voice workers", "Check the database connection pool"]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_anomalies_enriched_once(self, detector):
+        burst = [_anomaly("response_time_ms") for _ in range(20)]
+        series = _series("response_time_ms", spikes=0)
+
+        for anomaly in burst:
+            detector._schedule_enrichment(anomaly, series)
+        await detector.wait_for_enrichment()
+
+        assert detector.openai_service.generate_response.await_count == 1
+        assert all(anomaly.prediction == burst[0].prediction for anomaly in burst)
+        assert detector.enrichment_stats["grouped"] == 19
+
+    @pytest.mark.asyncio
+    async def test_signature_cache_reused_within_window(self, detector):
+        series = _series("response_time_ms", spikes=0)
+        detector._schedule_enrichment(_anomaly("response_time_ms"), series)
+        await detector.wait_for_enrichment()
+
+        later = _anomaly("response_time_ms")
+        detector._schedule_enrichment(later, series)
+        different = _anomaly("response_time_ms", AnomalySeverity.CRITICAL)
+        detector._schedule_enrichment(different, series)
+        await detector.wait_for_enrichment()
+
+        assert later.recommended_actions == ["Scale out the voice workers", "Check the database connection pool"]
+        assert detector.enrichment_stats["cache_hits"] == 1
+        assert detector.openai_service.generate_response.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_worker_pool_bounds_concurrency(self, detector):
+        active, peak = 0, 0
+
+        async def tracked_response(**kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return LLM_RESPONSE
+        detector.openai_service.generate_response.side_effect = tracked_response
+        detector.enrichment_workers = 2
+
+        series = _series("cpu_usage", spikes=0)
+        for i in range(10):
+            detector._schedule_enrichment(_anomaly(f"metric_{i}"), series)
+        await detector.wait_for_enrichment()
+
+        assert peak == 2
+        assert detector.enrichment_stats["enriched"] == 10
+
+    @pytest.mark.asyncio
+    async def test_full_queue_falls_back_without_blocking(self, detector):
+        detector.enrichment_workers = 1
+        detector.enrichment_queue_size = 1
+        async def slow_response(**kwargs):
+            await asyncio.sleep(0.05)
+            return LLM_RESPONSE
+        detector.openai_service.generate_response.side_effect = slow_response
+
+        series = _series("cpu_usage", spikes=0)
+        anomalies = [_anomaly(f"metric_{i}") for i in range(5)]
+        for anomaly in anomalies:
+            detector._schedule_enrichment(anomaly, series)
+
+        assert detector.enrichment_stats["dropped"] >= 1
+        assert anomalies[-1].recommended_actions == ["Monitor metric closely"]
+        await detector.wait_for_enrichment()
+        assert anomalies[0].prediction == "Latency will keep rising over the next hour"
+
+    @pytest.mark.asyncio
+    async def test_failed_enrichment_is_not_cached(self, detector):
+        detector.openai_service.generate_response.side_effect = [RuntimeError("rate limited"), LLM_RESPONSE]
+        series = _series("response_time_ms", spikes=0)
+
+        first = _anomaly("response_time_ms")
+        detector._schedule_enrichment(first, series)
+        await detector.wait_for_enrichment()
+        retried = _anomaly("response_time_ms")
+        detector._schedule_enrichment(retried, series)
+        await detector.wait_for_enrichment()
+
+        assert first.prediction == "Unable to generate prediction"
+        assert retried.prediction == "Latency will keep rising over the next hour"
+        assert detector.enrichment_stats["failed"] == 1
+        assert detector.enrichment_stats["cache_hits"] == 0
+        assert detector.openai_service.generate_response.await_count == 2
@@ -0,0 +1,115 @@
+"""
+Test Suite for the RoxyAgent call session store
+Tests bounded turn buffers, idle eviction, memory caps and the shared backend
+"""
+import time
+from unittest.mock import patch
+
+import pytest
+
+from voicehive.domains.calls.repositories.call_session_store import (
+    CallSessionStore, InMemorySessionBackend, RedisSessionBackend, TurnRecord
+)
+
+
+def _turns(call_index: int, count: int = 2):
+    return [TurnRecord("user" if i % 2 == 0 else "assistant", f"call {call_index} turn {i}") for i in range(count)]
+
+
+class TestInMemorySessionBackend:
+    """Test per-worker call session storage"""
+
+    @pytest.fixture
+    def store(self):
+        return CallSessionStore(InMemorySessionBackend(max_turns=4, idle_ttl=60))
+
+    @pytest.mark.asyncio
+    async def test_keeps_only_recent_turns(self, store):
+        for i in range(5):
+            await store.append("call-1", TurnRecord("user", f"question {i}"), TurnRecord("assistant", f"answer {i}"))
+
+        history = await store.get_history("call-1")
+
+        assert [turn.content for turn in history] == ["question 3", "answer 3", "question 4", "answer 4"]
+        assert store.get_stats()["memory_bytes"] == sum(turn.size_bytes for turn in history)
+
+    @pytest.mark.asyncio
+    async def test_end_session_drops_state(self, store):
+        await store.append("call-1", *_turns(1))
+
+        assert await store.end_session("call-1") is True
+        assert await store.get_history("call-1") == []
+        assert store.get_stats()["memory_bytes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_idle_sessions_expire_without_hang_event(self, store):
+        now = time.monotonic()
+        with patch("voicehive.domains.calls.repositories.call_session_store.time.monotonic", return_value=now):
+            await store.append("dropped-call", *_turns(1))
+        with patch("voicehive.domains.calls.repositories.call_session_store.time.monotonic", return_value=now + 30):
+            await store.append("live-call", *_turns(2))
+
+        with patch("voicehive.domains.calls.repositories.call_session_store.time.monotonic", return_value=now + 61):
+            assert await store.cleanup_expired() == 1
+            assert await store.get_history("dropped-call") == []
+            assert len(await store.get_history("live-call")) == 2
+
+        assert store.get_stats()["expired"] == 1
+
+    @pytest.mark.asyncio
+    async def test_session_cap_evicts_least_recently_active(self):
+        store = CallSessionStore(InMemorySessionBackend(max_turns=4, max_sessions=3))
+        for i in range(3):
+            await store.append(f"call-{i}", *_turns(i))
+
+        # Touch call-0 so call-1 becomes the least recently active
+        await store.append("call-0", TurnRecord("user", "still here"))
+        await store.append("call-3", *_turns(3))
+
+        assert await store.get_history("call-1") == []
+        assert len(await store.get_history("call-0")) == 3
+        assert store.get_stats()["active_sessions"] == 3
+        assert store.get_stats()["evicted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_cap(self):
+        backend = InMemorySessionBackend(max_turns=10, max_bytes=2000)
+        store = CallSessionStore(backend)
+        for i in range(20):
+            await store.append(f"call-{i}", TurnRecord("user", "x" * 400))
+
+        stats = store.get_stats()
+        assert stats["memory_bytes"] <= 2000
+        assert stats["active_sessions"] == 2000 // (400 + TurnRecord("user", "").size_bytes)
+
+    def test_turn_records_are_compact(self):
+        turn = TurnRecord("user", "hello")
+
+        assert not hasattr(turn, "__dict__")
+        assert TurnRecord.from_list(turn.to_list()).content == "hello"
+
+
+class TestRedisSessionBackend:
+    """Test the shared call session backend"""
+
+    @pytest.fixture
+    def redis_client(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        return fakeredis.FakeAsyncRedis()
+
+    @pytest.mark.asyncio
+    async def test_workers_share_call_state(self, redis_client):
+        worker_a = CallSessionStore(RedisSessionBackend(max_turns=4, client=redis_client))
+        worker_b = CallSessionStore(RedisSessionBackend(max_turns=4, client=redis_client))
+
+        await worker_a.append("call-1", TurnRecord("user", "Hi"), TurnRecord("assistant", "Hello!"))
+        await worker_b.append("call-1", TurnRecord("user", "Book me in"), TurnRecord("assistant", "Sure"))
+        await worker_a.append("call-1", TurnRecord("user", "Tomorrow"))
+
+        history = await worker_b.get_history("call-1")
+
+        assert [turn.content for turn in history] == ["Hello!", "Book me in", "Sure", "Tomorrow"]
+        assert 0 < await redis_client.ttl("voicehive:call_session:call-1") <= 1800
+
+        assert await worker_b.end_session("call-1") is True
+        assert await worker_a.get_history("call-1") == []
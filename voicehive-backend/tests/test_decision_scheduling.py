@@ -0,0 +1,203 @@
+"""
+Test Suite for DecisionEngine context snapshots and batched decision scheduling
+Tests snapshot versioning, per-type micro-batches, deadline ordering, the bounded worker pool and throughput
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from voicehive.domains.agents.services.ml.decision_engine import (
+    DecisionEngine, DecisionType, DecisionUrgency
+)
+from voicehive.domains.agents.services.ml.resource_allocator import ResourceAllocation, ResourceStatus, ResourceType
+from voicehive.services.ai.openai_service import OpenAIService
+from voicehive.utils.quantiles import LatencyRegistry
+
+
+def _engine(**config) -> DecisionEngine:
+    openai_service = Mock(spec=OpenAIService)
+    openai_service.generate_response = AsyncMock(return_value="[]")
+    engine = DecisionEngine(project_id="test-project", openai_service=openai_service,
+                            latency_registry=LatencyRegistry())
+    for name, value in config.items():
+        setattr(engine, name, value)
+    return engine
+
+
+async def _urgent(engine: DecisionEngine, decision_type=DecisionType.CONFLICT_RESOLUTION, data=None, deadline=None):
+    return await engine.request_decision(
+        decision_type=decision_type, urgency=DecisionUrgency.URGENT, data=data or {"conflicts": [1]},
+        requesting_agent="operational_supervisor", deadline=deadline
+    )
+
+
+class TestContextSnapshot:
+    """Test that the context is rebuilt only when its inputs change"""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_shared_until_inputs_change(self):
+        engine = _engine()
+        first = await engine._get_decision_context()
+        assert await engine._get_decision_context() is first
+
+        engine.resource_allocator._activate(ResourceAllocation(
+            id="a1", resource_type=ResourceType.COMPUTE_INSTANCE, allocated_amount=1.0, target_agent="agent",
+            allocation_time=datetime.now(), expiry_time=None, status=ResourceStatus.ALLOCATED
+        ))
+        second = await engine._get_decision_context()
+        engine.anomaly_detector.detected_anomalies.append(Mock())
+        third = await engine._get_decision_context()
+
+        assert second is not first and third is not second
+        assert len(third.recent_anomalies) == 1
+        assert engine.context_version == 3
+        assert engine.decision_metrics["context_reuses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_snapshot_expires(self):
+        engine = _engine(context_ttl_seconds=0.0)
+
+        first = await engine._get_decision_context()
+
+        assert await engine._get_decision_context() is not first
+
+
+class TestBatchedDecisions:
+    """Test micro-batching and the worker pool"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_batched(self):
+        engine = _engine()
+        analyze = Mock(wraps=engine.multi_criteria_analyzer.analyze_decision)
+        engine.multi_criteria_analyzer.analyze_decision = analyze
+
+        request_ids = await asyncio.gather(*(_urgent(engine) for _ in range(40)))
+
+        assert all(engine.get_decision_status(request_id)["status"] == "completed" for request_id in request_ids)
+        assert len(engine.pending_decisions) == 0
+        assert engine.decision_metrics["batches"] == 2
+        # One analysis per batch: all requests share the same context snapshot
+        assert analyze.call_count == 2
+        assert engine.decision_metrics["context_builds"] == 1
+        assert not engine._decision_workers
+
+    @pytest.mark.asyncio
+    async def test_same_type_side_effects_run_once_per_batch(self):
+        engine = _engine()
+        engine.resource_allocator.optimize_allocations = AsyncMock(return_value={"total_cost_per_hour": 1.0})
+        resource_data = {"resource_requests": [{"resource_type": "compute_instance", "amount": 1.0, "priority": 3}]}
+
+        await asyncio.gather(
+            *(_urgent(engine, DecisionType.RESOURCE_ALLOCATION, resource_data) for _ in range(10)),
+            *(_urgent(engine, DecisionType.EMERGENCY_RESPONSE, {"emergency": {"type": "outage"}}) for _ in range(10))
+        )
+
+        assert engine.resource_allocator.optimize_allocations.await_count == 1
+        assert engine.openai_service.generate_response.await_count == 1
+        assert len(engine.resource_allocator.pending_requests) == 10
+        assert engine.get_engine_statistics()["total_decisions"] == 20
+
+    @pytest.mark.asyncio
+    async def test_earliest_deadline_batch_runs_first(self):
+        engine = _engine(max_decision_workers=1)
+        order = []
+        original = engine._decide_batch
+
+        async def record(decision_type, requests):
+            order.append(decision_type)
+            return await original(decision_type, requests)
+        engine._decide_batch = record
+        soon = datetime.now() + timedelta(seconds=5)
+
+        await asyncio.gather(
+            *(_urgent(engine, DecisionType.STRATEGIC_PLANNING, {}) for _ in range(3)),
+            *(_urgent(engine, DecisionType.CONFLICT_RESOLUTION, deadline=soon) for _ in range(3))
+        )
+
+        assert order == [DecisionType.CONFLICT_RESOLUTION, DecisionType.STRATEGIC_PLANNING]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_leaves_requests_pending(self):
+        engine = _engine()
+        engine._decide_batch = AsyncMock(side_effect=RuntimeError("boom"))
+
+        request_ids = await asyncio.gather(*(_urgent(engine) for _ in range(3)))
+
+        assert all(engine.get_decision_status(request_id)["status"] == "pending" for request_id in request_ids)
+        assert not engine._decision_waiters
+
+    @pytest.mark.asyncio
+    async def test_statistics_report_throughput_and_latency(self):
+        engine = _engine()
+        await asyncio.gather(*(_urgent(engine) for _ in range(50)))
+
+        stats = engine.get_engine_statistics()
+
+        assert stats["decisions_per_second"] > 0
+        assert stats["decision_latency_ms"]["count"] == 50
+        assert stats["decision_latency_ms"]["p99"] is not None
+        assert stats["avg_batch_size"] > 1
+
+
+@pytest.mark.performance
+class TestDecisionBenchmark:
+    """Compare one-at-a-time urgent decisions with concurrent batched submission"""
+
+    @pytest.mark.asyncio
+    async def test_decision_throughput(self):
+        count = 2000
+
+        # Former path: context gathered per request, decisions made one by one
+        engine = _engine()
+        start = time.perf_counter()
+        for _ in range(count):
+            context = await engine._gather_decision_context()
+            request = Mock(id="r", decision_type=DecisionType.CONFLICT_RESOLUTION, data={"conflicts": [1]},
+                           context=context)
+            await engine.make_decision(request)
+        sequential_s = time.perf_counter() - start
+
+        engine = _engine()
+        start = time.perf_counter()
+        await asyncio.gather(*(_urgent(engine) for _ in range(count)))
+        batched_s = time.perf_counter() - start
+        stats = engine.get_engine_statistics()
+        latency = stats["decision_latency_ms"]
+
+        print(f"\n{count} urgent conflict decisions: one-by-one {count / sequential_s:.0f}/s, "
+              f"batched {count / batched_s:.0f}/s ({stats['batches']} batches of ~{stats['avg_batch_size']:.0f}, "
+              f"{stats['context_builds']} context builds); latency p50 {latency['p50']:.1f} ms, "
+              f"p99 {latency['p99']:.1f} ms")
+        assert stats["context_builds"] == 1
+
+    @pytest.mark.asyncio
+    async def test_emergency_throughput_with_llm_latency(self):
+        count = 200
+        data = {"emergency": {"type": "outage"}}
+
+        async def llm(**kwargs):
+            await asyncio.sleep(0.01)
+            return "[]"
+
+        results = {}
+        for mode in ("sequential", "concurrent"):
+            engine = _engine()
+            engine.openai_service.generate_response = AsyncMock(side_effect=llm)
+            start = time.perf_counter()
+            if mode == "sequential":
+                for _ in range(count):
+                    await _urgent(engine, DecisionType.EMERGENCY_RESPONSE, data)
+            else:
+                await asyncio.gather(*(_urgent(engine, DecisionType.EMERGENCY_RESPONSE, data) for _ in range(count)))
+            elapsed = time.perf_counter() - start
+            latency = engine.get_engine_statistics()["decision_latency_ms"]
+            results[mode] = (elapsed, engine.openai_service.generate_response.await_count, latency["p99"])
+
+        print(f"\n{count} urgent emergencies with 10 ms LLM latency: " + ", ".join(
+            f"{mode} {count / elapsed:.0f}/s ({calls} LLM calls, p99 {p99:.1f} ms)"
+            for mode, (elapsed, calls, p99) in results.items()))
+        assert results["concurrent"][1] <= count // 32 + 1
+        assert results["concurrent"][0] < results["sequential"][0] / 5
@@ -0,0 +1,197 @@
+"""
+Test Suite for embedding caching and vectorized similarity
+Tests hashed embeddings, the memory-mapped cache, batched model calls and near-duplicate merging
+"""
+import json
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pytest
+
+from voicehive.domains.agents.services.ml.embeddings import (
+    EmbeddingCache, batch_texts, cosine_similarity_matrix, group_near_duplicates, hashed_embeddings
+)
+from voicehive.domains.agents.services.ml.prioritization_engine import (
+    ImprovementCandidate, ImprovementCategory, PrioritizationEngine, VertexAIPredictor
+)
+from voicehive.services.ai.openai_service import OpenAIService
+
+
+def _reference_components(vectors, threshold):
+    similar = cosine_similarity_matrix(vectors) >= threshold
+    labels = [-1] * len(vectors)
+    for root in range(len(vectors)):
+        if labels[root] >= 0:
+            continue
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if labels[node] >= 0:
+                continue
+            labels[node] = root
+            stack.extend(np.flatnonzero(similar[node]).tolist())
+    return np.array(labels)
+
+
+def _fake_model(dimension=768):
+    def get_embeddings(texts):
+        return [SimpleNamespace(values=hashed_embeddings([text], dimension)[0].tolist()) for text in texts]
+    return Mock(get_embeddings=Mock(side_effect=get_embeddings))
+
+
+class TestEmbeddingUtilities:
+    """Test local embeddings, request batching and similarity grouping"""
+
+    def test_hashed_embeddings_reflect_lexical_overlap(self):
+        vectors = hashed_embeddings([
+            "Reduce API response time",
+            "Reduce API response time.",
+            "Reduce API response latency",
+            "Add multilingual greetings"
+        ])
+        similarity = cosine_similarity_matrix(vectors)
+
+        assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0)
+        assert similarity[0, 1] == pytest.approx(1.0)
+        assert similarity[0, 3] < similarity[0, 2] < 1.0
+        assert np.array_equal(vectors, hashed_embeddings([
+            "Reduce API response time", "Reduce API response time.",
+            "Reduce API response latency", "Add multilingual greetings"
+        ]))
+
+    def test_batches_respect_item_and_size_limits(self):
+        texts = ["a" * 40] * 7 + ["b" * 150]
+
+        batches = batch_texts(texts, max_items=3, max_chars=100)
+
+        assert batches == [[0, 1], [2, 3], [4, 5], [6], [7]]
+
+    def test_grouping_matches_connected_components(self):
+        rng = np.random.default_rng(0)
+        centers = rng.normal(size=(20, 32))
+        vectors = np.repeat(centers, 5, axis=0) + rng.normal(scale=0.15, size=(100, 32))
+        # A chain a~b~c where a and c are not directly similar must still merge
+        angles = np.radians([0, 20, 40])
+        vectors[:3] = 0
+        vectors[:3, 0], vectors[:3, 1] = np.cos(angles), np.sin(angles)
+
+        labels = group_near_duplicates(vectors, threshold=0.9)
+
+        assert np.array_equal(labels, _reference_components(vectors, 0.9))
+        assert labels[2] == 0
+
+
+class TestEmbeddingCache:
+    """Test the content-addressed cache and its persistence"""
+
+    def test_lookup_and_store(self):
+        cache = EmbeddingCache(dimension=4, initial_capacity=2)
+        cache.store(["a", "b", "a", "c"], np.arange(16, dtype=np.float32).reshape(4, 4))
+
+        vectors, missing = cache.lookup(["c", "d", "a"])
+
+        assert missing == [1]
+        assert vectors[0].tolist() == [12, 13, 14, 15]
+        assert vectors[2].tolist() == [0, 1, 2, 3]
+        assert len(cache) == 3
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "embeddings.f32")
+        texts = [f"improvement {i}" for i in range(50)]
+        first = EmbeddingCache(dimension=8, path=path, initial_capacity=4)
+        first.store(texts, hashed_embeddings(texts, 8))
+
+        reopened = EmbeddingCache(dimension=8, path=path)
+        vectors, missing = reopened.lookup(texts[::-1])
+
+        assert missing == []
+        assert np.array_equal(vectors, hashed_embeddings(texts[::-1], 8))
+        assert isinstance(reopened._vectors, np.memmap)
+
+
+class TestModelEmbeddings:
+    """Test batched, cached model embedding calls"""
+
+    @pytest.fixture
+    def predictor(self):
+        predictor = VertexAIPredictor("test-project")
+        predictor.initialized = True
+        predictor.embedding_model = _fake_model()
+        predictor.embedding_batch_size = 4
+        return predictor
+
+    @pytest.mark.asyncio
+    async def test_model_called_in_batches_and_cached(self, predictor):
+        texts = [f"Improve flow {i}" for i in range(10)]
+
+        first = await predictor.embed(texts)
+        second = await predictor.embed(texts[:5] + ["New idea"])
+
+        assert predictor.embedding_model.get_embeddings.call_count == 4
+        assert np.array_equal(first[:5], second[:5])
+        assert predictor.embedding_cache.get_stats()["hits"] == 5
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_falls_back_without_caching(self, predictor):
+        predictor.embedding_model.get_embeddings.side_effect = RuntimeError("quota exceeded")
+
+        vectors = await predictor.embed(["Reduce latency"])
+
+        assert np.array_equal(vectors, hashed_embeddings(["Reduce latency"]))
+        assert len(predictor.embedding_cache) == 0
+
+
+class TestNearDuplicateMerging:
+    """Test that near-duplicate candidates share reasoning"""
+
+    @pytest.mark.asyncio
+    async def test_near_duplicates_reasoned_once(self):
+        service = Mock(spec=OpenAIService)
+        service.generate_response = AsyncMock(return_value=json.dumps({"score": 0.8, "reasoning": "ok"}))
+        engine = PrioritizationEngine(project_id="test-project", openai_service=service)
+        engine.reasoning_batch_size = 1
+
+        def candidate(index, title):
+            return ImprovementCandidate(
+                id=f"imp-{index}", title=title, description="Callers wait too long on greeting",
+                category=ImprovementCategory.PERFORMANCE, estimated_impact=0.6, estimated_effort=0.3,
+                risk_level=0.2, performance_data={}, timestamp=datetime.now(), source_agent="feedback_agent"
+            )
+
+        results = await engine.prioritize_improvements([
+            candidate(1, "Reduce greeting latency"),
+            candidate(2, "Reduce greeting latency!"),
+            candidate(3, "Add Spanish voice support")
+        ])
+
+        assert service.generate_response.await_count == 2
+        assert engine.reasoning_stats["merged"] == 1
+        assert all(result.reasoning == "ok" for result in results)
+
+
+@pytest.mark.performance
+class TestSimilarityBenchmark:
+    """Benchmark vectorized grouping against a per-pair loop"""
+
+    def test_grouping_1000_candidates(self):
+        texts = [f"Reduce latency in workflow {i % 400}" for i in range(1000)]
+        vectors = hashed_embeddings(texts)
+
+        start = time.perf_counter()
+        labels = group_near_duplicates(vectors, threshold=0.92)
+        vectorized = time.perf_counter() - start
+
+        sample = vectors[:200]
+        start = time.perf_counter()
+        for i in range(len(sample)):
+            for j in range(i + 1, len(sample)):
+                float(np.dot(sample[i], sample[j]))
+        looped = (time.perf_counter() - start) * (1000 * 999) / (200 * 199)
+
+        print(f"\n1,000 candidates: vectorized grouping {vectorized * 1000:.1f} ms, "
+              f"pairwise loop (extrapolated) {looped * 1000:.0f} ms, {len(set(labels.tolist()))} clusters")
+        assert len(set(labels.tolist())) == 400
+        assert vectorized < looped / 10
@@ -0,0 +1,202 @@
+"""
+Test Suite for seasonal metric forecasting
+Tests the tiered time-series store, Holt-Winters accuracy, batch/incremental fitting and speed
+"""
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from voicehive.domains.agents.services.ml.anomaly_detector import MetricDataPoint, StatisticalAnalyzer
+from voicehive.domains.agents.services.ml.forecasting import ForecastEngine
+from voicehive.utils.timeseries import DownsampledTier, RingSeries, TimeSeriesStore
+
+DAY = 86400.0
+
+
+def _daily(timestamps, phase=0.0, level=100.0, amplitude=20.0, slope=0.0):
+    return level + slope * timestamps / 3600 + amplitude * np.sin(2 * np.pi * timestamps / DAY + phase)
+
+
+def _minute_store(metric_count, days, noise=2.0, seed=0, **capacities):
+    rng = np.random.default_rng(seed)
+    timestamps = np.arange(int(days * 1440)) * 60.0
+    store = TimeSeriesStore(**capacities)
+    for i in range(metric_count):
+        values = _daily(timestamps, phase=i * 0.1) + rng.normal(0, noise, len(timestamps))
+        store.extend(f"metric_{i}", timestamps, values)
+    return store
+
+
+class TestTimeSeriesStore:
+    """Test ring buffers and downsampling tiers"""
+
+    def test_ring_series_keeps_latest_window(self):
+        ring = RingSeries(capacity=5)
+        for i in range(12):
+            ring.append(float(i), float(i) * 10)
+        ring.extend(np.array([12.0, 13.0]), np.array([120.0, 130.0]))
+
+        assert ring.timestamps.tolist() == [9.0, 10.0, 11.0, 12.0, 13.0]
+        assert ring.values.tolist() == [90.0, 100.0, 110.0, 120.0, 130.0]
+        assert ring.indices().tolist() == [9, 10, 11, 12, 13]
+        assert ring.nbytes <= 2 * 5 * 2 * 8
+
+    def test_ring_series_views_are_zero_copy(self):
+        ring = RingSeries(capacity=100)
+        ring.extend(np.arange(10.0), np.arange(10.0))
+
+        assert np.shares_memory(ring.values, ring._values)
+
+    def test_vectorized_tier_matches_scalar_ingestion(self):
+        rng = np.random.default_rng(0)
+        timestamps = np.cumsum(rng.exponential(90, 5000))
+        values = rng.normal(size=5000)
+        scalar, batched = DownsampledTier(60, 300), DownsampledTier(60, 300)
+
+        for timestamp, value in zip(timestamps, values):
+            scalar.add(timestamp, value)
+        for chunk in np.array_split(np.arange(5000), 17):
+            batched.extend(timestamps[chunk], values[chunk])
+
+        assert np.array_equal(scalar.series.timestamps, batched.series.timestamps)
+        assert np.allclose(scalar.series.values, batched.series.values)
+
+    def test_tier_fills_gaps_with_previous_mean(self):
+        tier = DownsampledTier(60, 100)
+        tier.extend(np.array([0.0, 30.0, 250.0, 400.0]), np.array([1.0, 3.0, 8.0, 9.0]))
+
+        # Bucket 6 (t=400) is still open
+        assert tier.series.timestamps.tolist() == [0.0, 60.0, 120.0, 180.0, 240.0, 300.0]
+        assert tier.series.values.tolist() == [2.0, 2.0, 2.0, 2.0, 8.0, 8.0]
+
+    def test_store_memory_grows_with_data(self):
+        store = TimeSeriesStore()
+        store.extend("sparse", np.arange(5.0), np.ones(5))
+        store.extend("dense", np.arange(5000.0) * 60, np.ones(5000))
+
+        assert store.get("sparse").nbytes < store.get("dense").nbytes
+        assert store.get_stats()["metrics"] == 2
+
+
+class TestHoltWintersForecasting:
+    """Test forecast accuracy and batch/incremental consistency"""
+
+    def test_seasonal_forecast_beats_linear_trend(self):
+        store = _minute_store(metric_count=1, days=21)
+        forecast = ForecastEngine(store).forecast(["metric_0"], horizon=24)["metric_0"]
+
+        # Hourly buckets are labelled by their start; their mean sits at the half hour
+        truth = _daily(forecast.timestamps + 1800)
+        hourly = store.get("metric_0").tier("1h")
+        slope = np.polyfit(np.arange(20), hourly.values[-20:], 1)[0]
+        linear = hourly.values[-1] + slope * np.arange(1, 25)
+
+        assert forecast.tier == "1h"
+        assert forecast.season_length == 168
+        assert np.abs(forecast.values - truth).mean() < 1.0
+        assert np.abs(forecast.values - truth).mean() < np.abs(linear - truth).mean() / 5
+        assert np.all((forecast.lower <= truth) & (truth <= forecast.upper))
+
+    def test_daily_season_when_week_of_history_missing(self):
+        store = _minute_store(metric_count=1, days=3)
+        forecast = ForecastEngine(store).forecast(["metric_0"], horizon=12)["metric_0"]
+
+        assert forecast.season_length == 24
+        assert np.abs(forecast.values - _daily(forecast.timestamps + 1800)).mean() < 3.0
+
+    def test_trend_is_tracked(self):
+        timestamps = np.arange(14 * 24) * 3600.0
+        store = TimeSeriesStore()
+        store.extend("growing", timestamps, _daily(timestamps, slope=0.5))
+        forecast = ForecastEngine(store).forecast(["growing"], horizon=6)["growing"]
+
+        assert forecast.trend == pytest.approx(0.5, abs=0.1)
+
+    def test_batch_matches_single_metric_fits(self):
+        store = _minute_store(metric_count=6, days=9)
+        names = list(store)
+        batched = ForecastEngine(store).forecast(names, horizon=24)
+
+        for name in names:
+            single = ForecastEngine(store).forecast([name], horizon=24)[name]
+            assert np.allclose(batched[name].values, single.values)
+            assert np.allclose(batched[name].std, single.std)
+
+    def test_incremental_update_matches_full_refit(self):
+        timestamps = np.arange(10 * 1440) * 60.0
+        values = _daily(timestamps) + np.random.default_rng(3).normal(0, 2, len(timestamps))
+        split = 8 * 1440
+
+        store = TimeSeriesStore(hour_capacity=1000)
+        store.extend("cpu", timestamps[:split], values[:split])
+        engine = ForecastEngine(store)
+        engine.forecast(["cpu"], horizon=24)
+        store.extend("cpu", timestamps[split:], values[split:])
+        incremental = engine.forecast(["cpu"], horizon=24)["cpu"]
+
+        full_store = TimeSeriesStore(hour_capacity=1000)
+        full_store.extend("cpu", timestamps, values)
+        refit = ForecastEngine(full_store).forecast(["cpu"], horizon=24)["cpu"]
+
+        assert engine.stats["incremental_updates"] == 1
+        assert np.allclose(incremental.values, refit.values)
+        assert np.allclose(incremental.std, refit.std)
+
+    def test_short_history_falls_back_to_raw_samples(self):
+        start = datetime(2026, 1, 1)
+        analyzer = StatisticalAnalyzer()
+        for i in range(21):
+            analyzer.add_data_point(
+                "response_time_ms", MetricDataPoint(timestamp=start + timedelta(seconds=30 * i), value=100.0 + i)
+            )
+
+        predictions = analyzer.predict_future_values("response_time_ms", steps_ahead=5)
+
+        assert len(predictions) == 5
+        assert predictions[0].prediction_timestamp == start + timedelta(seconds=30 * 21)
+        assert predictions[0].trend_direction == "increasing"
+        assert predictions[0].predicted_value == pytest.approx(121.0, abs=1.0)
+        assert all(p.confidence_interval[0] <= p.predicted_value <= p.confidence_interval[1] for p in predictions)
+
+    def test_metrics_without_history_are_skipped(self):
+        analyzer = StatisticalAnalyzer()
+
+        assert analyzer.predict_future_values_batch(["unknown"], steps_ahead=3) == {}
+
+
+@pytest.mark.performance
+class TestForecastingBenchmark:
+    """Benchmark batch forecasting against per-metric fits"""
+
+    def test_batch_forecast_of_1000_seasonal_metrics(self):
+        metric_count = 1000
+        timestamps = np.arange(21 * 24) * 3600.0 + 1800
+        rng = np.random.default_rng(0)
+        store = TimeSeriesStore()
+        for i in range(metric_count):
+            store.extend(f"metric_{i}", timestamps, _daily(timestamps, phase=i * 0.01) + rng.normal(0, 2, len(timestamps)))
+        names = list(store)
+
+        start = time.perf_counter()
+        for name in names[:50]:
+            ForecastEngine(store).forecast([name], horizon=24)
+        single_rate = 50 / (time.perf_counter() - start)
+
+        engine = ForecastEngine(store)
+        start = time.perf_counter()
+        forecasts = engine.forecast(names, horizon=24)
+        batch_rate = metric_count / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        engine.forecast(names, horizon=24)
+        warm_rate = metric_count / (time.perf_counter() - start)
+
+        errors = [np.abs(f.values - _daily(f.timestamps + 1800, phase=i * 0.01)).mean()
+                  for i, f in enumerate(forecasts[name] for name in names)]
+        print(f"\n1,000 seasonal metrics: per-metric {single_rate:,.0f}/s, batched {batch_rate:,.0f}/s, "
+              f"warm {warm_rate:,.0f}/s, mean abs error {np.mean(errors):.2f}")
+        assert batch_rate > 10 * single_rate
+        assert warm_rate > batch_rate
+        assert np.mean(errors) < 2.5
@@ -0,0 +1,139 @@
+"""
+Test Suite for streaming latency quantile sketches
+Tests accuracy, mergeability and the windowed latency registry
+"""
+import pytest
+import numpy as np
+
+from voicehive.utils.quantiles import (
+    QuantileSketch, WindowedQuantileSketch, LatencyRegistry, quantile_label
+)
+
+
+class TestQuantileSketch:
+    """Test DDSketch-style quantile sketch"""
+
+    @pytest.fixture
+    def latencies(self):
+        rng = np.random.default_rng(42)
+        # Log-normal latencies with a heavy tail, like real webhook timings
+        return rng.lognormal(mean=5.0, sigma=0.8, size=50_000)
+
+    def test_empty_sketch(self):
+        sketch = QuantileSketch()
+
+        assert sketch.count == 0
+        assert sketch.quantile(0.5) is None
+        assert sketch.summary()["p99"] is None
+
+    def test_relative_accuracy(self, latencies):
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        sketch.add_many(latencies)
+
+        for q in (0.5, 0.95, 0.99):
+            expected = np.quantile(latencies, q)
+            assert sketch.quantile(q) == pytest.approx(expected, rel=0.02)
+
+    def test_single_inserts_match_batch(self, latencies):
+        batch = QuantileSketch()
+        batch.add_many(latencies[:1000])
+
+        single = QuantileSketch()
+        for value in latencies[:1000]:
+            single.add(value)
+
+        assert single.count == batch.count
+        assert single.quantiles([0.5, 0.99]) == batch.quantiles([0.5, 0.99])
+
+    def test_merge_equals_combined(self, latencies):
+        combined = QuantileSketch()
+        combined.add_many(latencies)
+
+        worker_a, worker_b = QuantileSketch(), QuantileSketch()
+        worker_a.add_many(latencies[:20_000])
+        worker_b.add_many(latencies[20_000:])
+        worker_a.merge(worker_b)
+
+        assert worker_a.count == combined.count
+        assert worker_a.quantiles([0.5, 0.95, 0.99]) == combined.quantiles([0.5, 0.95, 0.99])
+
+    def test_removed_values_are_forgotten(self, latencies):
+        kept = QuantileSketch()
+        kept.add_many(latencies[:1000])
+
+        sketch = QuantileSketch()
+        sketch.add_many(latencies[:2000])
+        for value in latencies[1000:2000]:
+            sketch.remove(value)
+        sketch.add(0.0)
+        sketch.remove(0.0)
+
+        assert sketch.count == kept.count
+        assert sketch.sum == pytest.approx(kept.sum)
+        assert sketch.quantiles([0.5, 0.95, 0.99]) == kept.quantiles([0.5, 0.95, 0.99])
+
+    def test_merge_rejects_different_accuracy(self):
+        with pytest.raises(ValueError):
+            QuantileSketch(relative_accuracy=0.01).merge(QuantileSketch(relative_accuracy=0.05))
+
+    def test_serialization_round_trip(self, latencies):
+        sketch = QuantileSketch()
+        sketch.add_many(latencies[:5000])
+
+        restored = QuantileSketch.from_dict(sketch.to_dict())
+
+        assert restored.count == sketch.count
+        assert restored.quantile(0.95) == sketch.quantile(0.95)
+
+    def test_zero_and_bounded_bins(self):
+        sketch = QuantileSketch(max_bins=64)
+        sketch.add_many([0.0] * 10)
+        sketch.add_many(np.logspace(-3, 6, 1000))
+
+        assert sketch.count == 1010
+        assert sketch.quantile(0.001) == 0.0
+        assert sketch._counts.size <= 64
+        assert sketch.quantile(1.0) == pytest.approx(1e6)
+
+    def test_quantile_label(self):
+        assert quantile_label(0.5) == "p50"
+        assert quantile_label(0.99) == "p99"
+        assert quantile_label(0.999) == "p99.9"
+
+
+class TestLatencyRegistry:
+    """Test windowed latency registry"""
+
+    def test_window_excludes_old_buckets(self):
+        sketch = WindowedQuantileSketch(window_seconds=120, bucket_seconds=60)
+        sketch.add(5000.0, timestamp=0.0)
+        sketch.add(10.0, timestamp=600.0)
+
+        snapshot = sketch.snapshot(now=610.0)
+
+        assert snapshot.count == 1
+        assert snapshot.quantile(0.5) == pytest.approx(10.0, rel=0.02)
+
+    def test_record_and_summarize(self):
+        registry = LatencyRegistry()
+        for value in range(1, 101):
+            registry.record("webhook", float(value))
+        registry.record("llm", 900.0)
+
+        quantiles = registry.get_all_quantiles()
+
+        assert set(quantiles) == {"webhook", "llm"}
+        assert quantiles["webhook"]["count"] == 100
+        assert quantiles["webhook"]["p99"] == pytest.approx(99.0, rel=0.02)
+
+    def test_merge_exports_across_workers(self):
+        worker_a, worker_b = LatencyRegistry(), LatencyRegistry()
+        for value in range(1, 51):
+            worker_a.record("bus_delivery", float(value))
+        for value in range(51, 101):
+            worker_b.record("bus_delivery", float(value))
+
+        merged = LatencyRegistry.merge_exports([worker_a.export(), worker_b.export()])
+
+        assert merged["bus_delivery"].count == 100
+        assert merged["bus_delivery"].quantile(0.5) == pytest.approx(50.0, rel=0.03)
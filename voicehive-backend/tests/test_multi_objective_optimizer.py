@@ -0,0 +1,470 @@
+"""
+Test Suite for the vectorized multi-objective optimizer
+Tests non-dominated sorting, crowding distance, genetic operators, hypervolume,
+the Pareto archive, NSGA-II runs and anytime behaviour
+"""
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from voicehive.domains.agents.services.ml.evaluation import EvaluationBackend
+from voicehive.domains.agents.services.ml.multi_objective_optimizer import (
+    MultiObjectiveOptimizer, Objective, ObjectiveType, OptimizationStrategy, Solution
+)
+from voicehive.domains.agents.services.ml.pareto import (
+    ParameterEncoding, ParetoArchive, crowding_distance, dominance_matrix, estimate_hypervolume,
+    hypervolume, mutate, non_dominated_sort, uniform_crossover
+)
+
+PARAMETER_SPACE = {
+    "cpu_allocation": {"type": "float", "min": 0.1, "max": 1.0},
+    "instance_count": {"type": "int", "min": 1, "max": 10},
+    "tier": {"type": "choice", "choices": ["basic", "standard", "premium"]}
+}
+
+
+def _reference_ranks(objectives: np.ndarray) -> np.ndarray:
+    """Front peeling on the full dominance matrix"""
+    dominates = dominance_matrix(objectives)
+    ranks = np.zeros(len(objectives), dtype=np.int64)
+    remaining = np.ones(len(objectives), dtype=bool)
+    rank = 1
+    while remaining.any():
+        indices = np.flatnonzero(remaining)
+        front = indices[~dominates[np.ix_(remaining, remaining)].any(axis=0)]
+        ranks[front] = rank
+        remaining[front] = False
+        rank += 1
+    return ranks
+
+
+def _grid_hypervolume(objectives: np.ndarray, reference: np.ndarray) -> float:
+    """Hypervolume by summing the grid cells induced by all coordinates"""
+    objectives = objectives[np.all(objectives < reference, axis=1)]
+    if not len(objectives):
+        return 0.0
+    axes = [np.unique(np.append(objectives[:, d], reference[d])) for d in range(objectives.shape[1])]
+    centers = np.stack(np.meshgrid(*[(a[:-1] + a[1:]) / 2 for a in axes], indexing="ij"), -1)
+    widths = np.stack(np.meshgrid(*[np.diff(a) for a in axes], indexing="ij"), -1)
+    centers = centers.reshape(-1, objectives.shape[1])
+    cell_volumes = widths.reshape(-1, objectives.shape[1]).prod(axis=1)
+    covered = np.zeros(len(centers), dtype=bool)
+    for point in objectives:
+        covered |= np.all(centers >= point, axis=1)
+    return float(cell_volumes[covered].sum())
+
+
+class TestNonDominatedSort:
+    """Test vectorized Pareto ranking"""
+
+    @pytest.mark.parametrize("objective_count", [1, 2, 3, 4])
+    def test_matches_reference_with_ties(self, objective_count):
+        rng = np.random.default_rng(objective_count)
+        for _ in range(25):
+            # Small integer grids force ties and duplicate solutions
+            objectives = rng.integers(0, 5, size=(rng.integers(1, 300), objective_count)).astype(float)
+            assert np.array_equal(non_dominated_sort(objectives), _reference_ranks(objectives))
+
+    @pytest.mark.parametrize("objective_count", [2, 3, 5])
+    def test_matches_reference_continuous(self, objective_count):
+        objectives = np.random.default_rng(7).random((500, objective_count))
+
+        assert np.array_equal(non_dominated_sort(objectives), _reference_ranks(objectives))
+
+    def test_crowding_distance_boundaries(self):
+        objectives = np.array([[0.0, 4.0], [1.0, 3.0], [2.0, 1.0], [4.0, 0.0]])
+        ranks = non_dominated_sort(objectives)
+
+        distance = crowding_distance(objectives, ranks)
+
+        assert np.all(ranks == 1)
+        assert np.isinf(distance[[0, 3]]).all()
+        assert distance[1] == pytest.approx(2 / 4 + 3 / 4)
+        assert distance[2] == pytest.approx(3 / 4 + 3 / 4)
+
+
+class TestHypervolume:
+    """Test the exact hypervolume indicator"""
+
+    @pytest.mark.parametrize("objective_count", [1, 2, 3, 4, 5, 6])
+    def test_matches_grid_reference(self, objective_count):
+        rng = np.random.default_rng(objective_count)
+        for trial in range(10):
+            count = rng.integers(1, {4: 10, 5: 10, 6: 7}.get(objective_count, 40))
+            if trial % 2:
+                objectives = rng.integers(0, 6, size=(count, objective_count)).astype(float)
+                reference = np.full(objective_count, 6.0)
+            else:
+                objectives = rng.random((count, objective_count))
+                reference = np.full(objective_count, 1.1)
+
+            assert hypervolume(objectives, reference) == pytest.approx(_grid_hypervolume(objectives, reference))
+
+    def test_points_beyond_reference_ignored(self):
+        objectives = np.array([[1.0, 1.0], [3.0, 0.5], [0.5, 5.0]])
+
+        assert hypervolume(objectives, np.array([2.0, 2.0])) == pytest.approx(1.0)
+        assert hypervolume(np.empty((0, 2)), np.array([2.0, 2.0])) == 0.0
+
+    def test_monte_carlo_estimate_close_to_exact(self):
+        rng = np.random.default_rng(5)
+        objectives = rng.random((150, 5))
+        objectives /= np.linalg.norm(objectives, axis=1, keepdims=True)
+        reference = np.full(5, 1.1)
+        samples = rng.random((50_000, 5))
+
+        exact = hypervolume(objectives, reference)
+        estimate = estimate_hypervolume(objectives, reference, samples)
+        improved = estimate_hypervolume(np.vstack([objectives, objectives.min(axis=0) + 0.05]), reference,
+                                        samples, lower=objectives.min(axis=0))
+
+        assert estimate == pytest.approx(exact, rel=0.02)
+        assert improved >= estimate_hypervolume(objectives, reference, samples, lower=objectives.min(axis=0))
+
+
+class TestParetoArchive:
+    """Test the incrementally maintained non-dominated archive"""
+
+    @pytest.mark.parametrize("objective_count", [2, 3])
+    def test_incremental_matches_full_recompute(self, objective_count):
+        rng = np.random.default_rng(objective_count)
+        archive = ParetoArchive(objective_count, parameter_count=1, max_size=10_000)
+        seen = []
+        for batch in range(20):
+            objectives = rng.integers(0, 20, size=(50, objective_count)).astype(float)
+            archive.add(objectives, objectives, np.zeros((50, 1)), np.arange(batch * 50, batch * 50 + 50))
+            seen.append(objectives)
+
+        everything = np.vstack(seen)
+        expected = np.unique(everything[non_dominated_sort(everything) == 1], axis=0)
+        assert np.array_equal(np.unique(archive.objectives, axis=0), expected)
+        assert len(archive) == len(expected)
+        reference = np.full(objective_count, 25.0)
+        assert archive.hypervolume(reference) == pytest.approx(hypervolume(everything, reference))
+
+    def test_two_objective_archive_stays_sorted(self):
+        archive = ParetoArchive(2, parameter_count=1)
+        objectives = np.random.default_rng(0).random((1000, 2))
+        for row in range(len(objectives)):
+            archive.add(objectives[row:row + 1], objectives[row:row + 1], np.zeros((1, 1)), np.array([row]))
+
+        assert np.all(np.diff(archive.objectives[:, 0]) > 0)
+        assert np.all(np.diff(archive.objectives[:, 1]) < 0)
+        assert archive.insertions + archive.rejections == 1000
+
+    def test_archive_is_bounded(self):
+        archive = ParetoArchive(2, parameter_count=1, max_size=50)
+        angles = np.random.default_rng(0).random(1000) * np.pi / 2
+        front = np.column_stack([np.cos(angles), np.sin(angles)])
+
+        archive.add(front, front, np.zeros((1000, 1)), np.arange(1000))
+
+        assert len(archive) == 50
+        # Boundary solutions survive truncation
+        assert archive.objectives[:, 0].min() == front[:, 0].min()
+        assert archive.objectives[:, 1].min() == front[:, 1].min()
+
+
+class TestGeneticOperators:
+    """Test vectorized crossover and mutation"""
+
+    @pytest.fixture
+    def encoding(self):
+        return ParameterEncoding(PARAMETER_SPACE)
+
+    def test_sample_and_decode_respect_space(self, encoding):
+        parameters = encoding.sample(200, np.random.default_rng(0))
+
+        for row in parameters:
+            decoded = encoding.decode(row)
+            assert 0.1 <= decoded["cpu_allocation"] <= 1.0
+            assert isinstance(decoded["instance_count"], int) and 1 <= decoded["instance_count"] <= 10
+            assert decoded["tier"] in PARAMETER_SPACE["tier"]["choices"]
+            assert np.array_equal(encoding.encode(decoded), row)
+
+    def test_crossover_swaps_genes_between_parents(self, encoding):
+        rng = np.random.default_rng(1)
+        first, second = encoding.sample(50, rng), encoding.sample(50, rng)
+
+        children = uniform_crossover(first, second, crossover_rate=1.0, rng=rng)
+
+        assert children.shape == (100, 3)
+        from_parents = (children[:50] == first) | (children[:50] == second)
+        assert from_parents.all()
+        assert np.array_equal(children[:50] + children[50:], first + second)
+
+    def test_mutation_stays_in_bounds(self, encoding):
+        rng = np.random.default_rng(2)
+        parameters = encoding.sample(500, rng)
+
+        mutated = mutate(parameters, encoding, mutation_rate=1.0, rng=rng, gene_rate=0.5)
+
+        assert not np.array_equal(mutated, parameters)
+        assert (mutated >= encoding.lows).all() and (mutated <= encoding.highs).all()
+        assert np.array_equal(mutated[:, 1:], np.rint(mutated[:, 1:]))
+
+
+class TestMultiObjectiveOptimizer:
+    """Test NSGA-II optimization runs"""
+
+    @pytest.fixture
+    def optimizer(self):
+        optimizer = MultiObjectiveOptimizer(openai_service=AsyncMock(), seed=42)
+        optimizer.use_ai_guidance = False
+        optimizer.max_generations = 10
+        optimizer.add_objective(Objective("cost_efficiency", ObjectiveType.MINIMIZE, 0.4))
+        optimizer.add_objective(Objective("customer_satisfaction", ObjectiveType.MAXIMIZE, 0.6))
+        return optimizer
+
+    @pytest.mark.asyncio
+    async def test_pareto_front_is_non_dominated(self, optimizer):
+        result = await optimizer.optimize(PARAMETER_SPACE, OptimizationStrategy.HYBRID_AI)
+
+        assert result.pareto_front
+        assert all(solution.pareto_rank == 1 for solution in result.pareto_front)
+        assert len(result.all_solutions) == optimizer.population_size
+
+        front = optimizer._objective_matrix(result.pareto_front)
+        assert not dominance_matrix(front).any()
+        assert result.convergence_metrics["pareto_front_size"] == len(result.pareto_front)
+
+    @pytest.mark.asyncio
+    async def test_front_improves_over_generations(self, optimizer):
+        initial = await optimizer._evaluate_solutions(
+            await optimizer._generate_initial_population(ParameterEncoding(PARAMETER_SPACE), 100)
+        )
+        initial_values = initial.values.copy()
+
+        evolved = await optimizer._hybrid_ai_optimization(initial, ParameterEncoding(PARAMETER_SPACE), 30)
+
+        # Survivor selection never loses the best value of either objective
+        assert evolved.values[:, 0].min() <= initial_values[:, 0].min()
+        assert evolved.values[:, 1].max() >= initial_values[:, 1].max()
+
+    @pytest.mark.asyncio
+    async def test_convergence_tracked_per_generation(self, optimizer):
+        result = await optimizer.optimize(PARAMETER_SPACE, OptimizationStrategy.HYBRID_AI)
+
+        history = result.convergence_history
+        assert [entry["generation"] for entry in history] == list(range(optimizer.max_generations + 1))
+        volumes = [entry["hypervolume"] for entry in history]
+        assert volumes == sorted(volumes)
+        assert volumes[-1] == pytest.approx(result.convergence_metrics["hypervolume"])
+        assert history[-1]["archive_size"] == len(result.pareto_front)
+
+    @pytest.mark.asyncio
+    async def test_many_objectives_use_monotone_estimate(self, optimizer):
+        for name in ("response_time", "resource_utilization", "error_rate"):
+            optimizer.add_objective(Objective(name, ObjectiveType.MINIMIZE, 0.1))
+        optimizer.population_size = 200
+
+        start = time.perf_counter()
+        result = await optimizer.optimize(PARAMETER_SPACE, OptimizationStrategy.HYBRID_AI)
+        elapsed = time.perf_counter() - start
+
+        volumes = [entry["hypervolume"] for entry in result.convergence_history]
+        assert optimizer._unit_samples is not None
+        assert volumes == sorted(volumes) and volumes[-1] > 0
+        assert volumes[-1] == pytest.approx(result.convergence_metrics["hypervolume"])
+        assert elapsed < 5.0
+
+    @pytest.mark.asyncio
+    async def test_archive_persists_and_resets_with_problem(self, optimizer):
+        first = await optimizer.optimize(PARAMETER_SPACE, OptimizationStrategy.HYBRID_AI)
+        archive = optimizer.archive
+        second = await optimizer.optimize(PARAMETER_SPACE, OptimizationStrategy.HYBRID_AI)
+
+        assert optimizer.archive is archive
+        assert second.convergence_metrics["hypervolume"] >= first.convergence_metrics["hypervolume"]
+
+        optimizer.add_objective(Objective("response_time", ObjectiveType.MINIMIZE, 0.2))
+        await optimizer.optimize(PARAMETER_SPACE, OptimizationStrategy.HYBRID_AI)
+        assert optimizer.archive is not archive
+        assert optimizer.archive.objective_count == 3
+
+    @pytest.mark.asyncio
+    async def test_history_is_bounded_and_drops_populations(self, optimizer):
+        optimizer.max_generations = 1
+        optimizer.optimization_history = type(optimizer.optimization_history)(maxlen=3)
+
+        for _ in range(5):
+            await optimizer.optimize(PARAMETER_SPACE, OptimizationStrategy.HYBRID_AI)
+
+        assert len(optimizer.optimization_history) == 3
+        assert all(result.population is None for result in optimizer.optimization_history)
+        assert optimizer.get_optimization_summary()["total_runs"] == 5
+
+    def test_assign_pareto_ranks_on_solution_objects(self, optimizer):
+        solutions = [
+            Solution("a", {}, {"cost_efficiency": 10, "customer_satisfaction": 90}),
+            Solution("b", {}, {"cost_efficiency": 20, "customer_satisfaction": 80}),
+            Solution("c", {}, {"cost_efficiency": 5, "customer_satisfaction": 50})
+        ]
+
+        optimizer._assign_pareto_ranks(solutions)
+
+        assert [solution.pareto_rank for solution in solutions] == [1, 2, 1]
+
+
+class SlowBackend(EvaluationBackend):
+    """Backend taking a fixed time per batch"""
+
+    def __init__(self, delay: float, constant: bool = False):
+        self.delay = delay
+        self.constant = constant
+        self.rng = np.random.default_rng(0)
+
+    async def evaluate(self, parameters, encoding, objective_names):
+        await asyncio.sleep(self.delay)
+        if self.constant:
+            return np.full((len(parameters), len(objective_names)), 50.0)
+        return self.rng.uniform(0, 100, size=(len(parameters), len(objective_names)))
+
+
+class TestAnytimeOptimization:
+    """Test time budgets, early stopping, concurrent guidance and streaming"""
+
+    @pytest.fixture
+    def optimizer(self):
+        optimizer = MultiObjectiveOptimizer(openai_service=AsyncMock(), seed=5)
+        optimizer.use_ai_guidance = False
+        optimizer.max_generations = 10_000
+        optimizer.add_objective(Objective("cost_efficiency", ObjectiveType.MINIMIZE, 0.4))
+        optimizer.add_objective(Objective("customer_satisfaction", ObjectiveType.MAXIMIZE, 0.6))
+        return optimizer
+
+    @pytest.mark.asyncio
+    async def test_time_budget_enforced_per_generation(self, optimizer):
+        optimizer.stagnation_generations = 0
+        optimizer.set_evaluation_backend(SlowBackend(delay=0.05))
+
+        result = await optimizer.optimize(PARAMETER_SPACE, OptimizationStrategy.PARETO_OPTIMAL, max_time_seconds=0.5)
+
+        assert result.stop_reason == "time_budget"
+        assert result.optimization_time < 0.6
+        assert len(result.convergence_history) > 3
+
+    @pytest.mark.asyncio
+    async def test_stops_when_hypervolume_stagnates(self, optimizer):
+        optimizer.stagnation_generations = 5
+        optimizer.set_evaluation_backend(SlowBackend(delay=0, constant=True))
+
+        result = await optimizer.optimize(PARAMETER_SPACE, OptimizationStrategy.HYBRID_AI)
+
+        assert result.stop_reason == "converged"
+        assert len(result.convergence_history) == 1 + 5
+
+    @pytest.mark.asyncio
+    async def test_guidance_does_not_block_generations(self, optimizer):
+        generations_before_guidance = []
+
+        async def slow_guidance(system_prompt, conversation_history):
+            assert "mutation_rate" in conversation_history[0]["content"]
+            await asyncio.sleep(0.2)
+            generations_before_guidance.append(len(optimizer._generation_metrics))
+            return '{"mutation_rate": 0.25}'
+
+        optimizer.use_ai_guidance = True
+        optimizer.max_generations = 40
+        optimizer.openai_service.generate_response = AsyncMock(side_effect=slow_guidance)
+        optimizer.set_evaluation_backend(SlowBackend(delay=0.01))
+
+        await optimizer.optimize(PARAMETER_SPACE, OptimizationStrategy.HYBRID_AI)
+
+        assert generations_before_guidance[0] > 5
+        assert optimizer._guided_rates == {"mutation_rate": 0.25}
+        assert optimizer.last_ai_guidance == '{"mutation_rate": 0.25}'
+
+    @pytest.mark.asyncio
+    async def test_pending_guidance_is_cancelled_when_the_run_ends(self, optimizer):
+        cancelled = []
+
+        async def hanging_guidance(system_prompt, conversation_history):
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        optimizer.use_ai_guidance = True
+        optimizer.max_generations = 3
+        optimizer.openai_service.generate_response = AsyncMock(side_effect=hanging_guidance)
+
+        await optimizer.optimize(PARAMETER_SPACE, OptimizationStrategy.HYBRID_AI)
+
+        assert cancelled == [True]
+        assert optimizer.last_ai_guidance is None
+
+    @pytest.mark.asyncio
+    async def test_guided_rates_do_not_leak_into_later_runs(self, optimizer):
+        optimizer._apply_ai_guidance('{"mutation_rate": 0.5, "crossover_rate": 0.3}')
+        assert optimizer._guided_rates == {"mutation_rate": 0.5, "crossover_rate": 0.3}
+
+        await optimizer.optimize(PARAMETER_SPACE, OptimizationStrategy.HYBRID_AI)
+
+        assert (optimizer.mutation_rate, optimizer.crossover_rate) == (0.1, 0.8)
+        assert optimizer._guided_rates == {}
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_improving_front(self, optimizer):
+        optimizer.max_generations = 30
+        snapshots = []
+
+        async for progress in optimizer.optimize_stream(PARAMETER_SPACE, max_time_seconds=30):
+            snapshots.append(progress)
+
+        assert snapshots[0].generation == 0
+        volumes = [snapshot.hypervolume for snapshot in snapshots]
+        assert all(later > earlier for earlier, later in zip(volumes, volumes[1:]))
+        assert all(solution.pareto_rank == 1 for solution in snapshots[-1].pareto_front)
+        assert len(snapshots[-1].pareto_front) == len(optimizer.archive)
+
+    @pytest.mark.asyncio
+    async def test_stream_can_stop_early(self, optimizer):
+        stream = optimizer.optimize_stream(PARAMETER_SPACE, max_time_seconds=30)
+        async for progress in stream:
+            if progress.generation >= 3:
+                break
+        await stream.aclose()
+
+        assert 3 <= len(optimizer._generation_metrics) < 50
+        assert len(optimizer.archive) > 0
+
+
+@pytest.mark.performance
+class TestParetoRankingBenchmark:
+    """Benchmark ranking of large populations"""
+
+    @pytest.mark.parametrize("objective_count", [2, 3])
+    def test_ranks_10k_solutions_under_a_second(self, objective_count):
+        objectives = np.random.default_rng(0).random((10_000, objective_count))
+
+        start = time.perf_counter()
+        ranks = non_dominated_sort(objectives)
+        crowding_distance(objectives, ranks)
+        elapsed = time.perf_counter() - start
+
+        print(f"\n{objective_count} objectives: ranked 10,000 solutions into "
+              f"{ranks.max()} fronts in {elapsed * 1000:.1f}ms")
+        assert elapsed < 0.5
+
+    @pytest.mark.parametrize("objective_count", [4, 5])
+    def test_hypervolume_of_200_point_front(self, objective_count):
+        rng = np.random.default_rng(0)
+        objectives = rng.random((200, objective_count))
+        objectives /= np.linalg.norm(objectives, axis=1, keepdims=True)
+        reference = np.full(objective_count, 1.1)
+
+        start = time.perf_counter()
+        exact = hypervolume(objectives, reference)
+        exact_s = time.perf_counter() - start
+        start = time.perf_counter()
+        estimate = estimate_hypervolume(objectives, reference, rng.random((20_000, objective_count)))
+        estimate_s = time.perf_counter() - start
+
+        print(f"\n{objective_count} objectives, 200-point front: WFG {exact_s * 1000:.0f}ms, "
+              f"Monte Carlo (20k samples) {estimate_s * 1000:.1f}ms, {abs(estimate - exact) / exact:.2%} off")
+        assert exact_s < 3.0
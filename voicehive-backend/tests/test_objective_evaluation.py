@@ -0,0 +1,166 @@
+"""
+Test Suite for multi-objective optimizer evaluation backends
+Tests vectorized and process-pool evaluation and the parameter-vector memo cache
+"""
+import time
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from voicehive.domains.agents.services.ml.evaluation import (
+    EvaluationCache, ProcessPoolBackend, VectorizedBackend
+)
+from voicehive.domains.agents.services.ml.multi_objective_optimizer import (
+    MultiObjectiveOptimizer, Objective, ObjectiveType, OptimizationStrategy
+)
+from voicehive.domains.agents.services.ml.pareto import ParameterEncoding
+
+PARAMETER_SPACE = {
+    "cpu_allocation": {"type": "float", "min": 0.1, "max": 1.0},
+    "instance_count": {"type": "int", "min": 1, "max": 10},
+    "tier": {"type": "choice", "choices": ["basic", "standard", "premium"]}
+}
+OBJECTIVES = ["cost_efficiency", "customer_satisfaction"]
+TIER_COST = {"basic": 1.0, "standard": 2.0, "premium": 4.0}
+
+
+def solution_objectives(parameters):
+    """Per-solution objectives (module level so worker processes can unpickle it)"""
+    cost = parameters["cpu_allocation"] * parameters["instance_count"] * TIER_COST[parameters["tier"]]
+    satisfaction = 100 * (1 - np.exp(-parameters["instance_count"] * parameters["cpu_allocation"]))
+    return [cost, satisfaction]
+
+
+def batch_objectives():
+    tier_cost = np.vectorize(TIER_COST.get, otypes=[float])
+    return {
+        "cost_efficiency": lambda c: c["cpu_allocation"] * c["instance_count"] * tier_cost(c["tier"]),
+        "customer_satisfaction": lambda c: 100 * (1 - np.exp(-c["instance_count"] * c["cpu_allocation"]))
+    }
+
+
+def _expected(parameters, encoding):
+    return np.array([solution_objectives(encoding.decode(row)) for row in parameters])
+
+
+class TestEvaluationBackends:
+    """Test batch and process-pool objective evaluation"""
+
+    @pytest.fixture
+    def encoding(self):
+        return ParameterEncoding(PARAMETER_SPACE)
+
+    @pytest.mark.asyncio
+    async def test_vectorized_matches_per_solution(self, encoding):
+        parameters = encoding.sample(300, np.random.default_rng(0))
+
+        values = await VectorizedBackend(batch_objectives()).evaluate(parameters, encoding, OBJECTIVES)
+
+        assert np.allclose(values, _expected(parameters, encoding))
+
+    @pytest.mark.asyncio
+    async def test_vectorized_requires_every_objective(self, encoding):
+        backend = VectorizedBackend({"cost_efficiency": lambda c: c["cpu_allocation"]})
+
+        with pytest.raises(KeyError):
+            await backend.evaluate(encoding.sample(5, np.random.default_rng(0)), encoding, OBJECTIVES)
+
+    @pytest.mark.asyncio
+    async def test_process_pool_matches_per_solution(self, encoding):
+        parameters = encoding.sample(101, np.random.default_rng(1))
+        backend = ProcessPoolBackend(solution_objectives, max_workers=2, chunk_size=16)
+        try:
+            values = await backend.evaluate(parameters, encoding, OBJECTIVES)
+        finally:
+            backend.close()
+
+        assert np.allclose(values, _expected(parameters, encoding))
+
+
+class TestEvaluationCache:
+    """Test memoization of evaluated parameter vectors"""
+
+    def test_lookup_splits_cached_and_duplicate_rows(self):
+        cache = EvaluationCache()
+        parameters = np.array([[1.0, 2.0], [3.0, 4.0], [1.0, 2.0], [5.0, 6.0]])
+        cache.store(cache.keys(parameters[1:2]), np.array([[30.0]]))
+
+        values, missing, inverse = cache.lookup(cache.keys(parameters), width=1)
+
+        assert missing.tolist() == [0, 3]
+        assert inverse.tolist() == [0, -1, 0, 1]
+        assert values[1, 0] == 30.0
+        assert cache.get_stats()["hits"] == 2
+
+    def test_lru_bound(self):
+        cache = EvaluationCache(max_size=10)
+        parameters = np.arange(40, dtype=float).reshape(20, 2)
+
+        cache.store(cache.keys(parameters), parameters)
+
+        assert len(cache) == 10
+        _, missing, _ = cache.lookup(cache.keys(parameters[-10:]), width=2)
+        assert len(missing) == 0
+
+
+class TestOptimizerEvaluation:
+    """Test the optimizer with pluggable evaluation"""
+
+    @pytest.fixture
+    def optimizer(self):
+        optimizer = MultiObjectiveOptimizer(openai_service=AsyncMock(), seed=3)
+        optimizer.use_ai_guidance = False
+        optimizer.max_generations = 10
+        optimizer.add_objective(Objective("cost_efficiency", ObjectiveType.MINIMIZE, 0.4))
+        optimizer.add_objective(Objective("customer_satisfaction", ObjectiveType.MAXIMIZE, 0.6))
+        return optimizer
+
+    @pytest.mark.asyncio
+    async def test_duplicate_solutions_evaluated_once(self, optimizer):
+        backend = VectorizedBackend(batch_objectives())
+        backend.evaluate = AsyncMock(side_effect=backend.evaluate)
+        optimizer.set_evaluation_backend(backend)
+
+        result = await optimizer.optimize(PARAMETER_SPACE, OptimizationStrategy.HYBRID_AI)
+
+        evaluated = sum(len(call.args[0]) for call in backend.evaluate.call_args_list)
+        distinct = len(np.unique(np.vstack([call.args[0] for call in backend.evaluate.call_args_list]), axis=0))
+        assert evaluated == distinct
+        assert optimizer.evaluation_cache.get_stats()["hits"] > 0
+
+        population = result.population
+        assert np.allclose(population.values, _expected(population.parameters, population.encoding))
+
+    @pytest.mark.asyncio
+    async def test_cache_cleared_when_problem_changes(self, optimizer):
+        optimizer.set_evaluation_backend(VectorizedBackend(batch_objectives()))
+        await optimizer.optimize(PARAMETER_SPACE, OptimizationStrategy.HYBRID_AI)
+        assert len(optimizer.evaluation_cache)
+
+        optimizer.objectives.pop("customer_satisfaction")
+        result = await optimizer.optimize(PARAMETER_SPACE, OptimizationStrategy.HYBRID_AI)
+
+        assert result.population.values.shape[1] == 1
+
+
+@pytest.mark.performance
+class TestEvaluationBenchmark:
+    """Benchmark batch evaluation against the per-solution loop"""
+
+    @pytest.mark.asyncio
+    async def test_vectorized_evaluation_speedup(self):
+        encoding = ParameterEncoding(PARAMETER_SPACE)
+        parameters = encoding.sample(10_000, np.random.default_rng(0))
+
+        start = time.perf_counter()
+        _expected(parameters, encoding)
+        serial = time.perf_counter() - start
+
+        start = time.perf_counter()
+        await VectorizedBackend(batch_objectives()).evaluate(parameters, encoding, OBJECTIVES)
+        vectorized = time.perf_counter() - start
+
+        print(f"\nEvaluated 10,000 solutions: per-solution {serial * 1000:.1f}ms, "
+              f"vectorized {vectorized * 1000:.1f}ms ({serial / vectorized:.0f}x)")
+        assert vectorized < serial
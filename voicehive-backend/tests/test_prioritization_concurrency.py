@@ -0,0 +1,160 @@
+"""
+Test Suite for concurrent prioritization scoring
+Tests batched reasoning, content-hash caching, deadlines and bounded history
+"""
+import asyncio
+import json
+import re
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from voicehive.domains.agents.services.ml.prioritization_engine import (
+    ImprovementCandidate, ImprovementCategory, PrioritizationEngine
+)
+from voicehive.services.ai.openai_service import OpenAIService
+
+
+def _candidate(index: int, title: str = None) -> ImprovementCandidate:
+    return ImprovementCandidate(
+        id=f"imp-{index}",
+        title=title or f"Improvement {index}",
+        description="Reduce call setup latency",
+        category=ImprovementCategory.PERFORMANCE,
+        estimated_impact=0.7,
+        estimated_effort=0.4,
+        risk_level=0.2,
+        performance_data={"latency_ms": 180.0},
+        timestamp=datetime.now(),
+        source_agent="feedback_agent"
+    )
+
+
+def _batch_reply(prompt: str) -> str:
+    ids = re.findall(r"- id: (\S+) \|", prompt)
+    if not ids:
+        return json.dumps({"score": 0.9, "reasoning": "single"})
+    return json.dumps({"results": [{"id": i, "score": 0.9, "reasoning": f"batched {i}"} for i in ids]})
+
+
+class TestConcurrentPrioritization:
+    """Test batched, cached and deadline-aware reasoning"""
+
+    @pytest.fixture
+    def openai_service(self):
+        service = Mock(spec=OpenAIService)
+        active = {"now": 0, "peak": 0}
+
+        async def reply(system_prompt, conversation_history):
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            await asyncio.sleep(0.05)
+            active["now"] -= 1
+            return _batch_reply(conversation_history[0]["content"])
+
+        service.generate_response = AsyncMock(side_effect=reply)
+        service.active = active
+        return service
+
+    @pytest.fixture
+    def engine(self, openai_service):
+        return PrioritizationEngine(project_id="test-project", openai_service=openai_service)
+
+    @pytest.mark.asyncio
+    async def test_candidates_batched_with_bounded_concurrency(self, engine, openai_service):
+        candidates = [_candidate(i) for i in range(50)]
+
+        start = time.perf_counter()
+        results = await engine.prioritize_improvements(candidates)
+        elapsed = time.perf_counter() - start
+
+        assert len(results) == 50
+        assert all(result.reasoning.startswith("batched") for result in results)
+        assert openai_service.generate_response.await_count == 10
+        assert openai_service.active["peak"] == engine.reasoning_concurrency
+        assert elapsed < 50 * 0.05 / 4
+
+    @pytest.mark.asyncio
+    async def test_recurring_content_reasoned_once(self, engine, openai_service):
+        repeated = [_candidate(i, title="Retry failed webhook deliveries") for i in range(6)]
+
+        await engine.prioritize_improvements(repeated)
+        assert openai_service.generate_response.await_count == 1
+        assert engine.reasoning_stats["deduplicated"] == 5
+
+        later = [_candidate(100 + i, title="Retry failed webhook deliveries") for i in range(3)]
+        results = await engine.prioritize_improvements(later)
+
+        assert openai_service.generate_response.await_count == 1
+        assert engine.reasoning_stats["cache_hits"] == 3
+        assert {result.reasoning_score for result in results} == {0.9}
+
+    @pytest.mark.asyncio
+    async def test_unstructured_batch_reply_retried_per_candidate(self, engine, openai_service):
+        openai_service.generate_response.side_effect = None
+        openai_service.generate_response.return_value = json.dumps({"score": 0.7, "reasoning": "ok"})
+
+        results = await engine.prioritize_improvements([_candidate(1), _candidate(2)])
+
+        assert openai_service.generate_response.await_count == 3
+        assert all(result.reasoning == "ok" for result in results)
+
+    @pytest.mark.asyncio
+    async def test_deadline_falls_back_to_ml_score(self, engine, openai_service):
+        async def slow_reply(system_prompt, conversation_history):
+            await asyncio.sleep(1.0)
+            return _batch_reply(conversation_history[0]["content"])
+        openai_service.generate_response.side_effect = slow_reply
+
+        start = time.perf_counter()
+        results = await engine.prioritize_improvements([_candidate(i) for i in range(8)], deadline_seconds=0.1)
+
+        assert time.perf_counter() - start < 0.5
+        assert len(results) == 8
+        assert all(result.reasoning_score == result.ml_score for result in results)
+        assert all(result.confidence <= 0.5 for result in results)
+        assert engine.reasoning_stats["deadline_fallbacks"] == 8
+        assert not engine._reasoning_cache
+
+    @pytest.mark.asyncio
+    async def test_deadline_holds_with_blocking_client(self):
+        def blocking_create(**kwargs):
+            time.sleep(0.5)
+            content = _batch_reply(kwargs["messages"][-1]["content"])
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=None)
+
+        with patch("voicehive.services.ai.openai_service.OpenAI") as mock_openai:
+            mock_openai.return_value.chat.completions.create = Mock(side_effect=blocking_create)
+            engine = PrioritizationEngine(project_id="test-project", openai_service=OpenAIService())
+
+            start = time.perf_counter()
+            results = await engine.prioritize_improvements([_candidate(i) for i in range(8)], deadline_seconds=0.1)
+            elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.4
+        assert len(results) == 8
+        assert engine.reasoning_stats["deadline_fallbacks"] == 8
+
+    @pytest.mark.asyncio
+    async def test_reasoning_errors_are_not_deadline_fallbacks(self, engine, openai_service):
+        openai_service.generate_response.side_effect = RuntimeError("rate limited")
+
+        results = await engine.prioritize_improvements([_candidate(i) for i in range(3)], deadline_seconds=5.0)
+
+        assert all(result.reasoning_score == 0.5 for result in results)
+        assert all(result.reasoning == "Fallback reasoning: Reduce call setup latency" for result in results)
+        assert engine.reasoning_stats["reasoning_errors"] == 3
+        assert engine.reasoning_stats["deadline_fallbacks"] == 0
+        assert not engine._reasoning_cache
+
+    @pytest.mark.asyncio
+    async def test_history_is_bounded(self, engine):
+        engine.prioritization_history = engine.prioritization_history.__class__(maxlen=5)
+
+        await engine.prioritize_improvements([_candidate(i) for i in range(12)])
+
+        assert len(engine.prioritization_history) == 5
+        assert engine.get_prioritization_statistics()["total_prioritizations"] == 5
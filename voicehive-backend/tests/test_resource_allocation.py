@@ -0,0 +1,309 @@
+"""
+Test Suite for the pending-request queue, batch allocation solver and allocation lifecycle
+Tests queue ordering and removal by id, solver optimality and feasibility, allocator wiring,
+expiry enforcement, incremental totals and the columnar ledger
+"""
+import asyncio
+import itertools
+import random
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from voicehive.domains.agents.services.ml.resource_allocator import (
+    AllocationLedger, AllocationRequest, AllocationStrategy, ResourceAllocation, ResourceAllocator,
+    ResourceStatus, ResourceType
+)
+from voicehive.utils.priority_queue import KeyedPriorityQueue
+
+TYPES = [ResourceType.COMPUTE_INSTANCE, ResourceType.AI_MODEL_CAPACITY,
+         ResourceType.MEMORY_ALLOCATION, ResourceType.AGENT_WORKERS]
+
+
+def _request(request_id, resource_type=ResourceType.COMPUTE_INSTANCE, amount=1.0, priority=3, deadline=None):
+    return AllocationRequest(
+        id=str(request_id), requesting_agent="agent", resource_type=resource_type, requested_amount=amount,
+        priority=priority, duration_hours=None, justification="", timestamp=datetime.now(), deadline=deadline
+    )
+
+
+def _random_requests(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [_request(i, rng.choice(TYPES), rng.choice([0.5, 1, 2, 4, 8, 16, 50]), rng.randint(1, 5))
+            for i in range(count)]
+
+
+def _allocator(capacity: float, budget: float = 1000.0) -> ResourceAllocator:
+    allocator = ResourceAllocator(project_id="test-project")
+    optimizer = allocator.resource_optimizer
+    for spec in optimizer.resource_specs.values():
+        spec.capacity = capacity
+        spec.scaling_limits = (1.0, capacity)
+    optimizer.budget_limit_per_hour = budget
+    return allocator
+
+
+class TestKeyedPriorityQueue:
+    """Test heap order and removal by key"""
+
+    def _queue(self):
+        return KeyedPriorityQueue(key=lambda r: r.id, priority=lambda r: (r.priority, r.deadline or datetime.max))
+
+    def test_priority_then_deadline_order(self):
+        queue = self._queue()
+        soon = datetime.now() + timedelta(minutes=5)
+        for request in [_request("a", priority=3), _request("b", priority=1), _request("c", priority=3, deadline=soon)]:
+            queue.push(request)
+
+        assert [r.id for r in queue.ordered()] == ["b", "c", "a"]
+        assert queue.peek().id == "b"
+        assert [queue.pop().id for _ in range(3)] == ["b", "c", "a"]
+        assert queue.pop() is None
+
+    def test_remove_and_replace_by_key(self):
+        queue = self._queue()
+        for i in range(5):
+            queue.push(_request(i, priority=5 - i))
+
+        assert queue.remove("4").id == "4"
+        assert queue.remove("4") is None
+        queue.push(_request("0", priority=1))
+
+        assert len(queue) == 4 and "4" not in queue
+        assert [r.id for r in queue.ordered()] == ["0", "3", "2", "1"]
+        assert [r.id for r in queue] == ["0", "1", "2", "3"]
+
+    def test_stale_entries_are_compacted(self):
+        queue = self._queue()
+        for i in range(10_000):
+            queue.push(_request(i))
+        for i in range(9_990):
+            queue.remove(str(i))
+
+        assert len(queue) == 10
+        assert queue.heap_size() <= 2 * len(queue) + 64
+
+
+class TestBatchSolver:
+    """Test the knapsack / LP relaxation solver"""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_exhaustive_search_and_respects_constraints(self, seed):
+        allocator = _allocator(capacity=20.0, budget=1.0)
+        optimizer = allocator.resource_optimizer
+        requests = _random_requests(12, seed)
+        metrics = asyncio.run(allocator._get_current_metrics())
+
+        selected = optimizer.solve_batch(requests, metrics)
+
+        def value(chosen):
+            return sum(optimizer.priority_weights[requests[i].priority] for i in chosen)
+
+        def feasible(chosen):
+            used = {rt: sum(requests[i].requested_amount for i in chosen if requests[i].resource_type == rt)
+                    for rt in TYPES}
+            cost = sum(requests[i].requested_amount * optimizer.resource_specs[requests[i].resource_type].cost_per_unit
+                       for i in chosen)
+            return all(amount <= 20.0 for amount in used.values()) and cost <= 1.0 + 1e-9
+
+        best = max(value(chosen) for size in range(13) for chosen in itertools.combinations(range(12), size)
+                   if feasible(chosen))
+        assert feasible(selected)
+        assert optimizer.last_solution["lp_bound"] >= best - 1e-9
+        assert value(selected) >= 0.8 * best
+
+    def test_selection_is_in_priority_order(self):
+        allocator = _allocator(capacity=1000.0)
+        requests = _random_requests(200)
+        metrics = asyncio.run(allocator._get_current_metrics())
+
+        selected = allocator.resource_optimizer.solve_batch(requests, metrics)
+
+        assert len(selected) == 200
+        assert [requests[i].priority for i in selected] == sorted(r.priority for r in requests)
+
+
+class TestAllocatorQueue:
+    """Test the allocator's use of the queue and solver"""
+
+    @pytest.mark.asyncio
+    async def test_optimization_allocates_within_capacity(self):
+        allocator = _allocator(capacity=10.0)
+        for i in range(30):
+            await allocator.request_resources("agent", ResourceType.COMPUTE_INSTANCE, 1.0, priority=3 + i % 3)
+
+        result = await allocator.optimize_allocations()
+
+        solution = allocator.get_allocation_statistics()["solver"]
+        assert result["new_allocations"] == 10 and len(allocator.active_allocations) == 10
+        assert solution["allocated"] == 10 and solution["cost_per_hour"] == pytest.approx(10 * 0.05)
+        assert len(allocator.pending_requests) == 20
+        assert all(a.metadata["request_id"] not in allocator.pending_requests
+                   for a in allocator.active_allocations.values())
+        # The highest pending priority level fills the capacity
+        assert all(a.metadata["priority"] == 3 for a in allocator.active_allocations.values())
+
+
+def _allocation(allocation_id, amount=2.0, hours_ago=1.0, expires_in=None, resource_type=ResourceType.COMPUTE_INSTANCE):
+    now = datetime.now()
+    return ResourceAllocation(
+        id=str(allocation_id), resource_type=resource_type, allocated_amount=amount, target_agent="agent",
+        allocation_time=now - timedelta(hours=hours_ago),
+        expiry_time=now + timedelta(seconds=expires_in) if expires_in is not None else None,
+        status=ResourceStatus.ALLOCATED, cost=amount * 0.05
+    )
+
+
+class TestAllocationLifecycle:
+    """Test expiry enforcement, incremental totals and the ledger"""
+
+    @pytest.mark.asyncio
+    async def test_timer_releases_expired_allocations(self):
+        allocator = ResourceAllocator(project_id="test-project")
+        for i in range(3):
+            allocator._activate(_allocation(i, expires_in=0.05 * (i + 1)))
+        allocator._activate(_allocation("long-lived"))
+
+        await asyncio.sleep(0.3)
+
+        assert list(allocator.active_allocations) == ["long-lived"]
+        assert allocator.lifecycle_stats["expired"] == 3
+        assert allocator.total_cost_per_hour == pytest.approx(0.1)
+        assert allocator._expiry_timer is None
+
+    def test_expired_allocations_swept_without_event_loop(self):
+        allocator = ResourceAllocator(project_id="test-project")
+        allocator._activate(_allocation("a", expires_in=-1))
+        allocator._activate(_allocation("b", expires_in=3600))
+
+        stats = allocator.get_allocation_statistics()
+
+        assert stats["active_allocations"] == 1 and stats["expired_allocations"] == 1
+        assert stats["scheduled_expiries"] == 1
+        assert allocator.release_expired(now=time.time() + 7200) == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_totals_track_transitions(self):
+        allocator = ResourceAllocator(project_id="test-project")
+        for i in range(6):
+            await allocator.request_resources("agent", TYPES[i % 4], 1.0 + i, priority=1)
+        allocator.release_allocation(next(iter(allocator.active_allocations)))
+        await allocator.optimize_allocations(AllocationStrategy.BALANCED)
+
+        for resource_type, totals in allocator.active_totals.items():
+            active = [a for a in allocator.active_allocations.values() if a.resource_type == resource_type]
+            assert totals["count"] == len(active)
+            assert totals["cost_per_hour"] == pytest.approx(sum(a.cost for a in active))
+            assert totals["allocated_amount"] == pytest.approx(
+                sum(a.allocated_amount for a in active if a.status == ResourceStatus.ALLOCATED))
+        assert allocator.lifecycle_stats == {"allocated": 6, "released": 1, "expired": 0}
+
+    def test_usage_report_from_ledger(self):
+        allocator = ResourceAllocator(project_id="test-project")
+        allocator._activate(_allocation("old", amount=4.0, hours_ago=30))
+        allocator._activate(_allocation("recent", amount=2.0, hours_ago=2))
+        allocator._activate(_allocation("memory", amount=8.0, resource_type=ResourceType.MEMORY_ALLOCATION))
+        allocator.release_allocation("old")
+        allocator.release_allocation("recent")
+
+        report = allocator.get_usage_report(window_hours=24)
+        compute = report["released"]["compute_instance"]
+
+        assert compute["allocations"] == 2
+        assert compute["unit_hours"] == pytest.approx(4.0 * 24 + 2.0 * 2, rel=1e-3)
+        assert compute["cost"] == pytest.approx(0.2 * 24 + 0.1 * 2, rel=1e-3)
+        assert report["active"]["memory_allocation"]["count"] == 1
+
+    def test_ledger_ring_keeps_latest_records(self):
+        ledger = AllocationLedger(capacity=3)
+        for i in range(5):
+            ledger.append(_allocation(i, amount=float(i + 1)), time.time(), expired=i % 2 == 0)
+
+        assert len(ledger) == 3 and ledger.total == 5
+        assert sorted(ledger.amount) == [3.0, 4.0, 5.0]
+        assert ledger.usage()["compute_instance"]["expired"] == 2
+
+
+@pytest.mark.performance
+class TestAllocationBenchmark:
+    """Benchmark queue operations and one optimization pass with 100k pending requests"""
+
+    def test_100k_pending_requests(self):
+        count = 100_000
+        requests = _random_requests(count)
+        allocator = ResourceAllocator(project_id="test-project")
+        metrics = asyncio.run(allocator._get_current_metrics())
+        optimizer = allocator.resource_optimizer
+
+        start = time.perf_counter()
+        for request in requests:
+            allocator.pending_requests.push(request)
+        push_us = (time.perf_counter() - start) / count * 1e6
+
+        start = time.perf_counter()
+        selected = optimizer.solve_batch(list(allocator.pending_requests), metrics)
+        solve_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        for index in selected:
+            allocator.pending_requests.remove(requests[index].id)
+        remove_us = (time.perf_counter() - start) / len(selected) * 1e6
+
+        # Former pass: full re-sort, then list.remove per fulfilled request
+        pending = list(requests)
+        start = time.perf_counter()
+        ordered = sorted(pending, key=lambda r: (r.priority, r.deadline or datetime.max))
+        for request in ordered[:1000]:
+            pending.remove(request)
+        list_remove_us = (time.perf_counter() - start) / 1000 * 1e6
+
+        # Capacity-aware greedy in priority order, for solution quality
+        remaining = {rt: max(optimizer.resource_specs[rt].scaling_limits[1], metrics[rt].total_capacity) for rt in TYPES}
+        greedy = 0.0
+        for request in ordered:
+            if request.requested_amount <= remaining[request.resource_type]:
+                remaining[request.resource_type] -= request.requested_amount
+                greedy += optimizer.priority_weights[request.priority]
+
+        solution = optimizer.last_solution
+        print(f"\n{count} pending: push {push_us:.2f} us, remove-by-id {remove_us:.2f} us "
+              f"(list.remove {list_remove_us:.0f} us); solve {solve_ms:.0f} ms for {solution['allocated']} allocations; "
+              f"objective {solution['objective']:.0f} vs priority-order greedy {greedy:.0f} "
+              f"(LP bound {solution['lp_bound']:.0f})")
+        assert len(allocator.pending_requests) == count - len(selected)
+        assert solution["objective"] >= greedy
+        assert remove_us < list_remove_us / 10
+
+    def test_statistics_and_expiry_with_50k_active_allocations(self):
+        count = 50_000
+        allocator = ResourceAllocator(project_id="test-project")
+        for i in range(count):
+            allocator._activate(_allocation(i, expires_in=3600 + i))
+
+        start = time.perf_counter()
+        for _ in range(100):
+            allocator.get_allocation_statistics()
+            asyncio.run(allocator._get_current_metrics())
+        aggregate_us = (time.perf_counter() - start) / 100 * 1e6
+
+        # Former reads: one pass over every allocation per total and per resource type
+        start = time.perf_counter()
+        for _ in range(5):
+            sum(a.cost for a in allocator.active_allocations.values())
+            for resource_type in allocator.resource_optimizer.resource_specs:
+                sum(a.allocated_amount for a in allocator.active_allocations.values()
+                    if a.resource_type == resource_type and a.status == ResourceStatus.ALLOCATED)
+        scan_us = (time.perf_counter() - start) / 5 * 1e6
+
+        start = time.perf_counter()
+        released = allocator.release_expired(now=time.time() + 3600 + count / 2)
+        sweep_us = (time.perf_counter() - start) / len(released) * 1e6
+
+        start = time.perf_counter()
+        allocator.get_usage_report(window_hours=None)
+        report_ms = (time.perf_counter() - start) * 1000
+
+        print(f"\n{count} active allocations: statistics + metrics {aggregate_us:.0f} us vs object scan {scan_us:.0f} us; "
+              f"expiry release {sweep_us:.1f} us per allocation; ledger report over {len(released)} records {report_ms:.1f} ms")
+        assert aggregate_us < scan_us / 10
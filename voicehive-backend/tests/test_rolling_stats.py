@@ -0,0 +1,135 @@
+"""
+Test Suite for incremental rolling statistics in the anomaly detector
+Tests O(1) window statistics, the vectorized batch pass and ingestion throughput
+"""
+import statistics
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from voicehive.domains.agents.services.ml.anomaly_detector import MetricDataPoint, StatisticalAnalyzer
+from voicehive.domains.agents.services.ml.rolling_stats import RollingWindowStats, rolling_batch_stats
+
+
+def _reference_trend(values):
+    if len(values) < 2:
+        return 0.0
+    return float(np.polyfit(np.arange(len(values)), values, 1)[0])
+
+
+def _points(values, start=None):
+    start = start or datetime(2026, 1, 1)
+    return [MetricDataPoint(timestamp=start + timedelta(minutes=i), value=float(v)) for i, v in enumerate(values)]
+
+
+class TestRollingWindowStats:
+    """Test incremental window statistics against direct computation"""
+
+    @pytest.mark.parametrize("window_size", [1, 2, 10, 100])
+    def test_matches_direct_computation(self, window_size):
+        rolling = RollingWindowStats(window_size=window_size, trend_window=20)
+        values = np.random.default_rng(window_size).normal(100, 15, 500)
+        values[::37] = 100.0  # repeated values exercise median and min/max ties
+
+        for index, value in enumerate(values):
+            rolling.add(value)
+            window = values[max(0, index - window_size + 1):index + 1]
+            assert rolling.mean == pytest.approx(statistics.mean(window))
+            assert rolling.std == pytest.approx(statistics.stdev(window) if len(window) > 1 else 0.0, abs=1e-9)
+            assert rolling.median == statistics.median(window)
+            assert rolling.minimum == window.min()
+            assert rolling.maximum == window.max()
+            assert rolling.trend == pytest.approx(_reference_trend(window[-20:]), abs=1e-9)
+
+    def test_long_streams_do_not_drift(self):
+        rolling = RollingWindowStats(window_size=50)
+        values = np.random.default_rng(0).normal(1e6, 1.0, 30_000)
+        for value in values:
+            rolling.add(value)
+
+        assert rolling.mean == pytest.approx(values[-50:].mean(), rel=1e-12)
+        assert rolling.std == pytest.approx(values[-50:].std(ddof=1), rel=1e-6)
+
+    def test_batch_pass_matches_incremental(self):
+        values = np.random.default_rng(1).normal(50, 5, 400)
+        rolling = RollingWindowStats(window_size=100)
+        for value in values[:60]:
+            rolling.add(value)
+
+        mean, std, trend, counts = rolling_batch_stats(values[:60], values[60:], 100, 20)
+
+        for offset, value in enumerate(values[60:]):
+            rolling.add(value)
+            assert mean[offset] == pytest.approx(rolling.mean)
+            assert std[offset] == pytest.approx(rolling.std)
+            assert trend[offset] == pytest.approx(rolling.trend, abs=1e-9)
+            assert counts[offset] == len(rolling)
+
+
+class TestStatisticalAnalyzerBatch:
+    """Test batch ingestion in the statistical analyzer"""
+
+    def test_batch_detection_matches_point_by_point(self):
+        values = np.random.default_rng(2).normal(100, 10, 300)
+        values[[30, 120, 121, 250]] = [220, 10, 260, 190]
+        points = _points(values)
+
+        sequential = StatisticalAnalyzer(sensitivity=2.0)
+        expected = []
+        for point in points:
+            sequential.add_data_point("response_time_ms", point)
+            anomaly = sequential.detect_anomalies("response_time_ms", point)
+            if anomaly:
+                expected.append(anomaly)
+
+        batched = StatisticalAnalyzer(sensitivity=2.0)
+        detected = batched.add_data_points("response_time_ms", points[:150])
+        detected += batched.add_data_points("response_time_ms", points[150:])
+
+        assert [a.value for a in detected] == [a.value for a in expected]
+        assert [a.severity for a in detected] == [a.severity for a in expected]
+        for actual, reference in zip(detected, expected):
+            assert actual.deviation_score == pytest.approx(reference.deviation_score)
+        for key, value in sequential.baseline_stats["response_time_ms"].items():
+            assert batched.baseline_stats["response_time_ms"][key] == pytest.approx(value)
+
+    def test_no_baseline_before_minimum_points(self):
+        analyzer = StatisticalAnalyzer()
+
+        assert analyzer.add_data_points("cpu_usage", _points([1, 1, 1, 1, 1, 1, 1, 1, 50])) == []
+        assert "cpu_usage" not in analyzer.baseline_stats
+
+
+@pytest.mark.performance
+class TestRollingStatsBenchmark:
+    """Benchmark ingestion throughput across many concurrent metrics"""
+
+    def test_points_per_second_across_10k_metrics(self):
+        metric_count, points_per_metric = 10_000, 120
+        values = np.random.default_rng(0).normal(100, 10, (points_per_metric, metric_count))
+        start_time = datetime(2026, 1, 1)
+
+        analyzer = StatisticalAnalyzer()
+        names = [f"metric_{i}" for i in range(metric_count)]
+        start = time.perf_counter()
+        for step in range(20):
+            timestamp = start_time + timedelta(seconds=step)
+            for name, value in zip(names, values[step].tolist()):
+                point = MetricDataPoint(timestamp=timestamp, value=value)
+                analyzer.add_data_point(name, point)
+                analyzer.detect_anomalies(name, point)
+        incremental_rate = 20 * metric_count / (time.perf_counter() - start)
+
+        batched = StatisticalAnalyzer()
+        series = {name: _points(values[:, i], start_time) for i, name in enumerate(names)}
+        start = time.perf_counter()
+        for name, points in series.items():
+            batched.add_data_points(name, points)
+        batch_rate = points_per_metric * metric_count / (time.perf_counter() - start)
+
+        print(f"\n10,000 metrics: per-point {incremental_rate:,.0f} points/s, "
+              f"batched {batch_rate:,.0f} points/s")
+        assert incremental_rate > 20_000
+        assert batch_rate > incremental_rate
@@ -0,0 +1,213 @@
+"""
+Test Suite for compiled safety-constraint evaluation
+Tests the expression compiler, decision-type indexing, batch checks and evaluation throughput
+"""
+import random
+import time
+from dataclasses import FrozenInstanceError
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from voicehive.domains.agents.services.autonomy.autonomous_controller import (
+    AutonomousController, DecisionContext, DecisionType, SafetyConstraint
+)
+from voicehive.services.ai.openai_service import OpenAIService
+from voicehive.utils.expressions import compile_expression
+
+
+def _controller() -> AutonomousController:
+    return AutonomousController(Mock(spec=OpenAIService))
+
+
+def _contexts(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    types = list(DecisionType)
+    return [
+        DecisionContext(decision_id=f"d{i}", decision_type=rng.choice(types), description="", data={},
+                        urgency=rng.randint(1, 10), impact=rng.randint(1, 10), risk_level=rng.randint(1, 10))
+        for i in range(count)
+    ]
+
+
+class TestExpressionCompiler:
+    """Test validation and evaluation of compiled expressions"""
+
+    def test_overlapping_names_are_distinct(self):
+        expression = compile_expression("impact_score > 5 and impact < 3", ["impact", "impact_score"])
+
+        assert expression.evaluate({"impact": 1, "impact_score": 9})
+        assert not expression.evaluate({"impact": 9, "impact_score": 9})
+        assert expression.names == {"impact", "impact_score"}
+
+    @pytest.mark.parametrize("source", [
+        "__import__('os').system('true')",
+        "risk_level.__class__",
+        "[x for x in (1, 2)]",
+        "unknown > 1",
+        "risk_level in risk_level",
+        "lambda: 1",
+        "risk_level >"
+    ])
+    def test_unsafe_or_invalid_expressions_rejected(self, source):
+        with pytest.raises(ValueError):
+            compile_expression(source, ["risk_level"])
+
+    def test_scalar_and_batch_agree(self):
+        expression = compile_expression(
+            "not (1 < risk_level <= 7) or decision_type in ('safety', 'emergency') and urgency * 2 - impact > 4",
+            ["risk_level", "decision_type", "urgency", "impact"]
+        )
+        rng = np.random.default_rng(3)
+        columns = {
+            "risk_level": rng.integers(1, 11, 500), "urgency": rng.integers(1, 11, 500),
+            "impact": rng.integers(1, 11, 500), "decision_type": rng.choice(["safety", "strategic", "emergency"], 500)
+        }
+
+        batch = expression.evaluate_batch(columns, 500)
+
+        expected = [expression.evaluate({name: column[i] for name, column in columns.items()}) for i in range(500)]
+        assert batch.tolist() == expected
+
+    def test_zero_division_rows_do_not_match(self):
+        expression = compile_expression(
+            "urgency == 5 or impact / (urgency - 5) > 1 and 0 < impact % risk_level < 3",
+            ["urgency", "impact", "risk_level"]
+        )
+        rng = np.random.default_rng(5)
+        columns = {name: rng.integers(0, 11, 500).astype(float) for name in ("urgency", "impact", "risk_level")}
+
+        batch = expression.evaluate_batch(columns, 500)
+
+        expected = []
+        for i in range(500):
+            try:
+                expected.append(expression.evaluate({name: column[i].item() for name, column in columns.items()}))
+            except ZeroDivisionError:
+                expected.append(False)
+        assert batch.tolist() == expected
+        assert batch[columns["urgency"] == 5].all()
+
+    def test_allowed_values(self):
+        variables = ["decision_type", "impact"]
+
+        assert compile_expression("decision_type == 'a' and impact > 5", variables).allowed_values(
+            "decision_type") == {"a"}
+        assert compile_expression("decision_type in ('a', 'b') or decision_type == 'c'", variables).allowed_values(
+            "decision_type") == {"a", "b", "c"}
+        assert compile_expression("decision_type == 'a' or impact > 5", variables).allowed_values(
+            "decision_type") is None
+
+
+class TestConstraintIndex:
+    """Test that only constraints relevant to a decision type are evaluated"""
+
+    def test_index_by_decision_type(self):
+        controller = _controller()
+
+        indexed = {decision_type: [constraint.name for constraint, _ in controller._constraints_for(decision_type)]
+                   for decision_type in DecisionType}
+
+        assert indexed[DecisionType.OPERATIONAL] == ["high_risk_operations"]
+        assert indexed[DecisionType.STRATEGIC] == ["high_risk_operations", "strategic_decisions"]
+        assert indexed[DecisionType.EMERGENCY] == ["high_risk_operations", "emergency_override"]
+
+    def test_constraints_added_later_are_indexed(self):
+        controller = _controller()
+        controller.add_safety_constraint(SafetyConstraint(
+            name="ops_impact", condition="decision_type == 'operational' and impact >= 9", max_risk_level=5
+        ))
+        controller.add_safety_constraint(SafetyConstraint(
+            name="added", condition="urgency == 1", max_risk_level=5
+        ))
+        context = DecisionContext(decision_id="d", decision_type=DecisionType.OPERATIONAL, description="",
+                                  data={}, urgency=2, impact=9, risk_level=2)
+
+        assert controller._check_safety_constraints(context)["constraint"] == "ops_impact"
+        assert [c.name for c, _ in controller._constraints_for(DecisionType.SAFETY)][-1] == "added"
+
+    def test_replaced_constraint_is_reindexed(self):
+        controller = _controller()
+
+        assert controller.remove_safety_constraint("strategic_decisions")
+        controller.add_safety_constraint(SafetyConstraint(
+            name="strategic_decisions", condition="decision_type == 'safety'", max_risk_level=3
+        ))
+
+        assert [c.name for c, _ in controller._constraints_for(DecisionType.STRATEGIC)] == ["high_risk_operations"]
+        assert [c.name for c, _ in controller._constraints_for(DecisionType.SAFETY)][-1] == "strategic_decisions"
+        assert not controller.remove_safety_constraint("missing")
+
+    def test_constraints_cannot_be_changed_behind_the_index(self):
+        controller = _controller()
+        constraint = controller.safety_constraints[0]
+
+        with pytest.raises(FrozenInstanceError):
+            constraint.condition = "risk_level > 1"
+        with pytest.raises(AttributeError):
+            controller.safety_constraints.append(constraint)
+
+    def test_invalid_condition_rejected_on_add(self):
+        controller = _controller()
+
+        with pytest.raises(ValueError):
+            controller.add_safety_constraint(SafetyConstraint(
+                name="bad", condition="open('/etc/passwd')", max_risk_level=5
+            ))
+        assert all(constraint.name != "bad" for constraint in controller.safety_constraints)
+
+    def test_batch_matches_single_checks(self):
+        controller = _controller()
+        controller.add_safety_constraint(SafetyConstraint(
+            name="optimization_cap", condition="decision_type == 'optimization' and urgency + impact > 12",
+            max_risk_level=4, requires_human_approval=False
+        ))
+        controller.add_safety_constraint(SafetyConstraint(
+            name="impact_ratio", condition="impact / (urgency - 5) > 1", max_risk_level=6,
+            requires_human_approval=False
+        ))
+        contexts = _contexts(2000)
+
+        batch = controller.check_safety_constraints_batch(contexts)
+
+        assert batch == [controller._check_safety_constraints(context) for context in contexts]
+        assert any(result["allowed"] for result in batch) and not all(result["allowed"] for result in batch)
+
+
+@pytest.mark.performance
+class TestConstraintBenchmark:
+    """Compare string-substitution eval with compiled and batched evaluation"""
+
+    def test_evaluations_per_second(self):
+        controller = _controller()
+        contexts = _contexts(5000)
+        evaluations = sum(len(controller.safety_constraints) for _ in contexts)
+
+        def substituted_eval(constraint, context):
+            condition = constraint.condition
+            condition = condition.replace("risk_level", str(context.risk_level))
+            condition = condition.replace("impact", str(context.impact))
+            condition = condition.replace("urgency", str(context.urgency))
+            condition = condition.replace("decision_type", f"'{context.decision_type.value}'")
+            return eval(condition)
+
+        start = time.perf_counter()
+        for context in contexts:
+            for constraint in controller.safety_constraints:
+                substituted_eval(constraint, context)
+        eval_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        single = [controller._check_safety_constraints(context) for context in contexts]
+        compiled_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch = controller.check_safety_constraints_batch(contexts)
+        batch_s = time.perf_counter() - start
+
+        print(f"\n{len(contexts)} decisions x {len(controller.safety_constraints)} constraints: "
+              f"eval {evaluations / eval_s:,.0f} evals/s, compiled+indexed {evaluations / compiled_s:,.0f}/s "
+              f"({eval_s / compiled_s:.0f}x), batch {evaluations / batch_s:,.0f}/s ({eval_s / batch_s:.0f}x)")
+        assert batch == single
+        assert compiled_s < eval_s / 10
@@ -0,0 +1,134 @@
+"""
+Test Suite for the per-request stage profiler
+Tests stage timing, per-stage histograms and the sampling profiler
+"""
+import asyncio
+import time
+
+import pytest
+
+from voicehive.utils.profiling import StageProfiler, current_profile
+
+
+def _busy_wait(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestStageProfiler:
+    """Test contextvar-based stage timing"""
+
+    @pytest.fixture
+    def profiler(self):
+        return StageProfiler(slowest_n=3)
+
+    def test_stage_outside_request_is_noop(self, profiler):
+        with profiler.stage("parse_json"):
+            pass
+
+        assert current_profile() is None
+        assert profiler.get_stage_summary() == {}
+
+    def test_records_named_and_nested_stages(self, profiler):
+        with profiler.profile_request("vapi_webhook") as profile:
+            with profiler.stage("validate"):
+                _busy_wait(0.002)
+            with profiler.stage("dispatch"):
+                with profiler.stage("llm"):
+                    _busy_wait(0.002)
+
+        assert set(profile.stages) == {"validate", "dispatch", "dispatch/llm"}
+        assert profile.stages["dispatch"] >= profile.stages["dispatch/llm"]
+
+        summary = profiler.get_stage_summary()["vapi_webhook"]
+        assert {"total", "validate", "dispatch", "dispatch/llm"} <= set(summary)
+        assert summary["validate"]["count"] == 1
+        assert summary["validate"]["p50"] >= 1.0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_isolated(self, profiler):
+        async def handle(delay: float):
+            with profiler.profile_request("vapi_webhook") as profile:
+                with profiler.stage("llm"):
+                    await asyncio.sleep(delay)
+                return profile
+
+        profiles = await asyncio.gather(handle(0.01), handle(0.03))
+
+        assert all(list(profile.stages) == ["llm"] for profile in profiles)
+        assert profiles[1].stages["llm"] > profiles[0].stages["llm"]
+
+    def test_keeps_slowest_requests(self, profiler):
+        for delay in (0.001, 0.006, 0.002, 0.004, 0.003):
+            with profiler.profile_request("vapi_webhook"):
+                _busy_wait(delay)
+
+        slowest = profiler.get_slowest_requests()
+
+        assert len(slowest) == 3
+        durations = [request["duration_ms"] for request in slowest]
+        assert durations == sorted(durations, reverse=True)
+        assert durations[-1] >= 3.0
+
+    def test_disabled_profiler(self):
+        profiler = StageProfiler(enabled=False)
+
+        with profiler.profile_request("vapi_webhook") as profile:
+            with profiler.stage("validate"):
+                pass
+
+        assert profile is None
+        assert profiler.requests_profiled == 0
+
+    def test_span_factory_called_per_stage(self, profiler):
+        spans = []
+
+        class FakeSpan:
+            def __init__(self, name):
+                self.name = name
+                self.ended = False
+
+            def end(self):
+                self.ended = True
+
+        def span_factory(name, attributes):
+            spans.append(FakeSpan(name))
+            return spans[-1]
+
+        profiler.set_span_factory(span_factory)
+        with profiler.profile_request("vapi_webhook"):
+            with profiler.stage("validate"):
+                pass
+
+        assert [span.name for span in spans] == ["vapi_webhook.validate"]
+        assert spans[0].ended
+
+
+class TestSamplingProfiler:
+    """Test collapsed-stack sampling of the slowest requests"""
+
+    def test_collapsed_stacks_for_slowest_requests(self, tmp_path):
+        profiler = StageProfiler(sampling_enabled=True, sample_interval_ms=1.0, slowest_n=2)
+
+        def slow_handler():
+            with profiler.profile_request("vapi_webhook"):
+                with profiler.stage("llm"):
+                    _busy_wait(0.05)
+
+        try:
+            slow_handler()
+        finally:
+            profiler.stop_sampler()
+
+        collapsed = profiler.collapsed_stacks()
+        assert collapsed
+        for line in collapsed.splitlines():
+            stack, count = line.rsplit(" ", 1)
+            assert stack.startswith("vapi_webhook;")
+            assert int(count) > 0
+        assert "slow_handler" in collapsed
+
+        output = tmp_path / "slowest.collapsed"
+        assert profiler.dump_collapsed_stacks(str(output)) == len(collapsed.splitlines())
+        assert output.read_text().strip() == collapsed
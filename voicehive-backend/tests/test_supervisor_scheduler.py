@@ -0,0 +1,299 @@
+"""
+Test Suite for the event-driven OperationalSupervisor coordination loop
+Tests heartbeat deadline heaps, queued decisions and conflicts, metric-triggered checks and stage budgets
+"""
+import asyncio
+import statistics
+import time
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import pytest_asyncio
+
+from voicehive.domains.agents.services.monitoring_agent import AgentStatus
+from voicehive.domains.agents.services.operational_supervisor import (
+    AgentConflict, ConflictType, DecisionType, OperationalDecision, OperationalSupervisor
+)
+from voicehive.domains.agents.services.emergency_manager import EmergencySeverity
+from voicehive.domains.agents.services.ml.resource_allocator import ResourceAllocation, ResourceStatus, ResourceType
+from voicehive.domains.communication.services.message_bus import MessageType
+from voicehive.services.ai.openai_service import OpenAIService
+from voicehive.utils.timeseries import TimeSeriesStore
+
+
+def _supervisor() -> OperationalSupervisor:
+    openai_service = Mock(spec=OpenAIService)
+    openai_service.generate_response = AsyncMock(return_value="{}")
+    message_bus = Mock()
+    message_bus.is_running = True
+    message_bus.subscribe = Mock()
+    message_bus.publish = AsyncMock()
+    monitoring_agent = Mock()
+    monitoring_agent.start = AsyncMock()
+    monitoring_agent.stop = AsyncMock()
+    monitoring_agent.register_agent = AsyncMock()
+    monitoring_agent.series_store = TimeSeriesStore()
+    emergency_manager = Mock()
+    emergency_manager.check_emergency_conditions = AsyncMock(return_value=[])
+
+    supervisor = OperationalSupervisor(
+        openai_service=openai_service,
+        message_bus=message_bus,
+        emergency_manager=emergency_manager,
+        monitoring_agent=monitoring_agent,
+        project_id="test-project"
+    )
+    supervisor.decision_engine.request_decision = AsyncMock(return_value="request-1")
+    supervisor.decision_engine.get_decision_status = Mock(return_value=None)
+    supervisor._resolve_agent_conflict = AsyncMock(return_value={"success": True, "strategy": "priority"})
+    supervisor._identify_improvement_triggers = AsyncMock(return_value=[])
+    return supervisor
+
+
+def _decision(index: int, confidence: float = 0.9) -> OperationalDecision:
+    return OperationalDecision(
+        id=f"decision-{index}", type=DecisionType.LOAD_BALANCING, description="Shift calls",
+        timestamp=datetime.now(), affected_agents=["agent-0"], decision_data={}, confidence_score=confidence
+    )
+
+
+def _conflict(index: int) -> AgentConflict:
+    return AgentConflict(
+        id=f"conflict-{index}", type=ConflictType.RESOURCE_CONTENTION, involved_agents=["agent-0", "agent-1"],
+        description="Both agents claim the same line", timestamp=datetime.now(), severity=EmergencySeverity.MEDIUM
+    )
+
+
+def _message(message_type: MessageType, data: dict):
+    message = Mock()
+    message.type = message_type
+    message.data = data
+    return message
+
+
+async def _wait_for(predicate, timeout: float = 1.0) -> float:
+    start = time.perf_counter()
+    while not predicate():
+        if time.perf_counter() - start > timeout:
+            raise AssertionError("condition not reached in time")
+        await asyncio.sleep(0.001)
+    return time.perf_counter() - start
+
+
+async def _register(supervisor: OperationalSupervisor, count: int, prefix: str = "agent"):
+    for i in range(count):
+        await supervisor.register_agent(f"{prefix}-{i}", "voice_agent", ["voice_processing"])
+
+
+class TestHeartbeatDeadlines:
+    """Test the heartbeat timer heap"""
+
+    @pytest.mark.asyncio
+    async def test_only_expired_agents_are_touched(self):
+        supervisor = _supervisor()
+        await _register(supervisor, 1000)
+        supervisor.heartbeat_timeout = 0.01
+        await _register(supervisor, 3, prefix="stale")
+        await asyncio.sleep(0.02)
+
+        await supervisor._monitor_agent_health()
+
+        offline = [a for a, r in supervisor.registered_agents.items() if r.status == AgentStatus.OFFLINE]
+        assert sorted(offline) == ["stale-0", "stale-1", "stale-2"]
+        assert supervisor._heartbeats.heap_size() == 1000
+        assert supervisor.message_bus.publish.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_rearms_deadline_lazily(self):
+        supervisor = _supervisor()
+        supervisor.heartbeat_timeout = 0.05
+        await _register(supervisor, 1)
+        await asyncio.sleep(0.03)
+        await supervisor._handle_message(_message(MessageType.AGENT_HEARTBEAT, {"agent_id": "agent-0"}))
+        await asyncio.sleep(0.03)
+
+        await supervisor._monitor_agent_health()
+
+        assert supervisor.registered_agents["agent-0"].status == AgentStatus.HEALTHY
+        assert supervisor._heartbeats.heap_size() == 1
+
+    @pytest.mark.asyncio
+    async def test_offline_notice_is_not_a_heartbeat(self):
+        supervisor = _supervisor()
+        supervisor.heartbeat_timeout = 0.01
+        await _register(supervisor, 1)
+        await asyncio.sleep(0.02)
+        await supervisor._monitor_agent_health()
+
+        await supervisor._handle_message(
+            _message(MessageType.AGENT_STATUS_UPDATE, {"agent_id": "agent-0", "status": "offline"})
+        )
+        assert supervisor.registered_agents["agent-0"].status == AgentStatus.OFFLINE
+
+        await supervisor._handle_message(
+            _message(MessageType.AGENT_STATUS_UPDATE, {"agent_id": "agent-0", "status": "degraded"})
+        )
+        assert supervisor.registered_agents["agent-0"].status == AgentStatus.DEGRADED
+        assert "agent-0" in supervisor._heartbeats
+
+
+class TestEventDrivenCoordination:
+    """Test that stages run as soon as their events arrive"""
+
+    @pytest_asyncio.fixture
+    async def supervisor(self):
+        supervisor = _supervisor()
+        await supervisor.start()
+        yield supervisor
+        await supervisor.stop()
+
+    @pytest.mark.asyncio
+    async def test_agent_goes_offline_at_its_deadline(self, supervisor):
+        supervisor.heartbeat_timeout = 0.05
+        await _register(supervisor, 1)
+
+        elapsed = await _wait_for(lambda: supervisor.registered_agents["agent-0"].status == AgentStatus.OFFLINE)
+
+        assert 0.04 < elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_decisions_and_conflicts_handled_on_arrival(self, supervisor):
+        supervisor.submit_decision(_decision(1))
+        supervisor.submit_decision(_decision(2, confidence=0.5))
+        supervisor.report_conflict(_conflict(1))
+
+        await _wait_for(lambda: "decision-1" not in supervisor.active_decisions
+                        and "conflict-1" not in supervisor.active_conflicts, timeout=0.2)
+
+        assert supervisor.decision_history[-1].executed
+        # Non-urgent decisions stay pending, as before
+        assert "decision-2" in supervisor.active_decisions
+        assert supervisor.performance_metrics["conflicts_resolved"] == 1
+
+    @pytest.mark.asyncio
+    async def test_metric_event_triggers_emergency_check(self, supervisor):
+        check = supervisor.emergency_manager.check_emergency_conditions
+
+        await supervisor._handle_message(_message(MessageType.PERFORMANCE_METRIC, {"metric_type": "system_overview"}))
+        await _wait_for(lambda: check.await_count == 1, timeout=0.2)
+
+        await supervisor._handle_message(
+            _message(MessageType.EMERGENCY_ALERT, {"event_type": "emergency_resolved"})
+        )
+        await asyncio.sleep(0.05)
+        assert check.await_count == 1
+        supervisor._identify_improvement_triggers.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_metric_bursts_are_coalesced(self, supervisor):
+        release = asyncio.Event()
+        runs = []
+
+        async def slow_check():
+            runs.append(time.perf_counter())
+            await release.wait()
+        supervisor._check_emergencies = slow_check
+
+        for _ in range(50):
+            await supervisor._handle_message(_message(MessageType.PERFORMANCE_METRIC, {}))
+            await asyncio.sleep(0)
+        release.set()
+        await asyncio.sleep(0.05)
+
+        assert len(runs) == 2
+
+    @pytest.mark.asyncio
+    async def test_slow_stage_is_bounded_and_does_not_block_others(self, supervisor):
+        supervisor.stage_budgets["emergencies"] = 0.05
+
+        async def hung_check():
+            await asyncio.sleep(10)
+        supervisor._check_emergencies = hung_check
+
+        supervisor.request_emergency_check()
+        await asyncio.sleep(0.01)
+        supervisor.submit_decision(_decision(1))
+        await _wait_for(lambda: "decision-1" not in supervisor.active_decisions, timeout=0.04)
+
+        await _wait_for(lambda: supervisor.coordination_stats["stage_timeouts"]["emergencies"] == 1)
+        assert supervisor.get_coordination_statistics()["stage_runs"]["decisions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_reconciliation_picks_up_directly_written_work(self, supervisor):
+        supervisor.active_decisions["decision-1"] = _decision(1)
+        supervisor._next_reconcile = 0.0
+        supervisor._wakeup.set()
+
+        await _wait_for(lambda: "decision-1" not in supervisor.active_decisions)
+
+
+class TestShutdown:
+    """Test that stopping the supervisor releases its timers"""
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_allocation_expiry_timer(self):
+        supervisor = _supervisor()
+        await supervisor.start()
+        supervisor.resource_allocator._activate(ResourceAllocation(
+            id="a1", resource_type=ResourceType.COMPUTE_INSTANCE, allocated_amount=1.0, target_agent="agent-0",
+            allocation_time=datetime.now(), expiry_time=datetime.now() + timedelta(hours=1),
+            status=ResourceStatus.ALLOCATED
+        ))
+        timer = supervisor.resource_allocator._expiry_timer
+        assert timer is not None
+
+        await supervisor.stop()
+
+        assert timer.cancelled()
+        assert supervisor.resource_allocator._expiry_timer is None
+
+
+@pytest.mark.performance
+class TestCoordinationBenchmark:
+    """Benchmark idle cost and event-to-action latency with 1,000 agents"""
+
+    @pytest.mark.asyncio
+    async def test_idle_cpu_and_latency_with_1000_agents(self):
+        supervisor = _supervisor()
+        await _register(supervisor, 1000)
+        await supervisor.start()
+        try:
+            await asyncio.sleep(0.05)
+            wakeups = supervisor.coordination_stats["wakeups"]
+            cpu_start, wall_start = time.process_time(), time.perf_counter()
+            await asyncio.sleep(1.0)
+            idle_cpu = (time.process_time() - cpu_start) / (time.perf_counter() - wall_start)
+            idle_wakeups = supervisor.coordination_stats["wakeups"] - wakeups
+
+            # Cost of one pass of the former full-scan health check, paid every second while idle
+            start = time.perf_counter()
+            now = datetime.now()
+            [now - r.last_heartbeat for r in supervisor.registered_agents.values()]
+            scan_ms = (time.perf_counter() - start) * 1000
+
+            decision_latency = []
+            for i in range(20):
+                supervisor.submit_decision(_decision(i))
+                decision_latency.append(
+                    await _wait_for(lambda: f"decision-{i}" not in supervisor.active_decisions)
+                )
+
+            check = supervisor.emergency_manager.check_emergency_conditions
+            metric_latency = []
+            for i in range(20):
+                await supervisor._handle_message(_message(MessageType.PERFORMANCE_METRIC, {}))
+                metric_latency.append(await _wait_for(lambda: check.await_count == i + 1))
+                await asyncio.sleep(0.005)
+        finally:
+            await supervisor.stop()
+
+        decision_ms = statistics.median(decision_latency) * 1000
+        metric_ms = statistics.median(metric_latency) * 1000
+        print(f"\n1,000 agents idle: {idle_wakeups} wakeups/s, {idle_cpu * 100:.2f}% CPU "
+              f"(1 s polling: 1 wakeup/s plus a {scan_ms:.2f} ms health scan); "
+              f"event-to-action p50: decision {decision_ms:.2f} ms, metric->emergency check {metric_ms:.2f} ms "
+              f"(polling: up to 1000 ms)")
+        assert idle_wakeups == 0
+        assert decision_ms < 50
+        assert metric_ms < 100
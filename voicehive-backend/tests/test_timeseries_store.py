@@ -0,0 +1,147 @@
+"""
+Test Suite for the shared columnar time-series store
+Tests interned tags, window views, monitoring history and memory footprint
+"""
+import tracemalloc
+from collections import deque
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pytest
+
+from voicehive.domains.agents.services.ml.anomaly_detector import MetricDataPoint, StatisticalAnalyzer
+from voicehive.domains.agents.services.monitoring_agent import MonitoringAgent, SystemMetrics
+from voicehive.domains.communication.services.message_bus import MessageBus
+from voicehive.utils.timeseries import RingSeries, TagTable, TimeSeriesStore
+
+
+def _system_metrics(timestamp: datetime, load: float) -> SystemMetrics:
+    return SystemMetrics(
+        timestamp=timestamp, total_agents=4, healthy_agents=3, degraded_agents=1, unhealthy_agents=0,
+        offline_agents=0, avg_response_time_ms=load * 10, overall_success_rate=0.99,
+        system_cpu_percent=load, system_memory_percent=50.0, active_emergencies=0,
+        p95_response_time_ms=load * 20
+    )
+
+
+class TestTaggedStorage:
+    """Test interned metadata and zero-copy windows"""
+
+    def test_tags_are_interned(self):
+        table = TagTable()
+
+        first = table.intern({"source": "supervisor", "region": "eu"})
+        assert table.intern({"region": "eu", "source": "supervisor"}) == first
+        assert table.intern({"source": "monitor"}) != first
+        assert table.intern(None) == table.intern({}) == 0
+        assert table.intern({"labels": ["a", "b"]}) == table.intern({"labels": ["a", "b"]})
+        assert len(table) == 3
+
+    def test_tag_column_allocated_on_first_tag(self):
+        ring = RingSeries(capacity=4)
+        ring.append(0.0, 1.0)
+        untagged = ring.nbytes
+        ring.append(1.0, 2.0, tag=3)
+
+        assert ring.nbytes > untagged
+        assert ring.tags.tolist() == [0, 3]
+
+    def test_metadata_round_trip(self):
+        store = TimeSeriesStore(raw_capacity=3)
+        metadata = [None, {"source": "a"}, {"source": "b"}, {"source": "a"}]
+        store.extend("cpu", np.arange(4.0), np.arange(4.0), metadata)
+
+        assert store.metadata("cpu") == metadata[1:]
+        assert store.get_stats()["interned_tags"] == 2
+
+    def test_window_views_share_buffers(self):
+        store = TimeSeriesStore(raw_capacity=50)
+        store.extend("cpu", np.arange(80.0), np.arange(80.0) * 2)
+
+        timestamps, values = store.window("cpu", size=10)
+        assert timestamps.tolist() == list(np.arange(70.0, 80.0))
+        assert np.shares_memory(values, store.get("cpu").raw.values)
+        assert store.window("missing")[0].size == 0
+
+    def test_memory_reported_per_metric(self):
+        store = TimeSeriesStore()
+        store.extend("busy", np.arange(900.0), np.ones(900))
+        store.add("idle", 0.0, 1.0)
+
+        memory = store.memory_by_metric()
+        assert memory["busy"] > 10 * memory["idle"]
+        assert sum(memory.values()) == store.memory_bytes()
+
+
+class TestSharedStore:
+    """Test the store shared by analyzer and monitoring agent"""
+
+    def test_analyzer_window_is_columnar(self):
+        store = TimeSeriesStore(raw_capacity=500)
+        analyzer = StatisticalAnalyzer(window_size=20, series_store=store)
+        start = datetime(2026, 1, 1)
+        for i in range(30):
+            analyzer.add_data_point(
+                "latency", MetricDataPoint(timestamp=start + timedelta(seconds=i), value=float(i), metadata={"node": "a"})
+            )
+
+        timestamps, values = analyzer.get_window("latency")
+        points = analyzer.get_data_points("latency")
+
+        assert values.tolist() == [float(i) for i in range(10, 30)]
+        assert len(store.get("latency").raw) == 30
+        assert points[0].timestamp == start + timedelta(seconds=10)
+        assert points[-1].metadata == {"node": "a"}
+
+    def test_monitoring_history_round_trip(self):
+        message_bus = Mock(spec=MessageBus)
+        message_bus.publish = AsyncMock()
+        agent = MonitoringAgent(message_bus=message_bus, series_store=TimeSeriesStore(raw_capacity=5))
+        start = datetime(2026, 1, 1, 12)
+        recorded = [_system_metrics(start + timedelta(seconds=5 * i), float(i)) for i in range(8)]
+        for metrics in recorded:
+            agent._add_to_history(metrics)
+
+        assert agent.get_system_metrics(limit=3) == recorded[-3:]
+        assert agent.metrics_history == recorded[-5:]
+        assert isinstance(agent.metrics_history[0].total_agents, int)
+        assert agent.get_monitoring_statistics()["metrics_history_size"] == 5
+
+
+@pytest.mark.performance
+class TestStorageFootprint:
+    """Compare memory of data point deques with the columnar store"""
+
+    def test_memory_per_point(self):
+        metric_count, points = 200, 1000
+        start = datetime(2026, 1, 1)
+        values = np.random.default_rng(0).normal(100, 10, points)
+
+        tracemalloc.start()
+        # Every sample carries its own datetime, as with live collection
+        windows = {
+            f"metric_{m}": deque(
+                (MetricDataPoint(timestamp=start + timedelta(seconds=i), value=v) for i, v in enumerate(values.tolist())),
+                maxlen=points
+            )
+            for m in range(metric_count)
+        }
+        deque_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del windows
+
+        epoch = start.timestamp() + np.arange(points, dtype=float)
+        tracemalloc.start()
+        store = TimeSeriesStore(raw_capacity=points)
+        for m in range(metric_count):
+            store.extend(f"metric_{m}", epoch, values)
+        store_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        per_point_before = deque_bytes / (metric_count * points)
+        per_point_after = store_bytes / (metric_count * points)
+        print(f"\nPer point: deque of MetricDataPoint {per_point_before:.0f} B, columnar store {per_point_after:.1f} B; "
+              f"10k metrics x 1k points: {per_point_before * 1e7 / 2**30:.2f} GiB -> "
+              f"{per_point_after * 1e7 / 2**30:.2f} GiB")
+        assert per_point_before / per_point_after > 8
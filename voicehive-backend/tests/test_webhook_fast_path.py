@@ -0,0 +1,124 @@
+"""
+Test Suite for the Vapi webhook fast path
+Tests orjson parsing, transcript type dispatch and parsing throughput
+"""
+import json
+import subprocess
+import sys
+import time
+
+import pytest
+from pydantic import ValidationError
+
+from voicehive.models.vapi import (
+    VapiWebhookRequest, VapiWebhookResponse, VapiTranscriptEvent, parse_vapi_webhook
+)
+from voicehive.api.responses import FastJSONResponse
+from voicehive.utils.serialization import dumps, loads
+
+
+def _webhook(message: dict) -> dict:
+    return {
+        "message": message,
+        "call": {
+            "id": "call-123",
+            "orgId": "org-1",
+            "createdAt": "2024-01-15T10:00:00Z",
+            "status": "in-progress",
+            "type": "inboundPhoneCall",
+            "customer": {"number": "+15551234567"}
+        }
+    }
+
+
+WEBHOOK_PAYLOADS = {
+    "transcript": _webhook({"type": "transcript", "transcript": "I'd like to book an appointment"}),
+    "function-call": _webhook({
+        "type": "function-call",
+        "functionCall": {"name": "book_appointment", "parameters": {"name": "Jane", "date": "2024-01-20"}}
+    }),
+    "hang": _webhook({"type": "hang"}),
+    "conversation-update": _webhook({"type": "conversation-update", "content": "Hello, is this the salon?"}),
+}
+
+
+class TestWebhookParsing:
+    """Test type-dispatched webhook parsing"""
+
+    def test_transcript_takes_fast_path(self):
+        event = parse_vapi_webhook(dumps(WEBHOOK_PAYLOADS["transcript"]))
+
+        assert isinstance(event, VapiTranscriptEvent)
+        assert event.call_id == "call-123"
+        assert event.transcript == "I'd like to book an appointment"
+
+    @pytest.mark.parametrize("message_type", ["function-call", "hang", "conversation-update"])
+    def test_other_types_fully_validated(self, message_type):
+        raw = dumps(WEBHOOK_PAYLOADS[message_type])
+
+        event = parse_vapi_webhook(raw)
+
+        assert isinstance(event, VapiWebhookRequest)
+        assert event == VapiWebhookRequest(**json.loads(raw))
+
+    def test_malformed_transcript_falls_back_to_validation(self):
+        payload = _webhook({"type": "transcript", "transcript": "hi"})
+        del payload["call"]["id"]
+
+        with pytest.raises(ValidationError):
+            parse_vapi_webhook(dumps(payload))
+
+    def test_invalid_json_rejected(self):
+        with pytest.raises(ValueError):
+            parse_vapi_webhook(b"{not json")
+
+    def test_response_rendering_matches_stdlib(self):
+        content = VapiWebhookResponse(result={"success": True, "message": "Booked"}).model_dump(mode="json")
+
+        body = FastJSONResponse(content=content).body
+
+        assert loads(body) == content
+        assert FastJSONResponse(content=b'{"status":"ok"}').body == b'{"status":"ok"}'
+
+    def test_models_do_not_import_web_framework(self):
+        code = "import sys, voicehive.models.vapi; print('fastapi' in sys.modules)"
+
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "False"
+
+
+@pytest.mark.performance
+class TestWebhookParsingBenchmark:
+    """Microbenchmark of webhook parse + validate + render throughput per message type"""
+
+    ITERATIONS = 2000
+
+    @staticmethod
+    def _legacy(raw: bytes) -> bytes:
+        request = VapiWebhookRequest(**json.loads(raw))
+        return json.dumps(VapiWebhookResponse(status=request.message.type).model_dump(mode="json")).encode()
+
+    @staticmethod
+    def _fast(raw: bytes) -> bytes:
+        event = parse_vapi_webhook(raw)
+        return dumps(VapiWebhookResponse(status=event.type if isinstance(event, VapiTranscriptEvent)
+                                         else event.message.type).model_dump(mode="json"))
+
+    def _events_per_second(self, handler, raw: bytes) -> float:
+        start = time.perf_counter()
+        for _ in range(self.ITERATIONS):
+            handler(raw)
+        return self.ITERATIONS / (time.perf_counter() - start)
+
+    @pytest.mark.parametrize("message_type", list(WEBHOOK_PAYLOADS))
+    def test_events_per_second_per_core(self, message_type):
+        raw = json.dumps(WEBHOOK_PAYLOADS[message_type]).encode()
+
+        legacy = self._events_per_second(self._legacy, raw)
+        fast = self._events_per_second(self._fast, raw)
+
+        print(f"\n{message_type}: legacy {legacy:,.0f} events/s, fast path {fast:,.0f} events/s "
+              f"({fast / legacy:.2f}x)")
+        if message_type == "transcript":
+            assert fast > legacy
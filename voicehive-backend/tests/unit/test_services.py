@@ -67,12 +67,13 @@ class TestRoxyAgent:
         assert response.success is False
         assert "Unknown function" in response.message
 
-    def test_conversation_history_management(self, roxy_agent):
+    @pytest.mark.asyncio
+    async def test_conversation_history_management(self, roxy_agent):
         """Test conversation history is properly managed"""
         call_id = "test-call"
         
         # Initially empty
-        history = roxy_agent._get_conversation_history(call_id)
+        history = await roxy_agent._get_conversation_history(call_id)
         assert len(history) == 0
         
         # Add messages
@@ -80,10 +81,10 @@ class TestRoxyAgent:
             ConversationMessage(role="user", content="Hello"),
             ConversationMessage(role="assistant", content="Hi there!")
         ]
-        roxy_agent._update_conversation_history(call_id, messages)
+        await roxy_agent._update_conversation_history(call_id, messages)
         
         # Check history
-        history = roxy_agent._get_conversation_history(call_id)
+        history = await roxy_agent._get_conversation_history(call_id)
         assert len(history) == 2
         assert history[0].content == "Hello"
 